@@ -0,0 +1,62 @@
+# Generated by Django 5.2.3 on 2026-10-17 01:59
+
+from django.db import migrations, models, transaction
+
+
+TRGM_INDEX_NAME = 'accounts_user_search_name_trgm'
+
+
+def backfill_search_name(apps, schema_editor):
+    from app.utils import normalize_search_text
+
+    UserProfile = apps.get_model('accounts', 'UserProfile')
+    batch = []
+    for user in UserProfile.objects.only('id', 'name', 'last_name', 'email').iterator(chunk_size=2000):
+        user.search_name = normalize_search_text(user.name, user.last_name, user.email)
+        batch.append(user)
+        if len(batch) >= 2000:
+            UserProfile.objects.bulk_update(batch, ['search_name'])
+            batch = []
+    if batch:
+        UserProfile.objects.bulk_update(batch, ['search_name'])
+
+
+def create_trigram_index(apps, schema_editor):
+    """
+    Índice GIN com gin_trgm_ops (PostgreSQL). Se a extensão pg_trgm não puder ser
+    criada (permissão/ambiente), a busca continua funcionando sem o índice.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    except Exception:
+        return
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {TRGM_INDEX_NAME} '
+        'ON accounts_userprofile USING gin (search_name gin_trgm_ops)'
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {TRGM_INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_userprofile_city_userprofile_company_name_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='search_name',
+            field=models.CharField(blank=True, default='', editable=False, max_length=767, verbose_name='Texto de Busca'),
+        ),
+        migrations.RunPython(backfill_search_name, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -3,6 +3,7 @@ from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseU
 from django.utils import timezone
 
 from app.models import Base
+from app.utils import normalize_search_text
 
 
 class UserProfileManager(BaseUserManager):
@@ -44,6 +45,8 @@ class UserProfile(Base, AbstractBaseUser, PermissionsMixin):
     city = models.CharField(max_length=100, blank=True, default='', verbose_name='Cidade')
     state = models.CharField(max_length=2, blank=True, default='', verbose_name='Estado (UF)')
     is_staff = models.BooleanField(default=False, verbose_name='É Funcionario?')
+    # Nome + e-mail sem acentos/minúsculo, indexado por trigramas (pg_trgm) para buscas
+    search_name = models.CharField(max_length=767, blank=True, default='', editable=False, verbose_name='Texto de Busca')
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['name', 'user_type']
@@ -60,5 +63,12 @@ class UserProfile(Base, AbstractBaseUser, PermissionsMixin):
             return f'{self.name} {self.last_name}'
         return self.name
 
+    def save(self, *args, **kwargs):
+        self.search_name = normalize_search_text(self.name, self.last_name, self.email)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'name', 'last_name', 'email'}.intersection(update_fields):
+            kwargs['update_fields'] = set(update_fields) | {'search_name'}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f'{self.full_name} ({self.get_user_type_display()})'
@@ -0,0 +1,60 @@
+"""
+Serviços de busca de usuários por nome/e-mail (pickers de recrutador).
+
+Usa UserProfile.search_name (texto sem acentos, minúsculo). No PostgreSQL com pg_trgm
+o filtro é atendido pelo índice GIN de trigramas, aceita pequenos erros de digitação
+(word similarity) e o resultado vem ranqueado. Sem pg_trgm (ou no SQLite) a busca cai
+para substring no mesmo campo normalizado, ainda insensível a acentos.
+"""
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connections
+from django.db.models import Q
+
+from app.utils import normalize_search_text
+
+
+_trigram_support = {}
+
+
+def has_trigram_support(using='default'):
+    """Verifica (uma vez por conexão) se a extensão pg_trgm está instalada."""
+    if using not in _trigram_support:
+        connection = connections[using]
+        supported = False
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+                supported = cursor.fetchone() is not None
+        _trigram_support[using] = supported
+    return _trigram_support[using]
+
+
+def search_by_name(queryset, term, field='search_name'):
+    """
+    Filtra e ranqueia um queryset pelo nome/e-mail normalizado.
+
+    Args:
+        queryset: queryset de UserProfile ou de um modelo relacionado
+        term: texto digitado
+        field: caminho até UserProfile.search_name (ex.: 'user__search_name')
+
+    Returns:
+        tuple (queryset, ranqueado: bool) — quando ranqueado, anota `name_rank`
+    """
+    normalized = normalize_search_text(term)
+    if not normalized:
+        return queryset, False
+
+    substring = Q()
+    for word in normalized.split():
+        substring &= Q(**{f'{field}__contains': word})
+
+    if not has_trigram_support(queryset.db):
+        return queryset.filter(substring).order_by(field), False
+
+    queryset = queryset.filter(
+        substring | Q(**{f'{field}__trigram_word_similar': normalized})
+    ).annotate(
+        name_rank=TrigramWordSimilarity(normalized, field)
+    ).order_by('-name_rank', field)
+    return queryset, True
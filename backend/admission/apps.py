@@ -5,3 +5,8 @@ class AdmissionConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'admission'
     verbose_name = 'Admissão e Documentos'
+
+    def ready(self):
+        # Versão de cache dos tipos de documento (app.cache)
+        from app.cache import register_model_versioning
+        register_model_versioning(self.get_model('DocumentType'))
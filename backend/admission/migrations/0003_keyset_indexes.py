@@ -0,0 +1,20 @@
+# Generated by Django 5.2.3 on 2026-10-17 02:03
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admission', '0002_admissiondata'),
+        ('candidates', '0015_keyset_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='candidatedocument',
+            index=models.Index(fields=['status', 'created_at', 'id'], name='cand_doc_status_created_idx'),
+        ),
+    ]
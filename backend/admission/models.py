@@ -94,6 +94,10 @@ class CandidateDocument(Base):
         verbose_name_plural = 'Documentos dos Candidatos'
         unique_together = ['candidate', 'document_type']
         ordering = ['document_type__order', 'document_type__name']
+        indexes = [
+            # Fila de revisão (pending-review) paginada por keyset
+            models.Index(fields=['status', 'created_at', 'id'], name='cand_doc_status_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.candidate} - {self.document_type.name}"
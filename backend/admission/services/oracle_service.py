@@ -9,7 +9,9 @@ import oracledb
 import logging
 from typing import Dict, Any, List, Optional
 from django.conf import settings
-from django.core.cache import cache
+
+from app.cache import get_or_compute
+from app.instrumentation import track_external
 
 logger = logging.getLogger(__name__)
 
@@ -93,11 +95,12 @@ class ProtheusOracleService:
 
         try:
             dsn = f"{self.host}:{self.port}/{self.service_name}"
-            connection = oracledb.connect(
-                user=self.username,
-                password=self.password,
-                dsn=dsn
-            )
+            with track_external('oracle_connect'):
+                connection = oracledb.connect(
+                    user=self.username,
+                    password=self.password,
+                    dsn=dsn
+                )
             return connection
         except oracledb.Error as e:
             logger.error(f"[Oracle] Erro ao conectar: {e}")
@@ -239,8 +242,9 @@ class ProtheusOracleService:
                 FETCH FIRST 20 ROWS ONLY
             """
 
-            cursor.execute(query, {'termo': f'%{term}%', 'termo2': f'%{term}%'})
-            rows = cursor.fetchall()
+            with track_external('oracle'):
+                cursor.execute(query, {'termo': f'%{term}%', 'termo2': f'%{term}%'})
+                rows = cursor.fetchall()
 
             results = [{
                 "matricula": row[0],
@@ -266,21 +270,32 @@ class ProtheusOracleService:
         2. Tabela genérica SX5 (estados, nacionalidades, tipos, etc.)
         3. CBOX inline (sexo, S/N flags, etc.) — sem query
 
-        Resultados ficam em cache por 1 hora para evitar queries repetidas ao Oracle.
+        Resultados ficam em cache compartilhado por 1 hora; ao vencer, um único worker
+        reconsulta o Oracle enquanto os demais servem o valor anterior (até 6 horas).
         """
         if not self.is_configured():
             return {}
 
-        cache_key = 'protheus_lookups_all'
-        cached = cache.get(cache_key)
-        if cached:
-            logger.info("[Oracle] Lookups retornados do cache")
-            return cached
+        try:
+            return get_or_compute(
+                'protheus_lookups_all',
+                self._consultar_todas_opcoes,
+                soft_ttl=3600,
+                hard_ttl=6 * 3600,
+                lock_timeout=120,
+            )
+        except Exception as e:
+            # Oracle indisponível e nada em cache: ao menos as opções CBOX
+            logger.error(f"[Oracle] Erro ao buscar lookups: {e}")
+            return self._opcoes_cbox()
 
+    @track_external('oracle')
+    def _consultar_todas_opcoes(self) -> Dict[str, List[Dict[str, str]]]:
+        """Consulta os lookups no Oracle (sem cache); falha de conexão gera exceção."""
         resultado: Dict[str, List[Dict[str, str]]] = {}
 
+        conn = self._get_connection()
         try:
-            conn = self._get_connection()
             cursor = conn.cursor()
 
             # 1. Tabelas F3 diretas
@@ -322,12 +337,17 @@ class ProtheusOracleService:
                     resultado[campo] = []
 
             cursor.close()
+        finally:
             conn.close()
 
-        except Exception as e:
-            logger.error(f"[Oracle] Erro ao buscar lookups: {e}")
-
         # 3. CBOX inline (parse local, sem query)
+        resultado.update(self._opcoes_cbox())
+        logger.info(f"[Oracle] Lookups consultados ({len(resultado)} campos)")
+        return resultado
+
+    def _opcoes_cbox(self) -> Dict[str, List[Dict[str, str]]]:
+        """Opções CBOX definidas inline (sem query)."""
+        resultado: Dict[str, List[Dict[str, str]]] = {}
         for campo, cbox in self.LOOKUP_CBOX.items():
             opcoes = []
             for item in cbox.split(";"):
@@ -335,10 +355,4 @@ class ProtheusOracleService:
                     v, d = item.split("=", 1)
                     opcoes.append({"valor": v.strip(), "descricao": d.strip()})
             resultado[campo] = opcoes
-
-        # Cache por 1 hora (lookups do Protheus nao mudam com frequencia)
-        if resultado:
-            cache.set(cache_key, resultado, 3600)
-            logger.info(f"[Oracle] Lookups salvos no cache ({len(resultado)} campos)")
-
         return resultado
@@ -7,6 +7,7 @@ from django.db import IntegrityError
 from django.utils import timezone
 from django.db.models import Prefetch
 
+from app.conditional import compute_validator, conditional_get, serializer_signature
 from candidates.models import CandidateProfile
 from .models import DocumentType, CandidateDocument, AdmissionData
 from .serializers import (
@@ -246,6 +247,13 @@ class CandidateDocumentViewSet(viewsets.ModelViewSet):
                 {'documento': document.document_type.name, 'observacoes': document.observations}
             )
 
+        from app.events import RECRUITERS_CHANNEL, publish
+        publish(RECRUITERS_CHANNEL, 'document_reviewed', {
+            'document_id': document.pk,
+            'candidate_profile_id': document.candidate_id,
+            'status': document.status,
+        })
+
         result_serializer = CandidateDocumentSerializer(
             document, context={'request': request}
         )
@@ -261,13 +269,25 @@ class CandidateDocumentViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        try:
-            profile = user.candidate_profile
-        except CandidateProfile.DoesNotExist:
+        # Validador: documentos do candidato e tipos de documento (tabela inteira,
+        # pequena). Sem alterações desde a última visita: 304 após uma consulta
+        validator = compute_validator(
+            CandidateProfile.objects.filter(user=user),
+            children={
+                'documents': (CandidateDocument, 'candidate'),
+                'document_types': (DocumentType, None),
+            },
+            extra=(serializer_signature(CandidateDocumentSerializer),),
+        )
+        if validator is None:
             return Response(
                 {'detail': 'Perfil de candidato não encontrado.'},
                 status=status.HTTP_404_NOT_FOUND
             )
+        return conditional_get(request, validator, lambda: self._my_documents_response(request, user))
+
+    def _my_documents_response(self, request, user):
+        profile = user.candidate_profile
 
         # Todos os tipos de documento ativos
         document_types = DocumentType.objects.filter(is_active=True).order_by('order', 'name')
@@ -326,6 +346,16 @@ class CandidateDocumentViewSet(viewsets.ModelViewSet):
             'candidate__user', 'document_type', 'reviewed_by'
         ).order_by('created_at')
 
+        # Paginação keyset opcional (?cursor=); sem ela mantém a lista completa
+        if 'cursor' in request.query_params:
+            from app.pagination import KeysetPagination
+            paginator = KeysetPagination(cursor_ordering=('created_at', 'id'))
+            page = paginator.paginate_queryset(docs, request, view=self)
+            serializer = CandidateDocumentSerializer(
+                page, many=True, context={'request': request}
+            )
+            return paginator.get_paginated_response(serializer.data)
+
         serializer = CandidateDocumentSerializer(
             docs, many=True, context={'request': request}
         )
@@ -575,6 +605,19 @@ class AdmissionDataViewSet(viewsets.ModelViewSet):
         elif instance.status == 'confirmed':
             notify_candidate_status_change(instance.candidate, 'admission_confirmed')
 
+    def retrieve(self, request, *args, **kwargs):
+        """Detalhe dos dados de admissão com GET condicional (ETag/Last-Modified)."""
+        lookup = kwargs.get(self.lookup_url_kwarg or self.lookup_field)
+        validator = None
+        if str(lookup).isdigit():
+            validator = compute_validator(
+                self.get_queryset().filter(pk=lookup),
+                fields=('candidate__user__updated_at', 'filled_by__updated_at'),
+                extra=(serializer_signature(AdmissionDataSerializer),),
+            )
+        parent_retrieve = super().retrieve
+        return conditional_get(request, validator, lambda: parent_retrieve(request, *args, **kwargs))
+
     def create(self, request, *args, **kwargs):
         """Cria dados de admissão para um candidato (ou atualiza se já existir)."""
         denied = self._check_recruiter(request.user)
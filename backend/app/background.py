@@ -0,0 +1,56 @@
+"""
+Execução de tarefas em segundo plano (threads do próprio processo).
+
+Usado para trabalho lento que não deve bloquear a requisição, como notificações
+WhatsApp (Evolution API). Não há fila persistente: tarefas pendentes se perdem se o
+worker for reiniciado, o que é aceitável para notificações "melhor esforço".
+
+Uso:
+    from app.background import submit_on_commit
+    submit_on_commit(notify_candidates_status_change, profile_ids, 'profile_approved')
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections, transaction
+
+logger = logging.getLogger('app')
+
+_executor = None
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, 'BACKGROUND_WORKERS', 4),
+            thread_name_prefix='background',
+        )
+    return _executor
+
+
+def _run(fn, args, kwargs):
+    try:
+        return fn(*args, **kwargs)
+    except Exception:
+        logger.exception(f'Erro na tarefa em segundo plano {getattr(fn, "__name__", fn)}')
+    finally:
+        # Conexões de banco são por thread: fechar para não vazar conexões do pool
+        connections.close_all()
+
+
+def submit(fn, *args, **kwargs):
+    """Agenda `fn(*args, **kwargs)` em uma thread de segundo plano."""
+    if getattr(settings, 'BACKGROUND_TASKS_EAGER', False):
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            logger.exception(f'Erro na tarefa {getattr(fn, "__name__", fn)}')
+            return None
+    return _get_executor().submit(_run, fn, args, kwargs)
+
+
+def submit_on_commit(fn, *args, **kwargs):
+    """Agenda a tarefa somente após o commit da transação atual (descartada em rollback)."""
+    transaction.on_commit(lambda: submit(fn, *args, **kwargs))
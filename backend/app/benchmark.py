@@ -0,0 +1,247 @@
+"""
+Benchmark dos endpoints mais acessados, em processo (sem servidor HTTP).
+
+Cada endpoint é chamado pelo APIClient do DRF (middlewares, autenticação forçada,
+serializers): uma chamada "fria" com o cache limpo e N chamadas "quentes". Para
+cada endpoint são registrados p50/p95/média da latência, quantidade e tempo das
+queries SQL (chamada fria: pior caso, é a que acusa N+1), os formatos de query
+repetidos acima de NPLUSONE_THRESHOLD e tamanho do JSON.
+
+O resultado é um dict serializável em JSON, comparável com um baseline:
+check_results() aponta endpoints acima do orçamento de queries (QUERY_BUDGETS) ou
+de formatos repetidos (REPEATED_QUERY_BUDGETS), com mais queries que o baseline
+ou, opcionalmente, com p95 acima da tolerância.
+
+Uso:
+    results = run_benchmarks(iterations=20)
+    failures = check_results(results, baseline=json.load(open('baseline.json')))
+
+A massa de dados vem de candidates.services.synthetic_services (comando
+benchmark_endpoints, que cria e descarta um banco de teste).
+"""
+import math
+import time
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from app.instrumentation import RequestMetrics, collecting, find_repeated_queries
+
+BENCHMARK_EMAIL = 'benchmark@sintetico.test'
+
+
+@dataclass
+class Endpoint:
+    name: str
+    # Caminho com placeholders preenchidos por resolve_context() (ex.: {process_id})
+    path: str
+    # 'recruiter' (staff: enxerga todos os dados) ou 'candidate'
+    user: str = 'recruiter'
+    params: dict = field(default_factory=dict)
+
+
+ENDPOINTS = [
+    Endpoint('candidates_list', '/api/v1/candidates/profiles/'),
+    Endpoint('candidates_search', '/api/v1/candidates/profiles/', params={'search': 'excel'}),
+    Endpoint('dashboard_stats', '/api/v1/candidates/profiles/dashboard-stats/'),
+    Endpoint('available_candidates', '/api/v1/selection-processes/{process_id}/available-candidates/'),
+    Endpoint('approved_awaiting_documents', '/api/v1/candidate-documents/approved-awaiting-documents/'),
+    Endpoint('candidates_in_process', '/api/v1/candidates-in-process/', params={'process': '{process_id}'}),
+    Endpoint('process_statistics', '/api/v1/selection-processes/{process_id}/statistics/'),
+    Endpoint('application_statistics', '/api/v1/applications/statistics/'),
+    Endpoint('my_documents', '/api/v1/candidate-documents/my-documents/', user='candidate'),
+]
+
+# Máximo de queries (chamada fria, página padrão) por endpoint; acima disso a
+# execução falha. Os valores altos são N+1 conhecidos: reduza ao corrigi-los.
+QUERY_BUDGETS = {
+    'candidates_list': 8,
+    'candidates_search': 8,
+    'dashboard_stats': 3,
+    'available_candidates': 5,
+    'approved_awaiting_documents': 5,
+    'candidates_in_process': 100,
+    'process_statistics': 15,
+    'application_statistics': 8,
+    'my_documents': 40,
+}
+
+# Máximo de formatos de query repetidos (N+1) por endpoint; os demais não podem ter
+# nenhum. Os valores são N+1 conhecidos: reduza ao corrigi-los.
+REPEATED_QUERY_BUDGETS = {
+    'candidates_in_process': 9,
+    'my_documents': 1,
+}
+
+
+def _percentile(values, percent):
+    """Percentil por interpolação linear (values não vazio)."""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * percent / 100
+    lower, upper = math.floor(position), math.ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def resolve_context():
+    """
+    Usuários e ids usados nos endpoints: um recrutador staff, o candidato com mais
+    documentos e o processo com mais participantes.
+    """
+    from django.db.models import Count
+
+    from accounts.models import UserProfile
+    from candidates.models import CandidateProfile
+    from selection_process.models import SelectionProcess
+
+    recruiter, _ = UserProfile.objects.get_or_create(
+        email=BENCHMARK_EMAIL,
+        defaults={'name': 'Benchmark', 'user_type': 'recruiter', 'is_staff': True},
+    )
+    process = (
+        SelectionProcess.objects.annotate(total=Count('candidates_in_process'))
+        .order_by('-total', 'pk').first()
+    )
+    candidate = (
+        CandidateProfile.objects.annotate(total=Count('documents'))
+        .select_related('user').order_by('-total', 'pk').first()
+    )
+    return {
+        'users': {'recruiter': recruiter, 'candidate': candidate.user if candidate else None},
+        'ids': {'process_id': process.pk if process else 0},
+    }
+
+
+def measure(client, path, params, iterations):
+    """Chamada fria (cache limpo) + `iterations` chamadas quentes de um GET."""
+    cache.clear()
+    # Tempo de SQL pelo execute_wrapper (captured_queries arredonda por query)
+    with CaptureQueriesContext(connection) as queries, collecting(RequestMetrics()) as metrics:
+        started = time.perf_counter()
+        response = client.get(path, params)
+        cold_ms = (time.perf_counter() - started) * 1000
+    payload = response.content if not response.streaming else b''.join(response.streaming_content)
+    repeated = find_repeated_queries(
+        [query['sql'] for query in queries.captured_queries], settings.NPLUSONE_THRESHOLD
+    )
+
+    timings = []
+    warm_queries = 0
+    for _ in range(iterations):
+        with CaptureQueriesContext(connection) as warm:
+            started = time.perf_counter()
+            client.get(path, params)
+            timings.append((time.perf_counter() - started) * 1000)
+        warm_queries = max(warm_queries, len(warm))
+
+    return {
+        'status': response.status_code,
+        'cold_ms': round(cold_ms, 2),
+        'p50_ms': round(_percentile(timings, 50), 2) if timings else None,
+        'p95_ms': round(_percentile(timings, 95), 2) if timings else None,
+        'mean_ms': round(sum(timings) / len(timings), 2) if timings else None,
+        'queries': len(queries),
+        'warm_queries': warm_queries,
+        'sql_ms': round(metrics.db_ms, 2),
+        'repeated_queries': [
+            {'count': count, 'sql': shape[:300]}
+            for shape, count in sorted(repeated.items(), key=lambda item: -item[1])
+        ],
+        'payload_bytes': len(payload),
+    }
+
+
+def run_benchmarks(iterations=20, endpoints=None, only=None):
+    """
+    Executa os benchmarks no banco atual.
+
+    Args:
+        iterations: chamadas quentes por endpoint
+        endpoints: lista de Endpoint (padrão: ENDPOINTS)
+        only: nomes dos endpoints a executar (padrão: todos)
+
+    Returns:
+        dict {'meta': {...}, 'endpoints': {nome: métricas}}
+    """
+    from rest_framework.test import APIClient
+
+    from accounts.models import UserProfile
+    from candidates.models import CandidateProfile
+
+    context = resolve_context()
+    clients = {}
+    for role, user in context['users'].items():
+        if user is not None:
+            clients[role] = APIClient()
+            clients[role].force_authenticate(user)
+
+    results = {}
+    # Middleware de instrumentação (app.instrumentation) desligado: as métricas e os
+    # N+1 são coletados aqui, e sem ele as linhas de log amostradas não poluem a saída
+    with override_settings(
+        REQUEST_METRICS_SAMPLE_RATE=0, REQUEST_METRICS_SLOW_MS=None,
+        REQUEST_METRICS_SERVER_TIMING=False, METRICS_ENABLED=False,
+        NPLUSONE_SAMPLE_RATE=0, NPLUSONE_RAISE=False,
+    ):
+        for endpoint in endpoints or ENDPOINTS:
+            if only and endpoint.name not in only:
+                continue
+            if endpoint.user not in clients:
+                results[endpoint.name] = {'skipped': f'sem usuário {endpoint.user}'}
+                continue
+            path = endpoint.path.format(**context['ids'])
+            params = {key: str(value).format(**context['ids']) for key, value in endpoint.params.items()}
+            results[endpoint.name] = measure(clients[endpoint.user], path, params, iterations)
+
+    return {
+        'meta': {
+            'database': connection.vendor,
+            'candidates': CandidateProfile.objects.count(),
+            'users': UserProfile.objects.count(),
+            'iterations': iterations,
+        },
+        'endpoints': results,
+    }
+
+
+def check_results(results, baseline=None, latency_tolerance=None):
+    """
+    Regressões do resultado: status != 200, queries acima de QUERY_BUDGETS ou do
+    baseline, formatos repetidos acima de REPEATED_QUERY_BUDGETS e, com
+    latency_tolerance (ex.: 0.25 = +25%), p95 acima do baseline.
+
+    Returns:
+        lista de mensagens (vazia se não houve regressão)
+    """
+    failures = []
+    previous = (baseline or {}).get('endpoints', {})
+    for name, metrics in results['endpoints'].items():
+        if 'skipped' in metrics:
+            continue
+        if metrics['status'] != 200:
+            failures.append(f'{name}: status {metrics["status"]}')
+            continue
+        budget = QUERY_BUDGETS.get(name)
+        if budget is not None and metrics['queries'] > budget:
+            failures.append(f'{name}: {metrics["queries"]} queries (orçamento {budget})')
+        repeated = metrics.get('repeated_queries', [])
+        if len(repeated) > REPEATED_QUERY_BUDGETS.get(name, 0):
+            worst = repeated[0]
+            failures.append(
+                f'{name}: {len(repeated)} queries repetidas (N+1; orçamento '
+                f'{REPEATED_QUERY_BUDGETS.get(name, 0)}), a pior {worst["count"]}x: {worst["sql"][:120]}'
+            )
+        before = previous.get(name)
+        if not before or 'skipped' in before:
+            continue
+        if metrics['queries'] > before['queries']:
+            failures.append(f'{name}: {metrics["queries"]} queries (baseline {before["queries"]})')
+        if latency_tolerance is not None and before.get('p95_ms'):
+            limit = before['p95_ms'] * (1 + latency_tolerance)
+            if metrics['p95_ms'] > limit:
+                failures.append(
+                    f'{name}: p95 {metrics["p95_ms"]:.1f}ms (baseline {before["p95_ms"]:.1f}ms)'
+                )
+    return failures
@@ -0,0 +1,342 @@
+"""
+Utilitários de cache compartilhado.
+
+1. Invalidação por versão de modelo
+
+Cada modelo registrado tem uma chave de versão no cache compartilhado (Redis em
+produção). post_save/post_delete do modelo trocam a versão, e as chaves dos valores
+derivados dele embutem as versões atuais: depois de uma alteração, todos os workers
+passam a procurar uma chave nova e o valor antigo simplesmente expira.
+
+Uso:
+    # apps.py
+    def ready(self):
+        from app.cache import register_model_versioning
+        register_model_versioning(self.get_model('DocumentType'))
+
+    # serviço
+    key = versioned_key('required_doc_type_ids', models=[DocumentType])
+    value = cache_get(key)
+    if value is None:
+        value = ...
+        cache_set(key, value, settings.CACHE_VERSIONED_TIMEOUT)
+
+2. Recomputação única (single-flight) com stale-while-revalidate
+
+get_or_compute() guarda o valor com um prazo "suave": vencido
+o prazo, um único worker (lock via cache.add) recalcula enquanto os demais seguem
+servindo o valor anterior. Sem valor algum, os demais aguardam o recálculo (até
+WAIT_TIMEOUT) em vez de repetir a consulta e, se ele falhar, desistem com
+ComputationUnavailable. Os prazos recebem jitter para não vencerem todos juntos.
+
+    def get_dashboard_stats():
+        return get_or_compute('dashboard_stats_result', get_pipeline_counts, soft_ttl=10)
+
+3. Cache fora do ar
+
+O banco é a fonte da verdade: se o Redis cair, as funções deste módulo registram o
+erro e seguem sem cache (fail open) em vez de derrubar a requisição. Depois de uma
+falha o cache não é consultado por CACHE_RETRY_AFTER segundos, para que cada chamada
+não espere o timeout do socket; trocas de versão perdidas nesse intervalo são
+reenviadas quando o cache volta.
+"""
+import logging
+import random
+import time
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from app.instrumentation import record_cache
+
+try:
+    from redis.exceptions import RedisError
+except ImportError:  # redis-py só é usado com REDIS_URL
+    RedisError = ConnectionError
+
+logger = logging.getLogger('app')
+
+VERSION_KEY_PREFIX = 'model_version'
+
+# Falhas do cache compartilhado (Redis fora do ar, timeout do socket)
+CACHE_ERRORS = (RedisError, ConnectionError, TimeoutError)
+# Segundos sem consultar o cache depois de uma falha
+CACHE_RETRY_AFTER = 10
+
+_registered = set()
+_unavailable_until = 0.0
+# Modelos cuja troca de versão falhou (reenviada quando o cache volta)
+_pending_bumps = set()
+
+
+def cache_available():
+    return time.monotonic() >= _unavailable_until
+
+
+def _cache_failed(operation, error):
+    global _unavailable_until
+    if cache_available():
+        logger.error(f'Cache indisponível em {operation}: {error}; seguindo sem cache por {CACHE_RETRY_AFTER}s')
+    _unavailable_until = time.monotonic() + CACHE_RETRY_AFTER
+
+
+def cache_get(key, default=None):
+    """cache.get que não falha: sem chave (versões indisponíveis) ou sem cache, retorna default."""
+    if key is None or not cache_available():
+        return default
+    try:
+        return cache.get(key, default)
+    except CACHE_ERRORS as e:
+        _cache_failed('get', e)
+        return default
+
+
+def cache_set(key, value, timeout):
+    """cache.set que não falha: sem chave ou sem cache o valor simplesmente não é guardado."""
+    if key is None or not cache_available():
+        return
+    try:
+        cache.set(key, value, timeout)
+    except CACHE_ERRORS as e:
+        _cache_failed('set', e)
+
+
+def _label(model):
+    return model if isinstance(model, str) else model._meta.label_lower
+
+
+def _version_key(model):
+    return f'{VERSION_KEY_PREFIX}:{_label(model)}'
+
+
+def _initial_version():
+    # Baseada no relógio: se a chave de versão for descartada pelo Redis, a nova
+    # versão nunca coincide com uma antiga e valores obsoletos não voltam a valer
+    return int(time.time() * 1000)
+
+
+def get_model_versions(models):
+    """
+    Versões atuais dos modelos (uma ida ao cache); cria as que não existem.
+    Retorna None se o cache está indisponível.
+    """
+    if not cache_available():
+        return None
+    keys = [_version_key(model) for model in models]
+    try:
+        _flush_pending_bumps()
+        versions = cache.get_many(keys)
+        for key in keys:
+            if key not in versions:
+                cache.add(key, _initial_version(), timeout=None)
+                versions[key] = cache.get(key)
+    except CACHE_ERRORS as e:
+        _cache_failed('get_model_versions', e)
+        return None
+    return [versions[key] for key in keys]
+
+
+def _incr_version(label):
+    key = _version_key(label)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _initial_version(), timeout=None)
+
+
+def _flush_pending_bumps():
+    while _pending_bumps:
+        label = next(iter(_pending_bumps))
+        _incr_version(label)
+        _pending_bumps.discard(label)
+
+
+def bump_model_version(model):
+    """Invalida todos os valores derivados do modelo."""
+    label = _label(model)
+    if not cache_available():
+        _pending_bumps.add(label)
+        return
+    try:
+        _incr_version(label)
+    except CACHE_ERRORS as e:
+        _pending_bumps.add(label)
+        _cache_failed('bump_model_version', e)
+
+
+def versioned_key(base, *parts, models=()):
+    """
+    Monta a chave de cache com as versões dos modelos dos quais o valor depende.
+
+    Exemplo:
+        >>> versioned_key('jobs_by_company', 'tesserato', models=[Job, Company])
+        'jobs_by_company:tesserato:jobs.job=1718000000000:companies.company=1718000000003'
+
+    Retorna None se as versões não puderem ser lidas (cache_get/cache_set ignoram a chave).
+    """
+    key = ':'.join(str(part) for part in (base, *parts))
+    if models:
+        versions = get_model_versions(models)
+        if versions is None:
+            return None
+        key += ':' + ':'.join(f'{_label(model)}={version}' for model, version in zip(models, versions))
+    return key
+
+
+def _bump_on_commit(sender, **kwargs):
+    # Após o commit: outro worker não pode recalcular com dados ainda não gravados
+    transaction.on_commit(lambda: bump_model_version(sender))
+
+
+def register_model_versioning(*models):
+    """Conecta post_save/post_delete dos modelos à troca de versão."""
+    for model in models:
+        if model in _registered:
+            continue
+        _registered.add(model)
+        post_save.connect(_bump_on_commit, sender=model, dispatch_uid=f'cache_version_save:{_label(model)}')
+        post_delete.connect(_bump_on_commit, sender=model, dispatch_uid=f'cache_version_delete:{_label(model)}')
+
+
+LOCK_SUFFIX = ':lock'
+FAILED_SUFFIX = ':failed'
+WAIT_INTERVAL = 0.05
+# Espera máxima (segundos) pelo recálculo de outro worker quando não há valor algum
+WAIT_TIMEOUT = 10
+# Segundos até nova tentativa após falha no recálculo (servindo o valor anterior ou,
+# sem valor, levantando ComputationUnavailable)
+RETRY_AFTER = 60
+
+
+class ComputationUnavailable(Exception):
+    """Sem valor em cache: o recálculo falhou há pouco ou outro worker não terminou a tempo."""
+
+
+def _jittered(seconds, jitter):
+    return seconds * (1 + random.uniform(-jitter, jitter)) if jitter else seconds
+
+
+def _acquire_lock(lock_key, token, lock_timeout):
+    """True/False conforme o lock foi obtido; None se o cache está indisponível."""
+    try:
+        return cache.add(lock_key, token, lock_timeout)
+    except CACHE_ERRORS as e:
+        _cache_failed('add', e)
+        return None
+
+
+def _release_lock(lock_key, token):
+    # Só remove o lock se ainda for nosso (pode ter expirado e sido pego por outro)
+    if cache_get(lock_key) != token:
+        return
+    try:
+        cache.delete(lock_key)
+    except CACHE_ERRORS as e:
+        _cache_failed('delete', e)
+
+
+def _compute_and_store(key, compute, soft_ttl, hard_ttl, jitter, should_cache):
+    value = compute()
+    if should_cache is None or should_cache(value):
+        entry = {'value': value, 'fresh_until': time.time() + _jittered(soft_ttl, jitter)}
+        cache_set(key, entry, _jittered(hard_ttl, jitter))
+    return value
+
+
+def _recompute(key, lock_key, token, entry, compute, soft_ttl, hard_ttl, jitter, should_cache):
+    """Recálculo feito por quem detém o lock."""
+    try:
+        return _compute_and_store(key, compute, soft_ttl, hard_ttl, jitter, should_cache)
+    except Exception:
+        if entry is None:
+            # Nada a servir: quem aguarda (e quem chegar até RETRY_AFTER) desiste em vez
+            # de repetir a chamada que acabou de falhar
+            cache_set(key + FAILED_SUFFIX, True, min(soft_ttl, RETRY_AFTER))
+            raise
+        logger.exception(f'Erro ao recalcular "{key}"; servindo valor anterior')
+        # Adia a próxima tentativa para não repetir a falha a cada requisição
+        retry_entry = {'value': entry['value'], 'fresh_until': time.time() + min(soft_ttl, RETRY_AFTER)}
+        cache_set(key, retry_entry, _jittered(hard_ttl, jitter))
+        return entry['value']
+    finally:
+        _release_lock(lock_key, token)
+
+
+def _recently_failed(key):
+    if cache_get(key + FAILED_SUFFIX):
+        raise ComputationUnavailable(f'Recálculo de "{key}" falhou há pouco; nova tentativa em até {RETRY_AFTER}s')
+
+
+def get_or_compute(key, compute, soft_ttl, hard_ttl=None, lock_timeout=30, jitter=0.1, should_cache=None,
+                   wait_timeout=WAIT_TIMEOUT):
+    """
+    Retorna o valor em cache, recalculando com `compute()` uma única vez por expiração.
+
+    Args:
+        key: chave do cache
+        compute: função sem argumentos que produz o valor
+        soft_ttl: segundos em que o valor é considerado atual
+        hard_ttl: segundos até o valor sair do cache (padrão: 10x soft_ttl); entre
+            soft_ttl e hard_ttl o valor antigo é servido enquanto um worker recalcula
+        lock_timeout: tempo máximo de um recálculo (segundos)
+        jitter: variação proporcional aplicada aos prazos (0.1 = ±10%)
+        should_cache: função opcional que decide se o valor calculado vai para o cache
+        wait_timeout: espera máxima pelo recálculo de outro worker quando não há valor
+            (limitada a lock_timeout)
+
+    Se o recálculo falhar e houver valor antigo, ele continua sendo servido. Sem valor
+    antigo a exceção chega só a quem recalculou; os demais recebem
+    ComputationUnavailable, assim como quem desistir de esperar. Com o cache
+    indisponível o valor é calculado a cada chamada, sem lock.
+
+    Raises:
+        ComputationUnavailable se não há valor e o recálculo falhou há pouco ou não
+        terminou dentro de wait_timeout
+    """
+    hard_ttl = hard_ttl or soft_ttl * 10
+    if not cache_available():
+        return compute()
+    try:
+        entry = cache.get(key)
+    except CACHE_ERRORS as e:
+        _cache_failed('get', e)
+        return compute()
+    if not isinstance(entry, dict) or 'fresh_until' not in entry:
+        entry = None
+    # Valor antigo servido durante o recálculo também conta como acerto
+    record_cache(key.split(':', 1)[0], hit=entry is not None)
+    if entry is not None and entry['fresh_until'] > time.time():
+        return entry['value']
+    if entry is None:
+        _recently_failed(key)
+
+    lock_key = key + LOCK_SUFFIX
+    token = uuid.uuid4().hex
+    locked = _acquire_lock(lock_key, token, lock_timeout)
+    if locked is None:
+        return compute()
+    if locked:
+        return _recompute(key, lock_key, token, entry, compute, soft_ttl, hard_ttl, jitter, should_cache)
+
+    # Outro worker está recalculando: serve o valor antigo ou aguarda o novo
+    if entry is not None:
+        return entry['value']
+    wait = min(wait_timeout, lock_timeout)
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        time.sleep(WAIT_INTERVAL)
+        entry = cache_get(key)
+        if isinstance(entry, dict) and 'fresh_until' in entry:
+            return entry['value']
+        _recently_failed(key)
+        if cache_get(lock_key) is None:
+            # Recálculo terminou sem guardar o valor (should_cache) ou o lock expirou:
+            # só um dos que aguardam assume; os demais continuam esperando
+            locked = _acquire_lock(lock_key, token, lock_timeout)
+            if locked is None:
+                return compute()
+            if locked:
+                return _recompute(key, lock_key, token, None, compute, soft_ttl, hard_ttl, jitter, should_cache)
+    raise ComputationUnavailable(f'Recálculo de "{key}" não terminou em {wait:.0f}s')
@@ -0,0 +1,121 @@
+"""
+GET condicional (ETag / Last-Modified) sem rodar serializers.
+
+O validador de um recurso sai de uma única consulta: o updated_at do objeto
+(app.models.Base), o maior updated_at e a quantidade de linhas de cada relação
+filha (a quantidade acusa exclusões, que não deixam updated_at) e os campos
+gravados por UPDATE sem tocar em updated_at (ex.: pipeline_status). Se o cliente
+já tem a versão atual (If-None-Match / If-Modified-Since) a view responde 304.
+
+Uso:
+    validator = compute_validator(
+        CandidateProfile.objects.filter(user=request.user),
+        children={'educations': (CandidateEducation, 'candidate')},
+        fields=['pipeline_status', 'user__updated_at'],
+    )
+    return conditional_get(request, validator, lambda: Response(serializer.data))
+"""
+import datetime
+import functools
+import hashlib
+import json
+
+from django.db.models import Count, IntegerField, Max, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.http import HttpResponseNotModified
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+class ResourceValidator:
+    """ETag e Last-Modified de um recurso."""
+
+    def __init__(self, parts, last_modified=None):
+        payload = json.dumps(parts, sort_keys=True, default=str, separators=(',', ':'))
+        self.etag = '"%s"' % hashlib.sha1(payload.encode('utf-8')).hexdigest()
+        self.last_modified = last_modified
+
+    @property
+    def last_modified_timestamp(self):
+        return int(self.last_modified.timestamp()) if self.last_modified else None
+
+
+@functools.lru_cache(maxsize=None)
+def serializer_signature(serializer_class):
+    """Campos do serializer: um deploy que muda a resposta invalida os ETags antigos."""
+    return sorted(serializer_class().fields)
+
+
+def _child_aggregates(name, model, fk):
+    """Maior updated_at e quantidade de linhas da relação (fk=None: tabela inteira)."""
+    if fk is None:
+        base = model.objects.order_by().annotate(_group=Value(1, output_field=IntegerField())).values('_group')
+    else:
+        base = model.objects.filter(**{fk: OuterRef('pk')}).order_by().values(fk)
+    return {
+        f'_{name}_max': Subquery(base.annotate(value=Max('updated_at')).values('value')[:1]),
+        f'_{name}_count': Coalesce(Subquery(base.annotate(value=Count('pk')).values('value')[:1]), 0),
+    }
+
+
+def compute_validator(queryset, children=None, fields=(), extra=()):
+    """
+    Calcula o validador do (único) objeto do queryset em uma consulta.
+
+    Args:
+        queryset: queryset já restrito ao objeto (e às permissões do usuário)
+        children: {nome: (Model, campo FK para o objeto | None para a tabela inteira)}
+        fields: campos/lookups do objeto que entram no validador (ex.: 'user__updated_at')
+        extra: valores adicionais (ex.: data do dia para campos calculados como idade)
+
+    Returns:
+        ResourceValidator, ou None se o objeto não existe
+    """
+    annotations = {}
+    for name, (model, fk) in (children or {}).items():
+        annotations.update(_child_aggregates(name, model, fk))
+
+    row = (
+        queryset.select_related(None).prefetch_related(None).order_by()
+        .annotate(**annotations)
+        .values('pk', 'updated_at', *fields, *annotations)
+        .first()
+    )
+    if row is None:
+        return None
+
+    dates = [value for value in row.values() if isinstance(value, datetime.datetime)]
+    parts = [queryset.model._meta.label_lower, sorted(row.items()), list(extra)]
+    return ResourceValidator(parts, last_modified=max(dates) if dates else None)
+
+
+def _set_validator_headers(response, validator):
+    response['ETag'] = validator.etag
+    if validator.last_modified is not None:
+        response['Last-Modified'] = http_date(validator.last_modified_timestamp)
+    # Dados pessoais: só o navegador guarda, e sempre revalida
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def conditional_get(request, validator, build_response):
+    """
+    Responde 304 se o cliente já tem a versão atual; senão chama build_response()
+    (onde ficam os serializers) e acrescenta ETag/Last-Modified.
+    """
+    if validator is None:
+        return build_response()
+
+    conditional = get_conditional_response(
+        request, etag=validator.etag, last_modified=validator.last_modified_timestamp
+    )
+    if isinstance(conditional, HttpResponseNotModified):
+        return _set_validator_headers(conditional, validator)
+    if conditional is not None:
+        # 412 (If-Match / If-Unmodified-Since não atendidos)
+        return conditional
+
+    response = build_response()
+    if response.status_code == 200:
+        _set_validator_headers(response, validator)
+    return response
@@ -0,0 +1,114 @@
+"""
+Endpoints de eventos em tempo real (Server-Sent Events).
+
+1. POST /api/v1/events/ticket/ (JWT) devolve um ticket assinado de curta duração
+   com os canais do usuário: EventSource não envia o header Authorization.
+2. GET /api/v1/events/stream/?ticket=... mantém a conexão aberta e envia os eventos
+   do barramento (app.events). View assíncrona: sob ASGI cada conexão ociosa é só
+   uma corrotina aguardando a fila, sem thread nem consulta ao banco.
+
+Sob WSGI (gunicorn sync) o stream responde 204: o EventSource não reconecta e o
+frontend volta à consulta periódica (poll) dos endpoints de sempre.
+"""
+import json
+import time
+
+from django.conf import settings
+from django.core import signing
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.urls import reverse
+from drf_spectacular.utils import extend_schema
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from app.events import RECRUITERS_CHANNEL, Subscription, get_event_bus, hub, user_channel
+
+TICKET_SALT = 'app.events.ticket'
+
+
+def get_user_channels(user):
+    """Canais que o usuário pode acompanhar."""
+    channels = [user_channel(user.pk)]
+    if user.user_type == 'recruiter' or user.is_staff or user.is_superuser:
+        channels.append(RECRUITERS_CHANNEL)
+    return channels
+
+
+class EventTicketView(APIView):
+    """Emite o ticket para abrir o stream de eventos."""
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    @extend_schema(
+        tags=['Eventos'],
+        summary='Ticket do stream de eventos',
+        description='Retorna um ticket assinado (válido por EVENTS_TICKET_MAX_AGE segundos) para abrir '
+                    'GET /api/v1/events/stream/?ticket=... com EventSource.',
+        request=None,
+        responses={200: {'description': 'Ticket e URL do stream'}},
+    )
+    def post(self, request):
+        ticket = signing.dumps(
+            {'u': request.user.pk, 'c': get_user_channels(request.user)}, salt=TICKET_SALT
+        )
+        # Caminho relativo: o frontend usa a própria base da API (HTTPS atrás do Nginx)
+        stream_url = reverse('events-stream') + f'?ticket={ticket}'
+        return Response({
+            'ticket': ticket,
+            'stream_url': stream_url,
+            'expires_in': settings.EVENTS_TICKET_MAX_AGE,
+        })
+
+
+def _format_event(message):
+    data = json.dumps(message.get('data', {}), ensure_ascii=False, default=str)
+    return f"event: {message['event']}\ndata: {data}\n\n"
+
+
+async def _event_source(subscription):
+    heartbeat = settings.EVENTS_HEARTBEAT_INTERVAL
+    deadline = time.monotonic() + settings.EVENTS_MAX_CONNECTION_AGE
+    hub.add(subscription)
+    try:
+        # retry: intervalo de reconexão do EventSource; "ready" permite ao cliente
+        # ressincronizar (uma consulta) ao conectar ou reconectar
+        yield f"retry: {settings.EVENTS_RETRY_MS}\nevent: ready\ndata: {{}}\n\n"
+        while time.monotonic() < deadline and not subscription.overflowed:
+            message = await subscription.get(timeout=heartbeat)
+            if message is None:
+                # Comentário SSE: mantém a conexão viva através de proxies
+                yield ': ping\n\n'
+            else:
+                yield _format_event(message)
+    finally:
+        hub.remove(subscription)
+
+
+async def event_stream(request):
+    """Stream SSE dos canais do ticket."""
+    if request.method != 'GET':
+        return HttpResponse(status=405, headers={'Allow': 'GET'})
+
+    if not isinstance(request, ASGIRequest):
+        # Sem ASGI cada conexão prenderia uma thread do worker: cliente usa poll
+        return HttpResponse(status=204)
+
+    try:
+        payload = signing.loads(
+            request.GET.get('ticket', ''), salt=TICKET_SALT, max_age=settings.EVENTS_TICKET_MAX_AGE
+        )
+    except signing.BadSignature:
+        return JsonResponse({'detail': 'Ticket inválido ou expirado.'}, status=401)
+
+    await get_event_bus().ensure_listening()
+    subscription = Subscription(payload['c'], max_queue=settings.EVENTS_QUEUE_SIZE)
+
+    response = StreamingHttpResponse(_event_source(subscription), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Nginx não deve acumular a resposta, e o GZipMiddleware não deve comprimi-la
+    # (compressão por bloco quebraria o stream)
+    response['X-Accel-Buffering'] = 'no'
+    response['Content-Encoding'] = 'identity'
+    return response
@@ -0,0 +1,198 @@
+"""
+Barramento de eventos em tempo real (Server-Sent Events).
+
+Serviços e views publicam eventos com publish() (após o commit da transação). O
+backend do barramento entrega cada evento ao processo ASGI que mantém as conexões
+SSE (app.event_views.event_stream), e o _Hub do processo repassa à fila asyncio de
+cada conexão inscrita no canal. Conexões ociosas ficam apenas aguardando a fila:
+nenhuma consulta ao banco e nenhuma requisição até que haja um evento.
+
+Backends (settings.EVENT_BUS_BACKEND):
+    RedisEventBus       Redis pub/sub: publicação em qualquer worker (gunicorn,
+                        comandos) chega aos processos ASGI; um único listener por processo
+    InProcessEventBus   memória do processo (desenvolvimento e testes)
+
+Canais:
+    user:<id>     eventos de um usuário (ex.: notificações do candidato)
+    recruiters    painel dos recrutadores (status de perfil, documentos, etapas, contadores)
+
+Uso:
+    from app.events import RECRUITERS_CHANNEL, publish
+    publish(RECRUITERS_CHANNEL, 'profile_status', {'profile_ids': [1, 2], 'status': 'approved'})
+"""
+import asyncio
+import json
+import logging
+import threading
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger('app')
+
+RECRUITERS_CHANNEL = 'recruiters'
+
+
+def user_channel(user_id):
+    return f'user:{user_id}'
+
+
+class Subscription:
+    """Fila de eventos de uma conexão SSE (vive no event loop da conexão)."""
+
+    def __init__(self, channels, max_queue=100):
+        self.channels = tuple(channels)
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(max_queue)
+        # Cliente lento demais: a conexão é encerrada e ele se ressincroniza ao reconectar
+        self.overflowed = False
+
+    def deliver(self, message):
+        """Entrega o evento; pode ser chamado de qualquer thread."""
+        try:
+            self.loop.call_soon_threadsafe(self._put, message)
+        except RuntimeError:
+            # Event loop já encerrado (conexão finalizada)
+            pass
+
+    def _put(self, message):
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def get(self, timeout):
+        """Próximo evento, ou None se nada chegar em `timeout` segundos."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class _Hub:
+    """Conexões SSE inscritas em cada canal, no processo atual."""
+
+    def __init__(self):
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def add(self, subscription):
+        with self._lock:
+            for channel in subscription.channels:
+                self._subscribers.setdefault(channel, set()).add(subscription)
+
+    def remove(self, subscription):
+        with self._lock:
+            for channel in subscription.channels:
+                subscribers = self._subscribers.get(channel)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscribers[channel]
+
+    def dispatch(self, channel, message):
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for subscription in subscribers:
+            subscription.deliver(message)
+
+    def connection_count(self):
+        with self._lock:
+            return len({s for subscribers in self._subscribers.values() for s in subscribers})
+
+
+hub = _Hub()
+
+
+class InProcessEventBus:
+    """Entrega direta ao _Hub: publicação e conexões precisam estar no mesmo processo."""
+
+    def publish(self, channel, message):
+        hub.dispatch(channel, message)
+
+    async def ensure_listening(self):
+        pass
+
+
+class RedisEventBus:
+    """Redis pub/sub: um listener por processo ASGI repassa os eventos ao _Hub."""
+
+    CHANNEL_PREFIX = 'bancotalentos:events:'
+    RECONNECT_DELAY = 2
+
+    def __init__(self, url=None):
+        self.url = url or settings.REDIS_URL
+        self._client = None
+        self._listener = None
+        self._client_lock = threading.Lock()
+
+    def _get_client(self):
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    import redis
+                    self._client = redis.Redis.from_url(
+                        self.url, socket_timeout=2, socket_connect_timeout=2
+                    )
+        return self._client
+
+    def publish(self, channel, message):
+        self._get_client().publish(self.CHANNEL_PREFIX + channel, json.dumps(message, default=str))
+
+    async def ensure_listening(self):
+        # Um listener por event loop (processo ASGI); recriado se tiver terminado
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.get_running_loop().create_task(self._listen())
+
+    async def _listen(self):
+        import redis.asyncio as aioredis
+
+        pattern = self.CHANNEL_PREFIX + '*'
+        while True:
+            client = aioredis.Redis.from_url(self.url, socket_connect_timeout=2)
+            try:
+                async with client.pubsub() as pubsub:
+                    await pubsub.psubscribe(pattern)
+                    async for item in pubsub.listen():
+                        if item.get('type') != 'pmessage':
+                            continue
+                        channel = item['channel'].decode()[len(self.CHANNEL_PREFIX):]
+                        try:
+                            hub.dispatch(channel, json.loads(item['data']))
+                        except ValueError:
+                            logger.warning(f'Evento inválido no canal {channel}')
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f'Listener de eventos (Redis) desconectado: {e}')
+            finally:
+                await client.aclose()
+            await asyncio.sleep(self.RECONNECT_DELAY)
+
+
+_bus = None
+
+
+def get_event_bus():
+    global _bus
+    if _bus is None:
+        _bus = import_string(settings.EVENT_BUS_BACKEND)()
+    return _bus
+
+
+def _send(channel, message):
+    try:
+        get_event_bus().publish(channel, message)
+    except Exception as e:
+        # Tempo real é melhor esforço: falha no barramento não afeta a requisição
+        logger.warning(f'Erro ao publicar evento "{message["event"]}" em {channel}: {e}')
+
+
+def publish(channel, event, data=None):
+    """
+    Publica um evento no canal após o commit da transação atual
+    (descartado em rollback, como app.background.submit_on_commit).
+    """
+    message = {'event': event, 'data': data or {}}
+    transaction.on_commit(lambda: _send(channel, message))
@@ -0,0 +1,388 @@
+"""
+Instrumentação por requisição: para onde vai o tempo de cada requisição.
+
+RequestInstrumentationMiddleware mede, por requisição:
+    - queries SQL (quantidade e tempo), via connection.execute_wrapper
+    - acertos/faltas de cache (record_cache, chamado por app.cache e pelos serviços)
+    - chamadas externas por serviço (track_external: Evolution API, OpenAI, Oracle)
+    - tempo dos serializers do DRF (Serializer.data; inclui as queries que disparam)
+    - queries repetidas com o mesmo formato (N+1), com o local do código que as
+      dispara: amostragem em produção (NPLUSONE_SAMPLE_RATE, log em "app.queries")
+      e, com NPLUSONE_RAISE (padrão nos testes), RepeatedQueriesError
+
+Saídas:
+    - cabeçalho Server-Timing para usuários staff (DevTools > Network > Timing)
+    - uma linha de log JSON (logger "app.requests") para as requisições sorteadas
+      (REQUEST_METRICS_SAMPLE_RATE) ou mais lentas que REQUEST_METRICS_SLOW_MS
+    - métricas do Prometheus (app.metrics), com METRICS_ENABLED
+
+Respostas em streaming (exportações) são medidas até o fim do envio; o
+Server-Timing delas cobre só a parte da view (os cabeçalhos saem antes do corpo).
+O stream de eventos (SSE) não é acompanhado: a conexão dura horas.
+
+Tarefas em segundo plano (app.background) rodam em outras threads e não entram
+na conta da requisição.
+
+Uso nos serviços:
+    with track_external('evolution_api'):
+        response = requests.post(...)
+
+    record_cache('dashboard_stats_result', hit=True)
+"""
+import json
+import logging
+import os
+import random
+import re
+import sys
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+
+from app import metrics as prometheus
+
+logger = logging.getLogger('app.requests')
+queries_logger = logging.getLogger('app.queries')
+
+_current = ContextVar('request_metrics', default=None)
+
+_WHITESPACE = re.compile(r'\s+')
+_IN_LIST = re.compile(r'\bIN \([^()]*\)', re.IGNORECASE)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+
+
+class RepeatedQueriesError(Exception):
+    """Query com o mesmo formato repetida acima do limite numa requisição (N+1)."""
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(sql):
+    """Formato da query: sem literais e com listas IN (...) de qualquer tamanho iguais."""
+    sql = _WHITESPACE.sub(' ', sql).strip()
+    sql = _IN_LIST.sub('IN (...)', sql)
+    sql = _STRING.sub('?', sql)
+    return _NUMBER.sub('?', sql)
+
+
+def find_repeated_queries(sqls, threshold):
+    """{formato: quantidade} dos formatos que aparecem `threshold` vezes ou mais."""
+    counts = {}
+    for sql in sqls:
+        shape = fingerprint(sql)
+        counts[shape] = counts.get(shape, 0) + 1
+    return {shape: count for shape, count in counts.items() if count >= threshold}
+
+
+def _code_location():
+    """
+    Frame mais interno do código do projeto (fora de bibliotecas e deste módulo)
+    ou, se antes dele a query vem do DRF (campo com source='fk.campo'), o
+    serializer e o campo.
+    """
+    base_dir = str(settings.BASE_DIR) + os.sep
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (filename.startswith(base_dir) and filename != __file__
+                and 'site-packages' not in filename):
+            relative = filename[len(base_dir):]
+            return f'{relative}:{frame.f_lineno} em {frame.f_code.co_name}'
+        if frame.f_code.co_name == 'to_representation':
+            field = frame.f_locals.get('field')
+            if field is not None and hasattr(field, 'field_name'):
+                return f'{type(frame.f_locals["self"]).__name__}.{field.field_name}'
+        frame = frame.f_back
+    return None
+
+
+class RequestMetrics:
+    """Contadores de uma requisição."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.db_queries = 0
+        self.db_ms = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # serviço -> {'calls': n, 'ms': total, 'errors': n}
+        self.external = {}
+        self.serializer_ms = 0.0
+        self.serializer_depth = 0
+        # formato -> contagem (None: detecção de N+1 desligada nesta requisição)
+        self.query_shapes = None
+        # formato -> local do código que atingiu o limite
+        self.repeated = {}
+        self.repeat_threshold = None
+        self.repeat_strict = False
+
+    @property
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    def start_query_detection(self, threshold, strict=False):
+        self.query_shapes = {}
+        self.repeat_threshold = threshold
+        self.repeat_strict = strict
+
+    def count_query(self, sql):
+        shape = fingerprint(sql)
+        count = self.query_shapes.get(shape, 0) + 1
+        self.query_shapes[shape] = count
+        if count == self.repeat_threshold:
+            location = _code_location()
+            self.repeated[shape] = location
+            if self.repeat_strict:
+                raise RepeatedQueriesError(
+                    f'{count} queries com o mesmo formato ({location or "local desconhecido"}): {shape[:300]}'
+                )
+
+    def add_external(self, service, ms, failed):
+        entry = self.external.setdefault(service, {'calls': 0, 'ms': 0.0, 'errors': 0})
+        entry['calls'] += 1
+        entry['ms'] += ms
+        entry['errors'] += int(failed)
+
+
+def current_metrics():
+    """Métricas da requisição em andamento (None fora de requisições instrumentadas)."""
+    return _current.get()
+
+
+def record_cache(name, hit):
+    """Registra um acerto/falta de cache da chave `name` (nome base, sem versões)."""
+    prometheus.cache_read(name, hit)
+    metrics = _current.get()
+    if metrics is not None:
+        if hit:
+            metrics.cache_hits += 1
+        else:
+            metrics.cache_misses += 1
+
+
+@contextmanager
+def track_external(service):
+    """Mede uma chamada a serviço externo (também serve como decorator)."""
+    started = time.perf_counter()
+    failed = False
+    try:
+        yield
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        prometheus.external_call(service, elapsed, failed)
+        metrics = _current.get()
+        if metrics is not None:
+            metrics.add_external(service, elapsed * 1000, failed)
+
+
+def _db_wrapper(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is not None and metrics.query_shapes is not None:
+        metrics.count_query(sql)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        if metrics is not None:
+            metrics.db_queries += 1
+            metrics.db_ms += (time.perf_counter() - started) * 1000
+
+
+def _db_wrappers():
+    stack = ExitStack()
+    for alias in connections:
+        stack.enter_context(connections[alias].execute_wrapper(_db_wrapper))
+    return stack
+
+
+@contextmanager
+def collecting(metrics):
+    """Acumula em `metrics` o que roda no bloco (queries, cache, chamadas externas)."""
+    token = _current.set(metrics)
+    try:
+        with _db_wrappers():
+            yield metrics
+    finally:
+        _current.reset(token)
+
+
+def _install_serializer_timing():
+    """Envolve BaseSerializer.data (usado por Serializer e ListSerializer)."""
+    from rest_framework.serializers import BaseSerializer
+
+    if getattr(BaseSerializer, '_instrumented', False):
+        return
+    original = BaseSerializer.data.fget
+
+    def data(self):
+        metrics = _current.get()
+        # Serializers aninhados que chamam .data entram na conta do externo
+        if metrics is None or metrics.serializer_depth:
+            return original(self)
+        metrics.serializer_depth += 1
+        started = time.perf_counter()
+        try:
+            return original(self)
+        finally:
+            metrics.serializer_depth -= 1
+            metrics.serializer_ms += (time.perf_counter() - started) * 1000
+
+    BaseSerializer.data = property(data)
+    BaseSerializer._instrumented = True
+
+
+def server_timing(metrics):
+    """Valor do cabeçalho Server-Timing."""
+    parts = [
+        f'db;dur={metrics.db_ms:.1f};desc="{metrics.db_queries} queries"',
+        f'cache;desc="{metrics.cache_hits} hit {metrics.cache_misses} miss"',
+        f'serializer;dur={metrics.serializer_ms:.1f}',
+    ]
+    for service, entry in sorted(metrics.external.items()):
+        parts.append(f'ext-{service};dur={entry["ms"]:.1f};desc="{entry["calls"]} calls"')
+    parts.append(f'total;dur={metrics.elapsed_ms:.1f}')
+    return ', '.join(parts)
+
+
+def log_record(request, response, metrics, streaming=False):
+    """Campos da linha de log estruturada."""
+    user = getattr(request, 'user', None)
+    match = getattr(request, 'resolver_match', None)
+    return {
+        'event': 'request',
+        'method': request.method,
+        'path': request.path,
+        'view': match.view_name if match else None,
+        'status': response.status_code,
+        'user_id': user.pk if user is not None and user.is_authenticated else None,
+        'duration_ms': round(metrics.elapsed_ms, 1),
+        'db_queries': metrics.db_queries,
+        'db_ms': round(metrics.db_ms, 1),
+        'cache_hits': metrics.cache_hits,
+        'cache_misses': metrics.cache_misses,
+        'serializer_ms': round(metrics.serializer_ms, 1),
+        'external': {
+            service: {'calls': entry['calls'], 'ms': round(entry['ms'], 1), 'errors': entry['errors']}
+            for service, entry in metrics.external.items()
+        },
+        'streaming': streaming,
+    }
+
+
+class RequestInstrumentationMiddleware:
+    """
+    Coleta RequestMetrics de cada requisição instrumentada: as sorteadas pela taxa
+    de amostragem ou, com REQUEST_METRICS_SERVER_TIMING ou METRICS_ENABLED, todas
+    (o cabeçalho só sai para staff, que não dá para identificar antes da
+    autenticação JWT da view).
+
+    Sob ASGI (serviço de eventos/SSE) não instrumenta: só repassa a requisição.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        self.sample_rate = getattr(settings, 'REQUEST_METRICS_SAMPLE_RATE', 0.0)
+        self.server_timing = getattr(settings, 'REQUEST_METRICS_SERVER_TIMING', False)
+        self.slow_ms = getattr(settings, 'REQUEST_METRICS_SLOW_MS', None)
+        self.prometheus = getattr(settings, 'METRICS_ENABLED', False)
+        self.detect_rate = getattr(settings, 'NPLUSONE_SAMPLE_RATE', 0.0)
+        self.detect_threshold = getattr(settings, 'NPLUSONE_THRESHOLD', 10)
+        self.detect_strict = getattr(settings, 'NPLUSONE_RAISE', False)
+        _install_serializer_timing()
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        sampled = self.sample_rate > 0 and random.random() < self.sample_rate
+        detect = self.detect_strict or (self.detect_rate > 0 and random.random() < self.detect_rate)
+        if not sampled and not self.server_timing and not self.prometheus and not detect:
+            return self.get_response(request)
+
+        metrics = RequestMetrics()
+        if detect:
+            metrics.start_query_detection(self.detect_threshold, strict=self.detect_strict)
+        if self.prometheus:
+            prometheus.request_started()
+        try:
+            with collecting(metrics):
+                response = self.get_response(request)
+        except BaseException:
+            if self.prometheus:
+                prometheus.request_aborted()
+            raise
+
+        user = getattr(request, 'user', None)
+        if self.server_timing and user is not None and user.is_staff:
+            response['Server-Timing'] = server_timing(metrics)
+            # Frontend em outra origem: sem isso o navegador esconde os tempos
+            if request.headers.get('Origin'):
+                response['Timing-Allow-Origin'] = request.headers['Origin']
+
+        if response.streaming and not response.is_async:
+            if response.get('Content-Type', '').startswith('text/event-stream'):
+                self._finish(request, response, metrics, sampled, streaming=True)
+            else:
+                response.streaming_content = self._measure_stream(
+                    request, response, metrics, sampled, response.streaming_content
+                )
+        else:
+            self._finish(request, response, metrics, sampled)
+        return response
+
+    async def __acall__(self, request):
+        return await self.get_response(request)
+
+    def _measure_stream(self, request, response, metrics, sampled, content):
+        # A geração do conteúdo (ex.: exportação) roda em next(), fora do middleware.
+        # Sem detecção de N+1: a leitura em lotes repete a mesma query por lote.
+        shapes, metrics.query_shapes = metrics.query_shapes, None
+        iterator = iter(content)
+        try:
+            while True:
+                try:
+                    with collecting(metrics):
+                        chunk = next(iterator)
+                except StopIteration:
+                    break
+                yield chunk
+        finally:
+            metrics.query_shapes = shapes
+            self._finish(request, response, metrics, sampled, streaming=True)
+
+    def _finish(self, request, response, metrics, sampled, streaming=False):
+        if self.prometheus:
+            prometheus.request_finished(request, response, metrics)
+        if metrics.repeated:
+            self._log_repeated(request, metrics)
+        slow = self.slow_ms is not None and metrics.elapsed_ms >= self.slow_ms
+        if sampled or slow:
+            record = log_record(request, response, metrics, streaming)
+            record['sampled'] = sampled
+            logger.info(json.dumps(record, ensure_ascii=False))
+
+    def _log_repeated(self, request, metrics):
+        match = getattr(request, 'resolver_match', None)
+        for shape, location in metrics.repeated.items():
+            queries_logger.warning(json.dumps({
+                'event': 'repeated_query',
+                'method': request.method,
+                'path': request.path,
+                'view': match.view_name if match else None,
+                'count': metrics.query_shapes[shape],
+                'threshold': metrics.repeat_threshold,
+                'location': location,
+                'sql': shape[:500],
+            }, ensure_ascii=False))
@@ -0,0 +1,161 @@
+"""
+Métricas no formato de exposição do Prometheus (GET /metrics).
+
+Alimentadas pela instrumentação por requisição (app.instrumentation):
+    - latência das requisições por view do DRF (basename-ação), método e status
+    - requisições em andamento (ocupação das threads dos workers)
+    - queries SQL por requisição
+    - acertos/faltas de cache por nome de chave (record_cache)
+    - latência e falhas de serviços externos (track_external: evolution_api,
+      openai, oracle, oracle_connect)
+
+Com vários workers do gunicorn cada processo escreve os valores em arquivos no
+diretório PROMETHEUS_MULTIPROC_DIR (definido em gunicorn.conf.py) e a view soma
+os arquivos de todos os processos. Sem a variável (runserver, comandos) as
+métricas ficam só na memória do processo.
+
+Acesso (METRICS_ENABLED, METRICS_LOCAL_ONLY, METRICS_ALLOWED_NETWORKS,
+METRICS_TOKEN): o Nginx não encaminha /metrics; com METRICS_LOCAL_ONLY só responde
+ao loopback e às redes de METRICS_ALLOWED_NETWORKS (CIDR, ex.: a sub-rede do Docker
+em que roda o Prometheus) e, com METRICS_TOKEN, exige o cabeçalho
+"Authorization: Bearer <token>". Outros endereços privados (RFC 1918, ULA) não são
+aceitos por padrão.
+"""
+import functools
+import hmac
+import ipaddress
+import os
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse, HttpResponseForbidden, HttpResponseNotFound
+from django.views.decorators.http import require_GET
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest,
+)
+from prometheus_client import multiprocess
+
+# Views sem rota (404) entram num rótulo só, para não explodir a cardinalidade
+UNRESOLVED_VIEW = '<unresolved>'
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    'Latência das requisições (até o fim do envio, em streaming)',
+    ['view', 'method', 'status'],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    'http_requests_in_progress',
+    'Requisições em andamento (somadas entre os workers vivos)',
+    multiprocess_mode='livesum',
+)
+REQUEST_DB_QUERIES = Histogram(
+    'http_request_db_queries',
+    'Queries SQL por requisição',
+    ['view'],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+CACHE_REQUESTS = Counter(
+    'app_cache_requests_total',
+    'Leituras de cache por nome de chave',
+    ['name', 'result'],
+)
+EXTERNAL_LATENCY = Histogram(
+    'app_external_request_duration_seconds',
+    'Latência das chamadas a serviços externos',
+    ['service'],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+EXTERNAL_FAILURES = Counter(
+    'app_external_request_failures_total',
+    'Chamadas a serviços externos que terminaram em exceção',
+    ['service'],
+)
+
+
+def request_started():
+    REQUESTS_IN_PROGRESS.inc()
+
+
+def request_aborted():
+    """A view levantou exceção sem virar resposta."""
+    REQUESTS_IN_PROGRESS.dec()
+
+
+def request_finished(request, response, metrics):
+    """Registra a requisição concluída (metrics: app.instrumentation.RequestMetrics)."""
+    REQUESTS_IN_PROGRESS.dec()
+    match = getattr(request, 'resolver_match', None)
+    view = match.view_name if match and match.view_name else UNRESOLVED_VIEW
+    REQUEST_LATENCY.labels(view, request.method, str(response.status_code)).observe(
+        metrics.elapsed_ms / 1000
+    )
+    REQUEST_DB_QUERIES.labels(view).observe(metrics.db_queries)
+
+
+def cache_read(name, hit):
+    CACHE_REQUESTS.labels(name, 'hit' if hit else 'miss').inc()
+
+
+def external_call(service, seconds, failed):
+    EXTERNAL_LATENCY.labels(service).observe(seconds)
+    if failed:
+        EXTERNAL_FAILURES.labels(service).inc()
+
+
+def render_metrics():
+    """Texto de exposição com os valores agregados de todos os workers."""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry)
+
+
+@functools.lru_cache(maxsize=8)
+def _allowed_networks(values):
+    try:
+        return [ipaddress.ip_network(value, strict=False) for value in values]
+    except ValueError as error:
+        raise ImproperlyConfigured(f'METRICS_ALLOWED_NETWORKS inválido: {error}') from error
+
+
+def _is_local(request):
+    # Requisições vindas pelo Nginx trazem o IP do cliente nesses cabeçalhos
+    if 'HTTP_X_FORWARDED_FOR' in request.META or 'HTTP_X_REAL_IP' in request.META:
+        return False
+    try:
+        address = ipaddress.ip_address(request.META.get('REMOTE_ADDR', ''))
+    except ValueError:
+        return False
+    # IPv4 em socket IPv6 (::ffff:127.0.0.1)
+    address = getattr(address, 'ipv4_mapped', None) or address
+    if address.is_loopback:
+        return True
+    networks = _allowed_networks(tuple(getattr(settings, 'METRICS_ALLOWED_NETWORKS', ())))
+    return any(address in network for network in networks)
+
+
+def _has_token(request, token):
+    header = request.headers.get('Authorization', '')
+    scheme, _, value = header.partition(' ')
+    return scheme.lower() == 'bearer' and hmac.compare_digest(value.strip().encode(), token.encode())
+
+
+@require_GET
+def metrics_view(request):
+    if not getattr(settings, 'METRICS_ENABLED', False):
+        return HttpResponseNotFound()
+
+    local_only = getattr(settings, 'METRICS_LOCAL_ONLY', True)
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    # Sem nenhuma das proteções configuradas o endpoint não responde a ninguém
+    if not local_only and not token:
+        return HttpResponseForbidden()
+    if local_only and not _is_local(request):
+        return HttpResponseForbidden()
+    if token and not _has_token(request, token):
+        return HttpResponseForbidden()
+
+    return HttpResponse(render_metrics(), content_type=CONTENT_TYPE_LATEST)
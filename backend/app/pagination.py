@@ -0,0 +1,157 @@
+import base64
+import json
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(PageNumberPagination):
+    """
+    Paginação por número de página (padrão, usada pelo painel admin) com modo
+    keyset opcional ativado por ?cursor=.
+
+    No modo keyset a ordenação é fixa, definida por `cursor_ordering` na view
+    (ex.: ('-created_at', '-id')), e cada página é um WHERE sobre a última linha
+    vista servido pelo índice composto correspondente: sem COUNT(*) nem OFFSET,
+    páginas profundas custam o mesmo que a primeira.
+
+    Uso:
+        GET /api/v1/candidates/profiles/?cursor=          -> primeira página
+        GET /api/v1/candidates/profiles/?cursor=<next>    -> página seguinte
+    Resposta: {"next": url|null, "previous": url|null, "results": [...]}
+
+    Com `keyset_only=True` o modo keyset vale também sem ?cursor= (listas que
+    não precisam de número de página, como a caixa de notificações).
+    """
+
+    cursor_query_param = 'cursor'
+    cursor_ordering = None
+    keyset_only = False
+
+    def __init__(self, cursor_ordering=None, keyset_only=None, page_size=None):
+        if cursor_ordering is not None:
+            self.cursor_ordering = tuple(cursor_ordering)
+        if keyset_only is not None:
+            self.keyset_only = keyset_only
+        if page_size is not None:
+            self.page_size = page_size
+        self.keyset = False
+
+    def get_cursor_ordering(self, view):
+        return self.cursor_ordering or getattr(view, 'cursor_ordering', None)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        ordering = self.get_cursor_ordering(view)
+        requested = self.keyset_only or self.cursor_query_param in request.query_params
+        if not requested or not ordering:
+            self.keyset = False
+            return super().paginate_queryset(queryset, request, view)
+
+        self.keyset = True
+        self.request = request
+        self.page_size_value = self.get_page_size(request)
+        self.fields = [(name.lstrip('-'), name.startswith('-')) for name in ordering]
+
+        position, reverse = self._decode_cursor(request.query_params.get(self.cursor_query_param))
+
+        order_by = [
+            f'-{name}' if descending != reverse else name
+            for name, descending in self.fields
+        ]
+        if position is not None:
+            queryset = queryset.filter(self._position_filter(queryset.model, position, reverse))
+
+        rows = list(queryset.order_by(*order_by)[:self.page_size_value + 1])
+        has_more = len(rows) > self.page_size_value
+        rows = rows[:self.page_size_value]
+        if reverse:
+            rows.reverse()
+
+        if reverse:
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+        self.rows = rows
+        return rows
+
+    def _position_filter(self, model, position, reverse):
+        """(a, b) < (x, y) expandido em OR, com limite redundante em `a` para o índice."""
+        condition = Q()
+        equal = Q()
+        for (name, descending), raw in zip(self.fields, position):
+            value = model._meta.get_field(name).to_python(raw)
+            lookup = 'lt' if descending != reverse else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+
+        first_name, first_desc = self.fields[0]
+        first_value = model._meta.get_field(first_name).to_python(position[0])
+        bound = 'lte' if first_desc != reverse else 'gte'
+        return Q(**{f'{first_name}__{bound}': first_value}) & condition
+
+    def _encode_cursor(self, obj, reverse):
+        position = []
+        for name, _descending in self.fields:
+            value = getattr(obj, name)
+            position.append(value.isoformat() if hasattr(value, 'isoformat') else value)
+        payload = json.dumps({'p': position, 'r': int(reverse)}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def _decode_cursor(self, encoded):
+        if not encoded:
+            return None, False
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+            position = payload['p']
+            if not isinstance(position, list) or len(position) != len(self.fields):
+                raise ValueError
+            return position, bool(payload.get('r'))
+        except (ValueError, KeyError, TypeError):
+            raise NotFound('Cursor inválido.')
+
+    def _cursor_link(self, obj, reverse):
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, self._encode_cursor(obj, reverse))
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+        if not self.has_next or not self.rows:
+            return None
+        return self._cursor_link(self.rows[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.keyset:
+            return super().get_previous_link()
+        if not self.has_previous or not self.rows:
+            return None
+        return self._cursor_link(self.rows[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        if self.get_cursor_ordering(view):
+            parameters.append({
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Ativa a paginação keyset: vazio para a primeira página, '
+                               'depois o valor retornado em next/previous.',
+                'schema': {'type': 'string'},
+            })
+        return parameters
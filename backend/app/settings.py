@@ -30,6 +30,23 @@ ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='*', cast=lambda v: [s.strip() f
 # OpenAI
 OPENAI_API_KEY = config('OPENAI_API_KEY', default='')
 
+# Insights de IA do dashboard (candidates.services.insights_services)
+# Cliente plugável: use ...insights_services.FakeInsightsClient em testes/desenvolvimento
+AI_INSIGHTS_CLIENT = config(
+    'AI_INSIGHTS_CLIENT', default='candidates.services.insights_services.OpenAIInsightsClient'
+)
+AI_INSIGHTS_MODEL = config('AI_INSIGHTS_MODEL', default='gpt-4o-mini')
+AI_INSIGHTS_TIMEOUT = config('AI_INSIGHTS_TIMEOUT', default=30, cast=int)
+# Intervalo mínimo (segundos) entre gerações quando os dados do pipeline mudam
+AI_INSIGHTS_MIN_INTERVAL = config('AI_INSIGHTS_MIN_INTERVAL', default=300, cast=int)
+
+# Ranqueamento de candidatos por vaga (candidates.services.matching_services)
+# Cada processo mantém a matriz de atributos em memória: relê as linhas alteradas no
+# máximo a cada MATCHING_REFRESH_INTERVAL segundos e recarrega tudo a cada
+# MATCHING_FULL_RELOAD_INTERVAL
+MATCHING_REFRESH_INTERVAL = config('MATCHING_REFRESH_INTERVAL', default=30, cast=int)
+MATCHING_FULL_RELOAD_INTERVAL = config('MATCHING_FULL_RELOAD_INTERVAL', default=3600, cast=int)
+
 # Application definition
 DJANGO_APPS = [
     'django.contrib.admin',
@@ -39,6 +56,7 @@ DJANGO_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'django.contrib.sites',
+    'django.contrib.postgres',
 ]
 
 THIRD_PARTY_APPS = [
@@ -197,6 +215,8 @@ SPECTACULAR_SETTINGS = {
 }
 
 MIDDLEWARE = [
+    # Primeiro: mede a requisição inteira (app.instrumentation)
+    'app.instrumentation.RequestInstrumentationMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.gzip.GZipMiddleware',
     'django.middleware.security.SecurityMiddleware',
@@ -210,6 +230,34 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Instrumentação por requisição (app.instrumentation): fração das requisições com
+# linha de log estruturada (queries, cache, chamadas externas, serializers); as mais
+# lentas que REQUEST_METRICS_SLOW_MS são sempre registradas. Com SERVER_TIMING (desligado
+# por padrão; ativar no .env de cada ambiente), toda requisição é medida e usuários
+# staff recebem o cabeçalho Server-Timing.
+REQUEST_METRICS_SAMPLE_RATE = config('REQUEST_METRICS_SAMPLE_RATE', default=0.05, cast=float)
+REQUEST_METRICS_SLOW_MS = config('REQUEST_METRICS_SLOW_MS', default=1000, cast=int)
+REQUEST_METRICS_SERVER_TIMING = config('REQUEST_METRICS_SERVER_TIMING', default=False, cast=bool)
+
+# Detector de N+1 (app.instrumentation): queries com o mesmo formato repetidas
+# NPLUSONE_THRESHOLD vezes numa requisição são registradas no log "app.queries"
+# (fração NPLUSONE_SAMPLE_RATE das requisições) ou, com NPLUSONE_RAISE, levantam
+# RepeatedQueriesError em todas (ligado nos testes por app/settings_test.py).
+NPLUSONE_SAMPLE_RATE = config('NPLUSONE_SAMPLE_RATE', default=0.01, cast=float)
+NPLUSONE_THRESHOLD = config('NPLUSONE_THRESHOLD', default=10, cast=int)
+NPLUSONE_RAISE = config('NPLUSONE_RAISE', default=False, cast=bool)
+
+# Métricas do Prometheus em /metrics (app.metrics). LOCAL_ONLY aceita só o loopback e
+# as redes de ALLOWED_NETWORKS (CIDR separados por vírgula, ex.: a sub-rede do Docker)
+# sem passar pelo Nginx; TOKEN exige "Authorization: Bearer".
+METRICS_ENABLED = config('METRICS_ENABLED', default=True, cast=bool)
+METRICS_LOCAL_ONLY = config('METRICS_LOCAL_ONLY', default=True, cast=bool)
+METRICS_ALLOWED_NETWORKS = config(
+    'METRICS_ALLOWED_NETWORKS', default='',
+    cast=lambda v: [s.strip() for s in v.split(',') if s.strip()]
+)
+METRICS_TOKEN = config('METRICS_TOKEN', default='')
+
 ROOT_URLCONF = 'app.urls'
 
 TEMPLATES = [
@@ -230,15 +278,51 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'app.wsgi.application'
 
-# Database
-# Cache em memória (para lookups Oracle e dados estáticos)
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'bancotalentos-cache',
-        'TIMEOUT': 3600,
+# Cache compartilhado entre workers (Redis) quando REDIS_URL estiver definido;
+# em desenvolvimento cai para cache em memória do processo (testes: app/settings_test.py).
+# Invalidação por versão de modelo e comportamento com o Redis fora do ar: app.cache
+REDIS_URL = config('REDIS_URL', default='')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'TIMEOUT': 3600,
+            'KEY_PREFIX': 'bancotalentos',
+            'OPTIONS': {
+                'socket_connect_timeout': 2,
+                'socket_timeout': 2,
+            },
+        }
     }
-}
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'bancotalentos-cache',
+            'TIMEOUT': 3600,
+        }
+    }
+
+# Validade dos valores com chave versionada (app.cache): a invalidação é feita
+# pela troca de versão, então o TTL serve só para liberar memória
+CACHE_VERSIONED_TIMEOUT = config('CACHE_VERSIONED_TIMEOUT', default=86400, cast=int)
+
+# Eventos em tempo real (SSE, app.events): Redis pub/sub entre processos quando
+# REDIS_URL estiver definido; senão, em memória (publicação e stream no mesmo processo).
+# O stream só é servido sob ASGI (serviço "events"); sob WSGI o frontend usa poll.
+if REDIS_URL:
+    EVENT_BUS_BACKEND = 'app.events.RedisEventBus'
+else:
+    EVENT_BUS_BACKEND = 'app.events.InProcessEventBus'
+EVENTS_TICKET_MAX_AGE = config('EVENTS_TICKET_MAX_AGE', default=300, cast=int)
+EVENTS_HEARTBEAT_INTERVAL = config('EVENTS_HEARTBEAT_INTERVAL', default=25, cast=int)
+# Conexões são encerradas após esse tempo; o cliente reconecta com um novo ticket
+EVENTS_MAX_CONNECTION_AGE = config('EVENTS_MAX_CONNECTION_AGE', default=3600, cast=int)
+EVENTS_RETRY_MS = 5000
+EVENTS_QUEUE_SIZE = 100
+
+# Database
 
 # Usa PostgreSQL se POSTGRES_HOST estiver definido, senão SQLite
 POSTGRES_HOST = config('POSTGRES_HOST', default='')
@@ -355,6 +439,12 @@ EVOLUTION_API_URL = config('EVOLUTION_API_URL', default='')
 EVOLUTION_API_KEY = config('EVOLUTION_API_KEY', default='')
 EVOLUTION_INSTANCE_NAME = config('EVOLUTION_INSTANCE_NAME', default='')
 
+# Tarefas em segundo plano (app.background): notificações e integrações lentas
+# executadas fora do ciclo da requisição, após o commit da transação
+BACKGROUND_WORKERS = config('BACKGROUND_WORKERS', default=4, cast=int)
+# Em testes/scripts, executa as tarefas de forma síncrona
+BACKGROUND_TASKS_EAGER = config('BACKGROUND_TASKS_EAGER', default=False, cast=bool)
+
 # Email Configuration
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 EMAIL_HOST = config('EMAIL_HOST', default='mail.tesseratointegra.com.br')
@@ -422,5 +512,10 @@ LOGGING = {
             'level': 'INFO',
             'propagate': False,
         },
+        'app': {
+            'handlers': ['console', 'file'],
+            'level': 'INFO',
+            'propagate': False,
+        },
     },
 }
@@ -0,0 +1,23 @@
+"""
+Settings dos testes (pytest.ini): os de app.settings com cache e eventos em
+memória, hash de senha rápido e o detector de N+1 em modo estrito.
+"""
+import os
+
+os.environ.setdefault('SECRET_KEY', 'testes-sem-segredo')
+
+from app.settings import *  # noqa: E402,F401,F403
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'bancotalentos-testes',
+    }
+}
+EVENT_BUS_BACKEND = 'app.events.InProcessEventBus'
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+# Queries repetidas (N+1) levantam RepeatedQueriesError em vez de irem para o log
+NPLUSONE_RAISE = True
+REQUEST_METRICS_SAMPLE_RATE = 0
+REQUEST_METRICS_SERVER_TIMING = False
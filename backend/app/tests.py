@@ -0,0 +1,308 @@
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from app.benchmark import check_results, run_benchmarks
+from app.utils import parse_brl_amount
+
+
+@pytest.mark.django_db
+def test_benchmark_hot_endpoints_within_budgets():
+    call_command('generate_synthetic_data', count=200, seed=7, stdout=StringIO())
+
+    results = run_benchmarks(iterations=2)
+
+    assert results['meta']['candidates'] == 200
+    assert not any('skipped' in metrics for metrics in results['endpoints'].values())
+    assert check_results(results) == []
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('R$ 3.500,00', Decimal('3500.00')),
+    ('R$\xa03.500,00', Decimal('3500.00')),
+    ('3.500', Decimal('3500.00')),
+    ('1.250.000', Decimal('1250000.00')),
+    ('3500.5', Decimal('3500.50')),
+    ('3500,5', Decimal('3500.50')),
+    (3500, Decimal('3500.00')),
+    (Decimal('3500.499'), Decimal('3500.50')),
+])
+def test_parse_brl_amount_accepts_known_formats(value, expected):
+    assert parse_brl_amount(value) == expected
+
+
+@pytest.mark.parametrize('value', [
+    None, '', 'R$', 'a combinar', '3.500,00,00', '3,500.00', '1.2.3', '3500,123', '-100', '99999999999,00',
+])
+def test_parse_brl_amount_rejects_junk(value):
+    assert parse_brl_amount(value) is None
+
+
+@pytest.mark.django_db
+def test_thumbnails_scheduled_only_for_new_uploads(monkeypatch, settings, tmp_path):
+    from django.core.files.uploadedfile import SimpleUploadedFile
+
+    from app import thumbnails
+    from candidates.models import CandidateProfile
+
+    settings.MEDIA_ROOT = str(tmp_path)
+    scheduled = []
+    monkeypatch.setattr(thumbnails, 'submit_on_commit', lambda func, storage, name: scheduled.append(name))
+    call_command('generate_synthetic_data', count=3, seed=10, stdout=StringIO())
+    profile = CandidateProfile.objects.first()
+
+    profile.image_profile = SimpleUploadedFile('foto.jpg', b'jpeg', content_type='image/jpeg')
+    profile.save()
+    assert scheduled == [profile.image_profile.name]
+
+    # Perfis carregados e salvos sem novo upload não geram miniaturas
+    for other in CandidateProfile.objects.all():
+        other.save()
+    profile.city = 'Curitiba'
+    profile.save(update_fields=['city', 'updated_at'])
+    assert len(scheduled) == 1
+
+
+@pytest.mark.django_db
+def test_strict_mode_raises_on_per_row_queries_in_list_serializer(settings):
+    from django.test import RequestFactory
+    from rest_framework import serializers
+    from rest_framework.response import Response
+
+    from app.instrumentation import RepeatedQueriesError, RequestInstrumentationMiddleware
+    from candidates.models import CandidateProfile
+
+    class ProfileEmailSerializer(serializers.ModelSerializer):
+        email = serializers.CharField(source='user.email')
+
+        class Meta:
+            model = CandidateProfile
+            fields = ['id', 'email']
+
+    def view(queryset):
+        return lambda request: Response(ProfileEmailSerializer(queryset, many=True).data)
+
+    assert settings.NPLUSONE_RAISE
+    call_command('generate_synthetic_data', count=settings.NPLUSONE_THRESHOLD + 2, seed=13, stdout=StringIO())
+    request = RequestFactory().get('/')
+
+    # Um SELECT do usuário por linha
+    with pytest.raises(RepeatedQueriesError, match='ProfileEmailSerializer.email'):
+        RequestInstrumentationMiddleware(view(CandidateProfile.objects.all()))(request)
+
+    response = RequestInstrumentationMiddleware(view(CandidateProfile.objects.select_related('user')))(request)
+    assert len(response.data) == settings.NPLUSONE_THRESHOLD + 2
+
+
+class _RedisDown:
+    """Substitui as operações do cache por falhas de conexão do Redis."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def fail(self, *args, **kwargs):
+        from redis.exceptions import ConnectionError as RedisConnectionError
+
+        self.calls += 1
+        raise RedisConnectionError('Error 111 connecting to redis:6379. Connection refused.')
+
+
+@pytest.mark.django_db
+def test_cache_outage_fails_open_on_the_write_path(monkeypatch, django_capture_on_commit_callbacks):
+    from django.core.cache import caches
+
+    from admission.models import DocumentType
+    from app import cache as app_cache
+    from candidates.models import CandidateProfile
+    from candidates.services.pipeline_services import get_required_document_type_ids, refresh_pipeline_status
+
+    call_command('generate_synthetic_data', count=5, seed=14, stdout=StringIO())
+    required = get_required_document_type_ids()
+    version = app_cache.get_model_versions([DocumentType])
+    profile = CandidateProfile.objects.first()
+
+    down = _RedisDown()
+    monkeypatch.setattr(app_cache, '_unavailable_until', 0.0)
+    with monkeypatch.context() as outage:
+        for method in ('get', 'get_many', 'set', 'add', 'incr', 'delete'):
+            outage.setattr(type(caches['default']), method, down.fail)
+
+        # Gravações seguem pelo banco: sem cache, sem erro
+        with django_capture_on_commit_callbacks(execute=True):
+            DocumentType.objects.filter(is_required=True).first().save()
+            profile.city = 'Londrina'
+            profile.save()
+            refresh_pipeline_status([profile.pk])
+        assert get_required_document_type_ids() == required
+        assert app_cache.get_or_compute('teste_fail_open', lambda: 42, soft_ttl=10) == 42
+        # Depois da primeira falha o cache não é consultado até CACHE_RETRY_AFTER
+        assert down.calls == 1
+        assert app_cache._pending_bumps == {'admission.documenttype'}
+
+    # Cache de volta: a troca de versão perdida é reenviada antes da próxima leitura
+    monkeypatch.setattr(app_cache, '_unavailable_until', 0.0)
+    assert app_cache.get_model_versions([DocumentType]) == [version[0] + 1]
+    assert not app_cache._pending_bumps
+
+
+def _run_concurrently(count, func):
+    import threading
+
+    barrier = threading.Barrier(count)
+    outcomes = [None] * count
+
+    def run(index):
+        barrier.wait()
+        try:
+            outcomes[index] = func()
+        except Exception as e:
+            outcomes[index] = e
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def test_get_or_compute_single_call_when_compute_fails():
+    import time
+
+    from django.core.cache import cache
+
+    from app.cache import ComputationUnavailable, get_or_compute
+
+    cache.clear()
+    calls = []
+
+    def failing():
+        calls.append(1)
+        time.sleep(0.2)
+        raise ConnectionError('Oracle indisponível')
+
+    outcomes = _run_concurrently(8, lambda: get_or_compute(
+        'teste_falha', failing, soft_ttl=60, lock_timeout=120, jitter=0
+    ))
+
+    assert len(calls) == 1
+    assert sum(isinstance(outcome, ConnectionError) for outcome in outcomes) == 1
+    assert sum(isinstance(outcome, ComputationUnavailable) for outcome in outcomes) == 7
+    # Quem chega logo depois também não repete a chamada
+    with pytest.raises(ComputationUnavailable):
+        get_or_compute('teste_falha', failing, soft_ttl=60, jitter=0)
+    assert len(calls) == 1
+
+
+def test_get_or_compute_waiters_give_up_after_wait_timeout():
+    import time
+
+    from django.core.cache import cache
+
+    from app.cache import ComputationUnavailable, get_or_compute
+
+    cache.clear()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.5)
+        return 'valor'
+
+    started = time.monotonic()
+    outcomes = _run_concurrently(4, lambda: get_or_compute(
+        'teste_lento', slow, soft_ttl=60, lock_timeout=120, wait_timeout=0.1, jitter=0
+    ))
+
+    assert len(calls) == 1
+    assert outcomes.count('valor') == 1
+    assert sum(isinstance(outcome, ComputationUnavailable) for outcome in outcomes) == 3
+    assert time.monotonic() - started < 1
+    assert get_or_compute('teste_lento', slow, soft_ttl=60) == 'valor'
+    assert len(calls) == 1
+
+
+def test_get_or_compute_recomputes_once_when_value_is_not_cached():
+    import time
+
+    from django.core.cache import cache
+
+    from app.cache import get_or_compute
+
+    cache.clear()
+    running = []
+    overlaps = []
+
+    def rejected():
+        running.append(1)
+        overlaps.append(len(running))
+        time.sleep(0.1)
+        running.pop()
+        return None
+
+    # Valor recusado por should_cache: os que aguardam recalculam um de cada vez
+    outcomes = _run_concurrently(4, lambda: get_or_compute(
+        'teste_recusado', rejected, soft_ttl=60, jitter=0, should_cache=lambda value: value is not None
+    ))
+
+    assert outcomes == [None] * 4
+    assert overlaps == [1, 1, 1, 1]
+
+
+@pytest.mark.parametrize('local_only, networks, token, meta, expected', [
+    # Só o loopback (IPv4, IPv6 e IPv4 em socket IPv6)
+    (True, [], '', {'REMOTE_ADDR': '127.0.0.1'}, 200),
+    (True, [], '', {'REMOTE_ADDR': '::1'}, 200),
+    (True, [], '', {'REMOTE_ADDR': '::ffff:127.0.0.1'}, 200),
+    # Rede privada (RFC 1918/ULA) não basta sem METRICS_ALLOWED_NETWORKS
+    (True, [], '', {'REMOTE_ADDR': '172.18.0.5'}, 403),
+    (True, [], '', {'REMOTE_ADDR': 'fd00::5'}, 403),
+    (True, ['172.18.0.0/16'], '', {'REMOTE_ADDR': '172.18.0.5'}, 200),
+    (True, ['172.18.0.0/16'], '', {'REMOTE_ADDR': '10.0.0.5'}, 403),
+    # Via Nginx (cabeçalhos de encaminhamento) nunca é local
+    (True, [], '', {'REMOTE_ADDR': '127.0.0.1', 'HTTP_X_FORWARDED_FOR': '127.0.0.1'}, 403),
+    (True, [], '', {'REMOTE_ADDR': '127.0.0.1', 'HTTP_X_REAL_IP': '127.0.0.1'}, 403),
+    # Token
+    (False, [], 'segredo', {'REMOTE_ADDR': '203.0.113.9', 'HTTP_AUTHORIZATION': 'Bearer segredo'}, 200),
+    (False, [], 'segredo', {'REMOTE_ADDR': '203.0.113.9', 'HTTP_AUTHORIZATION': 'Bearer outro'}, 403),
+    (False, [], 'segredo', {'REMOTE_ADDR': '203.0.113.9'}, 403),
+    (True, [], 'segredo', {'REMOTE_ADDR': '127.0.0.1'}, 403),
+    (True, [], 'segredo', {'REMOTE_ADDR': '127.0.0.1', 'HTTP_AUTHORIZATION': 'Bearer segredo'}, 200),
+    # Sem nenhuma proteção o endpoint não responde a ninguém
+    (False, [], '', {'REMOTE_ADDR': '127.0.0.1'}, 403),
+])
+def test_metrics_view_access(settings, local_only, networks, token, meta, expected):
+    from django.test import RequestFactory
+
+    from app.metrics import metrics_view
+
+    settings.METRICS_ENABLED = True
+    settings.METRICS_LOCAL_ONLY = local_only
+    settings.METRICS_ALLOWED_NETWORKS = networks
+    settings.METRICS_TOKEN = token
+
+    response = metrics_view(RequestFactory().get('/metrics', **meta))
+
+    assert response.status_code == expected
+    if expected == 200:
+        assert b'http_request_duration_seconds' in response.content
+
+
+def test_metrics_view_disabled_and_invalid_networks(settings):
+    from django.core.exceptions import ImproperlyConfigured
+    from django.test import RequestFactory
+
+    from app.metrics import metrics_view
+
+    request = RequestFactory().get('/metrics', REMOTE_ADDR='172.18.0.5')
+    settings.METRICS_ENABLED = False
+    assert metrics_view(request).status_code == 404
+
+    settings.METRICS_ENABLED = True
+    settings.METRICS_LOCAL_ONLY = True
+    settings.METRICS_TOKEN = ''
+    settings.METRICS_ALLOWED_NETWORKS = ['172.18.0.0/33']
+    with pytest.raises(ImproperlyConfigured):
+        metrics_view(request)
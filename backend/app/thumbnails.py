@@ -0,0 +1,173 @@
+"""
+Miniaturas das imagens enviadas (foto de perfil do candidato, logo da empresa).
+
+As derivadas são geradas com Pillow após o upload (em segundo plano, app.background)
+e gravadas no storage configurado (disco local ou S3), ao lado do original:
+
+    image_profile/foto_1a2b3c4d.jpg
+    image_profile/thumbs/foto_1a2b3c4d_64.webp
+    image_profile/thumbs/foto_1a2b3c4d_64.jpg
+    image_profile/thumbs/foto_1a2b3c4d_256.webp
+    image_profile/thumbs/foto_1a2b3c4d_256.jpg
+
+Os nomes são determinísticos: as URLs saem do nome do original, sem consultar o
+storage. A orientação EXIF é aplicada aos pixels e os metadados (EXIF, GPS) não são
+copiados para as derivadas. Imagens anteriores: manage.py generate_thumbnails.
+
+Uso:
+    register_thumbnails(CandidateProfile, 'image_profile')       # AppConfig.ready
+    image_profile_thumbnails = ThumbnailsField(source='image_profile')
+"""
+import logging
+import posixpath
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.db.models.signals import post_save, pre_save
+from rest_framework import serializers
+
+from app.background import submit_on_commit
+
+logger = logging.getLogger('app')
+
+THUMBNAIL_SIZES = (64, 256)
+
+# formato -> (extensão, formato Pillow, opções de gravação)
+THUMBNAIL_FORMATS = {
+    'webp': ('webp', 'WEBP', {'quality': 80, 'method': 4}),
+    'jpeg': ('jpg', 'JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+_registered = set()
+
+
+def thumbnail_name(name, size, fmt):
+    """Nome da derivada no storage: <pasta>/thumbs/<arquivo>_<tamanho>.<ext>"""
+    directory, filename = posixpath.split(name)
+    stem = posixpath.splitext(filename)[0]
+    return posixpath.join(directory, 'thumbs', f'{stem}_{size}.{THUMBNAIL_FORMATS[fmt][0]}')
+
+
+def thumbnail_urls(field_file, request=None):
+    """
+    URLs das miniaturas ({'64': {'webp': url, 'jpeg': url}, '256': {...}}),
+    ou None se não há imagem.
+    """
+    if not field_file:
+        return None
+    storage = field_file.storage
+    urls = {}
+    for size in THUMBNAIL_SIZES:
+        urls[str(size)] = {}
+        for fmt in THUMBNAIL_FORMATS:
+            url = storage.url(thumbnail_name(field_file.name, size, fmt))
+            urls[str(size)][fmt] = request.build_absolute_uri(url) if request is not None else url
+    return urls
+
+
+def _prepare(image, fmt):
+    """Converte para um modo aceito pelo formato (JPEG não tem transparência)."""
+    has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+    if fmt == 'jpeg' and image.mode == 'RGBA':
+        from PIL import Image
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel('A'))
+        image = background
+    return image
+
+
+def generate_thumbnails(storage, name, force=False):
+    """
+    Gera as miniaturas que faltam (todas, com force=True) do arquivo `name`.
+
+    Returns:
+        int com o número de derivadas gravadas
+    """
+    from PIL import Image, ImageOps
+
+    targets = [
+        (size, fmt, thumbnail_name(name, size, fmt))
+        for size in THUMBNAIL_SIZES for fmt in THUMBNAIL_FORMATS
+    ]
+    if not force:
+        targets = [target for target in targets if not storage.exists(target[2])]
+    if not targets:
+        return 0
+
+    with storage.open(name, 'rb') as source:
+        image = Image.open(source)
+        # JPEG: decodifica já reduzido (fotos de celular de 12 MP viram ~1/8 do trabalho)
+        largest = max(THUMBNAIL_SIZES)
+        image.draft('RGB', (largest * 2, largest * 2))
+        image.load()
+    # Aplica a orientação EXIF nos pixels; a derivada é gravada sem metadados
+    image = ImageOps.exif_transpose(image)
+
+    resized = {}
+    for size, fmt, thumb_name in targets:
+        if size not in resized:
+            thumb = image.copy()
+            thumb.thumbnail((size, size), Image.Resampling.LANCZOS)
+            resized[size] = thumb
+        _, pil_format, options = THUMBNAIL_FORMATS[fmt]
+        buffer = BytesIO()
+        _prepare(resized[size], fmt).save(buffer, pil_format, **options)
+        if storage.exists(thumb_name):
+            # FileSystemStorage renomearia o arquivo em vez de sobrescrever
+            storage.delete(thumb_name)
+        storage.save(thumb_name, ContentFile(buffer.getvalue()))
+    return len(targets)
+
+
+def _safe_generate(storage, name):
+    try:
+        generate_thumbnails(storage, name)
+    except Exception as e:
+        # Sem miniatura o frontend usa o original
+        logger.warning(f'Erro ao gerar miniaturas de {name}: {e}')
+
+
+def _detect_upload(sender, instance, raw=False, update_fields=None, **kwargs):
+    # Arquivo recém-atribuído ainda não gravado no storage (FileField.pre_save grava depois)
+    if raw:
+        return
+    instance._thumbnail_uploads = [
+        field_name for field_name in sender._thumbnail_fields
+        if (update_fields is None or field_name in update_fields)
+        and getattr(instance, field_name) and not getattr(instance, field_name)._committed
+    ]
+
+
+def _schedule_on_upload(sender, instance, **kwargs):
+    for field_name in instance.__dict__.pop('_thumbnail_uploads', ()):
+        field_file = getattr(instance, field_name)
+        submit_on_commit(_safe_generate, field_file.storage, field_file.name)
+
+
+def registered_thumbnail_fields():
+    """[(modelo, campo)] com miniaturas (para o comando generate_thumbnails)."""
+    return [(model, field_name) for model in _registered for field_name in model._thumbnail_fields]
+
+
+def register_thumbnails(model, *field_names):
+    """Gera miniaturas dos campos de imagem do modelo a cada novo upload."""
+    model._thumbnail_fields = tuple(dict.fromkeys(getattr(model, '_thumbnail_fields', ()) + field_names))
+    if model in _registered:
+        return
+    _registered.add(model)
+    label = model._meta.label_lower
+    pre_save.connect(_detect_upload, sender=model, dispatch_uid=f'thumbnails_upload:{label}')
+    post_save.connect(_schedule_on_upload, sender=model, dispatch_uid=f'thumbnails_save:{label}')
+
+
+class ThumbnailsField(serializers.Field):
+    """URLs das miniaturas de um ImageField (absolutas, como o ImageField do DRF)."""
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return thumbnail_urls(value, self.context.get('request'))
@@ -9,6 +9,9 @@ from drf_spectacular.views import (
     SpectacularRedocView
 )
 
+from app.event_views import EventTicketView, event_stream
+from app.metrics import metrics_view
+
 urlpatterns = [
     path('admin/', admin.site.urls),
 
@@ -34,6 +37,13 @@ urlpatterns = [
     path('api/v1/', include('admission.urls')),
     path('api/v1/', include('whatsapp.urls')),
 
+    # Eventos em tempo real (SSE)
+    path('api/v1/events/ticket/', EventTicketView.as_view(), name='events-ticket'),
+    path('api/v1/events/stream/', event_stream, name='events-stream'),
+
+    # Métricas do Prometheus (não passa pelo Nginx)
+    path('metrics', metrics_view, name='metrics'),
+
     # dj-rest-auth
     path('api/v1/accounts/', include('dj_rest_auth.urls')),
     path('api/v1/accounts/registration/', include('dj_rest_auth.registration.urls')),
@@ -1,5 +1,8 @@
 import os
+import re
+import unicodedata
 import uuid
+from decimal import Decimal, InvalidOperation
 from django.utils.text import slugify
 from django.utils.deconstruct import deconstructible
 
@@ -83,3 +86,61 @@ def sanitize_filename(filename):
         safe_name = safe_name[:100]
 
     return f"{safe_name}{ext.lower()}"
+
+
+def normalize_search_text(*parts):
+    """
+    Normaliza texto para busca: remove acentos, converte para minúsculas e
+    colapsa espaços. Permite que "joao" encontre "João" sem unaccent() no banco.
+
+    Exemplo:
+        >>> normalize_search_text("João", "Conceição")
+        'joao conceicao'
+    """
+    text = ' '.join(str(part) for part in parts if part)
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    return ' '.join(text.lower().split())
+
+
+_AMOUNT_RE = re.compile(r'^\d+(?:[.,]\d+)*$')
+_THOUSANDS_RE = re.compile(r'^\d{1,3}(?:\.\d{3})+$')
+MAX_AMOUNT = Decimal('9999999999.99')
+
+
+def parse_brl_amount(value):
+    """
+    Converte um valor em reais digitado como texto para Decimal (2 casas).
+    Aceita os formatos em uso: "R$ 3.500,00", "3.500,00", "3500,5", "3.500",
+    "3500.00" e números. Retorna None se vazio ou não reconhecido.
+
+    Exemplo:
+        >>> parse_brl_amount("R$ 3.500,00")
+        Decimal('3500.00')
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float, Decimal)):
+        text = str(value)
+    else:
+        text = str(value).replace('R$', '').replace('\xa0', '').replace(' ', '').strip()
+    if not text or not _AMOUNT_RE.match(text):
+        return None
+
+    if ',' in text:
+        # Formato brasileiro: ponto de milhar, vírgula decimal
+        integer, _, cents = text.rpartition(',')
+        if '.' in cents or len(cents) > 2:
+            return None
+        text = integer.replace('.', '') + '.' + cents
+    elif _THOUSANDS_RE.match(text):
+        # "3.500" / "1.250.000": apenas separadores de milhar
+        text = text.replace('.', '')
+    elif text.count('.') > 1:
+        return None
+
+    try:
+        amount = Decimal(text).quantize(Decimal('0.01'))
+    except InvalidOperation:
+        return None
+    return amount if amount <= MAX_AMOUNT else None
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.3 on 2026-10-17 02:03
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0006_alter_application_city_alter_application_name_and_more'),
+        ('jobs', '0004_job_type_models'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['applied_at', 'id'], name='application_applied_id_idx'),
+        ),
+    ]
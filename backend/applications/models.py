@@ -79,6 +79,10 @@ class Application(Base):
         verbose_name_plural = 'Candidaturas'
         unique_together = ('candidate', 'job')
         ordering = ['-applied_at']
+        indexes = [
+            # Paginação keyset (?cursor=) da listagem
+            models.Index(fields=['applied_at', 'id'], name='application_applied_id_idx'),
+        ]
 
     def __str__(self):
         return f'{self.candidate.name} - {self.job.title}'
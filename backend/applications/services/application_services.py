@@ -1,3 +1,5 @@
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
 from django.utils import timezone
 from rest_framework.exceptions import PermissionDenied, ValidationError
 
@@ -58,3 +60,39 @@ def update_application_status(user, application: Application, new_status: str, n
     )
 
     return application
+
+
+def recent_applications_by_candidate(candidate_ids, limit=5):
+    """
+    Retorna as `limit` candidaturas mais recentes de cada candidato em uma única query
+    (ROW_NUMBER() particionado por candidato).
+
+    Args:
+        candidate_ids: ids de UserProfile
+        limit: quantidade máxima por candidato
+
+    Returns:
+        dict {candidate_id: [{'job_id', 'job_title', 'status'}, ...]}
+    """
+    candidate_ids = list(candidate_ids)
+    result = {candidate_id: [] for candidate_id in candidate_ids}
+    if not candidate_ids:
+        return result
+
+    rows = Application.objects.filter(candidate_id__in=candidate_ids).annotate(
+        row_number=Window(
+            RowNumber(),
+            partition_by=[F('candidate_id')],
+            order_by=[F('applied_at').desc(), F('id').desc()],
+        )
+    ).filter(row_number__lte=limit).order_by(
+        'candidate_id', 'row_number'
+    ).values_list('candidate_id', 'job_id', 'job__title', 'status')
+
+    for candidate_id, job_id, job_title, status in rows:
+        result[candidate_id].append({
+            'job_id': job_id,
+            'job_title': job_title,
+            'status': status,
+        })
+    return result
@@ -10,6 +10,8 @@ from django.db.models import Q
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
+from app.pagination import KeysetPagination
+
 import logging
 import json
 
@@ -75,6 +77,8 @@ class ApplicationViewSet(viewsets.ModelViewSet):
 
     serializer_class = ApplicationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+    cursor_ordering = ('-applied_at', '-id')
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = ApplicationFilter
     search_fields = ['name', 'candidate__name', 'job__title', 'job__company__name']
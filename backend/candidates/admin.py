@@ -2,7 +2,8 @@ from django.contrib import admin
 
 from candidates.models import (
     CandidateProfile, CandidateEducation, CandidateExperience, 
-    CandidateLanguage, CandidateSkill
+    CandidateLanguage, CandidateSkill, CandidateImport, DuplicateSuggestion, Notification, PipelineCounter, PipelineInsight,
+    Skill, SkillAlias
 )
 
 
@@ -35,14 +36,14 @@ class CandidateProfileAdmin(admin.ModelAdmin):
         'experience_years', 'available_for_work', 'created_at'
     ]
     list_filter = [
-        'education_level', 'available_for_work', 'accepts_remote_work', 
+        'pipeline_status', 'education_level', 'available_for_work', 'accepts_remote_work', 
         'can_travel', 'accepts_relocation', 'preferred_work_shift'
     ]
     search_fields = [
         'user__name', 'user__email', 'current_position', 'current_company', 
         'skills', 'professional_summary'
     ]
-    readonly_fields = ['created_at', 'updated_at', 'age', 'full_address']
+    readonly_fields = ['created_at', 'updated_at', 'age', 'full_address', 'pipeline_status', 'unread_notifications']
 
     fieldsets = (
         ('Usuário', {
@@ -128,3 +129,80 @@ class CandidateSkillAdmin(admin.ModelAdmin):
     list_filter = ['level', 'years_experience']
     search_fields = ['candidate__user__name', 'skill_name']
     autocomplete_fields = ['candidate']
+
+
+class SkillAliasInline(admin.TabularInline):
+    model = SkillAlias
+    extra = 1
+    fields = ['alias']
+
+
+@admin.register(Skill)
+class SkillAdmin(admin.ModelAdmin):
+    list_display = ['name', 'normalized_name', 'is_active']
+    search_fields = ['name', 'normalized_name', 'aliases__alias']
+    inlines = [SkillAliasInline]
+
+
+@admin.register(PipelineCounter)
+class PipelineCounterAdmin(admin.ModelAdmin):
+    list_display = ['bucket', 'count', 'updated_at']
+    readonly_fields = ['bucket', 'count', 'updated_at']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(PipelineInsight)
+class PipelineInsightAdmin(admin.ModelAdmin):
+    list_display = ['generated_at', 'model_name', 'input_hash']
+    readonly_fields = ['input_hash', 'input_data', 'result', 'model_name', 'generated_at']
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(Notification)
+class NotificationAdmin(admin.ModelAdmin):
+    list_display = ['candidate', 'event', 'title', 'created_at', 'read_at']
+    list_filter = ['event']
+    search_fields = ['candidate__user__name', 'candidate__user__email', 'title']
+    raw_id_fields = ['candidate']
+    readonly_fields = ['candidate', 'event', 'title', 'message', 'link', 'icon', 'read_at', 'created_at']
+
+    # Notificações e o contador de não lidas do perfil são mantidos por notification_services
+    def has_add_permission(self, request):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(DuplicateSuggestion)
+class DuplicateSuggestionAdmin(admin.ModelAdmin):
+    list_display = ['user_a', 'user_b', 'score', 'status', 'updated_at']
+    list_filter = ['status']
+    search_fields = ['user_a__name', 'user_a__email', 'user_b__name', 'user_b__email']
+    raw_id_fields = ['user_a', 'user_b', 'resolved_by']
+    readonly_fields = ['score', 'reasons', 'resolved_by', 'resolved_at', 'created_at', 'updated_at']
+
+    # Sugestões são gravadas pela varredura (dedup_services); mesclagem pela API
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(CandidateImport)
+class CandidateImportAdmin(admin.ModelAdmin):
+    list_display = ['file_name', 'status', 'dry_run', 'total_rows', 'imported_rows', 'error_rows', 'created_at']
+    list_filter = ['status', 'dry_run']
+    readonly_fields = [
+        'file_name', 'dry_run', 'status', 'total_rows', 'imported_rows', 'error_rows', 'errors',
+        'message', 'created_by', 'created_at', 'finished_at'
+    ]
+
+    # Importações são criadas pela API (upload da planilha)
+    def has_add_permission(self, request):
+        return False
@@ -5,3 +5,10 @@ class CandidatesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'candidates'
     verbose_name = 'Candidatos'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+
+        # Miniaturas da foto de perfil (app.thumbnails)
+        from app.thumbnails import register_thumbnails
+        register_thumbnails(self.get_model('CandidateProfile'), 'image_profile')
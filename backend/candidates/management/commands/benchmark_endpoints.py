@@ -0,0 +1,120 @@
+import json
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from accounts.models import UserProfile
+from app.benchmark import ENDPOINTS, check_results, run_benchmarks
+from candidates.services.synthetic_services import candidate_email
+
+
+class Command(BaseCommand):
+    help = (
+        'Mede latência (p50/p95), queries SQL e tamanho da resposta dos endpoints mais '
+        'acessados sobre uma massa sintética; falha se algum endpoint passar do orçamento'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--count',
+            type=int,
+            default=10000,
+            help='Candidatos da massa sintética'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=1,
+            help='Seed da massa sintética'
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=20,
+            help='Chamadas medidas por endpoint (após a chamada fria)'
+        )
+        parser.add_argument(
+            '--endpoint',
+            action='append',
+            choices=[endpoint.name for endpoint in ENDPOINTS],
+            help='Executa só este endpoint (pode repetir)'
+        )
+        parser.add_argument(
+            '--output',
+            help='Grava o resultado (JSON) neste arquivo'
+        )
+        parser.add_argument(
+            '--baseline',
+            help='Resultado anterior (JSON) para comparar queries e latência'
+        )
+        parser.add_argument(
+            '--latency-tolerance',
+            type=float,
+            help='Falha se o p95 passar do baseline por esta fração (ex.: 0.25)'
+        )
+        parser.add_argument(
+            '--keepdb',
+            action='store_true',
+            help='Mantém o banco de teste (e a massa) para as próximas execuções (PostgreSQL; no SQLite o banco de teste fica em memória)'
+        )
+        parser.add_argument(
+            '--current-db',
+            action='store_true',
+            help='Mede no banco configurado, sem criar banco de teste nem gerar massa'
+        )
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options['baseline']:
+            try:
+                with open(options['baseline'], encoding='utf-8') as f:
+                    baseline = json.load(f)
+            except (OSError, ValueError) as e:
+                raise CommandError(f'Baseline inválido: {e}')
+
+        setup_test_environment()
+        old_name = None
+        try:
+            if not options['current_db']:
+                old_name = connection.settings_dict['NAME']
+                connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options['keepdb'])
+                if not UserProfile.objects.filter(email=candidate_email(1, options['seed'])).exists():
+                    self.stdout.write(f"Gerando {options['count']} candidatos...")
+                    call_command(
+                        'generate_synthetic_data', count=options['count'], seed=options['seed'],
+                        stdout=self.stdout,
+                    )
+            results = run_benchmarks(iterations=options['iterations'], only=options['endpoint'])
+        finally:
+            if old_name is not None:
+                connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options['keepdb'])
+            teardown_test_environment()
+
+        self.stdout.write(
+            f"\n{'endpoint':30} {'status':>6} {'p50 ms':>9} {'p95 ms':>9} {'fria ms':>9} "
+            f"{'queries':>8} {'N+1':>4} {'sql ms':>9} {'bytes':>9}"
+        )
+        for name, metrics in results['endpoints'].items():
+            if 'skipped' in metrics:
+                self.stdout.write(f"{name:30} {metrics['skipped']}")
+                continue
+            self.stdout.write(
+                f"{name:30} {metrics['status']:>6} {metrics['p50_ms']:>9} {metrics['p95_ms']:>9} "
+                f"{metrics['cold_ms']:>9} {metrics['queries']:>8} {len(metrics['repeated_queries']):>4} "
+                f"{metrics['sql_ms']:>9} "
+                f"{metrics['payload_bytes']:>9}"
+            )
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
+            self.stdout.write(f"\nResultado gravado em {options['output']}.")
+
+        failures = check_results(results, baseline, options['latency_tolerance'])
+        if failures:
+            for failure in failures:
+                self.stdout.write(self.style.ERROR(failure))
+            raise CommandError(f'{len(failures)} regressão(ões) de desempenho.')
+        self.stdout.write(self.style.SUCCESS('Nenhuma regressão.'))
@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from candidates.services.dedup_services import scan_duplicates
+
+
+class Command(BaseCommand):
+    help = 'Procura candidatos duplicados (CPF, e-mail, telefone, nome) e grava sugestões de mesclagem'
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        stats = scan_duplicates()
+        elapsed = time.monotonic() - started
+
+        self.stdout.write(
+            f"{stats['candidates']} candidatos, {stats['blocks']} blocos "
+            f"({stats['skipped_blocks']} ignorados por tamanho), {stats['compared_pairs']} pares comparados."
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{stats['suggestions']} sugestões de mesclagem, {stats['removed']} removidas "
+                f"em {elapsed:.1f}s."
+            )
+        )
@@ -0,0 +1,114 @@
+import datetime
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+
+from accounts.models import UserProfile
+from candidates.services.synthetic_services import (
+    CHUNK_SIZE, MAX_CANDIDATES, REFERENCE_DATE, candidate_email, chunk_count, create_reference_data,
+    generate_chunk,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Gera massa de dados sintética e determinística (candidatos, vagas, candidaturas, '
+        'processos, documentos e admissões) para testes de carga'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--count',
+            type=int,
+            default=10000,
+            help='Número de candidatos'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=1,
+            help='Seed (0-999); seeds diferentes geram e-mails e CPFs distintos'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Processos em paralelo (somente PostgreSQL)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=CHUNK_SIZE,
+            help='Candidatos por transação'
+        )
+        parser.add_argument(
+            '--password',
+            help='Senha de todos os usuários gerados (padrão: sem senha utilizável)'
+        )
+        parser.add_argument(
+            '--reference-date',
+            type=datetime.date.fromisoformat,
+            default=REFERENCE_DATE,
+            help=f'Data de referência das datas geradas, AAAA-MM-DD (padrão: {REFERENCE_DATE.isoformat()})'
+        )
+
+    def handle(self, *args, **options):
+        count = options['count']
+        seed = options['seed']
+        workers = max(1, options['workers'])
+        chunk_size = options['chunk_size']
+
+        if not 1 <= count <= MAX_CANDIDATES:
+            raise CommandError(f'--count deve estar entre 1 e {MAX_CANDIDATES}.')
+        if not 0 <= seed <= 999:
+            raise CommandError('--seed deve estar entre 0 e 999.')
+        if UserProfile.objects.filter(email=candidate_email(1, seed)).exists():
+            raise CommandError(f'Já existem dados gerados com a seed {seed}; use outra --seed.')
+        if workers > 1 and connection.vendor == 'sqlite':
+            self.stdout.write(self.style.WARNING('SQLite não aceita escritas em paralelo: usando 1 processo.'))
+            workers = 1
+
+        started = time.monotonic()
+        # Um único hash para todos os usuários (o hash por usuário dominaria o tempo)
+        password_hash = make_password(options['password']) if options['password'] else None
+        reference = create_reference_data(count, seed, password_hash, options['reference_date'])
+        self.stdout.write(
+            f"Referência: {len(reference['job_ids'])} vagas, {len(reference['processes'])} processos, "
+            f"{len(reference['recruiter_ids'])} recrutadores."
+        )
+
+        chunks = range(chunk_count(count, chunk_size))
+        totals = {}
+
+        def collect(result):
+            for key, value in result.items():
+                totals[key] = totals.get(key, 0) + value
+            elapsed = time.monotonic() - started
+            self.stdout.write(
+                f"{totals['candidates']}/{count} candidatos ({elapsed:.0f}s, "
+                f"{totals['candidates'] / elapsed:.0f}/s)"
+            )
+
+        if workers == 1:
+            for chunk in chunks:
+                collect(generate_chunk(chunk, count, seed, reference, chunk_size))
+        else:
+            # Os processos filhos (fork) abrem as próprias conexões
+            connections.close_all()
+            context = multiprocessing.get_context('fork')
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                futures = [
+                    executor.submit(generate_chunk, chunk, count, seed, reference, chunk_size)
+                    for chunk in chunks
+                ]
+                for future in futures:
+                    collect(future.result())
+
+        summary = ', '.join(f'{value} {key}' for key, value in totals.items())
+        self.stdout.write(self.style.SUCCESS(
+            f'Concluído em {time.monotonic() - started:.1f}s: {summary}.'
+        ))
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from app.thumbnails import generate_thumbnails, registered_thumbnail_fields
+
+
+class Command(BaseCommand):
+    help = 'Gera as miniaturas (64/256 px, WebP e JPEG) das imagens já enviadas'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Regera todas as miniaturas (padrão: apenas as que faltam)'
+        )
+
+    def handle(self, *args, **options):
+        created = failed = 0
+        for model, field_name in registered_thumbnail_fields():
+            names = (
+                model.objects.exclude(**{field_name: ''}).exclude(**{f'{field_name}__isnull': True})
+                .values_list(field_name, flat=True).iterator()
+            )
+            storage = model._meta.get_field(field_name).storage
+            for name in names:
+                try:
+                    created += generate_thumbnails(storage, name, force=options['force'])
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f'{model._meta.label} {name}: {e}')
+
+        self.stdout.write(
+            self.style.SUCCESS(f'{created} miniaturas geradas ({failed} imagens com erro).')
+        )
@@ -0,0 +1,71 @@
+import csv
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from candidates.services.import_services import (
+    BATCH_SIZE, ERROR_REPORT_HEADER, IMPORT_FORMATS, error_report_rows, import_candidates,
+)
+
+
+class Command(BaseCommand):
+    help = 'Importa candidatos de uma planilha CSV ou XLSX (mesmas colunas da exportação)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Caminho da planilha (.csv ou .xlsx)')
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Somente valida as linhas, sem cadastrar'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BATCH_SIZE,
+            help='Linhas gravadas por transação'
+        )
+        parser.add_argument(
+            '--report',
+            help='Grava os erros por linha neste arquivo CSV'
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = path.rsplit('.', 1)[-1].lower()
+        if file_format not in IMPORT_FORMATS:
+            raise CommandError('Use um arquivo .csv ou .xlsx.')
+
+        started = time.monotonic()
+
+        def progress(result):
+            self.stdout.write(
+                f"{result['total_rows']} linhas lidas, {result['imported_rows']} válidas, "
+                f"{len(result['errors'])} com erro ({time.monotonic() - started:.0f}s)"
+            )
+
+        try:
+            with open(path, 'rb') as stream:
+                result = import_candidates(
+                    stream, file_format, dry_run=options['dry_run'],
+                    batch_size=options['batch_size'], progress=progress,
+                )
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+
+        if options['report']:
+            with open(options['report'], 'w', newline='', encoding='utf-8-sig') as report:
+                writer = csv.writer(report, delimiter=';')
+                writer.writerow(ERROR_REPORT_HEADER)
+                writer.writerows(error_report_rows(result['errors']))
+
+        for entry in result['errors'][:20]:
+            messages = '; '.join(f'{column}: {message}' for column, message in entry['errors'].items())
+            self.stdout.write(self.style.WARNING(f"Linha {entry['row']}: {messages}"))
+        if len(result['errors']) > 20:
+            self.stdout.write(self.style.WARNING(f"... e mais {len(result['errors']) - 20} linha(s) com erro."))
+
+        verb = 'válidas (simulação)' if options['dry_run'] else 'importadas'
+        self.stdout.write(self.style.SUCCESS(
+            f"{result['imported_rows']} de {result['total_rows']} linhas {verb} "
+            f"em {time.monotonic() - started:.1f}s."
+        ))
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from candidates.models import CandidateProfile
+from candidates.services.matching_services import BATCH_SIZE, rebuild_match_features
+
+
+class Command(BaseCommand):
+    help = 'Cria/recria os atributos de ranqueamento de vagas dos candidatos'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Recria todos os atributos (padrão: apenas perfis sem atributos)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BATCH_SIZE,
+            help='Quantidade de perfis processados por lote'
+        )
+
+    def handle(self, *args, **options):
+        queryset = CandidateProfile.objects.all()
+        if not options['all']:
+            queryset = queryset.filter(match_features__isnull=True)
+
+        total = rebuild_match_features(queryset, batch_size=options['batch_size'])
+
+        self.stdout.write(
+            self.style.SUCCESS(f'{total} perfis com atributos de ranqueamento atualizados.')
+        )
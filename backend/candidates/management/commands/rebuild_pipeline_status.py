@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from candidates.models import CandidateProfile
+from candidates.services.pipeline_services import (
+    BATCH_SIZE, invalidate_required_document_types, rebuild_pipeline_statuses
+)
+
+
+class Command(BaseCommand):
+    help = 'Recalcula o status de pipeline materializado dos candidatos (backfill/reparo)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BATCH_SIZE,
+            help='Quantidade de perfis processados por lote'
+        )
+        parser.add_argument(
+            '--status',
+            help='Recalcula apenas perfis com este pipeline_status armazenado'
+        )
+
+    def handle(self, *args, **options):
+        invalidate_required_document_types()
+
+        queryset = CandidateProfile.objects.all()
+        if options['status']:
+            queryset = queryset.filter(pipeline_status=options['status'])
+
+        total, changed = rebuild_pipeline_statuses(queryset, batch_size=options['batch_size'])
+
+        self.stdout.write(
+            self.style.SUCCESS(f'{total} perfis verificados, {changed} corrigidos.')
+        )
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from candidates.models import CandidateProfile
+from candidates.services.search_services import BATCH_SIZE, rebuild_search_documents
+
+
+class Command(BaseCommand):
+    help = 'Cria/recria os documentos de busca textual dos candidatos'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Recria todos os documentos (padrão: apenas perfis sem documento)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BATCH_SIZE,
+            help='Quantidade de perfis processados por lote'
+        )
+
+    def handle(self, *args, **options):
+        queryset = CandidateProfile.objects.all()
+        if not options['all']:
+            queryset = queryset.filter(search_document__isnull=True)
+
+        total = rebuild_search_documents(queryset, batch_size=options['batch_size'])
+
+        self.stdout.write(
+            self.style.SUCCESS(f'{total} documentos de busca atualizados.')
+        )
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from candidates.models import CandidateProfile
+from candidates.services.skill_services import BATCH_SIZE, rebuild_skill_index
+
+
+class Command(BaseCommand):
+    help = 'Recria o índice de habilidades (taxonomia) dos candidatos'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--missing-only',
+            action='store_true',
+            help='Processa apenas perfis ainda sem entradas no índice'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BATCH_SIZE,
+            help='Quantidade de perfis processados por lote'
+        )
+
+    def handle(self, *args, **options):
+        queryset = CandidateProfile.objects.all()
+        if options['missing_only']:
+            queryset = queryset.filter(skill_index__isnull=True).distinct()
+
+        total = rebuild_skill_index(queryset, batch_size=options['batch_size'])
+
+        self.stdout.write(
+            self.style.SUCCESS(f'{total} perfis reindexados.')
+        )
@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from candidates.services.pipeline_services import reconcile_pipeline_counters
+
+
+class Command(BaseCommand):
+    help = 'Confere os contadores do pipeline (PipelineCounter) com os perfis e corrige divergências'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=0,
+            help='Executa continuamente a cada N segundos (0 = uma única vez)'
+        )
+
+    def handle(self, *args, **options):
+        interval = options['interval']
+        while True:
+            self._reconcile()
+            if interval <= 0:
+                break
+            time.sleep(interval)
+
+    def _reconcile(self):
+        drift = reconcile_pipeline_counters()
+        if not drift:
+            self.stdout.write(self.style.SUCCESS('Contadores do pipeline em dia.'))
+            return
+        for bucket, (stored, actual) in sorted(drift.items()):
+            self.stdout.write(self.style.WARNING(f'{bucket}: {stored} → {actual}'))
+        self.stdout.write(self.style.SUCCESS(f'{len(drift)} contador(es) corrigido(s).'))
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.3 on 2026-10-17 01:55
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def copy_profile_status(apps, schema_editor):
+    """Ponto de partida: status derivados de 'approved' são refinados por rebuild_pipeline_status."""
+    CandidateProfile = apps.get_model('candidates', 'CandidateProfile')
+    CandidateProfile.objects.update(pipeline_status=F('profile_status'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('candidates', '0012_add_pending_observation_sections'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidateprofile',
+            name='pipeline_status',
+            field=models.CharField(choices=[('pending', 'Em análise'), ('awaiting_review', 'Aguardando Revisão'), ('approved', 'Aprovado'), ('rejected', 'Reprovado'), ('changes_requested', 'Aguardando Candidato'), ('in_selection_process', 'Em Processo Seletivo'), ('documents_pending', 'Documentos Pendentes'), ('documents_complete', 'Documentos Completos'), ('admission_in_progress', 'Admissão em Andamento'), ('admitted', 'Admitido')], db_index=True, default='pending', editable=False, max_length=30, verbose_name='Status do Pipeline'),
+        ),
+        migrations.RunPython(copy_profile_status, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.3 on 2026-10-17 01:58
+
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+GIN_INDEX_NAME = 'cand_search_vector_gin'
+
+
+def create_gin_index(apps, schema_editor):
+    """Índice GIN só existe no PostgreSQL; no SQLite a busca usa icontains."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {GIN_INDEX_NAME} '
+        'ON candidates_candidatesearchdocument USING gin (search_vector)'
+    )
+
+
+def drop_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {GIN_INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('candidates', '0013_candidateprofile_pipeline_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CandidateSearchDocument',
+            fields=[
+                ('candidate', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='candidates.candidateprofile', verbose_name='Candidato')),
+                ('title_text', models.TextField(blank=True, verbose_name='Texto principal')),
+                ('keywords_text', models.TextField(blank=True, verbose_name='Palavras-chave')),
+                ('body_text', models.TextField(blank=True, verbose_name='Texto complementar')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(null=True, verbose_name='Vetor de busca')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Atualizado em')),
+            ],
+            options={
+                'verbose_name': 'Documento de Busca do Candidato',
+                'verbose_name_plural': 'Documentos de Busca dos Candidatos',
+            },
+        ),
+        migrations.RunPython(create_gin_index, drop_gin_index),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.3 on 2026-10-17 02:03
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('candidates', '0014_candidatesearchdocument'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='candidateprofile',
+            index=models.Index(fields=['created_at', 'id'], name='cand_profile_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.3 on 2026-10-17 02:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('candidates', '0015_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Está Ativo?')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Criado Em')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Atualizado Em')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='Nome')),
+                ('normalized_name', models.CharField(editable=False, max_length=100, unique=True, verbose_name='Nome Normalizado')),
+            ],
+            options={
+                'verbose_name': 'Habilidade (Taxonomia)',
+                'verbose_name_plural': 'Habilidades (Taxonomia)',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SkillAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias', models.CharField(max_length=100, verbose_name='Sinônimo')),
+                ('normalized_alias', models.CharField(editable=False, max_length=100, unique=True, verbose_name='Sinônimo Normalizado')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='candidates.skill', verbose_name='Habilidade')),
+            ],
+            options={
+                'verbose_name': 'Sinônimo de Habilidade',
+                'verbose_name_plural': 'Sinônimos de Habilidades',
+            },
+        ),
+        migrations.CreateModel(
+            name='CandidateSkillIndex',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('level_rank', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='Nível (ordem)')),
+                ('years_experience', models.PositiveIntegerField(blank=True, null=True, verbose_name='Anos de Experiência')),
+                ('source', models.CharField(choices=[('detailed', 'Habilidade detalhada'), ('free_text', 'Texto livre')], max_length=10, verbose_name='Origem')),
+                ('candidate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_index', to='candidates.candidateprofile', verbose_name='Candidato')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='candidate_index', to='candidates.skill', verbose_name='Habilidade')),
+            ],
+            options={
+                'verbose_name': 'Índice de Habilidade do Candidato',
+                'verbose_name_plural': 'Índice de Habilidades dos Candidatos',
+                'indexes': [models.Index(fields=['skill', 'level_rank', 'years_experience'], name='cand_skill_idx_lookup')],
+                'unique_together': {('candidate', 'skill')},
+            },
+        ),
+    ]
@@ -0,0 +1,79 @@
+from django.db import migrations
+
+
+# Habilidade canônica → sinônimos comuns (a normalização já trata caixa, acentos e versão)
+SKILLS = {
+    'Python': ['py'],
+    'JavaScript': ['js', 'ecmascript', 'es6'],
+    'TypeScript': ['ts'],
+    'Node.js': ['node', 'nodejs', 'node js'],
+    'React': ['reactjs', 'react.js', 'react js'],
+    'Angular': ['angularjs', 'angular.js'],
+    'Vue.js': ['vue', 'vuejs'],
+    'Django': ['django rest framework', 'drf'],
+    'PostgreSQL': ['postgres', 'postgre', 'psql'],
+    'MySQL': [],
+    'SQL Server': ['mssql', 'ms sql server', 'microsoft sql server'],
+    'Oracle': ['oracle database', 'pl/sql', 'plsql'],
+    'SQL': [],
+    'MongoDB': ['mongo'],
+    'Docker': [],
+    'Kubernetes': ['k8s'],
+    'AWS': ['amazon web services'],
+    'Git': ['github', 'gitlab'],
+    'Java': [],
+    'C#': ['csharp', 'c sharp'],
+    '.NET': ['dotnet', 'asp.net', 'net core', '.net core'],
+    'PHP': [],
+    'HTML': [],
+    'CSS': [],
+    'Excel': ['microsoft excel', 'ms excel', 'planilhas'],
+    'Power BI': ['powerbi'],
+    'Pacote Office': ['office', 'microsoft office', 'ms office'],
+    'Inglês': ['ingles', 'english'],
+    'Espanhol': ['spanish'],
+    'Comunicação': [],
+    'Liderança': [],
+    'Trabalho em Equipe': ['trabalho em grupo'],
+    'Atendimento ao Cliente': ['atendimento'],
+    'Vendas': [],
+    'Scrum': [],
+    'Metodologias Ágeis': ['agile', 'metodologia agil', 'agil'],
+    'Protheus': ['totvs protheus', 'totvs'],
+    'SAP': [],
+    'AutoCAD': ['cad'],
+    'Logística': [],
+    'CNH B': ['cnh categoria b', 'habilitacao b'],
+    'Empilhadeira': ['operador de empilhadeira'],
+    'NR-10': ['nr10'],
+    'NR-35': ['nr35'],
+}
+
+
+def seed_skills(apps, schema_editor):
+    from candidates.services.skill_services import normalize_skill_name
+
+    Skill = apps.get_model('candidates', 'Skill')
+    SkillAlias = apps.get_model('candidates', 'SkillAlias')
+    for name, aliases in SKILLS.items():
+        skill, _ = Skill.objects.get_or_create(
+            normalized_name=normalize_skill_name(name), defaults={'name': name}
+        )
+        for alias in aliases:
+            normalized = normalize_skill_name(alias)
+            if normalized == skill.normalized_name:
+                continue
+            SkillAlias.objects.get_or_create(
+                normalized_alias=normalized, defaults={'skill': skill, 'alias': alias}
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('candidates', '0016_skill_taxonomy'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_skills, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.3 on 2026-10-17 02:12
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_counters(apps, schema_editor):
+    """Contagem inicial por etapa (reconcile_pipeline_counters mantém em dia depois)."""
+    CandidateProfile = apps.get_model('candidates', 'CandidateProfile')
+    PipelineCounter = apps.get_model('candidates', 'PipelineCounter')
+    counts = dict(
+        CandidateProfile.objects.values_list('pipeline_status')
+        .annotate(count=Count('id'))
+        .values_list('pipeline_status', 'count')
+    )
+    buckets = [choice[0] for choice in PipelineCounter._meta.get_field('bucket').choices]
+    PipelineCounter.objects.bulk_create([
+        PipelineCounter(bucket=bucket, count=counts.get(bucket, 0)) for bucket in buckets
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('candidates', '0017_seed_skill_taxonomy'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PipelineCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket', models.CharField(choices=[('pending', 'Em análise'), ('awaiting_review', 'Aguardando Revisão'), ('approved', 'Aprovado'), ('rejected', 'Reprovado'), ('changes_requested', 'Aguardando Candidato'), ('in_selection_process', 'Em Processo Seletivo'), ('documents_pending', 'Documentos Pendentes'), ('documents_complete', 'Documentos Completos'), ('admission_in_progress', 'Admissão em Andamento'), ('admitted', 'Admitido')], max_length=30, unique=True, verbose_name='Etapa do Pipeline')),
+                ('count', models.IntegerField(default=0, verbose_name='Quantidade')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Atualizado em')),
+            ],
+            options={
+                'verbose_name': 'Contador do Pipeline',
+                'verbose_name_plural': 'Contadores do Pipeline',
+                'ordering': ['bucket'],
+            },
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.3 on 2026-10-17 02:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('candidates', '0018_pipeline_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PipelineInsight',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('input_hash', models.CharField(max_length=64, unique=True, verbose_name='Hash dos dados de entrada')),
+                ('input_data', models.JSONField(verbose_name='Dados de entrada')),
+                ('result', models.JSONField(verbose_name='Insights gerados')),
+                ('model_name', models.CharField(blank=True, max_length=100, verbose_name='Modelo de IA')),
+                ('generated_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Gerado em')),
+            ],
+            options={
+                'verbose_name': 'Insight do Pipeline',
+                'verbose_name_plural': 'Insights do Pipeline',
+                'ordering': ['-generated_at'],
+            },
+        ),
+    ]
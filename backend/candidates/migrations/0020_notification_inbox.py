@@ -0,0 +1,39 @@
+# Generated by Django 5.2.3 on 2026-10-17 02:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('candidates', '0019_pipeline_insights'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidateprofile',
+            name='unread_notifications',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Notificações não lidas'),
+        ),
+        migrations.CreateModel(
+            name='Notification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event', models.CharField(max_length=40, verbose_name='Evento')),
+                ('title', models.CharField(max_length=255, verbose_name='Título')),
+                ('message', models.TextField(blank=True, verbose_name='Mensagem')),
+                ('link', models.CharField(blank=True, max_length=255, verbose_name='Link')),
+                ('icon', models.CharField(blank=True, max_length=30, verbose_name='Ícone')),
+                ('read_at', models.DateTimeField(blank=True, null=True, verbose_name='Lida em')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Criada em')),
+                ('candidate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to='candidates.candidateprofile', verbose_name='Candidato')),
+            ],
+            options={
+                'verbose_name': 'Notificação',
+                'verbose_name_plural': 'Notificações',
+                'ordering': ['-created_at', '-id'],
+                'indexes': [models.Index(fields=['candidate', '-created_at', '-id'], name='cand_notification_inbox_idx')],
+            },
+        ),
+    ]
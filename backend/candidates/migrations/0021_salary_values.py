@@ -0,0 +1,70 @@
+# Generated by Django 5.2.3 on 2026-10-17 02:33
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Q
+
+from app.utils import parse_brl_amount
+
+BATCH_SIZE = 1000
+
+
+def _backfill(model, fields):
+    """Converte os salários em texto já gravados (campo texto -> coluna Decimal)."""
+    has_text = Q()
+    for source in fields:
+        has_text |= Q(**{f'{source}__isnull': False})
+    queryset = model.objects.filter(has_text)
+    batch = []
+    for obj in queryset.only('pk', *fields).iterator(chunk_size=BATCH_SIZE):
+        for source, target in fields.items():
+            setattr(obj, target, parse_brl_amount(getattr(obj, source)))
+        batch.append(obj)
+        if len(batch) >= BATCH_SIZE:
+            model.objects.bulk_update(batch, list(fields.values()))
+            batch = []
+    if batch:
+        model.objects.bulk_update(batch, list(fields.values()))
+
+
+def backfill_salary_values(apps, schema_editor):
+    _backfill(apps.get_model('candidates', 'CandidateProfile'), {
+        'desired_salary_min': 'desired_salary_min_value',
+        'desired_salary_max': 'desired_salary_max_value',
+    })
+    _backfill(apps.get_model('candidates', 'CandidateExperience'), {'salary': 'salary_value'})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('candidates', '0020_notification_inbox'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidateexperience',
+            name='salary_value',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, max_digits=12, null=True, verbose_name='Salário (valor)'),
+        ),
+        migrations.AddField(
+            model_name='candidateprofile',
+            name='desired_salary_max_value',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, max_digits=12, null=True, verbose_name='Pretensão Salarial Máxima (valor)'),
+        ),
+        migrations.AddField(
+            model_name='candidateprofile',
+            name='desired_salary_min_value',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, max_digits=12, null=True, verbose_name='Pretensão Salarial Mínima (valor)'),
+        ),
+        migrations.RunPython(backfill_salary_values, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='candidateprofile',
+            index=models.Index(fields=['desired_salary_min_value'], name='cand_profile_salary_min_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidateprofile',
+            index=models.Index(fields=['desired_salary_max_value'], name='cand_profile_salary_max_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.3 on 2026-10-17 02:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('candidates', '0021_salary_values'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CandidateMatchFeatures',
+            fields=[
+                ('candidate', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='match_features', serialize=False, to='candidates.candidateprofile', verbose_name='Candidato')),
+                ('pipeline_status', models.CharField(max_length=30, verbose_name='Status do Pipeline')),
+                ('is_available', models.BooleanField(default=True, verbose_name='Disponível')),
+                ('experience_years', models.PositiveIntegerField(blank=True, null=True, verbose_name='Anos de Experiência')),
+                ('education_rank', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='Escolaridade (ordem)')),
+                ('city', models.CharField(blank=True, max_length=100, verbose_name='Cidade (normalizada)')),
+                ('state', models.CharField(blank=True, max_length=2, verbose_name='Estado')),
+                ('accepts_remote_work', models.BooleanField(default=True, verbose_name='Aceita Trabalho Remoto')),
+                ('accepts_relocation', models.BooleanField(default=False, verbose_name='Aceita Mudança de Cidade')),
+                ('desired_salary_min', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True, verbose_name='Pretensão Salarial Mínima')),
+                ('skills', models.JSONField(blank=True, default=list, verbose_name='Habilidades')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True, verbose_name='Atualizado em')),
+            ],
+            options={
+                'verbose_name': 'Atributos de Ranqueamento do Candidato',
+                'verbose_name_plural': 'Atributos de Ranqueamento dos Candidatos',
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.3 on 2026-10-17 02:42
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('candidates', '0022_match_features'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DuplicateSuggestion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField(verbose_name='Score')),
+                ('reasons', models.JSONField(blank=True, default=list, verbose_name='Critérios coincidentes')),
+                ('status', models.CharField(choices=[('pending', 'Pendente'), ('merged', 'Mesclado'), ('dismissed', 'Descartado')], default='pending', max_length=20, verbose_name='Status')),
+                ('resolved_at', models.DateTimeField(blank=True, null=True, verbose_name='Resolvido em')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Criado em')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Atualizado em')),
+                ('resolved_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Resolvido por')),
+                ('user_a', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Usuário A')),
+                ('user_b', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Usuário B')),
+            ],
+            options={
+                'verbose_name': 'Possível Duplicidade',
+                'verbose_name_plural': 'Possíveis Duplicidades',
+                'ordering': ['-score', 'id'],
+                'indexes': [models.Index(fields=['status', '-score'], name='cand_duplicate_status_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user_a', 'user_b'), name='cand_duplicate_pair_uniq')],
+            },
+        ),
+    ]
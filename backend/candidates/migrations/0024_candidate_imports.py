@@ -0,0 +1,40 @@
+# Generated by Django 5.2.3 on 2026-10-17 02:45
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('candidates', '0023_duplicate_suggestions'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CandidateImport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Está Ativo?')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Criado Em')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Atualizado Em')),
+                ('file_name', models.CharField(max_length=255, verbose_name='Arquivo')),
+                ('dry_run', models.BooleanField(default=False, verbose_name='Somente validação')),
+                ('status', models.CharField(choices=[('pending', 'Na fila'), ('processing', 'Processando'), ('completed', 'Concluída'), ('failed', 'Falhou')], default='pending', max_length=20, verbose_name='Status')),
+                ('total_rows', models.PositiveIntegerField(default=0, verbose_name='Linhas lidas')),
+                ('imported_rows', models.PositiveIntegerField(default=0, verbose_name='Linhas importadas')),
+                ('error_rows', models.PositiveIntegerField(default=0, verbose_name='Linhas com erro')),
+                ('errors', models.JSONField(blank=True, default=list, verbose_name='Erros por linha')),
+                ('message', models.TextField(blank=True, verbose_name='Mensagem')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Concluída em')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Enviado por')),
+            ],
+            options={
+                'verbose_name': 'Importação de Candidatos',
+                'verbose_name_plural': 'Importações de Candidatos',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,105 @@
+from django.db import migrations
+
+BATCH_SIZE = 1000
+
+# Conteúdo congelado de notification_services.NOTIFICATION_CONTENT para os avisos
+# que a antiga my_notifications montava a partir do estado atual
+CONTENT = {
+    'profile_changes_requested': (
+        'Alterações solicitadas', 'O recrutador solicitou alterações no seu perfil.',
+        '/perfil', 'profile',
+    ),
+    'profile_approved': (
+        'Perfil aprovado!', 'Parabéns! Seu perfil foi aprovado pelo recrutador.',
+        '/perfil', 'profile_approved',
+    ),
+    'document_rejected': (
+        'Documento rejeitado', 'O documento {documento} foi rejeitado. Verifique o motivo e reenvie.',
+        '/perfil/documentos', 'document',
+    ),
+    'process_approved': (
+        'Aprovado: {processo}', 'Parabéns! Você foi aprovado no processo seletivo.',
+        '/perfil', 'process_approved',
+    ),
+    'process_rejected': (
+        'Reprovado: {processo}', 'Infelizmente você não foi aprovado neste processo.',
+        '/perfil', 'process_rejected',
+    ),
+}
+
+
+def _notification(Notification, candidate_id, event, **context):
+    title, message, link, icon = CONTENT[event]
+    return Notification(
+        candidate_id=candidate_id,
+        event=event,
+        title=title.format(**context)[:255],
+        message=message.format(**context),
+        link=link,
+        icon=icon,
+    )
+
+
+def backfill_notifications(apps, schema_editor):
+    """
+    Cria na caixa de entrada os avisos que a antiga my_notifications calculava do
+    estado atual (alterações solicitadas, perfil aprovado, documentos rejeitados,
+    resultado de processos) e acerta unread_notifications. Perfis que já têm
+    notificações são ignorados.
+    """
+    CandidateProfile = apps.get_model('candidates', 'CandidateProfile')
+    Notification = apps.get_model('candidates', 'Notification')
+    CandidateDocument = apps.get_model('admission', 'CandidateDocument')
+    CandidateInProcess = apps.get_model('selection_process', 'CandidateInProcess')
+
+    pending = list(
+        CandidateProfile.objects.filter(notifications__isnull=True)
+        .values_list('id', 'profile_status').order_by('id')
+    )
+    for start in range(0, len(pending), BATCH_SIZE):
+        chunk = dict(pending[start:start + BATCH_SIZE])
+        notifications = []
+        for profile_id, profile_status in chunk.items():
+            if profile_status == 'changes_requested':
+                notifications.append(_notification(Notification, profile_id, 'profile_changes_requested'))
+            elif profile_status == 'approved':
+                notifications.append(_notification(Notification, profile_id, 'profile_approved'))
+
+        approved_ids = [pk for pk, profile_status in chunk.items() if profile_status == 'approved']
+        rejected_documents = CandidateDocument.objects.filter(
+            candidate_id__in=approved_ids, is_active=True, status='rejected'
+        ).values_list('candidate_id', 'document_type__name').order_by('candidate_id', 'id')
+        for profile_id, document in rejected_documents:
+            notifications.append(_notification(Notification, profile_id, 'document_rejected', documento=document))
+
+        results = CandidateInProcess.objects.filter(
+            candidate_profile_id__in=list(chunk), status__in=['approved', 'rejected']
+        ).values_list('candidate_profile_id', 'status', 'process__title').order_by('candidate_profile_id', 'id')
+        for profile_id, result, process in results:
+            notifications.append(_notification(Notification, profile_id, f'process_{result}', processo=process))
+
+        if not notifications:
+            continue
+        Notification.objects.bulk_create(notifications, batch_size=BATCH_SIZE)
+        unread = {}
+        for notification in notifications:
+            unread[notification.candidate_id] = unread.get(notification.candidate_id, 0) + 1
+        # Um UPDATE por quantidade distinta de avisos
+        by_count = {}
+        for profile_id, count in unread.items():
+            by_count.setdefault(count, []).append(profile_id)
+        for count, profile_ids in by_count.items():
+            CandidateProfile.objects.filter(pk__in=profile_ids).update(unread_notifications=count)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('candidates', '0024_candidate_imports'),
+        ('admission', '0003_keyset_indexes'),
+        ('selection_process', '0003_processtemplate_templatestage_templatestagequestion'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_notifications, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 5.2.3 on 2026-10-17 03:34
+
+from django.db import migrations, models, transaction
+
+
+BATCH_SIZE = 2000
+TRGM_INDEX_NAME = 'cand_search_positions_trgm'
+
+
+def backfill_positions_text(apps, schema_editor):
+    from app.utils import normalize_search_text
+
+    CandidateSearchDocument = apps.get_model('candidates', 'CandidateSearchDocument')
+    CandidateProfile = apps.get_model('candidates', 'CandidateProfile')
+    CandidateExperience = apps.get_model('candidates', 'CandidateExperience')
+
+    candidate_ids = list(CandidateSearchDocument.objects.values_list('candidate_id', flat=True).order_by('pk'))
+    for start in range(0, len(candidate_ids), BATCH_SIZE):
+        batch = candidate_ids[start:start + BATCH_SIZE]
+        positions = {
+            pk: [current_position]
+            for pk, current_position in CandidateProfile.objects.filter(pk__in=batch).values_list(
+                'pk', 'current_position'
+            )
+        }
+        experiences = CandidateExperience.objects.filter(candidate_id__in=batch).values_list(
+            'candidate_id', 'position'
+        ).order_by('candidate_id', 'pk')
+        for candidate_id, position in experiences:
+            positions[candidate_id].append(position)
+        CandidateSearchDocument.objects.bulk_update(
+            [
+                CandidateSearchDocument(candidate_id=pk, positions_text=normalize_search_text(*values))
+                for pk, values in positions.items()
+            ],
+            ['positions_text'],
+        )
+
+
+def create_trigram_index(apps, schema_editor):
+    """
+    Índice GIN com gin_trgm_ops (PostgreSQL) para o filtro por cargo. Sem a extensão
+    pg_trgm o filtro continua funcionando sem o índice.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    except Exception:
+        return
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {TRGM_INDEX_NAME} '
+        'ON candidates_candidatesearchdocument USING gin (positions_text gin_trgm_ops)'
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {TRGM_INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('candidates', '0025_backfill_notifications'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidatesearchdocument',
+            name='positions_text',
+            field=models.TextField(blank=True, default='', editable=False, verbose_name='Cargos'),
+        ),
+        migrations.RunPython(backfill_positions_text, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
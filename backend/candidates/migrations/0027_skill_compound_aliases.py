@@ -0,0 +1,39 @@
+from django.db import migrations
+
+
+# Habilidades compostas com barra; antes da correção dos separadores eram quebradas em
+# duas ("CI" + "CD"). "PL/SQL" já é sinônimo de Oracle (0017)
+SKILLS = {
+    'CI/CD': ['ci cd', 'integracao continua', 'entrega continua'],
+    'UI/UX': ['ux/ui', 'ui ux', 'ux ui', 'ui/ux design', 'ux/ui design'],
+    'TCP/IP': ['tcp ip'],
+}
+
+
+def seed_skills(apps, schema_editor):
+    from candidates.services.skill_services import normalize_skill_name
+
+    Skill = apps.get_model('candidates', 'Skill')
+    SkillAlias = apps.get_model('candidates', 'SkillAlias')
+    for name, aliases in SKILLS.items():
+        skill, _ = Skill.objects.get_or_create(
+            normalized_name=normalize_skill_name(name), defaults={'name': name}
+        )
+        for alias in aliases:
+            normalized = normalize_skill_name(alias)
+            if normalized == skill.normalized_name:
+                continue
+            SkillAlias.objects.get_or_create(
+                normalized_alias=normalized, defaults={'skill': skill, 'alias': alias}
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('candidates', '0026_search_document_positions'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_skills, migrations.RunPython.noop),
+    ]
@@ -1,12 +1,39 @@
 from django.db import models
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MaxValueValidator
 from django.utils.translation import gettext_lazy as _
 
 from app.models import Base
-from app.utils import UniqueFilePathGenerator
+from app.utils import UniqueFilePathGenerator, parse_brl_amount
 
 
-class CandidateProfile(Base):
+class SalaryValuesMixin:
+    """
+    Mantém colunas Decimal indexáveis a partir dos salários digitados como texto
+    ("R$ 3.500,00"): filtros de faixa e ordenação usam os valores, não o texto
+    (lexicograficamente "9000" > "10000").
+    """
+
+    # campo texto -> coluna Decimal
+    SALARY_VALUE_FIELDS = {}
+
+    def sync_salary_values(self, update_fields=None):
+        """Recalcula as colunas Decimal; retorna as que devem ser gravadas."""
+        synced = []
+        for source, target in self.SALARY_VALUE_FIELDS.items():
+            if update_fields is None or source in update_fields:
+                setattr(self, target, parse_brl_amount(getattr(self, source)))
+                synced.append(target)
+        return synced
+
+    def _salary_save_kwargs(self, kwargs):
+        synced = self.sync_salary_values(kwargs.get('update_fields'))
+        if kwargs.get('update_fields') is not None and synced:
+            kwargs['update_fields'] = list(dict.fromkeys([*kwargs['update_fields'], *synced]))
+        return kwargs
+
+
+class CandidateProfile(SalaryValuesMixin, Base):
     """Perfil detalhado do candidato - complementa o UserProfile"""
 
     GENDER_CHOICES = [
@@ -34,6 +61,14 @@ class CandidateProfile(Base):
         ('changes_requested', 'Aguardando Candidato'),
     ]
 
+    PIPELINE_STATUS_CHOICES = PROFILE_STATUS_CHOICES + [
+        ('in_selection_process', 'Em Processo Seletivo'),
+        ('documents_pending', 'Documentos Pendentes'),
+        ('documents_complete', 'Documentos Completos'),
+        ('admission_in_progress', 'Admissão em Andamento'),
+        ('admitted', 'Admitido'),
+    ]
+
     user = models.OneToOneField(
         'accounts.UserProfile',
         on_delete=models.CASCADE,
@@ -84,6 +119,23 @@ class CandidateProfile(Base):
         null=True,
         verbose_name='Pretensão Salarial Máxima'
     )
+    # Valores numéricos das pretensões (SalaryValuesMixin)
+    desired_salary_min_value = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        blank=True,
+        null=True,
+        editable=False,
+        verbose_name='Pretensão Salarial Mínima (valor)'
+    )
+    desired_salary_max_value = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        blank=True,
+        null=True,
+        editable=False,
+        verbose_name='Pretensão Salarial Máxima (valor)'
+    )
 
     # Textos livres
     professional_summary = models.TextField(blank=True, verbose_name='Resumo Profissional')
@@ -151,13 +203,57 @@ class CandidateProfile(Base):
         verbose_name='Seções pendentes de edição'
     )
 
+    # Status do pipeline materializado (recalculado por candidates.signals)
+    pipeline_status = models.CharField(
+        max_length=30,
+        choices=PIPELINE_STATUS_CHOICES,
+        default='pending',
+        db_index=True,
+        editable=False,
+        verbose_name='Status do Pipeline'
+    )
+
+    # Notificações não lidas (mantido por notification_services junto com Notification)
+    unread_notifications = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Notificações não lidas'
+    )
+
+    # Campos desnormalizados gravados apenas pelos serviços que os mantêm
+    DENORMALIZED_FIELDS = ('pipeline_status', 'unread_notifications')
+    SALARY_VALUE_FIELDS = {
+        'desired_salary_min': 'desired_salary_min_value',
+        'desired_salary_max': 'desired_salary_max_value',
+    }
+
     class Meta:
         verbose_name = 'Perfil do Candidato'
         verbose_name_plural = 'Perfis dos Candidatos'
+        indexes = [
+            # Paginação keyset (?cursor=) da listagem
+            models.Index(fields=['created_at', 'id'], name='cand_profile_created_id_idx'),
+            # Filtros de faixa salarial (?desired_salary_min__gte=) e ordenação
+            models.Index(fields=['desired_salary_min_value'], name='cand_profile_salary_min_idx'),
+            models.Index(fields=['desired_salary_max_value'], name='cand_profile_salary_max_idx'),
+        ]
 
     def __str__(self):
         return f"Perfil de {self.user.name}"
 
+    def save(self, *args, **kwargs):
+        kwargs = self._salary_save_kwargs(kwargs)
+        # pipeline_status e unread_notifications só são gravados pelos serviços que
+        # mantêm os contadores: um save completo de uma instância desatualizada não
+        # pode sobrescrevê-los
+        if (not self._state.adding and not args and kwargs.get('update_fields') is None
+                and not kwargs.get('force_insert')):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.DENORMALIZED_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
     @property
     def full_address(self):
         """Retorna o endereço completo formatado"""
@@ -208,7 +304,7 @@ class CandidateEducation(Base):
         return f"{self.course} - {self.institution}"
 
 
-class CandidateExperience(Base):
+class CandidateExperience(SalaryValuesMixin, Base):
     """Experiência profissional do candidato"""
     
     candidate = models.ForeignKey(
@@ -230,6 +326,16 @@ class CandidateExperience(Base):
         null=True,
         verbose_name='Salário'
     )
+    salary_value = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        blank=True,
+        null=True,
+        editable=False,
+        verbose_name='Salário (valor)'
+    )
+
+    SALARY_VALUE_FIELDS = {'salary': 'salary_value'}
 
     class Meta:
         verbose_name = 'Experiência Profissional'
@@ -239,6 +345,9 @@ class CandidateExperience(Base):
     def __str__(self):
         return f"{self.position} - {self.company}"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **self._salary_save_kwargs(kwargs))
+
 
 class CandidateLanguage(Base):
     """Idiomas do candidato"""
@@ -311,3 +420,373 @@ class CandidateSkill(Base):
 
     def __str__(self):
         return f"{self.skill_name} - {self.get_level_display()}"
+
+
+class CandidateSearchDocument(models.Model):
+    """
+    Documento de busca textual do candidato (perfil, habilidades, experiências e formação).
+
+    Mantido por candidates.signals. No PostgreSQL o campo search_vector (config
+    'portuguese', índice GIN) atende a busca; no SQLite as colunas de texto são
+    usadas com icontains.
+    """
+
+    candidate = models.OneToOneField(
+        CandidateProfile,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='search_document',
+        verbose_name='Candidato'
+    )
+    # Peso A: nome, cargo atual e habilidades detalhadas
+    title_text = models.TextField(blank=True, verbose_name='Texto principal')
+    # Peso B: habilidades livres, cargos e empresas anteriores, cursos
+    keywords_text = models.TextField(blank=True, verbose_name='Palavras-chave')
+    # Peso C: resumo, certificações e descrições de experiências
+    body_text = models.TextField(blank=True, verbose_name='Texto complementar')
+    # Cargo atual e cargos das experiências, sem acentos e minúsculo (filtro por cargo)
+    positions_text = models.TextField(blank=True, default='', editable=False, verbose_name='Cargos')
+    search_vector = SearchVectorField(null=True, verbose_name='Vetor de busca')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='Atualizado em')
+
+    class Meta:
+        verbose_name = 'Documento de Busca do Candidato'
+        verbose_name_plural = 'Documentos de Busca dos Candidatos'
+
+    def __str__(self):
+        return f"Documento de busca de {self.candidate_id}"
+
+
+class CandidateMatchFeatures(models.Model):
+    """
+    Atributos do candidato usados no ranqueamento por vaga
+    (candidates.services.matching_services), já normalizados.
+
+    Mantido por candidates.signals, pelo recálculo do pipeline_status e pelo índice
+    de habilidades. Cada processo carrega a tabela em arrays NumPy e relê só as
+    linhas com updated_at posterior à última leitura.
+    """
+
+    candidate = models.OneToOneField(
+        CandidateProfile,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='match_features',
+        verbose_name='Candidato'
+    )
+    pipeline_status = models.CharField(max_length=30, verbose_name='Status do Pipeline')
+    # is_active e available_for_work do perfil
+    is_available = models.BooleanField(default=True, verbose_name='Disponível')
+    experience_years = models.PositiveIntegerField(blank=True, null=True, verbose_name='Anos de Experiência')
+    # Posição em CandidateProfile.EDUCATION_LEVEL_CHOICES
+    education_rank = models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='Escolaridade (ordem)')
+    city = models.CharField(max_length=100, blank=True, verbose_name='Cidade (normalizada)')
+    state = models.CharField(max_length=2, blank=True, verbose_name='Estado')
+    accepts_remote_work = models.BooleanField(default=True, verbose_name='Aceita Trabalho Remoto')
+    accepts_relocation = models.BooleanField(default=False, verbose_name='Aceita Mudança de Cidade')
+    desired_salary_min = models.DecimalField(
+        max_digits=12, decimal_places=2, blank=True, null=True, verbose_name='Pretensão Salarial Mínima'
+    )
+    # [[skill_id, level_rank], ...] de CandidateSkillIndex (level_rank 0 = sem nível)
+    skills = models.JSONField(default=list, blank=True, verbose_name='Habilidades')
+    updated_at = models.DateTimeField(auto_now=True, db_index=True, verbose_name='Atualizado em')
+
+    class Meta:
+        verbose_name = 'Atributos de Ranqueamento do Candidato'
+        verbose_name_plural = 'Atributos de Ranqueamento dos Candidatos'
+
+    def __str__(self):
+        return f"Atributos de ranqueamento de {self.candidate_id}"
+
+
+class Skill(Base):
+    """Habilidade canônica da taxonomia (ex.: "Python", "PostgreSQL")"""
+
+    name = models.CharField(max_length=100, unique=True, verbose_name='Nome')
+    normalized_name = models.CharField(max_length=100, unique=True, editable=False, verbose_name='Nome Normalizado')
+
+    class Meta:
+        verbose_name = 'Habilidade (Taxonomia)'
+        verbose_name_plural = 'Habilidades (Taxonomia)'
+        ordering = ['name']
+
+    def save(self, *args, **kwargs):
+        from candidates.services.skill_services import normalize_skill_name
+        self.normalized_name = normalize_skill_name(self.name)
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return self.name
+
+
+class SkillAlias(models.Model):
+    """Sinônimo de uma habilidade canônica (ex.: "Python3" → "Python")"""
+
+    skill = models.ForeignKey(
+        Skill,
+        on_delete=models.CASCADE,
+        related_name='aliases',
+        verbose_name='Habilidade'
+    )
+    alias = models.CharField(max_length=100, verbose_name='Sinônimo')
+    normalized_alias = models.CharField(max_length=100, unique=True, editable=False, verbose_name='Sinônimo Normalizado')
+
+    class Meta:
+        verbose_name = 'Sinônimo de Habilidade'
+        verbose_name_plural = 'Sinônimos de Habilidades'
+
+    def save(self, *args, **kwargs):
+        from candidates.services.skill_services import normalize_skill_name
+        self.normalized_alias = normalize_skill_name(self.alias)
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"{self.alias} → {self.skill.name}"
+
+
+class CandidateSkillIndex(models.Model):
+    """
+    Índice invertido candidato ↔ habilidade canônica, alimentado por
+    CandidateSkill (com nível/anos) e pelo texto livre CandidateProfile.skills.
+    Mantido por candidates.signals.
+    """
+
+    SOURCE_CHOICES = [
+        ('detailed', 'Habilidade detalhada'),
+        ('free_text', 'Texto livre'),
+    ]
+
+    # Ordem dos níveis de CandidateSkill.SKILL_LEVEL_CHOICES para filtros "nível >= X"
+    LEVEL_RANKS = {
+        'beginner': 1,
+        'intermediate': 2,
+        'advanced': 3,
+        'expert': 4,
+    }
+
+    candidate = models.ForeignKey(
+        CandidateProfile,
+        on_delete=models.CASCADE,
+        related_name='skill_index',
+        verbose_name='Candidato'
+    )
+    skill = models.ForeignKey(
+        Skill,
+        on_delete=models.CASCADE,
+        related_name='candidate_index',
+        verbose_name='Habilidade'
+    )
+    level_rank = models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='Nível (ordem)')
+    years_experience = models.PositiveIntegerField(blank=True, null=True, verbose_name='Anos de Experiência')
+    source = models.CharField(max_length=10, choices=SOURCE_CHOICES, verbose_name='Origem')
+
+    class Meta:
+        verbose_name = 'Índice de Habilidade do Candidato'
+        verbose_name_plural = 'Índice de Habilidades dos Candidatos'
+        unique_together = ['candidate', 'skill']
+        indexes = [
+            models.Index(fields=['skill', 'level_rank', 'years_experience'], name='cand_skill_idx_lookup'),
+        ]
+
+    def __str__(self):
+        return f"{self.candidate_id} - {self.skill_id}"
+
+
+class PipelineCounter(models.Model):
+    """
+    Contador de candidatos por etapa do pipeline (uma linha por pipeline_status).
+
+    Atualizado na mesma transação que move o candidato de etapa
+    (candidates.services.pipeline_services); o comando reconcile_pipeline_counters
+    corrige eventuais divergências.
+    """
+
+    bucket = models.CharField(
+        max_length=30,
+        unique=True,
+        choices=CandidateProfile.PIPELINE_STATUS_CHOICES,
+        verbose_name='Etapa do Pipeline'
+    )
+    count = models.IntegerField(default=0, verbose_name='Quantidade')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='Atualizado em')
+
+    class Meta:
+        verbose_name = 'Contador do Pipeline'
+        verbose_name_plural = 'Contadores do Pipeline'
+        ordering = ['bucket']
+
+    def __str__(self):
+        return f"{self.get_bucket_display()}: {self.count}"
+
+
+class PipelineInsight(models.Model):
+    """
+    Insights de IA gerados para um retrato do pipeline.
+
+    `input_hash` identifica os dados de entrada (distribuição, candidaturas e
+    conversão): dados idênticos reaproveitam o insight já gerado.
+    """
+
+    input_hash = models.CharField(max_length=64, unique=True, verbose_name='Hash dos dados de entrada')
+    input_data = models.JSONField(verbose_name='Dados de entrada')
+    result = models.JSONField(verbose_name='Insights gerados')
+    model_name = models.CharField(max_length=100, blank=True, verbose_name='Modelo de IA')
+    generated_at = models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Gerado em')
+
+    class Meta:
+        verbose_name = 'Insight do Pipeline'
+        verbose_name_plural = 'Insights do Pipeline'
+        ordering = ['-generated_at']
+
+    def __str__(self):
+        return f"Insight de {self.generated_at:%d/%m/%Y %H:%M}"
+
+
+class Notification(models.Model):
+    """
+    Notificação da caixa de entrada do candidato.
+
+    Gravada no momento do evento (os mesmos que disparam o WhatsApp, ver
+    candidates.services.notification_services); o total de não lidas fica
+    desnormalizado em CandidateProfile.unread_notifications.
+    """
+
+    candidate = models.ForeignKey(
+        CandidateProfile,
+        on_delete=models.CASCADE,
+        related_name='notifications',
+        verbose_name='Candidato'
+    )
+    event = models.CharField(max_length=40, verbose_name='Evento')
+    title = models.CharField(max_length=255, verbose_name='Título')
+    message = models.TextField(blank=True, verbose_name='Mensagem')
+    link = models.CharField(max_length=255, blank=True, verbose_name='Link')
+    icon = models.CharField(max_length=30, blank=True, verbose_name='Ícone')
+    read_at = models.DateTimeField(blank=True, null=True, verbose_name='Lida em')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='Criada em')
+
+    class Meta:
+        verbose_name = 'Notificação'
+        verbose_name_plural = 'Notificações'
+        ordering = ['-created_at', '-id']
+        indexes = [
+            # Caixa de entrada paginada por cursor (?cursor=)
+            models.Index(fields=['candidate', '-created_at', '-id'], name='cand_notification_inbox_idx'),
+        ]
+
+    @property
+    def is_read(self):
+        return self.read_at is not None
+
+    def __str__(self):
+        return f"{self.candidate_id} - {self.title}"
+
+
+class DuplicateSuggestion(models.Model):
+    """
+    Par de usuários candidatos que parecem ser a mesma pessoa (cadastro do perfil
+    e/ou candidatura espontânea), encontrado por candidates.services.dedup_services.
+
+    O par é gravado com user_a_id < user_b_id; uma nova varredura atualiza o score
+    das sugestões pendentes e não repete pares descartados ou mesclados.
+    """
+
+    STATUS_CHOICES = [
+        ('pending', 'Pendente'),
+        ('merged', 'Mesclado'),
+        ('dismissed', 'Descartado'),
+    ]
+
+    user_a = models.ForeignKey(
+        'accounts.UserProfile',
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='Usuário A'
+    )
+    user_b = models.ForeignKey(
+        'accounts.UserProfile',
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='Usuário B'
+    )
+    score = models.FloatField(verbose_name='Score')
+    reasons = models.JSONField(default=list, blank=True, verbose_name='Critérios coincidentes')
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='pending',
+        verbose_name='Status'
+    )
+    resolved_by = models.ForeignKey(
+        'accounts.UserProfile',
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name='+',
+        verbose_name='Resolvido por'
+    )
+    resolved_at = models.DateTimeField(blank=True, null=True, verbose_name='Resolvido em')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='Criado em')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='Atualizado em')
+
+    class Meta:
+        verbose_name = 'Possível Duplicidade'
+        verbose_name_plural = 'Possíveis Duplicidades'
+        ordering = ['-score', 'id']
+        constraints = [
+            models.UniqueConstraint(fields=['user_a', 'user_b'], name='cand_duplicate_pair_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['status', '-score'], name='cand_duplicate_status_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_a_id} x {self.user_b_id} ({self.score:.2f})"
+
+
+class CandidateImport(Base):
+    """
+    Importação de planilha de candidatos (CSV/XLSX) enviada pela API.
+
+    O arquivo é processado em segundo plano (candidates.services.import_services) e
+    não fica guardado: o registro mantém apenas os totais e o relatório de erros por
+    linha.
+    """
+
+    STATUS_CHOICES = [
+        ('pending', 'Na fila'),
+        ('processing', 'Processando'),
+        ('completed', 'Concluída'),
+        ('failed', 'Falhou'),
+    ]
+
+    file_name = models.CharField(max_length=255, verbose_name='Arquivo')
+    dry_run = models.BooleanField(default=False, verbose_name='Somente validação')
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='pending',
+        verbose_name='Status'
+    )
+    total_rows = models.PositiveIntegerField(default=0, verbose_name='Linhas lidas')
+    imported_rows = models.PositiveIntegerField(default=0, verbose_name='Linhas importadas')
+    error_rows = models.PositiveIntegerField(default=0, verbose_name='Linhas com erro')
+    errors = models.JSONField(default=list, blank=True, verbose_name='Erros por linha')
+    message = models.TextField(blank=True, verbose_name='Mensagem')
+    created_by = models.ForeignKey(
+        'accounts.UserProfile',
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name='+',
+        verbose_name='Enviado por'
+    )
+    finished_at = models.DateTimeField(blank=True, null=True, verbose_name='Concluída em')
+
+    class Meta:
+        verbose_name = 'Importação de Candidatos'
+        verbose_name_plural = 'Importações de Candidatos'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.file_name} ({self.get_status_display()})"
@@ -2,9 +2,12 @@ from datetime import date
 
 from rest_framework import serializers
 
+from app.thumbnails import ThumbnailsField
+from app.utils import parse_brl_amount
+from candidates.validators import birth_date_error, cpf_error, zip_code_error
 from candidates.models import (
     CandidateProfile, CandidateEducation, CandidateExperience, 
-    CandidateLanguage, CandidateSkill
+    CandidateLanguage, CandidateSkill, CandidateImport, DuplicateSuggestion, Notification
 )
 
 
@@ -120,6 +123,7 @@ class CandidateProfileSerializer(serializers.ModelSerializer):
     # Campos calculados
     age = serializers.ReadOnlyField()
     full_address = serializers.ReadOnlyField()
+    image_profile_thumbnails = ThumbnailsField(source='image_profile')
 
     # Dados do usuário
     user_name = serializers.CharField(source='user.name', read_only=True)
@@ -129,8 +133,6 @@ class CandidateProfileSerializer(serializers.ModelSerializer):
     # Dados da revisão do perfil
     reviewed_by_name = serializers.CharField(source='profile_reviewed_by.name', read_only=True, default=None)
 
-    # Status computado do pipeline
-    pipeline_status = serializers.SerializerMethodField()
     admission_start_date = serializers.SerializerMethodField()
 
     class Meta:
@@ -138,9 +140,6 @@ class CandidateProfileSerializer(serializers.ModelSerializer):
         fields = '__all__'
         read_only_fields = ['user', 'created_at', 'updated_at', 'profile_reviewed_by', 'profile_reviewed_at']
 
-    def get_pipeline_status(self, obj):
-        return _compute_pipeline_status(obj)
-
     def get_admission_start_date(self, obj):
         try:
             admission = obj.admission_data
@@ -153,41 +152,18 @@ class CandidateProfileSerializer(serializers.ModelSerializer):
     def validate_date_of_birth(self, value):
         """Valida data de nascimento"""
         if value:
-            today = date.today()
-            age = today.year - value.year - ((today.month, today.day) < (value.month, value.day))
-
-            if age < 14:
-                raise serializers.ValidationError('Idade mínima é 14 anos.')
-            if age > 100:
-                raise serializers.ValidationError('Idade não pode ser superior a 100 anos.')
+            error = birth_date_error(value)
+            if error:
+                raise serializers.ValidationError(error)
 
         return value
 
     def validate_cpf(self, value):
         """Valida formato, dígitos verificadores e unicidade do CPF"""
         if value:
-            import re
-            numbers_only = re.sub(r'\D', '', value)
-            if len(numbers_only) != 11:
-                raise serializers.ValidationError('CPF deve ter 11 dígitos.')
-
-            # Rejeitar CPFs com todos os dígitos iguais (ex: 111.111.111-11)
-            if numbers_only == numbers_only[0] * 11:
-                raise serializers.ValidationError('CPF inválido.')
-
-            # Validar primeiro dígito verificador
-            soma = sum(int(numbers_only[i]) * (10 - i) for i in range(9))
-            resto = soma % 11
-            digito1 = 0 if resto < 2 else 11 - resto
-            if int(numbers_only[9]) != digito1:
-                raise serializers.ValidationError('CPF inválido.')
-
-            # Validar segundo dígito verificador
-            soma = sum(int(numbers_only[i]) * (11 - i) for i in range(10))
-            resto = soma % 11
-            digito2 = 0 if resto < 2 else 11 - resto
-            if int(numbers_only[10]) != digito2:
-                raise serializers.ValidationError('CPF inválido.')
+            error = cpf_error(value)
+            if error:
+                raise serializers.ValidationError(error)
 
             # Verificar unicidade (excluindo o próprio perfil em caso de update)
             from candidates.models import CandidateProfile
@@ -202,16 +178,16 @@ class CandidateProfileSerializer(serializers.ModelSerializer):
     def validate_zip_code(self, value):
         """Valida formato do CEP"""
         if value:
-            import re
-            if not re.match(r'^\d{5}-?\d{3}$', value):
-                raise serializers.ValidationError('CEP deve estar no formato 00000-000.')
+            error = zip_code_error(value)
+            if error:
+                raise serializers.ValidationError(error)
         return value
 
     def validate(self, data):
         """Validações gerais"""
-        # Validar faixa salarial
-        salary_min = data.get('desired_salary_min')
-        salary_max = data.get('desired_salary_max')
+        # Validar faixa salarial (valores digitados como "R$ 3.500,00")
+        salary_min = parse_brl_amount(data.get('desired_salary_min'))
+        salary_max = parse_brl_amount(data.get('desired_salary_max'))
 
         if salary_min and salary_min <= 0:
             raise serializers.ValidationError({
@@ -242,25 +218,9 @@ class CandidateProfileCreateUpdateSerializer(serializers.ModelSerializer):
     def validate_cpf(self, value):
         """Valida formato, dígitos verificadores e unicidade do CPF"""
         if value:
-            import re
-            numbers_only = re.sub(r'\D', '', value)
-            if len(numbers_only) != 11:
-                raise serializers.ValidationError('CPF deve ter 11 dígitos.')
-
-            if numbers_only == numbers_only[0] * 11:
-                raise serializers.ValidationError('CPF inválido.')
-
-            soma = sum(int(numbers_only[i]) * (10 - i) for i in range(9))
-            resto = soma % 11
-            digito1 = 0 if resto < 2 else 11 - resto
-            if int(numbers_only[9]) != digito1:
-                raise serializers.ValidationError('CPF inválido.')
-
-            soma = sum(int(numbers_only[i]) * (11 - i) for i in range(10))
-            resto = soma % 11
-            digito2 = 0 if resto < 2 else 11 - resto
-            if int(numbers_only[10]) != digito2:
-                raise serializers.ValidationError('CPF inválido.')
+            error = cpf_error(value)
+            if error:
+                raise serializers.ValidationError(error)
 
             from candidates.models import CandidateProfile
             qs = CandidateProfile.objects.filter(cpf=value)
@@ -274,92 +234,40 @@ class CandidateProfileCreateUpdateSerializer(serializers.ModelSerializer):
     def validate_date_of_birth(self, value):
         """Valida data de nascimento"""
         if value:
-            today = date.today()
-            age = today.year - value.year - ((today.month, today.day) < (value.month, value.day))
-
-            if age < 14:
-                raise serializers.ValidationError('Idade mínima é 14 anos.')
-            if age > 100:
-                raise serializers.ValidationError('Idade não pode ser superior a 100 anos.')
+            error = birth_date_error(value)
+            if error:
+                raise serializers.ValidationError(error)
 
         return value
 
 
-def _compute_pipeline_status(profile):
-    """Computa o status do pipeline completo do candidato.
-    Otimizado para usar dados prefetched quando disponíveis."""
-    base = profile.profile_status
-    if base != 'approved':
-        return base
-
-    # 1. Admissão (maior prioridade) — usa select_related('admission_data')
-    try:
-        admission = profile.admission_data
-        if admission.status in ('completed', 'sent', 'confirmed'):
-            return 'admitted'
-        if admission.status == 'draft':
-            return 'admission_in_progress'
-    except Exception:
-        pass
-
-    # 2. Processo seletivo — usa dados prefetched do queryset (sem query extra)
-    processes = list(profile.selection_processes.all())
-    has_active_process = any(
-        p.is_active and p.status in ('pending', 'in_progress')
-        for p in processes
-    )
-    if has_active_process:
-        return 'in_selection_process'
-
-    # 3. Só verifica documentos se foi APROVADO em algum processo seletivo
-    was_approved_in_process = any(p.status == 'approved' for p in processes)
-    if not was_approved_in_process:
-        return 'approved'
-
-    # 4. Documentos — cachear required_types para evitar query repetida no loop
-    from admission.models import CandidateDocument, DocumentType
-    from django.core.cache import cache
-
-    total_required = cache.get('total_required_doc_types')
-    required_ids = cache.get('required_doc_type_ids')
-    if total_required is None:
-        required_types = DocumentType.objects.filter(is_active=True, is_required=True)
-        total_required = required_types.count()
-        required_ids = list(required_types.values_list('id', flat=True))
-        cache.set('total_required_doc_types', total_required, 300)
-        cache.set('required_doc_type_ids', required_ids, 300)
-
-    if total_required > 0:
-        approved_docs = CandidateDocument.objects.filter(
-            candidate=profile, document_type_id__in=required_ids,
-            is_active=True, status='approved'
-        ).count()
-        if approved_docs < total_required:
-            return 'documents_pending'
-
-    return 'documents_complete'
-
-
 class CandidateProfileListSerializer(serializers.ModelSerializer):
-    """Serializer simplificado para listagem de candidatos"""
+    """
+    Serializer simplificado para listagem de candidatos.
+
+    Use com um queryset preparado por `setup_eager_loading`: os resumos vêm de
+    Prefetch(to_attr=...) fatiados e de anotações, sem queries por linha.
+    """
 
     user_id = serializers.IntegerField(source='user.id', read_only=True)
     user_name = serializers.CharField(source='user.name', read_only=True)
     user_last_name = serializers.CharField(source='user.last_name', read_only=True)
     user_email = serializers.CharField(source='user.email', read_only=True)
+    image_profile_thumbnails = ThumbnailsField(source='image_profile')
     age = serializers.ReadOnlyField()
     experience_summary = serializers.SerializerMethodField()
     education_summary = serializers.SerializerMethodField()
     applications_count = serializers.SerializerMethodField()
+    applications_summary = serializers.SerializerMethodField()
+    selection_processes_summary = serializers.SerializerMethodField()
     cpf = serializers.CharField(read_only=True)
-    pipeline_status = serializers.SerializerMethodField()
     admission_start_date = serializers.SerializerMethodField()
 
     class Meta:
         model = CandidateProfile
         fields = [
             'id', 'user_id', 'user_name', 'user_last_name', 'user_email', 'cpf', 'current_position', 'current_company',
-            'city', 'state', 'image_profile', 'skills', 'professional_summary',
+            'city', 'state', 'image_profile', 'image_profile_thumbnails', 'skills', 'professional_summary',
             'age', 'education_level', 'experience_years', 'desired_salary_min',
             'desired_salary_max', 'available_for_work', 'accepts_remote_work',
             'accepts_relocation', 'can_travel',
@@ -368,8 +276,44 @@ class CandidateProfileListSerializer(serializers.ModelSerializer):
             'profile_status', 'pipeline_status', 'admission_start_date', 'profile_observations', 'profile_reviewed_at', 'created_at'
         ]
 
-    def get_pipeline_status(self, obj):
-        return _compute_pipeline_status(obj)
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Carrega tudo que a listagem usa em um número fixo de queries."""
+        from django.db.models import Count, IntegerField, OuterRef, Prefetch, Subquery
+        from django.db.models.functions import Coalesce
+        from applications.models import Application
+        from selection_process.models import CandidateInProcess
+
+        applications_count = Application.objects.filter(
+            candidate_id=OuterRef('user_id')
+        ).order_by().values('candidate_id').annotate(c=Count('id')).values('c')
+
+        return queryset.select_related('user', 'admission_data').prefetch_related(
+            Prefetch(
+                'experiences',
+                queryset=CandidateExperience.objects.filter(is_active=True).order_by('-start_date')[:2],
+                to_attr='recent_experiences'
+            ),
+            Prefetch(
+                'educations',
+                queryset=CandidateEducation.objects.filter(is_active=True).order_by('-start_date')[:1],
+                to_attr='latest_educations'
+            ),
+            Prefetch(
+                'user__applications',
+                queryset=Application.objects.select_related('job', 'job__company').order_by('-applied_at')[:5],
+                to_attr='recent_applications'
+            ),
+            Prefetch(
+                'selection_processes',
+                queryset=CandidateInProcess.objects.filter(is_active=True).select_related(
+                    'process', 'current_stage'
+                ).order_by('-added_at')[:5],
+                to_attr='recent_processes'
+            ),
+        ).annotate(
+            applications_total=Coalesce(Subquery(applications_count, output_field=IntegerField()), 0)
+        )
 
     def get_admission_start_date(self, obj):
         try:
@@ -382,7 +326,9 @@ class CandidateProfileListSerializer(serializers.ModelSerializer):
 
     def get_experience_summary(self, obj):
         """Resumo das experiências"""
-        experiences = obj.experiences.filter(is_active=True).order_by('-start_date')[:2]
+        experiences = getattr(obj, 'recent_experiences', None)
+        if experiences is None:
+            experiences = obj.experiences.filter(is_active=True).order_by('-start_date')[:2]
         return [
             {
                 'company': exp.company,
@@ -394,7 +340,10 @@ class CandidateProfileListSerializer(serializers.ModelSerializer):
 
     def get_education_summary(self, obj):
         """Resumo da educação"""
-        education = obj.educations.filter(is_active=True).order_by('-start_date').first()
+        educations = getattr(obj, 'latest_educations', None)
+        if educations is None:
+            educations = obj.educations.filter(is_active=True).order_by('-start_date')[:1]
+        education = next(iter(educations), None)
         if education:
             return {
                 'course': education.course,
@@ -405,14 +354,16 @@ class CandidateProfileListSerializer(serializers.ModelSerializer):
 
     def get_applications_count(self, obj):
         """Conta candidaturas do usuário"""
-        return obj.user.applications.count()
-
-    applications_summary = serializers.SerializerMethodField()
-    selection_processes_summary = serializers.SerializerMethodField()
+        total = getattr(obj, 'applications_total', None)
+        if total is None:
+            total = obj.user.applications.count()
+        return total
 
     def get_applications_summary(self, obj):
         """Resumo das candidaturas com dados da vaga"""
-        applications = obj.user.applications.select_related('job', 'job__company').order_by('-applied_at')[:5]
+        applications = getattr(obj.user, 'recent_applications', None)
+        if applications is None:
+            applications = obj.user.applications.select_related('job', 'job__company').order_by('-applied_at')[:5]
         return [
             {
                 'id': app.id,
@@ -427,7 +378,11 @@ class CandidateProfileListSerializer(serializers.ModelSerializer):
 
     def get_selection_processes_summary(self, obj):
         """Resumo dos processos seletivos do candidato"""
-        processes = obj.selection_processes.filter(is_active=True).select_related('process').order_by('-added_at')[:5]
+        processes = getattr(obj, 'recent_processes', None)
+        if processes is None:
+            processes = obj.selection_processes.filter(is_active=True).select_related(
+                'process', 'current_stage'
+            ).order_by('-added_at')[:5]
         return [
             {
                 'id': cp.id,
@@ -464,3 +419,126 @@ class ProfileStatusUpdateSerializer(serializers.Serializer):
             })
 
         return data
+
+
+class BulkProfileStatusUpdateSerializer(ProfileStatusUpdateSerializer):
+    """Serializer para revisão de perfis em lote (mesma decisão para vários candidatos)"""
+
+    MAX_PROFILES = 1000
+
+    profile_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=MAX_PROFILES,
+        help_text='IDs dos perfis a revisar (máximo 1000 por requisição)'
+    )
+
+    def validate_profile_ids(self, value):
+        # Remove duplicados preservando a ordem enviada
+        return list(dict.fromkeys(value))
+
+
+class NotificationSerializer(serializers.ModelSerializer):
+    """Serializer para notificações da caixa de entrada do candidato"""
+
+    type = serializers.CharField(source='event', read_only=True)
+    is_read = serializers.BooleanField(read_only=True)
+
+    class Meta:
+        model = Notification
+        fields = ['id', 'type', 'title', 'message', 'link', 'icon', 'is_read', 'read_at', 'created_at']
+        read_only_fields = fields
+
+
+class NotificationMarkReadSerializer(serializers.Serializer):
+    """Serializer para marcar notificações como lidas (ids informados ou todas)"""
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=500,
+        help_text='IDs das notificações; omita para marcar todas como lidas'
+    )
+
+
+class DuplicateUserSerializer(serializers.Serializer):
+    """Resumo de um dos usuários de uma possível duplicidade"""
+
+    id = serializers.IntegerField(read_only=True)
+    name = serializers.CharField(source='full_name', read_only=True)
+    email = serializers.EmailField(read_only=True)
+    phone = serializers.CharField(read_only=True)
+    is_active = serializers.BooleanField(read_only=True)
+    candidate_profile_id = serializers.SerializerMethodField()
+    cpf = serializers.SerializerMethodField()
+    spontaneous_application_id = serializers.SerializerMethodField()
+
+    def get_candidate_profile_id(self, user):
+        profile = getattr(user, 'candidate_profile', None)
+        return profile.pk if profile is not None else None
+
+    def get_cpf(self, user):
+        for name in ('candidate_profile', 'candidate_spontaneous'):
+            related = getattr(user, name, None)
+            if related is not None and related.cpf:
+                return related.cpf
+        return ''
+
+    def get_spontaneous_application_id(self, user):
+        application = getattr(user, 'candidate_spontaneous', None)
+        return application.pk if application is not None else None
+
+
+class DuplicateSuggestionSerializer(serializers.ModelSerializer):
+    """Serializer para sugestões de mesclagem de candidatos duplicados"""
+
+    user_a = DuplicateUserSerializer(read_only=True)
+    user_b = DuplicateUserSerializer(read_only=True)
+
+    class Meta:
+        model = DuplicateSuggestion
+        fields = [
+            'id', 'user_a', 'user_b', 'score', 'reasons', 'status',
+            'resolved_by', 'resolved_at', 'created_at', 'updated_at'
+        ]
+        read_only_fields = fields
+
+
+class DuplicateMergeSerializer(serializers.Serializer):
+    """Serializer para mesclar uma sugestão (keep_user_id: usuário mantido)"""
+
+    keep_user_id = serializers.IntegerField(
+        required=False,
+        help_text='Usuário mantido (user_a ou user_b); padrão: o que tem cadastro completo, depois o mais antigo'
+    )
+
+
+class CandidateImportSerializer(serializers.ModelSerializer):
+    """Serializer para acompanhar uma importação de planilha de candidatos"""
+
+    created_by_name = serializers.CharField(source='created_by.name', read_only=True, default=None)
+
+    class Meta:
+        model = CandidateImport
+        fields = [
+            'id', 'file_name', 'dry_run', 'status', 'total_rows', 'imported_rows', 'error_rows',
+            'errors', 'message', 'created_by', 'created_by_name', 'created_at', 'updated_at', 'finished_at'
+        ]
+        read_only_fields = fields
+
+
+class CandidateImportUploadSerializer(serializers.Serializer):
+    """Serializer para envio de planilha de candidatos (CSV ou XLSX)"""
+
+    file = serializers.FileField()
+    dry_run = serializers.BooleanField(
+        default=False,
+        help_text='Somente valida as linhas, sem cadastrar'
+    )
+
+    def validate_file(self, value):
+        extension = value.name.rsplit('.', 1)[-1].lower() if '.' in value.name else ''
+        if extension not in ('csv', 'xlsx'):
+            raise serializers.ValidationError('Envie um arquivo .csv ou .xlsx.')
+        return value
@@ -0,0 +1 @@
+# Candidates Services
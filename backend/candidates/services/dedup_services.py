@@ -0,0 +1,467 @@
+"""
+Detecção e mesclagem de candidatos duplicados.
+
+Uma pessoa pode ter mais de um usuário: o cadastro completo (CandidateProfile) e a
+candidatura espontânea (SpontaneousApplication, com cpf/email/telefone próprios),
+ou dois cadastros com o CPF em formatos diferentes ("123.456.789-09" e
+"12345678909" não violam o unique).
+
+A varredura não compara todos com todos: cada usuário entra em "blocos" pelos
+identificadores normalizados (CPF, e-mail, DDD + 8 últimos dígitos do telefone e a
+chave fonética de primeiro + último nome) e só os pares dentro de um mesmo bloco
+recebem score. Blocos grandes demais (ex.: telefone genérico, nome muito comum) não
+trazem informação e são ignorados, o que mantém o custo linear na base.
+
+merge_candidates() move candidaturas, processos seletivos, documentos e o
+restante do cadastro para o usuário mantido e desativa o outro.
+"""
+import logging
+import re
+from difflib import SequenceMatcher
+from itertools import combinations
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from app.utils import normalize_search_text
+
+from ..models import (
+    CandidateEducation, CandidateExperience, CandidateLanguage, CandidateProfile,
+    CandidateSkill, DuplicateSuggestion, Notification,
+)
+
+logger = logging.getLogger('app')
+
+# Blocos com mais usuários que isso são ignorados (identificador/nome comum demais)
+MAX_BLOCK_SIZE = {'cpf': 10, 'email': 10, 'phone': 10, 'name': 50}
+
+# Evidências somadas no score do par (0 a 1); negativas indicam pessoas diferentes
+SCORE_WEIGHTS = {
+    'cpf': 0.6,
+    'cpf_conflict': -0.5,
+    'email': 0.35,
+    'phone': 0.25,
+    'name': 0.3,
+    'name_mismatch': -0.2,
+    'birth_date': 0.25,
+    'birth_date_conflict': -0.3,
+    'city': 0.1,
+}
+MIN_SCORE = 0.6
+NAME_SIMILARITY = 0.85
+
+NAME_PARTICLES = {'de', 'da', 'do', 'das', 'dos', 'e'}
+
+# Campos de texto do perfil preenchidos a partir do duplicado quando vazios no mantido
+PROFILE_FILL_FIELDS = [
+    'phone_secondary', 'gender', 'zip_code', 'street', 'number', 'complement', 'neighborhood',
+    'current_position', 'current_company', 'education_level', 'desired_salary_min',
+    'desired_salary_max', 'professional_summary', 'skills', 'certifications', 'linkedin_url',
+    'github_url', 'portfolio_url', 'emergency_contact_name', 'emergency_contact_phone',
+]
+PROFILE_FILL_NULLABLE_FIELDS = ['date_of_birth', 'experience_years']
+
+_PHONETIC_RULES = [
+    (r'ph', 'f'), (r'lh', 'l'), (r'nh', 'n'), (r'ch|sh', 'x'), (r'qu|q', 'k'),
+    (r'c(?=[ei])', 's'), (r'c', 'k'), (r'gu(?=[ei])', 'g'), (r'g(?=[ei])', 'j'),
+    (r'y', 'i'), (r'w', 'v'), (r'z', 's'),
+    (r'h', ''), (r'(?<=.)[aeiou]', ''), (r'(.)\1+', r'\1'),
+]
+_PHONETIC_RULES = [(re.compile(pattern), replacement) for pattern, replacement in _PHONETIC_RULES]
+
+
+# ============================================
+# NORMALIZAÇÃO
+# ============================================
+
+def normalize_cpf(value):
+    """11 dígitos do CPF, ou '' se não houver 11 dígitos (ou todos iguais)."""
+    digits = re.sub(r'\D', '', value or '')
+    if len(digits) != 11 or digits == digits[0] * 11:
+        return ''
+    return digits
+
+
+def normalize_email(value):
+    return (value or '').strip().lower()
+
+
+def normalize_phone(value):
+    """
+    DDD + 8 últimos dígitos ("(11) 98765-4321", "+55 11 8765-4321" e
+    "011987654321" geram a mesma chave), ou '' se incompleto.
+    """
+    digits = re.sub(r'\D', '', value or '')
+    if len(digits) in (12, 13) and digits.startswith('55'):
+        digits = digits[2:]
+    digits = digits.lstrip('0')
+    if len(digits) not in (10, 11):
+        return ''
+    return digits[:2] + digits[-8:]
+
+
+def name_tokens(value):
+    return [token for token in normalize_search_text(value).split() if token not in NAME_PARTICLES]
+
+
+def phonetic(word):
+    """Chave fonética simplificada para português (grafias como Luiz/Luis, Thiago/Tiago)."""
+    key = word
+    for pattern, replacement in _PHONETIC_RULES:
+        key = pattern.sub(replacement, key)
+    return key
+
+
+def name_key(value):
+    """Chave fonética de primeiro + último nome, ou '' para nome de uma palavra."""
+    tokens = name_tokens(value)
+    if len(tokens) < 2:
+        return ''
+    return f'{phonetic(tokens[0])} {phonetic(tokens[-1])}'
+
+
+# ============================================
+# VARREDURA
+# ============================================
+
+class _Person:
+    """Identificadores de um usuário candidato reunidos do perfil e da candidatura espontânea."""
+
+    __slots__ = ('user_id', 'cpfs', 'emails', 'phones', 'names', 'birth_date', 'city')
+
+    def __init__(self, user_id):
+        self.user_id = user_id
+        self.cpfs = set()
+        self.emails = set()
+        self.phones = set()
+        self.names = set()
+        self.birth_date = None
+        self.city = ''
+
+    def add(self, cpf='', email='', phones=(), name=''):
+        for value, normalize, target in ((cpf, normalize_cpf, self.cpfs), (email, normalize_email, self.emails)):
+            normalized = normalize(value)
+            if normalized:
+                target.add(normalized)
+        for phone in phones:
+            normalized = normalize_phone(phone)
+            if normalized:
+                self.phones.add(normalized)
+        normalized_name = ' '.join(name_tokens(name))
+        if normalized_name:
+            self.names.add(normalized_name)
+
+    def block_keys(self):
+        keys = [('cpf', value) for value in self.cpfs]
+        keys += [('email', value) for value in self.emails]
+        keys += [('phone', value) for value in self.phones]
+        keys += [('name', key) for key in {name_key(name) for name in self.names} if key]
+        return keys
+
+
+def load_people():
+    """{user_id: _Person} de todos os usuários candidatos ativos (três consultas)."""
+    from accounts.models import UserProfile
+    from spontaneous.models import SpontaneousApplication
+
+    people = {}
+    for user_id, name, last_name, email, phone in UserProfile.objects.filter(
+        user_type='candidate', is_active=True
+    ).values_list('pk', 'name', 'last_name', 'email', 'phone').iterator(chunk_size=2000):
+        person = people[user_id] = _Person(user_id)
+        person.add(email=email, phones=[phone], name=f'{name} {last_name}')
+
+    for user_id, cpf, phone_secondary, birth_date, city in CandidateProfile.objects.filter(
+        is_active=True
+    ).values_list('user_id', 'cpf', 'phone_secondary', 'date_of_birth', 'city').iterator(chunk_size=2000):
+        person = people.get(user_id)
+        if person is None:
+            continue
+        person.add(cpf=cpf, phones=[phone_secondary])
+        person.birth_date = birth_date
+        person.city = normalize_search_text(city)
+
+    for user_id, cpf, email, phone, name, city in SpontaneousApplication.objects.values_list(
+        'user_id', 'cpf', 'email', 'phone', 'name', 'city'
+    ).iterator(chunk_size=2000):
+        person = people.get(user_id)
+        if person is None:
+            continue
+        person.add(cpf=cpf, email=email, phones=[phone], name=name)
+        person.city = person.city or normalize_search_text(city)
+
+    return people
+
+
+def build_blocks(people):
+    """
+    Agrupa os usuários por identificador normalizado.
+
+    Returns:
+        (lista de blocos com 2+ usuários, quantidade de blocos ignorados por tamanho)
+    """
+    blocks = {}
+    for person in people.values():
+        for key in person.block_keys():
+            blocks.setdefault(key, []).append(person.user_id)
+
+    kept, skipped = [], 0
+    for (kind, _), user_ids in blocks.items():
+        if len(user_ids) < 2:
+            continue
+        if len(user_ids) > MAX_BLOCK_SIZE[kind]:
+            skipped += 1
+            continue
+        kept.append(user_ids)
+    return kept, skipped
+
+
+def _name_similarity(a, b):
+    if not a.names or not b.names:
+        return None
+    return max(SequenceMatcher(None, x, y).ratio() for x in a.names for y in b.names)
+
+
+def score_pair(a, b):
+    """(score de 0 a 1, critérios coincidentes) de dois usuários."""
+    score = 0.0
+    reasons = []
+
+    if a.cpfs & b.cpfs:
+        score += SCORE_WEIGHTS['cpf']
+        reasons.append('cpf')
+    elif a.cpfs and b.cpfs:
+        score += SCORE_WEIGHTS['cpf_conflict']
+    if a.emails & b.emails:
+        score += SCORE_WEIGHTS['email']
+        reasons.append('email')
+    if a.phones & b.phones:
+        score += SCORE_WEIGHTS['phone']
+        reasons.append('phone')
+
+    similarity = _name_similarity(a, b)
+    if similarity is not None:
+        if similarity >= NAME_SIMILARITY:
+            score += SCORE_WEIGHTS['name'] * similarity
+            reasons.append('name')
+        elif similarity < 0.5:
+            score += SCORE_WEIGHTS['name_mismatch']
+
+    if a.birth_date and b.birth_date:
+        if a.birth_date == b.birth_date:
+            score += SCORE_WEIGHTS['birth_date']
+            reasons.append('birth_date')
+        else:
+            score += SCORE_WEIGHTS['birth_date_conflict']
+    if a.city and a.city == b.city:
+        score += SCORE_WEIGHTS['city']
+        reasons.append('city')
+
+    return round(max(0.0, min(score, 1.0)), 3), reasons
+
+
+def find_duplicates(people=None):
+    """
+    Pares prováveis de duplicidade.
+
+    Returns:
+        (dict {(user_a_id, user_b_id): (score, reasons)}, estatísticas da varredura)
+    """
+    if people is None:
+        people = load_people()
+    blocks, skipped = build_blocks(people)
+
+    compared = set()
+    pairs = {}
+    for user_ids in blocks:
+        for pair in combinations(sorted(set(user_ids)), 2):
+            if pair in compared:
+                continue
+            compared.add(pair)
+            score, reasons = score_pair(people[pair[0]], people[pair[1]])
+            if score >= MIN_SCORE:
+                pairs[pair] = (score, reasons)
+
+    stats = {
+        'candidates': len(people),
+        'blocks': len(blocks),
+        'skipped_blocks': skipped,
+        'compared_pairs': len(compared),
+        'suggestions': len(pairs),
+    }
+    return pairs, stats
+
+
+def scan_duplicates():
+    """
+    Varre a base e grava as sugestões (DuplicateSuggestion).
+
+    Pares novos entram como pendentes; pendentes existentes têm o score atualizado e
+    os que deixaram de ser encontrados são removidos. Descartados e mesclados ficam
+    como estão.
+
+    Returns:
+        dict com as estatísticas da varredura
+    """
+    pairs, stats = find_duplicates()
+
+    with transaction.atomic():
+        resolved = set(
+            DuplicateSuggestion.objects.exclude(status='pending').values_list('user_a_id', 'user_b_id')
+        )
+        suggestions = [
+            DuplicateSuggestion(user_a_id=a, user_b_id=b, score=score, reasons=reasons)
+            for (a, b), (score, reasons) in pairs.items() if (a, b) not in resolved
+        ]
+        DuplicateSuggestion.objects.bulk_create(
+            suggestions,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['user_a', 'user_b'],
+            update_fields=['score', 'reasons', 'updated_at'],
+        )
+        stale = [
+            pk for pk, a, b in DuplicateSuggestion.objects.filter(status='pending').values_list(
+                'pk', 'user_a_id', 'user_b_id'
+            )
+            if (a, b) not in pairs
+        ]
+        for start in range(0, len(stale), 500):
+            DuplicateSuggestion.objects.filter(pk__in=stale[start:start + 500]).delete()
+
+    stats['removed'] = len(stale)
+    logger.info(f'Varredura de duplicidades: {stats}')
+    return stats
+
+
+# ============================================
+# MESCLAGEM
+# ============================================
+
+def choose_primary(user_a, user_b):
+    """Usuário mantido por padrão: o que tem cadastro completo; depois o mais antigo."""
+    has_profile = set(
+        CandidateProfile.objects.filter(user__in=[user_a, user_b]).values_list('user_id', flat=True)
+    )
+    if (user_a.pk in has_profile) != (user_b.pk in has_profile):
+        return (user_a, user_b) if user_a.pk in has_profile else (user_b, user_a)
+    return (user_a, user_b) if user_a.pk < user_b.pk else (user_b, user_a)
+
+
+def _merge_profiles(target, source, summary):
+    """Move os dados do perfil `source` para `target` (mesmo usuário após a mesclagem)."""
+    from admission.models import AdmissionData, CandidateDocument
+    from selection_process.models import CandidateInProcess
+
+    target_languages = CandidateLanguage.objects.filter(candidate=target).values('language')
+    target_skills = CandidateSkill.objects.filter(candidate=target).values('skill_name')
+    target_processes = CandidateInProcess.objects.filter(candidate_profile=target).values('process')
+    target_documents = CandidateDocument.objects.filter(candidate=target).values('document_type')
+
+    summary['educations_moved'] = CandidateEducation.objects.filter(candidate=source).update(candidate=target)
+    summary['experiences_moved'] = CandidateExperience.objects.filter(candidate=source).update(candidate=target)
+    summary['languages_moved'] = CandidateLanguage.objects.filter(candidate=source).exclude(
+        language__in=target_languages
+    ).update(candidate=target)
+    summary['skills_moved'] = CandidateSkill.objects.filter(candidate=source).exclude(
+        skill_name__in=target_skills
+    ).update(candidate=target)
+    # Mesmo processo/tipo de documento nos dois perfis: fica o registro do perfil mantido
+    summary['processes_moved'] = CandidateInProcess.objects.filter(candidate_profile=source).exclude(
+        process__in=target_processes
+    ).update(candidate_profile=target)
+    summary['documents_moved'] = CandidateDocument.objects.filter(candidate=source).exclude(
+        document_type__in=target_documents
+    ).update(candidate=target)
+    if not AdmissionData.objects.filter(candidate=target).exists():
+        summary['admission_data_moved'] = AdmissionData.objects.filter(candidate=source).update(candidate=target)
+    summary['notifications_moved'] = Notification.objects.filter(candidate=source).update(candidate=target)
+
+    update_fields = ['unread_notifications', 'updated_at']
+    target.unread_notifications = Notification.objects.filter(candidate=target, read_at__isnull=True).count()
+    for field in PROFILE_FILL_FIELDS:
+        if not getattr(target, field) and getattr(source, field):
+            setattr(target, field, getattr(source, field))
+            update_fields.append(field)
+    for field in PROFILE_FILL_NULLABLE_FIELDS:
+        if getattr(target, field) is None and getattr(source, field) is not None:
+            setattr(target, field, getattr(source, field))
+            update_fields.append(field)
+    # O CPF fica no perfil desativado (unique): copiar exigiria apagar o do duplicado
+    target.save(update_fields=update_fields)
+
+    source.is_active = False
+    source.available_for_work = False
+    source.unread_notifications = 0
+    source.save(update_fields=['is_active', 'available_for_work', 'unread_notifications', 'updated_at'])
+
+
+def merge_candidates(target_user, source_user, merged_by=None):
+    """
+    Mescla o usuário `source_user` em `target_user`.
+
+    Candidaturas, perfil (ou seus dados, se os dois têm perfil), processos seletivos,
+    documentos, dados de admissão e a candidatura espontânea passam para o usuário
+    mantido. Registros que conflitam com os do mantido (mesma vaga, mesmo processo,
+    mesmo tipo de documento) ficam no duplicado, que é desativado sem ser excluído.
+
+    Returns:
+        dict com a quantidade de registros movidos
+    """
+    from applications.models import Application
+    from spontaneous.models import SpontaneousApplication
+
+    from .matching_services import refresh_match_features_on_commit
+    from .pipeline_services import refresh_pipeline_status
+    from .search_services import refresh_search_documents
+    from .skill_services import refresh_skill_index
+
+    if target_user.pk == source_user.pk:
+        raise ValueError('Não é possível mesclar um usuário com ele mesmo.')
+
+    summary = {}
+    with transaction.atomic():
+        summary['applications_moved'] = Application.objects.filter(candidate=source_user).exclude(
+            job__in=Application.objects.filter(candidate=target_user).values('job')
+        ).update(candidate=target_user)
+
+        target_profile = CandidateProfile.objects.select_for_update().filter(user=target_user).first()
+        source_profile = CandidateProfile.objects.select_for_update().filter(user=source_user).first()
+        profile_ids = [profile.pk for profile in (target_profile, source_profile) if profile is not None]
+        if source_profile is not None and target_profile is None:
+            source_profile.user = target_user
+            source_profile.save(update_fields=['user', 'updated_at'])
+            summary['profile_moved'] = 1
+        elif source_profile is not None:
+            _merge_profiles(target_profile, source_profile, summary)
+
+        if not SpontaneousApplication.objects.filter(user=target_user).exists():
+            summary['spontaneous_moved'] = SpontaneousApplication.objects.filter(
+                user=source_user
+            ).update(user=target_user)
+
+        source_user.is_active = False
+        source_user.save(update_fields=['is_active', 'updated_at'])
+
+        a, b = sorted([target_user.pk, source_user.pk])
+        suggestion, _ = DuplicateSuggestion.objects.get_or_create(
+            user_a_id=a, user_b_id=b, defaults={'score': 1.0, 'reasons': ['manual']}
+        )
+        suggestion.status = 'merged'
+        suggestion.resolved_by = merged_by
+        suggestion.resolved_at = timezone.now()
+        suggestion.save(update_fields=['status', 'resolved_by', 'resolved_at', 'updated_at'])
+        # Demais sugestões do duplicado serão refeitas contra o mantido na próxima varredura
+        DuplicateSuggestion.objects.filter(
+            Q(user_a=source_user) | Q(user_b=source_user), status='pending'
+        ).delete()
+
+        # update() não dispara signals: recalcula os dados derivados dos dois perfis
+        if profile_ids:
+            refresh_pipeline_status(profile_ids)
+            transaction.on_commit(lambda: refresh_search_documents(profile_ids))
+            transaction.on_commit(lambda: refresh_skill_index(profile_ids))
+            refresh_match_features_on_commit(profile_ids)
+
+    return summary
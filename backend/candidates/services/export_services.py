@@ -0,0 +1,290 @@
+"""
+Exportação do banco de candidatos em planilha (CSV ou XLSX) por streaming.
+
+As linhas vêm de `values_list()` percorrido com `iterator(chunk_size=...)` (cursor no
+servidor no PostgreSQL) e são escritas em blocos: a memória do worker fica constante,
+qualquer que seja o número de candidatos exportados.
+
+O XLSX é gerado com a biblioteca padrão (zipfile em modo streaming + SpreadsheetML
+mínimo com strings inline), sem montar a planilha inteira em memória ou em disco.
+"""
+import csv
+import datetime
+import re
+import zipfile
+from decimal import Decimal
+from xml.sax.saxutils import escape
+
+from django.core.exceptions import FieldDoesNotExist
+from django.utils import timezone
+
+from ..models import CandidateProfile
+
+
+CHUNK_SIZE = 2000
+
+# Linhas acumuladas antes de entregar um bloco ao cliente
+ROWS_PER_BLOCK = 500
+
+# chave da coluna -> (cabeçalho, lookup em values_list)
+EXPORT_COLUMNS = {
+    'id': ('ID', 'id'),
+    'name': ('Nome', 'user__name'),
+    'last_name': ('Sobrenome', 'user__last_name'),
+    'email': ('E-mail', 'user__email'),
+    'cpf': ('CPF', 'cpf'),
+    'phone': ('Telefone', 'phone_secondary'),
+    'date_of_birth': ('Data de Nascimento', 'date_of_birth'),
+    'gender': ('Gênero', 'gender'),
+    'city': ('Cidade', 'city'),
+    'state': ('Estado', 'state'),
+    'current_position': ('Cargo Atual', 'current_position'),
+    'current_company': ('Empresa Atual', 'current_company'),
+    'education_level': ('Escolaridade', 'education_level'),
+    'experience_years': ('Anos de Experiência', 'experience_years'),
+    'desired_salary_min': ('Pretensão Salarial Mínima', 'desired_salary_min'),
+    'desired_salary_max': ('Pretensão Salarial Máxima', 'desired_salary_max'),
+    'skills': ('Habilidades', 'skills'),
+    'available_for_work': ('Disponível para Trabalho', 'available_for_work'),
+    'accepts_remote_work': ('Aceita Trabalho Remoto', 'accepts_remote_work'),
+    'accepts_relocation': ('Aceita Mudança de Cidade', 'accepts_relocation'),
+    'can_travel': ('Disponível para Viagens', 'can_travel'),
+    'preferred_work_shift': ('Turno Preferido', 'preferred_work_shift'),
+    'has_cnh': ('Possui CNH', 'has_cnh'),
+    'has_vehicle': ('Possui Veículo', 'has_vehicle'),
+    'linkedin_url': ('LinkedIn', 'linkedin_url'),
+    'profile_status': ('Status do Perfil', 'profile_status'),
+    'pipeline_status': ('Status no Pipeline', 'pipeline_status'),
+    'created_at': ('Cadastrado em', 'created_at'),
+}
+
+DEFAULT_COLUMNS = [
+    'id', 'name', 'last_name', 'email', 'phone', 'city', 'state', 'current_position',
+    'education_level', 'experience_years', 'profile_status', 'pipeline_status', 'created_at',
+]
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+    'xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'xlsx'),
+}
+
+# Caracteres de controle não permitidos em XML 1.0
+INVALID_XML_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def parse_columns(value):
+    """
+    Converte ?columns=name,email,... na lista de chaves de coluna.
+
+    Raises:
+        ValueError com as colunas desconhecidas
+    """
+    if not value:
+        return list(DEFAULT_COLUMNS)
+    columns = list(dict.fromkeys(c.strip() for c in value.split(',') if c.strip()))
+    unknown = [c for c in columns if c not in EXPORT_COLUMNS]
+    if unknown:
+        raise ValueError(f'Colunas desconhecidas: {", ".join(unknown)}.')
+    return columns or list(DEFAULT_COLUMNS)
+
+
+def _choices_for(lookup):
+    """Rótulos dos choices para campos locais do perfil (ex.: education_level)."""
+    try:
+        field = CandidateProfile._meta.get_field(lookup)
+    except FieldDoesNotExist:
+        return None
+    return dict(field.flatchoices) if field.choices else None
+
+
+def _format_value(value, choices):
+    if value is None:
+        return ''
+    if choices is not None:
+        return str(choices.get(value, value))
+    if isinstance(value, bool):
+        return 'Sim' if value else 'Não'
+    if isinstance(value, datetime.datetime):
+        return timezone.localtime(value).strftime('%d/%m/%Y %H:%M')
+    if isinstance(value, datetime.date):
+        return value.strftime('%d/%m/%Y')
+    return value
+
+
+def iter_export_rows(queryset, columns, chunk_size=CHUNK_SIZE):
+    """Percorre o queryset em projeção values_list, já com valores formatados."""
+    lookups = [EXPORT_COLUMNS[c][1] for c in columns]
+    choices = [_choices_for(lookup) for lookup in lookups]
+    rows = queryset.values_list(*lookups).iterator(chunk_size=chunk_size)
+    for row in rows:
+        yield [_format_value(value, field_choices) for value, field_choices in zip(row, choices)]
+
+
+def _blocks(rows, size=ROWS_PER_BLOCK):
+    block = []
+    for row in rows:
+        block.append(row)
+        if len(block) >= size:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
+class _Echo:
+    """Buffer de escrita que devolve o valor escrito (padrão do csv.writer em streaming)."""
+
+    def write(self, value):
+        return value
+
+
+# Início de célula que o Excel/LibreOffice interpretam como fórmula
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def _safe_cell(value):
+    """Texto que viraria fórmula (nome, cidade, resumo digitados pelo candidato) sai com ' na frente."""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def stream_csv(header, rows):
+    """Gera o CSV em blocos de bytes (UTF-8 com BOM e ';', como o Excel em pt-BR espera)."""
+    writer = csv.writer(_Echo(), delimiter=';')
+    yield ('\ufeff' + writer.writerow(header)).encode('utf-8')
+    for block in _blocks(rows):
+        yield ''.join(writer.writerow([_safe_cell(value) for value in row]) for row in block).encode('utf-8')
+
+
+class _ZipStream:
+    """Destino não posicionável para o zipfile: acumula bytes até serem drenados."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+XLSX_STATIC_PARTS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/workbook.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Candidatos" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+        'Target="styles.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/styles.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+        '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/></cellXfs>'
+        '</styleSheet>'
+    ),
+}
+
+
+def _xlsx_cell(value, style=''):
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        return f'<c{style}><v>{value}</v></c>'
+    text = INVALID_XML_CHARS.sub('', str(value))
+    if not text:
+        return '<c/>'
+    return f'<c t="inlineStr"{style}><is><t xml:space="preserve">{escape(text)}</t></is></c>'
+
+
+def _xlsx_row(values, style=''):
+    return '<row>' + ''.join(_xlsx_cell(value, style) for value in values) + '</row>'
+
+
+def stream_xlsx(header, rows):
+    """Gera o XLSX em blocos de bytes: o ZIP é escrito e drenado à medida que as linhas chegam."""
+    output = _ZipStream()
+    with zipfile.ZipFile(output, mode='w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in XLSX_STATIC_PARTS.items():
+            archive.writestr(name, content)
+        yield output.drain()
+
+        with archive.open('xl/worksheets/sheet1.xml', mode='w') as sheet:
+            sheet.write((
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                '<sheetViews><sheetView workbookViewId="0">'
+                '<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>'
+                '</sheetView></sheetViews>'
+                '<sheetData>' + _xlsx_row(header, style=' s="1"')
+            ).encode('utf-8'))
+            for block in _blocks(rows):
+                sheet.write(''.join(_xlsx_row(row) for row in block).encode('utf-8'))
+                chunk = output.drain()
+                if chunk:
+                    yield chunk
+            sheet.write(b'</sheetData></worksheet>')
+    yield output.drain()
+
+
+def export_candidates(queryset, columns, file_format='csv'):
+    """
+    Monta o gerador de bytes da exportação.
+
+    Args:
+        queryset: queryset de CandidateProfile já filtrado e ordenado
+        columns: chaves de EXPORT_COLUMNS (ver parse_columns)
+        file_format: 'csv' ou 'xlsx'
+
+    Returns:
+        gerador de bytes para StreamingHttpResponse
+    """
+    header = [EXPORT_COLUMNS[c][0] for c in columns]
+    rows = iter_export_rows(queryset, columns)
+    if file_format == 'xlsx':
+        return stream_xlsx(header, rows)
+    return stream_csv(header, rows)
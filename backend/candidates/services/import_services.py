@@ -0,0 +1,640 @@
+"""
+Importação em lote de candidatos a partir de planilhas (CSV ou XLSX) de agências
+parceiras.
+
+As linhas são lidas por streaming (csv.reader sobre o arquivo; XLSX com zipfile +
+iterparse, sem openpyxl) e processadas em lotes de BATCH_SIZE: cada lote é validado
+com as regras do cadastro (candidates.validators), com uma consulta de unicidade de
+e-mail e uma de CPF, e gravado com bulk_create (usuários, perfis, formações e
+habilidades) na própria transação. A memória fica limitada ao lote, e uma linha
+inválida não impede a importação das demais: o resultado traz os erros por linha.
+
+bulk_create não dispara signals: contadores do pipeline, documentos de busca e
+índice de habilidades (que atualiza os atributos de ranqueamento) são atualizados
+explicitamente ao fim de cada lote.
+
+Os usuários são criados sem senha utilizável: o candidato define a senha pelo
+"Esqueci minha senha" com o e-mail importado.
+
+Cabeçalhos aceitos: os da exportação (export_services, ex.: "Nome", "E-mail",
+"Cidade") ou as chaves (name, email, city), sem diferenciar acentos e maiúsculas.
+"""
+import codecs
+import csv
+import datetime
+import io
+import logging
+import os
+import re
+import zipfile
+from xml.etree.ElementTree import iterparse
+
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.validators import URLValidator, validate_email
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+
+from app.utils import normalize_search_text, parse_brl_amount
+
+from ..models import CandidateEducation, CandidateImport, CandidateProfile, CandidateSkill
+from ..validators import birth_date_error, cpf_digits, cpf_error, format_cpf, zip_code_error
+from .export_services import EXPORT_COLUMNS
+from .matching_services import normalize_state
+from .skill_services import split_free_text_skills
+
+logger = logging.getLogger('app')
+
+BATCH_SIZE = 500
+
+IMPORT_FORMATS = ('csv', 'xlsx')
+
+# Colunas importadas além das da exportação: chave -> cabeçalho
+EXTRA_COLUMNS = {
+    'zip_code': 'CEP',
+    'street': 'Rua',
+    'number': 'Número',
+    'neighborhood': 'Bairro',
+    'professional_summary': 'Resumo Profissional',
+    'education_institution': 'Instituição',
+    'education_course': 'Curso',
+    'education_degree': 'Grau',
+    'education_start_date': 'Início do Curso',
+    'education_end_date': 'Conclusão do Curso',
+}
+
+PROFILE_TEXT_FIELDS = [
+    'city', 'current_position', 'current_company', 'skills', 'linkedin_url',
+    'zip_code', 'street', 'number', 'neighborhood', 'professional_summary',
+]
+BOOLEAN_FIELDS = [
+    'available_for_work', 'accepts_remote_work', 'accepts_relocation', 'can_travel', 'has_cnh', 'has_vehicle',
+]
+CHOICE_FIELDS = ['gender', 'education_level', 'preferred_work_shift']
+# CPF é único em CandidateProfile (inclusive vazio): obrigatório na importação
+REQUIRED_FIELDS = ['name', 'email', 'cpf', 'city', 'state']
+
+TRUE_VALUES = {'sim', 's', 'true', 'verdadeiro', '1', 'x', 'yes', 'y'}
+FALSE_VALUES = {'nao', 'n', 'false', 'falso', '0', 'no'}
+
+DATE_FORMATS = ['%d/%m/%Y', '%Y-%m-%d', '%d-%m-%Y', '%d.%m.%Y', '%d/%m/%y']
+# Datas do Excel são números de dias a partir de 30/12/1899
+EXCEL_EPOCH = datetime.date(1899, 12, 30)
+
+SKILL_LEVELS = {
+    normalize_search_text(label): key for key, label in CandidateSkill.SKILL_LEVEL_CHOICES
+}
+SKILL_LEVELS.update({key: key for key, _ in CandidateSkill.SKILL_LEVEL_CHOICES})
+DEFAULT_SKILL_LEVEL = 'intermediate'
+# "Python (Avançado)" / "Python: avançado"
+SKILL_WITH_LEVEL = re.compile(r'^(?P<name>.+?)\s*(?:\((?P<paren>[^)]*)\)|:\s*(?P<colon>.+))$')
+
+XLSX_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+
+_validate_url = URLValidator()
+
+
+def _header_key(value):
+    return re.sub(r'[^a-z0-9]+', '_', normalize_search_text(value)).strip('_')
+
+
+def _build_header_aliases():
+    aliases = {}
+    columns = {key: header for key, (header, _) in EXPORT_COLUMNS.items()}
+    columns.update(EXTRA_COLUMNS)
+    for key, header in columns.items():
+        aliases[_header_key(key)] = key
+        aliases[_header_key(header)] = key
+    return aliases
+
+
+HEADER_ALIASES = _build_header_aliases()
+
+
+# ============================================
+# LEITURA DAS PLANILHAS
+# ============================================
+
+class _ExcelSemicolon(csv.excel):
+    delimiter = ';'
+
+
+def _detect_encoding(sample):
+    """UTF-8 (com ou sem BOM) ou, se inválido, cp1252 (CSV salvo pelo Excel em pt-BR)."""
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8-sig'
+    except UnicodeDecodeError:
+        return 'cp1252'
+
+
+def read_csv_rows(stream):
+    """Linhas (listas de texto) de um CSV binário; separador ';', ',' ou tabulação."""
+    sample = stream.read(64 * 1024)
+    stream.seek(0)
+    encoding = _detect_encoding(sample)
+    text = io.TextIOWrapper(stream, encoding=encoding, newline='')
+    try:
+        dialect = csv.Sniffer().sniff(sample.decode(encoding, errors='ignore'), delimiters=';,\t')
+    except csv.Error:
+        dialect = _ExcelSemicolon
+    try:
+        yield from csv.reader(text, dialect)
+    finally:
+        text.detach()
+
+
+def _column_index(reference):
+    letters = re.match(r'[A-Z]+', reference).group()
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - ord('A') + 1
+    return index - 1
+
+
+def _xlsx_shared_strings(archive):
+    if 'xl/sharedStrings.xml' not in archive.namelist():
+        return []
+    strings = []
+    with archive.open('xl/sharedStrings.xml') as source:
+        for _, element in iterparse(source):
+            if element.tag == f'{XLSX_NS}si':
+                strings.append(''.join(node.text or '' for node in element.iter(f'{XLSX_NS}t')))
+                element.clear()
+    return strings
+
+
+def _xlsx_cell_value(cell, shared_strings):
+    cell_type = cell.get('t', 'n')
+    if cell_type == 'inlineStr':
+        return ''.join(node.text or '' for node in cell.iter(f'{XLSX_NS}t'))
+    value = cell.find(f'{XLSX_NS}v')
+    if value is None or value.text is None:
+        return ''
+    if cell_type == 's':
+        return shared_strings[int(value.text)]
+    if cell_type == 'b':
+        return value.text == '1'
+    if cell_type == 'n':
+        number = float(value.text)
+        return int(number) if number.is_integer() else number
+    return value.text
+
+
+def read_xlsx_rows(stream):
+    """Linhas da primeira planilha de um XLSX, lidas elemento a elemento (iterparse)."""
+    with zipfile.ZipFile(stream) as archive:
+        sheets = sorted(
+            name for name in archive.namelist() if re.match(r'xl/worksheets/sheet\d+\.xml$', name)
+        )
+        if not sheets:
+            raise ValueError('Planilha XLSX sem abas.')
+        shared_strings = _xlsx_shared_strings(archive)
+        with archive.open(sheets[0]) as source:
+            for _, element in iterparse(source):
+                if element.tag != f'{XLSX_NS}row':
+                    continue
+                values = []
+                for cell in element.iter(f'{XLSX_NS}c'):
+                    reference = cell.get('r')
+                    if reference:
+                        values.extend([''] * (_column_index(reference) - len(values)))
+                    values.append(_xlsx_cell_value(cell, shared_strings))
+                element.clear()
+                yield values
+
+
+def iter_import_rows(stream, file_format):
+    """
+    Percorre a planilha como dicionários {coluna: valor}.
+
+    Yields:
+        (número da linha na planilha, dict)
+
+    Raises:
+        ValueError se o cabeçalho não tem as colunas obrigatórias
+    """
+    reader = read_xlsx_rows(stream) if file_format == 'xlsx' else read_csv_rows(stream)
+    header = next(reader, None)
+    if not header:
+        raise ValueError('Planilha vazia.')
+    columns = [HEADER_ALIASES.get(_header_key(str(value))) for value in header]
+    missing = [field for field in REQUIRED_FIELDS if field not in columns]
+    if missing:
+        labels = [EXPORT_COLUMNS[field][0] for field in missing]
+        raise ValueError(f'Colunas obrigatórias ausentes: {", ".join(labels)}.')
+
+    for line, values in enumerate(reader, start=2):
+        row = {
+            column: value.strip() if isinstance(value, str) else value
+            for column, value in zip(columns, values) if column
+        }
+        if any(value not in ('', None) for value in row.values()):
+            yield line, row
+
+
+# ============================================
+# VALIDAÇÃO
+# ============================================
+
+def _parse_date(value):
+    if isinstance(value, (int, float)) and 1 < value < 100000:
+        return EXCEL_EPOCH + datetime.timedelta(days=int(value))
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(str(value).split(' ')[0], date_format).date()
+        except ValueError:
+            continue
+    raise ValueError('Data inválida (use dd/mm/aaaa).')
+
+
+def _parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    normalized = normalize_search_text(str(value))
+    if normalized in TRUE_VALUES:
+        return True
+    if normalized in FALSE_VALUES:
+        return False
+    raise ValueError('Use Sim ou Não.')
+
+
+def _choice_lookup(field_name):
+    choices = {}
+    for key, label in CandidateProfile._meta.get_field(field_name).flatchoices:
+        choices[normalize_search_text(key)] = key
+        choices[normalize_search_text(label)] = key
+    return choices
+
+
+CHOICE_LOOKUPS = {field: _choice_lookup(field) for field in CHOICE_FIELDS}
+
+
+def _parse_skills(text):
+    """[(nome, nível)] de "Python (Avançado); Django" (nível padrão: intermediário)."""
+    skills = {}
+    for term in split_free_text_skills(text):
+        name, level = term, DEFAULT_SKILL_LEVEL
+        match = SKILL_WITH_LEVEL.match(term)
+        if match:
+            given = normalize_search_text(match.group('paren') or match.group('colon') or '')
+            if given in SKILL_LEVELS:
+                name, level = match.group('name'), SKILL_LEVELS[given]
+        name = name.strip()[:100]
+        if name:
+            skills.setdefault(name.lower(), (name, level))
+    return list(skills.values())
+
+
+# Colunas numéricas no Excel (e CSVs salvos por ele) perdem os zeros à esquerda
+ZERO_PADDED_FIELDS = {'cpf': 11, 'zip_code': 8}
+
+
+def _text(row, field):
+    value = row.get(field)
+    if value is None:
+        return ''
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if float(value).is_integer():
+            value = int(value)
+    value = str(value).strip()
+    if field in ZERO_PADDED_FIELDS and value.isdigit():
+        return value.zfill(ZERO_PADDED_FIELDS[field])
+    return value
+
+
+def validate_row(row):
+    """
+    Valida e converte uma linha.
+
+    Returns:
+        (dict com os valores limpos, dict {coluna: mensagem de erro})
+    """
+    cleaned = {}
+    errors = {}
+
+    for field in REQUIRED_FIELDS:
+        if not _text(row, field):
+            errors[field] = 'Campo obrigatório.'
+
+    email = _text(row, 'email').lower()
+    if email and 'email' not in errors:
+        try:
+            validate_email(email)
+        except ValidationError:
+            errors['email'] = 'E-mail inválido.'
+    cleaned['email'] = email
+    cleaned['name'] = _text(row, 'name')[:255]
+    cleaned['last_name'] = _text(row, 'last_name')[:255]
+    cleaned['phone'] = _text(row, 'phone')[:20]
+
+    cpf = _text(row, 'cpf')
+    if cpf:
+        error = cpf_error(cpf)
+        if error:
+            errors['cpf'] = error
+        else:
+            cpf = format_cpf(cpf)
+    cleaned['cpf'] = cpf
+
+    state = _text(row, 'state')
+    if state and 'state' not in errors:
+        cleaned['state'] = normalize_state(state)
+        if not cleaned['state']:
+            errors['state'] = 'UF inválida.'
+
+    for field in PROFILE_TEXT_FIELDS:
+        max_length = CandidateProfile._meta.get_field(field).max_length
+        value = _text(row, field)
+        cleaned[field] = value[:max_length] if max_length else value
+    if cleaned['zip_code']:
+        error = zip_code_error(cleaned['zip_code'])
+        if error:
+            errors['zip_code'] = error
+        else:
+            digits = cleaned['zip_code'].replace('-', '')
+            cleaned['zip_code'] = f'{digits[:5]}-{digits[5:]}'
+    if cleaned['linkedin_url']:
+        try:
+            _validate_url(cleaned['linkedin_url'])
+        except ValidationError:
+            errors['linkedin_url'] = 'URL inválida.'
+
+    for field in CHOICE_FIELDS:
+        value = _text(row, field)
+        if value:
+            cleaned[field] = CHOICE_LOOKUPS[field].get(normalize_search_text(value))
+            if cleaned[field] is None:
+                errors[field] = 'Opção inválida.'
+
+    for field in BOOLEAN_FIELDS:
+        value = row.get(field)
+        if value not in ('', None):
+            try:
+                cleaned[field] = _parse_bool(value)
+            except ValueError as e:
+                errors[field] = str(e)
+
+    if row.get('date_of_birth') not in ('', None):
+        try:
+            cleaned['date_of_birth'] = _parse_date(row['date_of_birth'])
+            error = birth_date_error(cleaned['date_of_birth'])
+            if error:
+                errors['date_of_birth'] = error
+        except ValueError as e:
+            errors['date_of_birth'] = str(e)
+
+    experience = _text(row, 'experience_years')
+    if experience:
+        if not experience.isdigit() or int(experience) > 50:
+            errors['experience_years'] = 'Informe um número inteiro de 0 a 50.'
+        else:
+            cleaned['experience_years'] = int(experience)
+
+    # Faixa salarial: mesmas regras de CandidateProfileSerializer.validate
+    for field in ('desired_salary_min', 'desired_salary_max'):
+        value = _text(row, field)
+        cleaned[field] = value[:50]
+        if value:
+            amount = parse_brl_amount(value)
+            if amount is None or amount <= 0:
+                errors[field] = 'Valor inválido.'
+    salary_min = parse_brl_amount(cleaned['desired_salary_min'])
+    salary_max = parse_brl_amount(cleaned['desired_salary_max'])
+    if salary_min and salary_max and salary_min > salary_max:
+        errors['desired_salary_max'] = 'Salário máximo deve ser maior que o mínimo.'
+
+    cleaned['detailed_skills'] = _parse_skills(cleaned['skills'])
+
+    institution = _text(row, 'education_institution')
+    course = _text(row, 'education_course')
+    if institution or course:
+        education = {
+            'institution': institution[:255],
+            'course': course[:255],
+            'degree': _text(row, 'education_degree')[:100],
+        }
+        if not institution or not course:
+            errors['education_course' if institution else 'education_institution'] = (
+                'Informe instituição e curso.'
+            )
+        for field, key in (('education_start_date', 'start_date'), ('education_end_date', 'end_date')):
+            if row.get(field) not in ('', None):
+                try:
+                    education[key] = _parse_date(row[field])
+                except ValueError as e:
+                    errors[field] = str(e)
+        if 'start_date' not in education and 'education_start_date' not in errors:
+            errors['education_start_date'] = 'Campo obrigatório para a formação.'
+        cleaned['education'] = education
+
+    return cleaned, errors
+
+
+def _existing_emails(emails):
+    from accounts.models import UserProfile
+    return {email.lower() for email in UserProfile.objects.filter(email__in=emails).values_list('email', flat=True)}
+
+
+def _existing_cpfs(cpfs):
+    variants = set(cpfs) | {cpf_digits(cpf) for cpf in cpfs}
+    return {
+        cpf_digits(cpf) for cpf in CandidateProfile.objects.filter(cpf__in=variants).values_list('cpf', flat=True)
+    }
+
+
+# ============================================
+# GRAVAÇÃO
+# ============================================
+
+def _create_batch(rows):
+    """Grava um lote de linhas válidas; retorna os ids dos perfis criados."""
+    from accounts.models import UserProfile
+
+    from .pipeline_services import adjust_pipeline_counters
+
+    # make_password(None): senha não utilizável, sem o custo do hash por usuário
+    unusable_password = make_password(None)
+    users = [
+        UserProfile(
+            email=row['email'], name=row['name'], last_name=row['last_name'], phone=row['phone'],
+            user_type='candidate', password=unusable_password,
+            search_name=normalize_search_text(row['name'], row['last_name'], row['email']),
+        )
+        for row in rows
+    ]
+    profile_fields = PROFILE_TEXT_FIELDS + CHOICE_FIELDS + BOOLEAN_FIELDS + [
+        'cpf', 'state', 'date_of_birth', 'experience_years', 'desired_salary_min', 'desired_salary_max',
+    ]
+
+    with transaction.atomic():
+        UserProfile.objects.bulk_create(users)
+        profiles = []
+        for user, row in zip(users, rows):
+            profile = CandidateProfile(
+                user=user, phone_secondary=row['phone'],
+                **{field: row[field] for field in profile_fields if row.get(field) is not None},
+            )
+            profile.sync_salary_values()
+            profiles.append(profile)
+        CandidateProfile.objects.bulk_create(profiles)
+
+        educations = []
+        skills = []
+        for profile, row in zip(profiles, rows):
+            education = row.get('education')
+            if education:
+                educations.append(CandidateEducation(
+                    candidate=profile, is_current=education.get('end_date') is None, **education
+                ))
+            skills.extend(
+                CandidateSkill(candidate=profile, skill_name=name, level=level)
+                for name, level in row['detailed_skills']
+            )
+        CandidateEducation.objects.bulk_create(educations)
+        CandidateSkill.objects.bulk_create(skills)
+
+        counts = {}
+        for profile in profiles:
+            counts[profile.pipeline_status] = counts.get(profile.pipeline_status, 0) + 1
+        adjust_pipeline_counters(counts)
+
+    return [profile.pk for profile in profiles]
+
+
+def _refresh_derived(profile_ids):
+    from .search_services import refresh_search_documents
+    from .skill_services import refresh_skill_index
+
+    refresh_search_documents(profile_ids)
+    # Também atualiza os atributos de ranqueamento (matching_services)
+    refresh_skill_index(profile_ids)
+
+
+def _process_batch(batch, seen_emails, seen_cpfs, result, dry_run):
+    emails = _existing_emails([cleaned['email'] for _, cleaned, _ in batch if cleaned['email']])
+    cpfs = _existing_cpfs([cleaned['cpf'] for _, cleaned, _ in batch if cleaned['cpf']])
+
+    valid = []
+    for line, cleaned, errors in batch:
+        email, cpf = cleaned['email'], cpf_digits(cleaned['cpf'])
+        if email and 'email' not in errors:
+            if email in emails:
+                errors['email'] = 'E-mail já cadastrado.'
+            elif email in seen_emails:
+                errors['email'] = 'E-mail repetido na planilha.'
+        if cpf and 'cpf' not in errors:
+            if cpf in cpfs:
+                errors['cpf'] = 'Este CPF já está cadastrado.'
+            elif cpf in seen_cpfs:
+                errors['cpf'] = 'CPF repetido na planilha.'
+        seen_emails.add(email)
+        if cpf:
+            seen_cpfs.add(cpf)
+
+        if errors:
+            result['errors'].append({'row': line, 'errors': errors})
+        else:
+            valid.append((line, cleaned))
+
+    if dry_run or not valid:
+        result['imported_rows'] += len(valid)
+        return
+
+    try:
+        profile_ids = _create_batch([cleaned for _, cleaned in valid])
+    except DatabaseError as e:
+        # Ex.: e-mail/CPF cadastrado por outra requisição durante a importação
+        for line, _ in valid:
+            result['errors'].append({'row': line, 'errors': {'_': f'Falha ao gravar o lote: {e}'}})
+        return
+    result['imported_rows'] += len(profile_ids)
+    _refresh_derived(profile_ids)
+
+
+def import_candidates(stream, file_format='csv', dry_run=False, batch_size=BATCH_SIZE, progress=None):
+    """
+    Importa os candidatos da planilha.
+
+    Args:
+        stream: arquivo binário (CSV ou XLSX)
+        file_format: 'csv' ou 'xlsx'
+        dry_run: só valida, sem gravar
+        batch_size: linhas por lote (uma transação por lote)
+        progress: função chamada com o resultado parcial após cada lote
+
+    Returns:
+        dict com total_rows, imported_rows e errors ([{'row': n, 'errors': {coluna: mensagem}}])
+
+    Raises:
+        ValueError se o arquivo não pode ser lido ou o cabeçalho é inválido
+    """
+    result = {'total_rows': 0, 'imported_rows': 0, 'errors': []}
+    seen_emails, seen_cpfs = set(), set()
+    batch = []
+    try:
+        for line, row in iter_import_rows(stream, file_format):
+            cleaned, errors = validate_row(row)
+            batch.append((line, cleaned, errors))
+            result['total_rows'] += 1
+            if len(batch) >= batch_size:
+                _process_batch(batch, seen_emails, seen_cpfs, result, dry_run)
+                batch = []
+                if progress is not None:
+                    progress(result)
+        if batch:
+            _process_batch(batch, seen_emails, seen_cpfs, result, dry_run)
+    except (zipfile.BadZipFile, csv.Error, UnicodeDecodeError) as e:
+        raise ValueError(f'Não foi possível ler a planilha: {e}')
+    return result
+
+
+def error_report_rows(errors):
+    """Linhas do relatório de erros (linha, coluna, mensagem) para stream_csv."""
+    for entry in errors:
+        for column, message in entry['errors'].items():
+            yield [entry['row'], column, message]
+
+
+ERROR_REPORT_HEADER = ['Linha', 'Coluna', 'Erro']
+
+
+def run_import_job(import_id, path, file_format):
+    """
+    Processa uma CandidateImport em segundo plano (app.background) e apaga o
+    arquivo temporário ao terminar.
+    """
+    def save(**values):
+        CandidateImport.objects.filter(pk=import_id).update(updated_at=timezone.now(), **values)
+
+    def progress(result):
+        save(
+            total_rows=result['total_rows'],
+            imported_rows=result['imported_rows'],
+            error_rows=len(result['errors']),
+        )
+
+    save(status='processing')
+    try:
+        dry_run = CandidateImport.objects.filter(pk=import_id).values_list('dry_run', flat=True).get()
+        with open(path, 'rb') as stream:
+            result = import_candidates(stream, file_format, dry_run=dry_run, progress=progress)
+    except ValueError as e:
+        save(status='failed', message=str(e), finished_at=timezone.now())
+    except Exception as e:
+        logger.exception(f'Erro na importação de candidatos {import_id}')
+        save(status='failed', message=f'Erro inesperado: {e}', finished_at=timezone.now())
+    else:
+        save(
+            status='completed',
+            total_rows=result['total_rows'],
+            imported_rows=result['imported_rows'],
+            error_rows=len(result['errors']),
+            errors=result['errors'],
+            finished_at=timezone.now(),
+        )
+    finally:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
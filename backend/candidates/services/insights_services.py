@@ -0,0 +1,232 @@
+"""
+Insights de IA do pipeline de candidatos.
+
+A geração (chamada ao modelo de IA) roda em segundo plano (app.background) e o
+resultado fica em PipelineInsight, identificado pelo hash dos dados de entrada
+(distribuição do pipeline, agregados de candidaturas e taxas de conversão). A
+requisição nunca espera a IA: devolve o insight dos dados atuais, se já existir,
+ou o último gerado enquanto o novo é produzido.
+
+O cliente de IA é plugável (settings.AI_INSIGHTS_CLIENT): OpenAIInsightsClient em
+produção, FakeInsightsClient em testes e desenvolvimento.
+"""
+import hashlib
+import json
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError
+from django.db.models import Count, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from app.background import submit
+from app.instrumentation import track_external
+
+from ..models import PipelineInsight
+from .pipeline_services import get_dashboard_stats
+
+logger = logging.getLogger('candidates')
+
+GENERATION_LOCK_KEY = 'ai_insights_generating'
+
+SYSTEM_PROMPT = (
+    "Você é um analista de RH especializado em recrutamento. "
+    "Analise os dados do pipeline de candidatos e gere insights em português brasileiro. "
+    "Retorne APENAS JSON válido com esta estrutura exata:\n"
+    "{\n"
+    '  "summary": "resumo geral em 1-2 frases",\n'
+    '  "highlights": [{"title": "...", "description": "...", "type": "positive|warning|critical"}],\n'
+    '  "bottleneck": "fase com maior perda de candidatos e explicação",\n'
+    '  "recommendations": ["recomendação 1", "recomendação 2", "recomendação 3"]\n'
+    "}\n"
+    "Gere 3-5 highlights. Tipos: positive=bom, warning=atenção, critical=urgente."
+)
+
+
+class InsightsUnavailable(Exception):
+    """Cliente de IA não configurado (ex.: OPENAI_API_KEY ausente)."""
+
+
+class OpenAIInsightsClient:
+    """Gera os insights com a API da OpenAI (com timeout)."""
+
+    def __init__(self):
+        self.api_key = getattr(settings, 'OPENAI_API_KEY', '')
+        self.model_name = settings.AI_INSIGHTS_MODEL
+
+    def is_available(self):
+        return bool(self.api_key)
+
+    def generate(self, inputs):
+        from openai import OpenAI
+
+        client = OpenAI(api_key=self.api_key, timeout=settings.AI_INSIGHTS_TIMEOUT, max_retries=1)
+        prompt_data = json.dumps({
+            'total_candidatos': inputs['total'],
+            'distribuicao_pipeline': inputs['distribution'],
+            'candidaturas': inputs['applications'],
+            'taxas_conversao': inputs['conversion'],
+        }, ensure_ascii=False)
+
+        with track_external('openai'):
+            response = client.chat.completions.create(
+                model=self.model_name,
+                response_format={"type": "json_object"},
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": f"Analise estes dados do nosso banco de talentos:\n\n{prompt_data}"},
+                ],
+                max_tokens=800,
+                temperature=0.7,
+            )
+        return json.loads(response.choices[0].message.content)
+
+
+class FakeInsightsClient:
+    """Cliente local e determinístico (sem rede), para testes e desenvolvimento."""
+
+    model_name = 'fake'
+
+    def is_available(self):
+        return True
+
+    def generate(self, inputs):
+        conversion = inputs['conversion']
+        steps = {
+            'Cadastro → Aprovado': conversion['cadastro_to_aprovado'],
+            'Aprovado → Documentos OK': conversion['aprovado_to_docs_ok'],
+            'Documentos OK → Admitido': conversion['docs_ok_to_admitido'],
+        }
+        bottleneck = min(steps, key=steps.get)
+        return {
+            'summary': f"{inputs['total']} candidatos no banco, "
+                       f"{inputs['applications']['total']} candidaturas.",
+            'highlights': [
+                {
+                    'title': step,
+                    'description': f'Taxa de conversão de {rate}%.',
+                    'type': 'positive' if rate >= 50 else 'warning' if rate >= 20 else 'critical',
+                }
+                for step, rate in steps.items()
+            ],
+            'bottleneck': f'{bottleneck} ({steps[bottleneck]}%).',
+            'recommendations': [],
+        }
+
+
+def get_insights_client():
+    return import_string(settings.AI_INSIGHTS_CLIENT)()
+
+
+def collect_insight_inputs():
+    """Dados de entrada dos insights: distribuição, candidaturas e taxas de conversão."""
+    from applications.models import Application
+
+    stats = get_dashboard_stats()
+    distribution = stats['distribution']
+    total = stats['total']
+
+    applications = Application.objects.aggregate(
+        total=Count('id'),
+        submitted=Count('id', filter=Q(status='submitted')),
+        in_process=Count('id', filter=Q(status='in_process')),
+        interview_scheduled=Count('id', filter=Q(status='interview_scheduled')),
+        approved=Count('id', filter=Q(status='approved')),
+        rejected=Count('id', filter=Q(status='rejected')),
+        withdrawn=Count('id', filter=Q(status='withdrawn')),
+    )
+
+    approved_profiles = distribution.get('approved', 0) + distribution.get('in_selection_process', 0) + \
+        distribution.get('documents_pending', 0) + distribution.get('documents_complete', 0) + \
+        distribution.get('admission_in_progress', 0) + distribution.get('admitted', 0)
+    docs_complete = distribution.get('documents_complete', 0) + distribution.get('in_selection_process', 0) + \
+        distribution.get('admission_in_progress', 0) + distribution.get('admitted', 0)
+    admitted_count = distribution.get('admitted', 0)
+
+    conversion = {
+        'cadastro_to_aprovado': round(approved_profiles / total * 100, 1) if total > 0 else 0,
+        'aprovado_to_docs_ok': round(docs_complete / approved_profiles * 100, 1) if approved_profiles > 0 else 0,
+        'docs_ok_to_admitido': round(admitted_count / docs_complete * 100, 1) if docs_complete > 0 else 0,
+    }
+
+    return {
+        'distribution': distribution,
+        'total': total,
+        'conversion': conversion,
+        'applications': applications,
+    }
+
+
+def compute_input_hash(inputs):
+    payload = json.dumps(inputs, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def generate_insight(input_hash, inputs):
+    """Gera e grava o insight (executado em segundo plano). Idempotente por input_hash."""
+    lock_key = f'{GENERATION_LOCK_KEY}:{input_hash}'
+    if PipelineInsight.objects.filter(input_hash=input_hash).exists():
+        cache.delete(lock_key)
+        return
+
+    client = get_insights_client()
+    try:
+        result = client.generate(inputs)
+    except Exception as e:
+        # O lock expira sozinho: funciona como espera antes de nova tentativa
+        logger.error(f'Erro ao gerar insights de IA: {e}')
+        return
+
+    try:
+        PipelineInsight.objects.create(
+            input_hash=input_hash,
+            input_data=inputs,
+            result=result,
+            model_name=getattr(client, 'model_name', ''),
+        )
+    except IntegrityError:
+        pass
+    cache.delete(lock_key)
+
+
+def _schedule_generation(input_hash, inputs):
+    """Agenda a geração uma única vez por hash (lock compartilhado entre workers)."""
+    lock_timeout = settings.AI_INSIGHTS_TIMEOUT * 2 + 30
+    if cache.add(f'{GENERATION_LOCK_KEY}:{input_hash}', 1, lock_timeout):
+        submit(generate_insight, input_hash, inputs)
+
+
+def get_pipeline_insights():
+    """
+    Retorna os insights para os dados atuais sem esperar pela IA.
+
+    Returns:
+        tuple (inputs, PipelineInsight | None, status) onde status é:
+        'ready' (insight dos dados atuais), 'stale' (insight anterior; o novo está
+        sendo gerado ou aguardando o intervalo mínimo) ou 'generating' (nenhum ainda)
+
+    Raises:
+        InsightsUnavailable se for preciso gerar e o cliente de IA não estiver configurado
+    """
+    inputs = collect_insight_inputs()
+    input_hash = compute_input_hash(inputs)
+
+    insight = PipelineInsight.objects.filter(input_hash=input_hash).first()
+    if insight is not None:
+        return inputs, insight, 'ready'
+
+    latest = PipelineInsight.objects.order_by('-generated_at').first()
+    min_interval = settings.AI_INSIGHTS_MIN_INTERVAL
+    if latest is not None and (timezone.now() - latest.generated_at).total_seconds() < min_interval:
+        # Dados mudaram há pouco: evita uma geração a cada novo cadastro
+        return inputs, latest, 'stale'
+
+    if not get_insights_client().is_available():
+        if latest is not None:
+            return inputs, latest, 'stale'
+        raise InsightsUnavailable('OPENAI_API_KEY não configurada.')
+
+    _schedule_generation(input_hash, inputs)
+    return inputs, latest, 'stale' if latest is not None else 'generating'
@@ -0,0 +1,654 @@
+"""
+Ranqueamento de candidatos para uma vaga (jobs.Job).
+
+Os atributos de cada candidato ficam pré-calculados em CandidateMatchFeatures. Cada
+processo carrega a tabela em arrays NumPy (_FeatureMatrix, uma linha por candidato)
+e relê apenas as linhas alteradas, no máximo a cada MATCHING_REFRESH_INTERVAL
+segundos. O score de todos os candidatos é calculado de forma vetorizada e os
+melhores saem de np.argpartition, sem ordenar a base inteira.
+
+Critérios (0 a 1 cada, combinados por FEATURE_WEIGHTS):
+    skills       habilidades da taxonomia citadas no título/requisitos da vaga
+    experience   anos de experiência ("3 anos de experiência" nos requisitos)
+    education    escolaridade mínima citada nos requisitos
+    location     mesma cidade / mesmo estado de Job.location
+    work_model   Job.type_models x aceita trabalho remoto / aceita mudança
+    salary       pretensão mínima x teto de Job.salary_range
+
+Critérios sem informação na vaga (ex.: sem faixa salarial, vaga remota para
+localização) ficam com peso 0 e os demais são renormalizados. A resposta traz os
+pesos usados e o score de cada critério por candidato.
+"""
+import re
+import threading
+import time
+from datetime import timedelta
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+
+from app.utils import normalize_search_text, parse_brl_amount
+
+from ..models import CandidateMatchFeatures, CandidateProfile, CandidateSkillIndex, Skill
+from .skill_services import resolve_skills
+
+BATCH_SIZE = 500
+
+FEATURE_WEIGHTS = {
+    'skills': 0.35,
+    'experience': 0.15,
+    'education': 0.10,
+    'location': 0.15,
+    'work_model': 0.10,
+    'salary': 0.15,
+}
+
+# Perfis fora do ranqueamento (além de inativos e indisponíveis para trabalho)
+INELIGIBLE_PIPELINE_STATUSES = ('rejected', 'admitted')
+
+EDUCATION_RANKS = {key: rank for rank, (key, _) in enumerate(CandidateProfile.EDUCATION_LEVEL_CHOICES)}
+
+# Peso de cada habilidade encontrada por CandidateSkillIndex.level_rank
+# (0: texto livre ou sem nível; 1 a 4: iniciante a especialista)
+SKILL_LEVEL_WEIGHTS = np.array([0.8, 0.6, 0.8, 1.0, 1.0], dtype=np.float32)
+
+# Sem exigência explícita, a experiência satura neste número de anos
+DEFAULT_EXPERIENCE_YEARS = 5
+# Segundos relidos antes da última leitura: cobre transações que gravaram
+# updated_at antes do commit
+REFRESH_OVERLAP = 60
+
+MAX_SKILL_TERMS = 2000
+
+BRAZILIAN_STATES = {
+    'acre': 'AC', 'alagoas': 'AL', 'amapa': 'AP', 'amazonas': 'AM', 'bahia': 'BA',
+    'ceara': 'CE', 'distrito federal': 'DF', 'espirito santo': 'ES', 'goias': 'GO',
+    'maranhao': 'MA', 'mato grosso': 'MT', 'mato grosso do sul': 'MS', 'minas gerais': 'MG',
+    'para': 'PA', 'paraiba': 'PB', 'parana': 'PR', 'pernambuco': 'PE', 'piaui': 'PI',
+    'rio de janeiro': 'RJ', 'rio grande do norte': 'RN', 'rio grande do sul': 'RS',
+    'rondonia': 'RO', 'roraima': 'RR', 'santa catarina': 'SC', 'sao paulo': 'SP',
+    'sergipe': 'SE', 'tocantins': 'TO',
+}
+STATE_CODES = set(BRAZILIAN_STATES.values())
+
+REMOTE_TERMS = re.compile(r'\b(remoto|remota|home office|100% remoto|remote|teletrabalho)\b')
+
+# Escolaridade citada nos requisitos (texto normalizado), da maior para a menor: o
+# trecho reconhecido é removido antes de testar as seguintes ("pós-graduação" não
+# conta como "graduação")
+EDUCATION_PATTERNS = [
+    ('doutorado', re.compile(r'\bdoutorado\b')),
+    ('mestrado', re.compile(r'\bmestrado\b')),
+    ('pos_graduacao', re.compile(r'\bpos[- ]?graduacao\b|\bmba\b|\bespecializacao\b')),
+    ('superior', re.compile(
+        r'\b(ensino|nivel|formacao) superior\b|\bsuperior (completo|incompleto|cursando)\b'
+        r'|\bgraduacao\b|\bgraduado\b|\bbacharelado\b|\btecnologo\b|\blicenciatura\b'
+    )),
+    ('tecnico', re.compile(r'\b(curso|ensino|nivel|formacao) tecnic[oa]\b|\btecnico em\b')),
+    ('medio', re.compile(r'\b(ensino|nivel) medio\b|\b2o grau\b|\bsegundo grau\b')),
+    ('fundamental', re.compile(r'\bensino fundamental\b|\b1o grau\b|\bprimeiro grau\b')),
+]
+
+EXPERIENCE_PATTERNS = [
+    re.compile(r'(\d{1,2})\s*\+?\s*anos?\s+(?:de\s+)?(?:experiencia|atuacao)'),
+    re.compile(r'experiencia\s+(?:minima\s+)?(?:de\s+)?(\d{1,2})\s+anos?'),
+]
+
+AMOUNT_PATTERN = re.compile(r'\d[\d.]*(?:,\d{1,2})?')
+
+# Campos de CandidateProfile que alimentam CandidateMatchFeatures (update_fields)
+MATCH_FEATURE_INPUT_FIELDS = {
+    'is_active', 'available_for_work', 'pipeline_status', 'experience_years', 'education_level',
+    'city', 'state', 'accepts_remote_work', 'accepts_relocation', 'desired_salary_min',
+    'desired_salary_min_value',
+}
+
+FEATURE_COLUMNS = (
+    'candidate_id', 'pipeline_status', 'is_available', 'experience_years', 'education_rank',
+    'city', 'state', 'accepts_remote_work', 'accepts_relocation', 'desired_salary_min',
+    'skills', 'updated_at',
+)
+
+
+# ============================================
+# ATRIBUTOS DOS CANDIDATOS (CandidateMatchFeatures)
+# ============================================
+
+def normalize_state(value):
+    """UF em maiúsculas a partir da sigla ou do nome do estado ('' se não reconhecido)."""
+    normalized = normalize_search_text(value)
+    if normalized.upper() in STATE_CODES:
+        return normalized.upper()
+    return BRAZILIAN_STATES.get(normalized, '')
+
+
+def normalize_city(value):
+    return normalize_search_text(value)[:100]
+
+
+def refresh_match_features(profile_ids):
+    """Recria (upsert) os atributos de ranqueamento dos perfis informados."""
+    profile_ids = list(profile_ids)
+    for start in range(0, len(profile_ids), BATCH_SIZE):
+        batch = profile_ids[start:start + BATCH_SIZE]
+        skills = {}
+        for candidate_id, skill_id, level_rank in CandidateSkillIndex.objects.filter(
+            candidate_id__in=batch
+        ).values_list('candidate_id', 'skill_id', 'level_rank'):
+            skills.setdefault(candidate_id, []).append([skill_id, level_rank or 0])
+
+        rows = CandidateProfile.objects.filter(pk__in=batch).values_list(
+            'pk', 'pipeline_status', 'is_active', 'available_for_work', 'experience_years',
+            'education_level', 'city', 'state', 'accepts_remote_work', 'accepts_relocation',
+            'desired_salary_min_value',
+        )
+        features = [
+            CandidateMatchFeatures(
+                candidate_id=pk,
+                pipeline_status=pipeline_status,
+                is_available=is_active and available_for_work,
+                experience_years=experience_years,
+                education_rank=EDUCATION_RANKS.get(education_level),
+                city=normalize_city(city),
+                state=normalize_state(state),
+                accepts_remote_work=accepts_remote_work,
+                accepts_relocation=accepts_relocation,
+                desired_salary_min=salary_min,
+                skills=sorted(skills.get(pk, [])),
+            )
+            for (pk, pipeline_status, is_active, available_for_work, experience_years, education_level,
+                 city, state, accepts_remote_work, accepts_relocation, salary_min) in rows
+        ]
+        if not features:
+            continue
+        CandidateMatchFeatures.objects.bulk_create(
+            features,
+            update_conflicts=True,
+            unique_fields=['candidate'],
+            update_fields=[name for name in FEATURE_COLUMNS if name != 'candidate_id'],
+        )
+
+
+def refresh_match_features_on_commit(profile_ids):
+    profile_ids = list(profile_ids)
+    if profile_ids:
+        transaction.on_commit(lambda: refresh_match_features(profile_ids))
+
+
+def rebuild_match_features(queryset=None, batch_size=BATCH_SIZE):
+    """
+    Recria os atributos de ranqueamento de todos os perfis (ou de um queryset).
+
+    Returns:
+        int com o número de perfis processados
+    """
+    if queryset is None:
+        queryset = CandidateProfile.objects.all()
+    profile_ids = list(queryset.order_by('pk').values_list('pk', flat=True))
+    for start in range(0, len(profile_ids), batch_size):
+        refresh_match_features(profile_ids[start:start + batch_size])
+    return len(profile_ids)
+
+
+# ============================================
+# MATRIZ EM MEMÓRIA
+# ============================================
+
+class _FeatureMatrix:
+    """
+    Atributos de todos os candidatos em arrays NumPy (uma linha por perfil).
+
+    Imutável depois de montada: uma atualização gera uma nova matriz, então uma
+    consulta em andamento nunca vê arrays pela metade. As habilidades ficam em
+    formato de coordenadas (linha, skill_id, nível), uma entrada por par.
+    """
+
+    def __init__(self, city_codes=None):
+        # Códigos inteiros de cidade/UF (só crescem; compartilhados entre versões)
+        self.city_codes = city_codes if city_codes is not None else {}
+        self.row_by_id = {}
+        self.ids = np.empty(0, dtype=np.int64)
+        self.eligible = np.empty(0, dtype=bool)
+        self.experience = np.empty(0, dtype=np.float32)
+        self.education = np.empty(0, dtype=np.int8)
+        self.city = np.empty(0, dtype=np.int32)
+        self.state = np.empty(0, dtype=np.int32)
+        self.remote = np.empty(0, dtype=bool)
+        self.relocation = np.empty(0, dtype=bool)
+        self.salary_min = np.empty(0, dtype=np.float64)
+        self.skill_rows = np.empty(0, dtype=np.int32)
+        self.skill_ids = np.empty(0, dtype=np.int32)
+        self.skill_levels = np.empty(0, dtype=np.int8)
+        self.watermark = None
+        self.loaded_at = time.monotonic()
+        self.checked_at = self.loaded_at
+
+    def __len__(self):
+        return len(self.ids)
+
+    def code(self, value):
+        """Código inteiro de uma cidade/UF normalizada (-1 se vazia)."""
+        if not value:
+            return -1
+        return self.city_codes.setdefault(value, len(self.city_codes))
+
+    def _columns(self, rows):
+        excluded = set(INELIGIBLE_PIPELINE_STATUSES)
+        return {
+            'ids': np.array([row[0] for row in rows], dtype=np.int64),
+            'eligible': np.array([row[2] and row[1] not in excluded for row in rows], dtype=bool),
+            'experience': np.array(
+                [np.nan if row[3] is None else row[3] for row in rows], dtype=np.float32
+            ),
+            'education': np.array([-1 if row[4] is None else row[4] for row in rows], dtype=np.int8),
+            'city': np.array([self.code(row[5]) for row in rows], dtype=np.int32),
+            'state': np.array([self.code(row[6]) for row in rows], dtype=np.int32),
+            'remote': np.array([row[7] for row in rows], dtype=bool),
+            'relocation': np.array([row[8] for row in rows], dtype=bool),
+            'salary_min': np.array(
+                [np.nan if row[9] is None else float(row[9]) for row in rows], dtype=np.float64
+            ),
+        }
+
+    @staticmethod
+    def _skill_entries(rows, row_indexes):
+        entries = [
+            (index, skill_id, level)
+            for row, index in zip(rows, row_indexes)
+            for skill_id, level in row[10]
+        ]
+        if not entries:
+            return (np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int8))
+        array = np.array(entries, dtype=np.int64)
+        return (
+            array[:, 0].astype(np.int32),
+            array[:, 1].astype(np.int32),
+            np.clip(array[:, 2], 0, len(SKILL_LEVEL_WEIGHTS) - 1).astype(np.int8),
+        )
+
+    @classmethod
+    def load(cls, rows, city_codes=None):
+        """Monta a matriz inteira a partir das linhas de CandidateMatchFeatures."""
+        matrix = cls(city_codes)
+        if rows:
+            for name, values in matrix._columns(rows).items():
+                setattr(matrix, name, values)
+            matrix.skill_rows, matrix.skill_ids, matrix.skill_levels = cls._skill_entries(rows, range(len(rows)))
+            matrix.watermark = max(row[11] for row in rows)
+        matrix.row_by_id = {candidate_id: index for index, candidate_id in enumerate(matrix.ids.tolist())}
+        return matrix
+
+    def with_rows(self, rows):
+        """Nova matriz com as linhas alteradas substituídas e as novas acrescentadas."""
+        matrix = _FeatureMatrix(self.city_codes)
+        matrix.loaded_at = self.loaded_at
+        matrix.row_by_id = dict(self.row_by_id)
+        existing = [row for row in rows if row[0] in self.row_by_id]
+        added = [row for row in rows if row[0] not in self.row_by_id]
+
+        for name in ('ids', 'eligible', 'experience', 'education', 'city', 'state',
+                     'remote', 'relocation', 'salary_min'):
+            setattr(matrix, name, getattr(self, name).copy())
+        if existing:
+            indexes = np.array([self.row_by_id[row[0]] for row in existing], dtype=np.int64)
+            for name, values in matrix._columns(existing).items():
+                getattr(matrix, name)[indexes] = values
+        if added:
+            for name, values in matrix._columns(added).items():
+                setattr(matrix, name, np.concatenate([getattr(matrix, name), values]))
+            for offset, row in enumerate(added):
+                matrix.row_by_id[row[0]] = len(self) + offset
+
+        # Habilidades: descarta as entradas das linhas alteradas e acrescenta as atuais
+        row_indexes = [matrix.row_by_id[row[0]] for row in rows]
+        keep = ~np.isin(self.skill_rows, np.array(row_indexes, dtype=np.int32))
+        new_rows, new_ids, new_levels = self._skill_entries(rows, row_indexes)
+        matrix.skill_rows = np.concatenate([self.skill_rows[keep], new_rows])
+        matrix.skill_ids = np.concatenate([self.skill_ids[keep], new_ids])
+        matrix.skill_levels = np.concatenate([self.skill_levels[keep], new_levels])
+
+        matrix.watermark = max([self.watermark or rows[0][11], *(row[11] for row in rows)])
+        return matrix
+
+    def without(self, candidate_ids):
+        """Nova matriz sem as linhas dos perfis removidos (índices das demais compactados)."""
+        matrix = _FeatureMatrix(self.city_codes)
+        matrix.loaded_at = self.loaded_at
+        matrix.watermark = self.watermark
+        keep = np.ones(len(self), dtype=bool)
+        keep[[self.row_by_id[pk] for pk in candidate_ids]] = False
+
+        for name in ('ids', 'eligible', 'experience', 'education', 'city', 'state',
+                     'remote', 'relocation', 'salary_min'):
+            setattr(matrix, name, getattr(self, name)[keep])
+        matrix.row_by_id = {candidate_id: index for index, candidate_id in enumerate(matrix.ids.tolist())}
+
+        # Habilidades: descarta as das linhas removidas e renumera as demais
+        new_index = np.cumsum(keep, dtype=np.int32) - 1
+        skill_keep = keep[self.skill_rows]
+        matrix.skill_rows = new_index[self.skill_rows[skill_keep]]
+        matrix.skill_ids = self.skill_ids[skill_keep]
+        matrix.skill_levels = self.skill_levels[skill_keep]
+        return matrix
+
+
+class _MatrixStore:
+    """Matriz do processo, atualizada de forma incremental sob demanda."""
+
+    def __init__(self):
+        self._matrix = None
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._matrix = None
+
+    def get(self):
+        matrix = self._matrix
+        if matrix is not None and time.monotonic() - matrix.checked_at < settings.MATCHING_REFRESH_INTERVAL:
+            return matrix
+        with self._lock:
+            matrix = self._matrix
+            now = time.monotonic()
+            if matrix is not None and now - matrix.checked_at < settings.MATCHING_REFRESH_INTERVAL:
+                return matrix
+            if matrix is None or now - matrix.loaded_at >= settings.MATCHING_FULL_RELOAD_INTERVAL:
+                matrix = _FeatureMatrix.load(
+                    list(CandidateMatchFeatures.objects.values_list(*FEATURE_COLUMNS)),
+                    matrix.city_codes if matrix is not None else None,
+                )
+            else:
+                matrix = self._refreshed(matrix)
+            matrix.checked_at = now
+            self._matrix = matrix
+            return matrix
+
+    @staticmethod
+    def _refreshed(matrix):
+        queryset = CandidateMatchFeatures.objects.all()
+        if matrix.watermark is not None:
+            queryset = queryset.filter(updated_at__gte=matrix.watermark - timedelta(seconds=REFRESH_OVERLAP))
+        rows = list(queryset.values_list(*FEATURE_COLUMNS))
+        if rows:
+            matrix = matrix.with_rows(rows)
+
+        # Perfis excluídos (cascata) não deixam linha alterada: compara os totais
+        if CandidateMatchFeatures.objects.count() != len(matrix):
+            current = set(CandidateMatchFeatures.objects.values_list('candidate_id', flat=True))
+            removed = [pk for pk in matrix.row_by_id if pk not in current]
+            if removed:
+                matrix = matrix.without(removed)
+        return matrix
+
+
+_store = _MatrixStore()
+
+
+def get_feature_matrix():
+    return _store.get()
+
+
+# ============================================
+# REQUISITOS DA VAGA
+# ============================================
+
+class JobRequirements:
+    """Requisitos extraídos de uma vaga, no formato comparável com a matriz."""
+
+    def __init__(self, skill_ids=(), min_years=None, education_rank=None, city='', state='',
+                 remote=False, type_model='', salary_max=None):
+        self.skill_ids = sorted(set(skill_ids))
+        self.min_years = min_years
+        self.education_rank = education_rank
+        self.city = city
+        self.state = state
+        self.remote = remote
+        self.type_model = type_model
+        self.salary_max = salary_max
+
+    def as_dict(self, skill_names):
+        education = None
+        if self.education_rank is not None:
+            education = CandidateProfile.EDUCATION_LEVEL_CHOICES[self.education_rank][0]
+        return {
+            'skills': [skill_names.get(skill_id, str(skill_id)) for skill_id in self.skill_ids],
+            'min_experience_years': self.min_years,
+            'education_level': education,
+            'city': self.city,
+            'state': self.state,
+            'remote': self.remote,
+            'type_model': self.type_model,
+            'salary_max': float(self.salary_max) if self.salary_max is not None else None,
+        }
+
+
+def extract_skill_ids(text):
+    """Habilidades da taxonomia citadas em um texto livre (termos de 1 a 3 palavras)."""
+    tokens = [token.strip('.-') for token in re.findall(r'[\w+#.\-]+', normalize_search_text(text))]
+    tokens = [token for token in tokens if token]
+    terms = set()
+    for size in (1, 2, 3):
+        for start in range(len(tokens) - size + 1):
+            terms.add(' '.join(tokens[start:start + size]))
+            if len(terms) >= MAX_SKILL_TERMS:
+                break
+    return set(resolve_skills(terms).values())
+
+
+def extract_min_years(text):
+    normalized = normalize_search_text(text)
+    years = [int(match) for pattern in EXPERIENCE_PATTERNS for match in pattern.findall(normalized)]
+    years = [value for value in years if 0 < value <= 40]
+    return max(years) if years else None
+
+
+def extract_education_rank(text):
+    """Menor escolaridade citada (a exigência mínima), ou None."""
+    normalized = normalize_search_text(text)
+    found = []
+    for key, pattern in EDUCATION_PATTERNS:
+        if pattern.search(normalized):
+            found.append(EDUCATION_RANKS[key])
+            normalized = pattern.sub(' ', normalized)
+    return min(found) if found else None
+
+
+def parse_job_location(text):
+    """(cidade normalizada, UF, remoto) de Job.location ("São Paulo - SP", "Remoto")."""
+    normalized = normalize_search_text(text)
+    remote = bool(REMOTE_TERMS.search(normalized))
+    city = state = ''
+    for part in re.split(r'[,/|()\-–]', normalized):
+        part = part.strip()
+        if not part or REMOTE_TERMS.fullmatch(part):
+            continue
+        if not state and normalize_state(part):
+            state = normalize_state(part)
+            if len(part) == 2 or city:
+                continue
+        if not city:
+            city = part[:100]
+    return city, state, remote
+
+
+def parse_salary_max(text):
+    """Teto de Job.salary_range ("R$ 3.000,00 - R$ 5.000,00"), ou None."""
+    amounts = [parse_brl_amount(match) for match in AMOUNT_PATTERN.findall(text or '')]
+    amounts = [amount for amount in amounts if amount]
+    return max(amounts) if amounts else None
+
+
+def build_job_requirements(job, skill_names=None):
+    """
+    Requisitos comparáveis da vaga. `skill_names` (ex.: ['Python', 'Django'])
+    substitui as habilidades extraídas do texto.
+    """
+    if skill_names:
+        skill_ids = set(resolve_skills(skill_names).values())
+    else:
+        skill_ids = extract_skill_ids(f'{job.title}\n{job.requirements}')
+    city, state, remote = parse_job_location(job.location)
+    return JobRequirements(
+        skill_ids=skill_ids,
+        min_years=extract_min_years(job.requirements),
+        education_rank=extract_education_rank(job.requirements),
+        city=city,
+        state=state,
+        remote=remote or job.type_models == 'home_office',
+        type_model=job.type_models,
+        salary_max=parse_salary_max(job.salary_range),
+    )
+
+
+# ============================================
+# SCORE
+# ============================================
+
+def _score_features(matrix, requirements):
+    """Score (0 a 1) de cada critério para todas as linhas, e os critérios aplicáveis."""
+    size = len(matrix)
+    scores = {}
+
+    if requirements.skill_ids:
+        matched = np.isin(matrix.skill_ids, np.array(requirements.skill_ids, dtype=np.int32))
+        weights = SKILL_LEVEL_WEIGHTS[matrix.skill_levels[matched]]
+        total = np.bincount(matrix.skill_rows[matched], weights=weights, minlength=size)
+        scores['skills'] = np.minimum(total / len(requirements.skill_ids), 1).astype(np.float32)
+
+    years = np.nan_to_num(matrix.experience, nan=0.0)
+    scores['experience'] = np.clip(
+        years / (requirements.min_years or DEFAULT_EXPERIENCE_YEARS), 0, 1
+    ).astype(np.float32)
+
+    if requirements.education_rank is not None:
+        gap = requirements.education_rank - matrix.education.astype(np.float32)
+        scores['education'] = np.where(
+            matrix.education < 0, 0, np.clip(1 - 0.35 * np.maximum(gap, 0), 0, 1)
+        ).astype(np.float32)
+
+    city_code = matrix.city_codes.get(requirements.city, -2) if requirements.city else -2
+    state_code = matrix.city_codes.get(requirements.state, -2) if requirements.state else -2
+    same_state = matrix.state == state_code
+    same_city = (matrix.city == city_code) & (same_state | (matrix.state < 0) | (state_code == -2))
+    located = requirements.city or requirements.state
+
+    if not requirements.remote and located:
+        scores['location'] = np.where(same_city, 1.0, np.where(same_state, 0.5, 0.0)).astype(np.float32)
+
+    if requirements.remote:
+        scores['work_model'] = matrix.remote.astype(np.float32)
+    elif located and requirements.type_model == 'hybrid':
+        scores['work_model'] = np.where(
+            same_city, 1.0, np.where(same_state | matrix.relocation, 0.6, 0.0)
+        ).astype(np.float32)
+    elif located:
+        scores['work_model'] = np.where(same_city, 1.0, np.where(matrix.relocation, 0.7, 0.0)).astype(np.float32)
+
+    if requirements.salary_max:
+        ceiling = float(requirements.salary_max)
+        desired = matrix.salary_min
+        with np.errstate(invalid='ignore'):
+            fit = np.clip(1 - (desired - ceiling) / ceiling, 0, 1)
+        scores['salary'] = np.where(
+            np.isnan(desired), 0.5, np.where(desired <= ceiling, 1.0, fit)
+        ).astype(np.float32)
+
+    return scores
+
+
+def _feature_details(matrix, requirements, rows, skill_names):
+    """Valores de cada candidato que explicam os scores (só para as linhas retornadas)."""
+    matched_skills = {}
+    if requirements.skill_ids:
+        mask = np.isin(matrix.skill_rows, rows) & np.isin(
+            matrix.skill_ids, np.array(requirements.skill_ids, dtype=np.int32)
+        )
+        for row, skill_id in zip(matrix.skill_rows[mask].tolist(), matrix.skill_ids[mask].tolist()):
+            matched_skills.setdefault(row, []).append(skill_names.get(skill_id, str(skill_id)))
+
+    details = {}
+    for row in rows.tolist():
+        education = int(matrix.education[row])
+        salary = matrix.salary_min[row]
+        years = matrix.experience[row]
+        details[row] = {
+            'skills': {'matched': sorted(matched_skills.get(row, []))},
+            'experience': {'years': None if np.isnan(years) else int(years)},
+            'education': {
+                'level': CandidateProfile.EDUCATION_LEVEL_CHOICES[education][0] if education >= 0 else None
+            },
+            'location': {},
+            'work_model': {
+                'accepts_remote_work': bool(matrix.remote[row]),
+                'accepts_relocation': bool(matrix.relocation[row]),
+            },
+            'salary': {'desired_min': None if np.isnan(salary) else float(salary)},
+        }
+    return details
+
+
+def rank_candidates(job, limit=50, skill_names=None):
+    """
+    Ranqueia os candidatos elegíveis para a vaga.
+
+    Returns:
+        dict com os requisitos extraídos, os pesos usados, o total de candidatos
+        avaliados e os `limit` melhores com o score de cada critério
+    """
+    requirements = build_job_requirements(job, skill_names)
+    matrix = get_feature_matrix()
+    names = dict(Skill.objects.filter(pk__in=requirements.skill_ids).values_list('pk', 'name'))
+
+    scores = _score_features(matrix, requirements)
+    weight_sum = sum(FEATURE_WEIGHTS[name] for name in scores)
+    weights = {name: FEATURE_WEIGHTS[name] / weight_sum for name in scores}
+
+    total = np.zeros(len(matrix), dtype=np.float32)
+    for name, values in scores.items():
+        total += weights[name] * values
+    total = np.where(matrix.eligible, total, -1)
+
+    evaluated = int(matrix.eligible.sum())
+    k = min(limit, evaluated)
+    if k > 0:
+        top = np.argpartition(-total, k - 1)[:k]
+        top = top[np.argsort(-total[top], kind='stable')]
+    else:
+        top = np.empty(0, dtype=np.int64)
+
+    details = _feature_details(matrix, requirements, top, names)
+    candidate_ids = matrix.ids[top].tolist()
+    profiles = {
+        row['pk']: row for row in CandidateProfile.objects.filter(pk__in=candidate_ids).values(
+            'pk', 'user__name', 'user__last_name', 'current_position', 'city', 'state', 'pipeline_status'
+        )
+    }
+
+    results = []
+    for row, candidate_id in zip(top.tolist(), candidate_ids):
+        profile = profiles.get(candidate_id)
+        if profile is None:
+            continue
+        features = {
+            name: {'score': round(float(values[row]), 3), **details[row][name]}
+            for name, values in scores.items()
+        }
+        results.append({
+            'candidate_profile_id': candidate_id,
+            'name': ' '.join(filter(None, [profile['user__name'], profile['user__last_name']])),
+            'current_position': profile['current_position'],
+            'city': profile['city'],
+            'state': profile['state'],
+            'pipeline_status': profile['pipeline_status'],
+            'score': round(float(total[row]) * 100, 1),
+            'features': features,
+        })
+
+    return {
+        'job_id': job.pk,
+        'requirements': requirements.as_dict(names),
+        'weights': {name: round(value, 3) for name, value in weights.items()},
+        'evaluated': evaluated,
+        'results': results,
+    }
@@ -0,0 +1,233 @@
+"""
+Caixa de entrada de notificações do candidato.
+
+As notificações são gravadas no momento do evento (aprovação de perfil, etapa de
+processo seletivo, revisão de documento, candidatura, admissão), pelos mesmos
+pontos que disparam o WhatsApp (whatsapp.services.notify_candidate_status_change).
+O total de não lidas fica em CandidateProfile.unread_notifications, atualizado
+na mesma transação que grava ou marca as notificações: a consulta do candidato
+é uma leitura indexada, sem recontar nada. Com o stream de eventos (app.events),
+cada notificação também é enviada ao candidato conectado (evento "notification").
+"""
+import logging
+
+from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from app.events import publish, user_channel
+
+from ..models import CandidateProfile, Notification
+
+logger = logging.getLogger('candidates')
+
+
+# evento -> conteúdo da notificação; {processo}, {vaga}, {documento} e {data_inicio}
+# vêm do contexto do evento. `suffix` é acrescentado à mensagem só quando a variável
+# indicada está no contexto
+NOTIFICATION_CONTENT = {
+    'profile_approved': {
+        'title': 'Perfil aprovado!',
+        'message': 'Parabéns! Seu perfil foi aprovado pelo recrutador.',
+        'link': '/perfil',
+        'icon': 'profile_approved',
+    },
+    'profile_rejected': {
+        'title': 'Perfil não aprovado',
+        'message': 'Infelizmente seu perfil não foi aprovado neste momento.',
+        'link': '/perfil',
+        'icon': 'process_rejected',
+    },
+    'profile_changes_requested': {
+        'title': 'Alterações solicitadas',
+        'message': 'O recrutador solicitou alterações no seu perfil.',
+        'link': '/perfil',
+        'icon': 'profile',
+    },
+    'process_added': {
+        'title': 'Novo processo seletivo: {processo}',
+        'message': 'Você foi adicionado a um processo seletivo.',
+        'link': '/perfil',
+        'icon': 'profile',
+    },
+    'process_approved': {
+        'title': 'Aprovado: {processo}',
+        'message': 'Parabéns! Você foi aprovado no processo seletivo.',
+        'link': '/perfil',
+        'icon': 'process_approved',
+    },
+    'process_rejected': {
+        'title': 'Reprovado: {processo}',
+        'message': 'Infelizmente você não foi aprovado neste processo.',
+        'link': '/perfil',
+        'icon': 'process_rejected',
+    },
+    'document_approved': {
+        'title': 'Documento aprovado',
+        'message': 'O documento {documento} foi aprovado.',
+        'link': '/perfil/documentos',
+        'icon': 'profile_approved',
+    },
+    'document_rejected': {
+        'title': 'Documento rejeitado',
+        'message': 'O documento {documento} foi rejeitado. Verifique o motivo e reenvie.',
+        'link': '/perfil/documentos',
+        'icon': 'document',
+    },
+    'application_in_process': {
+        'title': 'Candidatura em análise',
+        'message': 'Sua candidatura para {vaga} está em processo.',
+        'link': '/perfil',
+        'icon': 'profile',
+    },
+    'application_interview': {
+        'title': 'Entrevista agendada',
+        'message': 'Uma entrevista foi agendada para a vaga {vaga}.',
+        'link': '/perfil',
+        'icon': 'profile',
+    },
+    'application_approved': {
+        'title': 'Candidatura aprovada',
+        'message': 'Parabéns! Sua candidatura para {vaga} foi aprovada.',
+        'link': '/perfil',
+        'icon': 'process_approved',
+    },
+    'application_rejected': {
+        'title': 'Candidatura não aprovada',
+        'message': 'Sua candidatura para {vaga} não foi aprovada.',
+        'link': '/perfil',
+        'icon': 'process_rejected',
+    },
+    'admission_started': {
+        'title': 'Admissão iniciada',
+        'message': 'Seu processo de admissão foi iniciado.',
+        'link': '/perfil/documentos',
+        'icon': 'document',
+    },
+    'admission_completed': {
+        'title': 'Dados de admissão preenchidos',
+        'message': 'Seus dados de admissão foram preenchidos pelo recrutador.',
+        'link': '/perfil',
+        'icon': 'profile',
+    },
+    'admission_confirmed': {
+        'title': 'Admissão confirmada!',
+        'message': 'Sua admissão foi confirmada.',
+        'suffix': ('data_inicio', ' Início em {data_inicio}.'),
+        'link': '/perfil',
+        'icon': 'process_approved',
+    },
+}
+
+
+def _publish_notifications(user_ids, notifications):
+    from ..serializers import NotificationSerializer
+    for user_id, notification in zip(user_ids, notifications):
+        publish(user_channel(user_id), 'notification', NotificationSerializer(notification).data)
+
+
+class _SafeContext(dict):
+    def __missing__(self, key):
+        return ''
+
+
+def build_notification(candidate_id, status_event, extra_context=None):
+    """
+    Monta a Notification (não salva) do evento, ou None se o evento não tem conteúdo.
+    """
+    content = NOTIFICATION_CONTENT.get(status_event)
+    if content is None:
+        return None
+    context = _SafeContext({key: value for key, value in (extra_context or {}).items() if value})
+    message = content['message'].format_map(context)
+    if 'suffix' in content and content['suffix'][0] in context:
+        message += content['suffix'][1].format_map(context)
+    return Notification(
+        candidate_id=candidate_id,
+        event=status_event,
+        title=content['title'].format_map(context).rstrip(': ')[:255],
+        message=message,
+        link=content['link'],
+        icon=content['icon'],
+    )
+
+
+def create_notification(candidate_profile, status_event, extra_context=None):
+    """
+    Grava a notificação do evento e incrementa o contador de não lidas.
+    Não interrompe o fluxo principal em caso de erro (savepoint próprio).
+
+    Returns:
+        Notification criada ou None
+    """
+    notification = build_notification(candidate_profile.pk, status_event, extra_context)
+    if notification is None:
+        return None
+    try:
+        with transaction.atomic():
+            notification.save()
+            CandidateProfile.objects.filter(pk=candidate_profile.pk).update(
+                unread_notifications=F('unread_notifications') + 1
+            )
+    except Exception as e:
+        logger.error(f'Erro ao gravar notificação ({status_event}) do perfil {candidate_profile.pk}: {e}')
+        return None
+    _publish_notifications([candidate_profile.user_id], [notification])
+    return notification
+
+
+def create_notifications(profile_ids, status_event, extra_context=None):
+    """
+    Versão em lote de create_notification (ex.: revisão de perfis em lote):
+    um INSERT em lote e um UPDATE dos contadores.
+
+    Returns:
+        int com o número de notificações criadas
+    """
+    if status_event not in NOTIFICATION_CONTENT:
+        return 0
+    user_by_profile = dict(CandidateProfile.objects.filter(pk__in=list(profile_ids)).values_list('pk', 'user_id'))
+    notifications = [build_notification(pk, status_event, extra_context) for pk in user_by_profile]
+    if not notifications:
+        return 0
+    with transaction.atomic():
+        Notification.objects.bulk_create(notifications, batch_size=1000)
+        CandidateProfile.objects.filter(pk__in=list(user_by_profile)).update(
+            unread_notifications=F('unread_notifications') + 1
+        )
+    _publish_notifications(user_by_profile.values(), notifications)
+    return len(notifications)
+
+
+def mark_notifications_read(candidate_profile, notification_ids=None):
+    """
+    Marca notificações do candidato como lidas (todas, se notification_ids for None).
+
+    Apenas as que ainda não estavam lidas são alteradas, e o contador é reduzido
+    exatamente por elas: marcações concorrentes não contam a mesma notificação duas vezes.
+
+    Returns:
+        tuple (quantidade marcada, não lidas restantes)
+    """
+    queryset = Notification.objects.filter(candidate=candidate_profile, read_at__isnull=True)
+    if notification_ids is not None:
+        queryset = queryset.filter(pk__in=list(notification_ids))
+
+    with transaction.atomic():
+        marked = queryset.update(read_at=timezone.now())
+        if marked:
+            CandidateProfile.objects.filter(pk=candidate_profile.pk).update(
+                unread_notifications=Greatest(F('unread_notifications') - marked, Value(0))
+            )
+        unread = CandidateProfile.objects.filter(pk=candidate_profile.pk).values_list(
+            'unread_notifications', flat=True
+        ).first() or 0
+    if marked:
+        # Outras abas/dispositivos do candidato atualizam o contador
+        publish(user_channel(candidate_profile.user_id), 'notifications_read', {
+            'ids': None if notification_ids is None else list(notification_ids),
+            'count': unread,
+        })
+    return marked, unread
+
@@ -0,0 +1,294 @@
+"""
+Serviços para o status de pipeline materializado do candidato.
+
+CandidateProfile.pipeline_status é derivado de profile_status, CandidateInProcess,
+CandidateDocument e AdmissionData. As funções abaixo recalculam o status em lote,
+com queries agregadas, e gravam apenas as linhas que mudaram.
+
+PipelineCounter guarda a quantidade de candidatos por etapa: cada mudança de
+pipeline_status ajusta os contadores na mesma transação, e o dashboard lê só essa
+tabela. reconcile_pipeline_counters corrige divergências (ex.: bulk_create/SQL manual).
+"""
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from app.cache import bump_model_version, cache_get, cache_set, get_or_compute, versioned_key
+from app.instrumentation import record_cache
+from app.events import RECRUITERS_CHANNEL, publish
+
+from ..models import CandidateProfile, PipelineCounter
+
+
+REQUIRED_DOC_TYPES_CACHE_KEY = 'required_doc_type_ids'
+DASHBOARD_STATS_CACHE_KEY = 'dashboard_stats_result'
+# Contadores mudam a cada transição; o cache só absorve rajadas de acessos ao dashboard
+DASHBOARD_STATS_SOFT_TTL = 10
+
+# Limite de ids por query (evita estourar o limite de parâmetros do SQLite)
+BATCH_SIZE = 500
+
+ADMITTED_STATUSES = ('completed', 'sent', 'confirmed')
+ACTIVE_PROCESS_STATUSES = ('pending', 'in_progress')
+DOCUMENT_PIPELINE_STATUSES = ('documents_pending', 'documents_complete')
+
+
+def get_required_document_type_ids():
+    """Retorna os ids dos tipos de documento obrigatórios ativos (cache versionado por DocumentType)."""
+    from admission.models import DocumentType
+    cache_key = versioned_key(REQUIRED_DOC_TYPES_CACHE_KEY, models=[DocumentType])
+    required_ids = cache_get(cache_key)
+    record_cache(REQUIRED_DOC_TYPES_CACHE_KEY, hit=required_ids is not None)
+    if required_ids is None:
+        required_ids = list(
+            DocumentType.objects.filter(is_active=True, is_required=True)
+            .values_list('id', flat=True)
+        )
+        cache_set(cache_key, required_ids, settings.CACHE_VERSIONED_TIMEOUT)
+    return required_ids
+
+
+def invalidate_required_document_types():
+    """
+    Descarta o cache dos tipos de documento obrigatórios imediatamente, para o
+    recálculo na mesma transação (os demais workers recebem a troca após o commit).
+    """
+    from admission.models import DocumentType
+    bump_model_version(DocumentType)
+
+
+def compute_pipeline_statuses(profile_ids):
+    """
+    Calcula o status do pipeline para um conjunto de perfis.
+
+    Prioridade (para perfis aprovados): admitted > admission_in_progress >
+    in_selection_process > approved (sem processo aprovado) > documentos.
+
+    Args:
+        profile_ids: iterável de ids de CandidateProfile
+
+    Returns:
+        dict {profile_id: pipeline_status}
+    """
+    return _compute_pipeline_statuses(profile_ids)[0]
+
+
+def _compute_pipeline_statuses(profile_ids):
+    """Retorna (status calculados, status gravados) dos perfis informados."""
+    from admission.models import AdmissionData, CandidateDocument
+    from selection_process.models import CandidateInProcess
+
+    profile_ids = list(profile_ids)
+    if not profile_ids:
+        return {}, {}
+
+    statuses = {}
+    stored = {}
+    for pid, profile_status, pipeline_status in CandidateProfile.objects.filter(
+        pk__in=profile_ids
+    ).values_list('id', 'profile_status', 'pipeline_status'):
+        statuses[pid] = profile_status
+        stored[pid] = pipeline_status
+    approved_ids = [pid for pid, status in statuses.items() if status == 'approved']
+    if not approved_ids:
+        return statuses, stored
+
+    admission_by_candidate = dict(
+        AdmissionData.objects.filter(candidate_id__in=approved_ids)
+        .values_list('candidate_id', 'status')
+    )
+    in_process_set = set(
+        CandidateInProcess.objects.filter(
+            candidate_profile_id__in=approved_ids,
+            is_active=True,
+            status__in=ACTIVE_PROCESS_STATUSES
+        ).values_list('candidate_profile_id', flat=True)
+    )
+    approved_in_process_set = set(
+        CandidateInProcess.objects.filter(
+            candidate_profile_id__in=approved_ids,
+            status='approved'
+        ).values_list('candidate_profile_id', flat=True)
+    )
+
+    required_ids = get_required_document_type_ids()
+    doc_counts = {}
+    if required_ids and approved_in_process_set:
+        doc_counts = dict(
+            CandidateDocument.objects.filter(
+                candidate_id__in=approved_in_process_set,
+                document_type_id__in=required_ids,
+                is_active=True, status='approved'
+            ).values('candidate_id').annotate(c=Count('id')).values_list('candidate_id', 'c')
+        )
+
+    for pid in approved_ids:
+        admission_status = admission_by_candidate.get(pid)
+        if admission_status in ADMITTED_STATUSES:
+            statuses[pid] = 'admitted'
+        elif admission_status == 'draft':
+            statuses[pid] = 'admission_in_progress'
+        elif pid in in_process_set:
+            statuses[pid] = 'in_selection_process'
+        elif pid not in approved_in_process_set:
+            statuses[pid] = 'approved'
+        elif doc_counts.get(pid, 0) < len(required_ids):
+            statuses[pid] = 'documents_pending'
+        else:
+            statuses[pid] = 'documents_complete'
+
+    return statuses, stored
+
+
+def _write_pipeline_statuses(computed, stored):
+    """
+    Grava os status calculados com um UPDATE por transição (anterior → novo) e ajusta
+    os contadores na mesma transação; retorna linhas alteradas.
+
+    O filtro pelo status anterior garante que a contagem siga o que foi de fato gravado,
+    mesmo com atualizações concorrentes.
+    """
+    transitions = {}
+    for pid, status in computed.items():
+        previous = stored.get(pid)
+        if previous is not None and previous != status:
+            transitions.setdefault((previous, status), []).append(pid)
+    if not transitions:
+        return 0
+
+    changed = 0
+    deltas = {}
+    with transaction.atomic():
+        for (previous, status), ids in transitions.items():
+            moved = CandidateProfile.objects.filter(
+                pk__in=ids, pipeline_status=previous
+            ).update(pipeline_status=status)
+            if moved:
+                changed += moved
+                deltas[previous] = deltas.get(previous, 0) - moved
+                deltas[status] = deltas.get(status, 0) + moved
+        adjust_pipeline_counters(deltas)
+    if changed:
+        # Perfis reprovados/admitidos saem do ranqueamento de vagas
+        from .matching_services import refresh_match_features_on_commit
+        refresh_match_features_on_commit([pid for ids in transitions.values() for pid in ids])
+    return changed
+
+
+def refresh_pipeline_status(profile_ids):
+    """
+    Recalcula e grava o pipeline_status dos perfis informados.
+
+    Só as linhas cujo valor mudou são atualizadas.
+
+    Returns:
+        dict {profile_id: pipeline_status} com os valores atuais
+    """
+    profile_ids = list(profile_ids)
+    result = {}
+    for start in range(0, len(profile_ids), BATCH_SIZE):
+        computed, stored = _compute_pipeline_statuses(profile_ids[start:start + BATCH_SIZE])
+        _write_pipeline_statuses(computed, stored)
+        result.update(computed)
+    return result
+
+
+def rebuild_pipeline_statuses(queryset=None, batch_size=BATCH_SIZE):
+    """
+    Recalcula o pipeline_status de todos os perfis (ou de um queryset).
+
+    Returns:
+        tuple (perfis processados, perfis corrigidos)
+    """
+    if queryset is None:
+        queryset = CandidateProfile.objects.all()
+    profile_ids = list(queryset.order_by('pk').values_list('pk', flat=True))
+    changed = 0
+    for start in range(0, len(profile_ids), batch_size):
+        computed, stored = _compute_pipeline_statuses(profile_ids[start:start + batch_size])
+        changed += _write_pipeline_statuses(computed, stored)
+    return len(profile_ids), changed
+
+
+def adjust_pipeline_counters(deltas):
+    """
+    Soma os deltas {pipeline_status: +n/-n} aos contadores (UPDATE count = count + n).
+    Deve rodar na mesma transação que alterou os perfis. Os painéis conectados por
+    SSE recebem os deltas após o commit (evento "pipeline_counters").
+    """
+    deltas = {bucket: delta for bucket, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    now = timezone.now()
+    for bucket, delta in deltas.items():
+        updated = PipelineCounter.objects.filter(bucket=bucket).update(
+            count=F('count') + delta, updated_at=now
+        )
+        if not updated:
+            # Linha ainda inexistente (ex.: etapa nova): cria com o valor real
+            PipelineCounter.objects.get_or_create(
+                bucket=bucket,
+                defaults={'count': CandidateProfile.objects.filter(pipeline_status=bucket).count()},
+            )
+    publish(RECRUITERS_CHANNEL, 'pipeline_counters', {'deltas': deltas})
+
+
+def get_pipeline_counts():
+    """
+    Lê a distribuição do pipeline da tabela de contadores (uma query, tamanho fixo).
+
+    Returns:
+        dict {'total': int, 'distribution': {pipeline_status: int}}
+    """
+    counts = dict(PipelineCounter.objects.values_list('bucket', 'count'))
+    distribution = {
+        status: max(counts.get(status, 0), 0)
+        for status, _label in CandidateProfile.PIPELINE_STATUS_CHOICES
+    }
+    return {'total': sum(distribution.values()), 'distribution': distribution}
+
+
+def get_dashboard_stats():
+    """
+    Distribuição do pipeline para dashboard/insights, com cache compartilhado e
+    recálculo único por expiração (ver app.cache.get_or_compute).
+    """
+    return get_or_compute(DASHBOARD_STATS_CACHE_KEY, get_pipeline_counts, DASHBOARD_STATS_SOFT_TTL)
+
+
+def reconcile_pipeline_counters():
+    """
+    Recalcula os contadores a partir de CandidateProfile (GROUP BY) e corrige divergências.
+
+    As linhas dos contadores ficam bloqueadas durante a contagem: transições concorrentes
+    aguardam e aplicam seus deltas sobre o valor reconciliado.
+
+    Returns:
+        dict {pipeline_status: (valor anterior, valor real)} só com as etapas divergentes
+    """
+    buckets = [status for status, _label in CandidateProfile.PIPELINE_STATUS_CHOICES]
+    with transaction.atomic():
+        existing = set(PipelineCounter.objects.values_list('bucket', flat=True))
+        PipelineCounter.objects.bulk_create(
+            [PipelineCounter(bucket=bucket) for bucket in buckets if bucket not in existing],
+            ignore_conflicts=True,
+        )
+        stored = dict(
+            PipelineCounter.objects.select_for_update().values_list('bucket', 'count')
+        )
+        actual = dict(
+            CandidateProfile.objects.values_list('pipeline_status')
+            .annotate(count=Count('id'))
+            .values_list('pipeline_status', 'count')
+        )
+        drift = {}
+        now = timezone.now()
+        for bucket in set(stored) | set(actual):
+            real = actual.get(bucket, 0)
+            if stored.get(bucket) != real:
+                drift[bucket] = (stored.get(bucket), real)
+                PipelineCounter.objects.update_or_create(
+                    bucket=bucket, defaults={'count': real, 'updated_at': now}
+                )
+    return drift
@@ -0,0 +1,168 @@
+"""
+Serviços de busca textual de candidatos.
+
+Cada CandidateProfile tem um CandidateSearchDocument com o texto agregado do perfil,
+habilidades, experiências, formação e idiomas. No PostgreSQL a busca usa o tsvector
+(config 'portuguese', índice GIN) com ranking; no SQLite (desenvolvimento) cai para
+icontains nas colunas de texto do documento, sem joins.
+
+O filtro por cargo (filter_by_position) é separado do texto livre: compara só os
+cargos do candidato (positions_text, sem acentos), com índice de trigramas no
+PostgreSQL.
+"""
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connections
+from django.db.models import F, Q
+
+from app.utils import normalize_search_text
+
+from ..models import CandidateProfile, CandidateSearchDocument
+
+
+SEARCH_CONFIG = 'portuguese'
+BATCH_SIZE = 500
+
+SEARCH_VECTOR = (
+    SearchVector('title_text', weight='A', config=SEARCH_CONFIG)
+    + SearchVector('keywords_text', weight='B', config=SEARCH_CONFIG)
+    + SearchVector('body_text', weight='C', config=SEARCH_CONFIG)
+)
+
+# Campos do perfil que entram no documento de busca
+PROFILE_SEARCH_FIELDS = {
+    'current_position', 'current_company', 'skills', 'professional_summary', 'certifications',
+}
+
+
+def is_full_text_available(using='default'):
+    """Busca full-text só existe no PostgreSQL."""
+    return connections[using].vendor == 'postgresql'
+
+
+def _join(*parts):
+    return ' '.join(str(part) for part in parts if part)
+
+
+def build_search_texts(profile):
+    """
+    Monta os textos ponderados do documento de busca.
+    Espera user, detailed_skills, experiences, educations e languages prefetched.
+    """
+    skills = profile.detailed_skills.all()
+    experiences = profile.experiences.all()
+    educations = profile.educations.all()
+    languages = profile.languages.all()
+
+    return {
+        'title_text': _join(
+            profile.user.name, profile.user.last_name, profile.current_position,
+            *(s.skill_name for s in skills)
+        ),
+        'keywords_text': _join(
+            profile.skills, profile.current_company,
+            *(_join(e.position, e.company) for e in experiences),
+            *(_join(e.course, e.degree, e.institution) for e in educations),
+            *(lang.language for lang in languages)
+        ),
+        'body_text': _join(
+            profile.professional_summary, profile.certifications,
+            *(_join(e.description, e.achievements) for e in experiences),
+            *(e.description for e in educations)
+        ),
+        'positions_text': normalize_search_text(
+            profile.current_position, *(e.position for e in experiences)
+        ),
+    }
+
+
+def refresh_search_documents(profile_ids):
+    """Recria (upsert) os documentos de busca dos perfis informados."""
+    profile_ids = list(profile_ids)
+    for start in range(0, len(profile_ids), BATCH_SIZE):
+        batch = profile_ids[start:start + BATCH_SIZE]
+        profiles = CandidateProfile.objects.filter(pk__in=batch).select_related('user').prefetch_related(
+            'detailed_skills', 'experiences', 'educations', 'languages'
+        )
+        documents = [
+            CandidateSearchDocument(candidate=profile, **build_search_texts(profile))
+            for profile in profiles
+        ]
+        if not documents:
+            continue
+        CandidateSearchDocument.objects.bulk_create(
+            documents,
+            update_conflicts=True,
+            unique_fields=['candidate'],
+            update_fields=['title_text', 'keywords_text', 'body_text', 'positions_text', 'updated_at'],
+        )
+        if is_full_text_available(CandidateSearchDocument.objects.db):
+            CandidateSearchDocument.objects.filter(candidate_id__in=batch).update(
+                search_vector=SEARCH_VECTOR
+            )
+
+
+def rebuild_search_documents(queryset=None, batch_size=BATCH_SIZE):
+    """
+    Recria os documentos de busca de todos os perfis (ou de um queryset).
+
+    Returns:
+        int com o número de perfis processados
+    """
+    if queryset is None:
+        queryset = CandidateProfile.objects.all()
+    profile_ids = list(queryset.order_by('pk').values_list('pk', flat=True))
+    for start in range(0, len(profile_ids), batch_size):
+        refresh_search_documents(profile_ids[start:start + batch_size])
+    return len(profile_ids)
+
+
+def _prefix_query(term):
+    """Converte o termo digitado em tsquery com prefixo em cada palavra (busca enquanto digita)."""
+    words = re.findall(r'\w+', term)
+    if not words:
+        return None
+    raw = ' & '.join(f'{word}:*' for word in words)
+    return SearchQuery(raw, search_type='raw', config=SEARCH_CONFIG)
+
+
+def search_candidates(queryset, term):
+    """
+    Filtra um queryset de CandidateProfile pelo termo de busca.
+
+    No PostgreSQL anota `search_rank` (ts_rank ponderado) para ordenação.
+
+    Returns:
+        tuple (queryset, ranqueado: bool)
+    """
+    term = (term or '').strip()
+    if not term:
+        return queryset, False
+
+    if is_full_text_available(queryset.db):
+        query = _prefix_query(term)
+        if query is None:
+            return queryset, False
+        queryset = queryset.filter(search_document__search_vector=query).annotate(
+            search_rank=SearchRank(F('search_document__search_vector'), query)
+        )
+        return queryset, True
+
+    for word in term.split():
+        queryset = queryset.filter(
+            Q(search_document__title_text__icontains=word)
+            | Q(search_document__keywords_text__icontains=word)
+            | Q(search_document__body_text__icontains=word)
+        )
+    return queryset, False
+
+
+def filter_by_position(queryset, term):
+    """
+    Filtra um queryset de CandidateProfile pelo cargo atual ou de experiências
+    anteriores (todas as palavras do termo, sem acentos).
+    """
+    for word in normalize_search_text(term).split():
+        queryset = queryset.filter(search_document__positions_text__contains=word)
+    return queryset
@@ -0,0 +1,210 @@
+"""
+Serviços da taxonomia de habilidades.
+
+Habilidades digitadas pelos candidatos (CandidateSkill.skill_name e o texto livre
+CandidateProfile.skills) são normalizadas (minúsculas, sem acentos, sem sufixo de
+versão) e resolvidas para um Skill canônico, direto ou via SkillAlias. O resultado
+alimenta CandidateSkillIndex, usado nas buscas por habilidades como um join indexado.
+"""
+import re
+
+from django.db import transaction
+from django.db.models import Count, Q
+
+from app.utils import normalize_search_text
+
+from ..models import CandidateProfile, CandidateSkillIndex, Skill, SkillAlias
+
+
+BATCH_SIZE = 500
+
+# Separadores do texto livre de habilidades ("Python, Django; SQL / Git"). A barra só
+# separa com espaços em volta: "PL/SQL", "CI/CD" e "TCP/IP" são uma habilidade
+FREE_TEXT_SEPARATORS = re.compile(r'[,;\n\r|•]+|\s+/\s+')
+
+# Sufixo de versão: "python3" → "python", "angular 17" → "angular"; "es6" e "s3" são mantidos
+VERSION_SUFFIX = re.compile(r'^(?P<base>.*[a-z+#].*[a-z+#])\s*v?\d+(\.\d+)*$')
+
+
+def normalize_skill_name(name):
+    """
+    Normaliza o nome de uma habilidade para comparação.
+
+    Exemplo:
+        >>> normalize_skill_name(' Python3 ')
+        'python'
+        >>> normalize_skill_name('Comunicação')
+        'comunicacao'
+    """
+    normalized = normalize_search_text(name)
+    normalized = re.sub(r'[^\w+#.\- ]', '', normalized).strip(' -').rstrip('.')
+    match = VERSION_SUFFIX.match(normalized)
+    if match and len(match.group('base').strip()) >= 3:
+        normalized = match.group('base').strip()
+    return normalized[:100]
+
+
+def split_free_text_skills(text):
+    """Separa o texto livre de habilidades em termos individuais."""
+    return [term.strip() for term in FREE_TEXT_SEPARATORS.split(text or '') if term.strip()]
+
+
+def compound_parts(name):
+    """
+    Partes de um termo com barra sem espaços, para quando o termo inteiro não está
+    na taxonomia ("HTML/CSS" → ["HTML", "CSS"]).
+    """
+    if '/' not in name:
+        return []
+    return [part.strip() for part in name.split('/') if part.strip()]
+
+
+def resolve_skills(names, create_missing=False):
+    """
+    Resolve nomes digitados para habilidades canônicas.
+
+    Args:
+        names: iterável de nomes
+        create_missing: cria Skill para nomes desconhecidos (usado para CandidateSkill)
+
+    Returns:
+        dict {nome normalizado: skill_id}
+    """
+    keys = {normalize_skill_name(name): name for name in names}
+    keys.pop('', None)
+    if not keys:
+        return {}
+
+    resolved = dict(
+        SkillAlias.objects.filter(normalized_alias__in=keys).values_list('normalized_alias', 'skill_id')
+    )
+    missing = [key for key in keys if key not in resolved]
+    if missing:
+        resolved.update(
+            Skill.objects.filter(normalized_name__in=missing).values_list('normalized_name', 'id')
+        )
+
+    if create_missing:
+        for key in [key for key in keys if key not in resolved]:
+            skill, _ = Skill.objects.get_or_create(
+                normalized_name=key, defaults={'name': keys[key].strip()[:100]}
+            )
+            resolved[key] = skill.id
+    return resolved
+
+
+def partition_known_skills(text):
+    """
+    Separa um texto de habilidades em (conhecidas na taxonomia, desconhecidas).
+
+    Returns:
+        tuple (list, list) com os nomes como digitados
+    """
+    names = split_free_text_skills(text)
+    resolved = resolve_skills(names)
+    known = [name for name in names if normalize_skill_name(name) in resolved]
+    unknown = [name for name in names if normalize_skill_name(name) not in resolved]
+    return known, unknown
+
+
+def refresh_skill_index(profile_ids):
+    """Recria as entradas de CandidateSkillIndex dos perfis informados."""
+    from .matching_services import refresh_match_features
+
+    profile_ids = list(profile_ids)
+    for start in range(0, len(profile_ids), BATCH_SIZE):
+        batch = profile_ids[start:start + BATCH_SIZE]
+        profiles = list(
+            CandidateProfile.objects.filter(pk__in=batch).only('id', 'skills').prefetch_related('detailed_skills')
+        )
+
+        detailed_names = [s.skill_name for p in profiles for s in p.detailed_skills.all()]
+        free_names = [name for p in profiles for name in split_free_text_skills(p.skills)]
+        free_names += [part for name in free_names for part in compound_parts(name)]
+        skill_ids = resolve_skills(detailed_names, create_missing=True)
+        skill_ids.update({
+            key: value for key, value in resolve_skills(free_names).items() if key not in skill_ids
+        })
+
+        entries = []
+        for profile in profiles:
+            by_skill = {}
+            for detailed in profile.detailed_skills.all():
+                skill_id = skill_ids.get(normalize_skill_name(detailed.skill_name))
+                if skill_id is None:
+                    continue
+                rank = CandidateSkillIndex.LEVEL_RANKS.get(detailed.level)
+                current = by_skill.get(skill_id)
+                if current is None or (rank or 0) > (current.level_rank or 0):
+                    by_skill[skill_id] = CandidateSkillIndex(
+                        candidate_id=profile.id, skill_id=skill_id, level_rank=rank,
+                        years_experience=detailed.years_experience, source='detailed'
+                    )
+            for name in split_free_text_skills(profile.skills):
+                skill_id = skill_ids.get(normalize_skill_name(name))
+                found = [skill_id] if skill_id is not None else [
+                    skill_ids.get(normalize_skill_name(part)) for part in compound_parts(name)
+                ]
+                for skill_id in found:
+                    if skill_id is not None and skill_id not in by_skill:
+                        by_skill[skill_id] = CandidateSkillIndex(
+                            candidate_id=profile.id, skill_id=skill_id, source='free_text'
+                        )
+            entries.extend(by_skill.values())
+
+        with transaction.atomic():
+            CandidateSkillIndex.objects.filter(candidate_id__in=batch).delete()
+            CandidateSkillIndex.objects.bulk_create(entries, batch_size=1000)
+            # As habilidades também compõem os atributos de ranqueamento
+            refresh_match_features(batch)
+
+
+def rebuild_skill_index(queryset=None, batch_size=BATCH_SIZE):
+    """
+    Recria o índice de habilidades de todos os perfis (ou de um queryset).
+
+    Returns:
+        int com o número de perfis processados
+    """
+    if queryset is None:
+        queryset = CandidateProfile.objects.all()
+    profile_ids = list(queryset.order_by('pk').values_list('pk', flat=True))
+    for start in range(0, len(profile_ids), batch_size):
+        refresh_skill_index(profile_ids[start:start + batch_size])
+    return len(profile_ids)
+
+
+def filter_by_skills(queryset, names, match='all', min_level=None, min_years=None):
+    """
+    Filtra perfis pelas habilidades do índice invertido.
+
+    Args:
+        queryset: queryset de CandidateProfile
+        names: nomes das habilidades (aceita sinônimos)
+        match: 'all' (E) ou 'any' (OU)
+        min_level: nível mínimo (beginner/intermediate/advanced/expert)
+        min_years: anos mínimos de experiência na habilidade
+
+    Returns:
+        queryset filtrado
+    """
+    requested = {normalize_skill_name(name) for name in names} - {''}
+    resolved = resolve_skills(names)
+    skill_ids = set(resolved.values())
+    if not skill_ids or (match == 'all' and len(resolved) < len(requested)):
+        # Alguma habilidade pedida não existe na taxonomia: nenhum candidato atende
+        return queryset.none()
+
+    conditions = Q(skill_id__in=skill_ids)
+    if min_level:
+        conditions &= Q(level_rank__gte=CandidateSkillIndex.LEVEL_RANKS[min_level])
+    if min_years is not None:
+        conditions &= Q(years_experience__gte=min_years)
+
+    matches = CandidateSkillIndex.objects.filter(conditions).values('candidate_id')
+    if match == 'all' and len(skill_ids) > 1:
+        matches = matches.annotate(
+            matched=Count('skill_id', distinct=True)
+        ).filter(matched=len(skill_ids))
+
+    return queryset.filter(pk__in=matches.values('candidate_id'))
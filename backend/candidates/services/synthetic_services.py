@@ -0,0 +1,562 @@
+"""
+Gerador de massa de dados sintética para testes de carga (100k+ candidatos).
+
+Preenche todos os subsistemas em proporções próximas às de produção: recrutadores,
+empresas e vagas, processos seletivos com etapas e perguntas, tipos de documento
+e, para cada candidato, usuário, perfil, formações, experiências, habilidades,
+idiomas, candidaturas, participação em processos (com respostas por etapa),
+documentos e dados de admissão.
+
+Determinístico: a mesma seed gera os mesmos dados. Os candidatos são gerados em
+blocos de CHUNK_SIZE e cada bloco usa o próprio Random(f'{seed}:{bloco}'), então o
+resultado não depende da ordem nem da quantidade de processos que geram os blocos.
+As datas são relativas a uma data de referência fixa (REFERENCE_DATE), não ao dia da
+execução: a mesma seed gera os mesmos dados em qualquer dia.
+
+Tudo é gravado com bulk_create, que não dispara signals: contadores do pipeline,
+pipeline_status, documentos de busca e índice de habilidades (que atualiza os
+atributos de ranqueamento) são atualizados explicitamente ao fim de cada bloco.
+
+Os arquivos (documentos) não existem no storage: só o nome é gravado.
+
+Uso:
+    reference = create_reference_data(200_000, seed=42)
+    for chunk in range(chunk_count(200_000)):
+        generate_chunk(chunk, 200_000, 42, reference)
+"""
+import datetime
+import random
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from app.cache import bump_model_version
+from app.utils import normalize_search_text
+
+from ..models import (
+    CandidateEducation, CandidateExperience, CandidateLanguage, CandidateProfile, CandidateSkill,
+)
+
+
+CHUNK_SIZE = 2000
+# Data de referência das datas geradas (vagas, processos, experiências, revisões)
+REFERENCE_DATE = datetime.date(2026, 1, 1)
+# O número do candidato compõe a base do CPF (seed * 1.000.000 + número)
+MAX_CANDIDATES = 999_999
+
+EMAIL_DOMAIN = 'sintetico.test'
+
+# Proporções (aproximadas a partir da base de produção)
+CANDIDATES_PER_RECRUITER = 20_000
+CANDIDATES_PER_COMPANY = 2_000
+JOBS_PER_COMPANY = 4
+PROCESS_SHARE_OF_JOBS = 0.5
+APPLICATIONS_PER_CANDIDATE = (0, 0, 1, 1, 1, 2, 2, 3, 4, 5)
+# Entre os perfis aprovados
+IN_PROCESS_SHARE = 0.25
+# Entre os participantes de processos
+ADMISSION_SHARE_OF_APPROVED = 0.3
+
+PROFILE_STATUS_WEIGHTS = {
+    'approved': 40,
+    'pending': 30,
+    'awaiting_review': 12,
+    'changes_requested': 10,
+    'rejected': 8,
+}
+PROCESS_STATUS_WEIGHTS = {
+    'pending': 20,
+    'in_progress': 40,
+    'approved': 25,
+    'rejected': 12,
+    'withdrawn': 3,
+}
+APPLICATION_STATUS_WEIGHTS = {
+    'submitted': 45,
+    'in_process': 20,
+    'interview_scheduled': 8,
+    'approved': 7,
+    'rejected': 17,
+    'withdrawn': 3,
+}
+DOCUMENT_STATUS_WEIGHTS = {'approved': 70, 'pending': 20, 'rejected': 10}
+
+FIRST_NAMES = [
+    'Ana', 'Maria', 'Juliana', 'Fernanda', 'Patrícia', 'Aline', 'Camila', 'Amanda', 'Bruna', 'Letícia',
+    'Beatriz', 'Larissa', 'Gabriela', 'Vanessa', 'Débora', 'João', 'José', 'Carlos', 'Paulo', 'Lucas',
+    'Pedro', 'Marcos', 'Luiz', 'Gabriel', 'Rafael', 'Daniel', 'Marcelo', 'Bruno', 'Eduardo', 'Felipe',
+    'Rodrigo', 'Thiago', 'Mateus', 'André', 'Fábio',
+]
+LAST_NAMES = [
+    'Silva', 'Santos', 'Oliveira', 'Souza', 'Rodrigues', 'Ferreira', 'Alves', 'Pereira', 'Lima', 'Gomes',
+    'Costa', 'Ribeiro', 'Martins', 'Carvalho', 'Almeida', 'Lopes', 'Soares', 'Fernandes', 'Vieira',
+    'Barbosa', 'Rocha', 'Dias', 'Nascimento', 'Andrade', 'Moreira', 'Nunes', 'Marques', 'Machado',
+    'Mendes', 'Freitas',
+]
+# (cidade, UF, peso)
+CITIES = [
+    ('São Paulo', 'SP', 30), ('Campinas', 'SP', 6), ('Guarulhos', 'SP', 4), ('Santos', 'SP', 3),
+    ('Rio de Janeiro', 'RJ', 14), ('Niterói', 'RJ', 3), ('Belo Horizonte', 'MG', 8), ('Uberlândia', 'MG', 3),
+    ('Curitiba', 'PR', 6), ('Londrina', 'PR', 2), ('Porto Alegre', 'RS', 5), ('Florianópolis', 'SC', 3),
+    ('Joinville', 'SC', 2), ('Salvador', 'BA', 5), ('Recife', 'PE', 5), ('Fortaleza', 'CE', 4),
+    ('Goiânia', 'GO', 3), ('Brasília', 'DF', 5), ('Manaus', 'AM', 3), ('Belém', 'PA', 2),
+]
+NEIGHBORHOODS = ['Centro', 'Jardim América', 'Vila Nova', 'Bela Vista', 'Santa Cruz', 'Boa Vista', 'Liberdade']
+STREETS = ['Rua das Flores', 'Avenida Brasil', 'Rua da Paz', 'Rua São José', 'Avenida Paulista', 'Rua XV de Novembro']
+
+POSITIONS = [
+    'Auxiliar Administrativo', 'Assistente Administrativo', 'Analista Financeiro', 'Analista de RH',
+    'Operador de Produção', 'Auxiliar de Produção', 'Técnico de Manutenção', 'Eletricista',
+    'Mecânico Industrial', 'Operador de Empilhadeira', 'Auxiliar de Logística', 'Motorista',
+    'Vendedor', 'Atendente', 'Recepcionista', 'Desenvolvedor Python', 'Analista de Sistemas',
+    'Técnico de Segurança do Trabalho', 'Enfermeiro do Trabalho', 'Engenheiro de Produção',
+]
+COMPANY_WORDS = ['Tecno', 'Agro', 'Metal', 'Log', 'Pack', 'Quimi', 'Constru', 'Ali', 'Trans', 'Ener']
+COMPANY_SUFFIXES = ['Indústria', 'Serviços', 'Comércio', 'Soluções', 'Logística', 'Alimentos']
+# Poucas habilidades muito comuns e uma cauda longa (distribuição parecida com a real)
+SKILLS = [
+    ('Pacote Office', 30), ('Excel', 28), ('Atendimento ao Cliente', 20), ('Trabalho em Equipe', 18),
+    ('Comunicação', 16), ('Vendas', 10), ('Logística', 9), ('Operação de Empilhadeira', 7), ('NR-10', 6),
+    ('NR-35', 6), ('Eletricidade Industrial', 5), ('Manutenção Mecânica', 5), ('SAP', 5), ('Protheus', 4),
+    ('Power BI', 4), ('Python', 4), ('SQL', 4), ('Contabilidade', 4), ('Departamento Pessoal', 4),
+    ('Gestão de Pessoas', 3), ('Inglês Técnico', 3), ('Lean Manufacturing', 3), ('5S', 3),
+    ('Soldagem', 2), ('AutoCAD', 2), ('JavaScript', 2), ('React', 2), ('Django', 1), ('Docker', 1),
+    ('Primeiros Socorros', 2),
+]
+LANGUAGES = [('Inglês', 6), ('Espanhol', 3), ('Francês', 1), ('Alemão', 1), ('Italiano', 1)]
+INSTITUTIONS = ['USP', 'UNICAMP', 'UFMG', 'UFRJ', 'UFPR', 'UFPE', 'SENAI', 'SENAC', 'ETEC', 'UNIP', 'Estácio', 'Anhanguera']
+COURSES = [
+    ('Ensino Médio', 'medio'), ('Técnico em Mecânica', 'tecnico'), ('Técnico em Eletrotécnica', 'tecnico'),
+    ('Técnico em Logística', 'tecnico'), ('Administração', 'superior'), ('Ciências Contábeis', 'superior'),
+    ('Engenharia de Produção', 'superior'), ('Ciência da Computação', 'superior'),
+    ('Recursos Humanos', 'superior'), ('MBA em Gestão', 'pos_graduacao'),
+]
+STAGE_NAMES = ['Triagem', 'Teste Online', 'Entrevista com RH', 'Entrevista Técnica', 'Dinâmica em Grupo', 'Entrevista Final']
+DOCUMENT_TYPES = [
+    ('RG', True), ('CPF', True), ('Carteira de Trabalho', True), ('Comprovante de Residência', True),
+    ('Título de Eleitor', True), ('Certificado de Reservista', False), ('Certidão de Casamento', False),
+    ('Diploma', False),
+]
+
+
+def chunk_count(count, chunk_size=CHUNK_SIZE):
+    return (count + chunk_size - 1) // chunk_size
+
+
+def candidate_email(index, seed):
+    return f'candidato{index:06d}.s{seed}@{EMAIL_DOMAIN}'
+
+
+def _cpf(base):
+    """CPF válido (com dígitos verificadores) a partir de uma base de 9 dígitos."""
+    digits = [int(d) for d in f'{base % 1_000_000_000:09d}']
+    for length in (9, 10):
+        total = sum(d * (length + 1 - i) for i, d in enumerate(digits[:length]))
+        rest = total % 11
+        digits.append(0 if rest < 2 else 11 - rest)
+    d = ''.join(map(str, digits))
+    return f'{d[:3]}.{d[3:6]}.{d[6:9]}-{d[9:]}'
+
+
+def _cnpj(base):
+    """CNPJ no formato 00.000.000/0001-00 (só a raiz varia; sem dígitos verificadores)."""
+    d = f'{base % 100_000_000:08d}'
+    return f'{d[:2]}.{d[2:5]}.{d[5:]}/0001-00'
+
+
+def _weighted(rng, weights):
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def _brl(amount):
+    return f'R$ {amount:,.2f}'.replace(',', 'X').replace('.', ',').replace('X', '.')
+
+
+def _date_between(rng, start, end):
+    return start + datetime.timedelta(days=rng.randint(0, max((end - start).days, 0)))
+
+
+# ============================================
+# DADOS DE REFERÊNCIA (empresas, vagas, processos)
+# ============================================
+
+def create_reference_data(count, seed, password_hash=None, reference_date=REFERENCE_DATE):
+    """
+    Cria recrutadores, empresas, vagas, processos (etapas e perguntas) e tipos de
+    documento proporcionais a `count` candidatos. As datas são relativas a
+    `reference_date`, repassada aos blocos no dict retornado.
+
+    Returns:
+        dict serializável (enviado aos processos que geram os blocos) com os ids
+        usados na geração dos candidatos
+    """
+    from accounts.models import UserProfile
+    from admission.models import DocumentType
+    from companies.models import Company, CompanyGroup
+    from jobs.models import Job
+    from selection_process.models import ProcessStage, SelectionProcess, StageQuestion
+
+    rng = random.Random(f'{seed}:reference')
+    password_hash = password_hash or make_password(None)
+    today = reference_date
+
+    with transaction.atomic():
+        recruiters = UserProfile.objects.bulk_create([
+            UserProfile(
+                email=f'recrutador{i:03d}.s{seed}@{EMAIL_DOMAIN}', name=f'Recrutador {i}',
+                user_type='recruiter', password=password_hash,
+                search_name=normalize_search_text(f'Recrutador {i}', f'recrutador{i:03d}.s{seed}@{EMAIL_DOMAIN}'),
+            )
+            for i in range(1, max(2, count // CANDIDATES_PER_RECRUITER) + 1)
+        ])
+
+        company_total = max(3, count // CANDIDATES_PER_COMPANY)
+        groups = CompanyGroup.objects.bulk_create([
+            CompanyGroup(name=f'Grupo Sintético {i} (s{seed})')
+            for i in range(1, max(1, company_total // 25) + 1)
+        ])
+        companies = []
+        for i in range(1, company_total + 1):
+            name = f'{rng.choice(COMPANY_WORDS)}{rng.choice(COMPANY_WORDS).lower()} {rng.choice(COMPANY_SUFFIXES)} {i}'
+            companies.append(Company(
+                name=name, cnpj=_cnpj(seed * 100_000 + i), slug=f'sintetico-s{seed}-empresa-{i}',
+                group=rng.choice(groups) if rng.random() < 0.6 else None,
+            ))
+        Company.objects.bulk_create(companies)
+
+        jobs = []
+        for company in companies:
+            for _ in range(JOBS_PER_COMPANY):
+                title = rng.choice(POSITIONS)
+                city, state, _ = rng.choices(CITIES, weights=[c[2] for c in CITIES])[0]
+                skills = rng.sample([name for name, _ in SKILLS], 3)
+                salary = rng.randrange(1800, 12000, 100)
+                jobs.append(Job(
+                    company=company, title=title,
+                    type_models=rng.choice(['in_person', 'in_person', 'hybrid', 'home_office']),
+                    job_type=rng.choice(['full_time', 'full_time', 'full_time', 'part_time', 'internship', 'contract']),
+                    description=f'Vaga de {title} em {city}.',
+                    location=f'{city} - {state}',
+                    salary_range=f'{_brl(salary)} - {_brl(salary * 1.4)}',
+                    requirements=(
+                        f'Experiência mínima de {rng.randint(0, 5)} anos. Conhecimentos em '
+                        f'{", ".join(skills)}. Ensino médio completo.'
+                    ),
+                    responsibilities=f'Atuar como {title}.',
+                    closure=today + datetime.timedelta(days=rng.randint(-60, 120)),
+                    slug=f'sintetico-s{seed}-vaga-{len(jobs) + 1}',
+                ))
+        Job.objects.bulk_create(jobs)
+
+        processes = SelectionProcess.objects.bulk_create([
+            SelectionProcess(
+                title=f'Processo {job.title} #{i}', description='Processo seletivo sintético',
+                job=job, company=job.company, created_by=rng.choice(recruiters),
+                status=rng.choice(['active', 'active', 'active', 'paused', 'completed']),
+                start_date=today - datetime.timedelta(days=rng.randint(0, 180)),
+            )
+            for i, job in enumerate(rng.sample(jobs, int(len(jobs) * PROCESS_SHARE_OF_JOBS)), start=1)
+        ])
+        stages = ProcessStage.objects.bulk_create([
+            ProcessStage(process=process, name=name, order=order, is_eliminatory=rng.random() < 0.7)
+            for process in processes
+            for order, name in enumerate(rng.sample(STAGE_NAMES, rng.randint(3, 5)), start=1)
+        ])
+        questions = StageQuestion.objects.bulk_create([
+            StageQuestion(
+                stage=stage, order=order,
+                question_text=f'Pergunta {order} da etapa {stage.name}',
+                question_type='multiple_choice' if order % 2 else 'open_text',
+                options=['Sim', 'Não', 'Parcialmente'] if order % 2 else None,
+            )
+            for stage in stages
+            for order in range(1, rng.randint(1, 3) + 1)
+        ])
+
+        document_types = DocumentType.objects.bulk_create([
+            DocumentType(
+                name=f'{name} (s{seed})', is_required=required, order=order,
+                created_by=recruiters[0],
+            )
+            for order, (name, required) in enumerate(DOCUMENT_TYPES, start=1)
+        ])
+
+    # bulk_create não dispara os signals que invalidam os caches versionados
+    for model in (Company, CompanyGroup, Job, DocumentType):
+        bump_model_version(model)
+
+    questions_by_stage = {}
+    for question in questions:
+        questions_by_stage.setdefault(question.stage_id, []).append([question.pk, question.question_type])
+    stages_by_process = {}
+    for stage in stages:
+        stages_by_process.setdefault(stage.process_id, []).append(
+            [stage.pk, questions_by_stage.get(stage.pk, [])]
+        )
+
+    return {
+        'recruiter_ids': [user.pk for user in recruiters],
+        'job_ids': [job.pk for job in jobs],
+        # [[process_id, [[stage_id, [[question_id, question_type], ...]], ...]], ...]
+        'processes': [[process.pk, stages_by_process[process.pk]] for process in processes],
+        'document_type_ids': [document_type.pk for document_type in document_types],
+        'password_hash': password_hash,
+        'reference_date': reference_date.isoformat(),
+    }
+
+
+# ============================================
+# CANDIDATOS (por bloco)
+# ============================================
+
+def _build_candidate(rng, index, seed, password_hash, today):
+    first_name = rng.choice(FIRST_NAMES)
+    last_name = f'{rng.choice(LAST_NAMES)} {rng.choice(LAST_NAMES)}'
+    email = candidate_email(index, seed)
+    city, state, _ = rng.choices(CITIES, weights=[c[2] for c in CITIES])[0]
+    phone = f'({rng.randint(11, 99)}) 9{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}'
+
+    user = dict(
+        email=email, name=first_name, last_name=last_name, phone=phone, city=city, state=state,
+        user_type='candidate', password=password_hash,
+        search_name=normalize_search_text(first_name, last_name, email),
+    )
+
+    experience_years = min(int(rng.expovariate(1 / 6)), 40)
+    course, education_level = rng.choice(COURSES)
+    salary_min = rng.randrange(1500, 9000, 100)
+    skills = {}
+    for name, _ in rng.choices(SKILLS, weights=[s[1] for s in SKILLS], k=rng.randint(2, 8)):
+        skills[name] = rng.choice(['beginner', 'intermediate', 'intermediate', 'advanced', 'expert'])
+    profile_status = _weighted(rng, PROFILE_STATUS_WEIGHTS)
+
+    profile = CandidateProfile(
+        cpf=_cpf(seed * 1_000_000 + index),
+        date_of_birth=_date_between(rng, datetime.date(1965, 1, 1), datetime.date(2006, 12, 31)),
+        gender=rng.choice(['M', 'F', 'F', 'M', 'O', 'N']),
+        phone_secondary=phone if rng.random() < 0.3 else '',
+        city=city, state=state,
+        zip_code=f'{rng.randint(10000, 99999)}-{rng.randint(0, 999):03d}',
+        street=rng.choice(STREETS), number=str(rng.randint(1, 3000)), neighborhood=rng.choice(NEIGHBORHOODS),
+        current_position=rng.choice(POSITIONS) if experience_years else '',
+        education_level=education_level,
+        experience_years=experience_years,
+        desired_salary_min=_brl(salary_min),
+        desired_salary_max=_brl(salary_min * rng.uniform(1.1, 1.8)),
+        professional_summary=f'Profissional com {experience_years} anos de experiência.',
+        # Parte dos perfis só tem as habilidades em texto livre (cadastros antigos)
+        skills=', '.join(skills) if rng.random() < 0.6 else '',
+        available_for_work=rng.random() < 0.85,
+        can_travel=rng.random() < 0.3,
+        accepts_remote_work=rng.random() < 0.6,
+        accepts_relocation=rng.random() < 0.25,
+        preferred_work_shift=rng.choice(['morning', 'afternoon', 'night', 'flexible', 'flexible']),
+        has_vehicle=rng.random() < 0.35,
+        has_cnh=rng.random() < 0.5,
+        profile_status=profile_status,
+        pipeline_status=profile_status,
+    )
+    profile.sync_salary_values()
+
+    start = _date_between(rng, datetime.date(2000, 1, 1), today - datetime.timedelta(days=365))
+    educations = [dict(
+        institution=rng.choice(INSTITUTIONS), course=course, degree=dict(CandidateProfile.EDUCATION_LEVEL_CHOICES)[education_level],
+        start_date=start, end_date=None if rng.random() < 0.15 else start + datetime.timedelta(days=365 * 3),
+    )]
+    if rng.random() < 0.3:
+        extra = _date_between(rng, datetime.date(2005, 1, 1), today)
+        educations.append(dict(
+            institution=rng.choice(INSTITUTIONS), course='Curso Livre', degree='Curso Livre',
+            start_date=extra, end_date=extra + datetime.timedelta(days=120),
+        ))
+    for education in educations:
+        education['is_current'] = education['end_date'] is None
+
+    experiences = []
+    end = None
+    for position in range(min(rng.randint(0, 3), experience_years)):
+        finish = end or (None if position == 0 and rng.random() < 0.5 else today)
+        begin = (finish or today) - datetime.timedelta(days=rng.randint(180, 365 * 4))
+        experiences.append(dict(
+            company=f'{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_SUFFIXES)}',
+            position=rng.choice(POSITIONS), start_date=begin, end_date=finish, is_current=finish is None,
+            description='Atividades da função.', salary=_brl(rng.randrange(1500, 10000, 100)),
+        ))
+        end = begin - datetime.timedelta(days=rng.randint(0, 120))
+
+    languages = {
+        name: rng.choice(['basic', 'intermediate', 'advanced', 'fluent'])
+        for name, _ in rng.choices(LANGUAGES, weights=[l[1] for l in LANGUAGES], k=rng.choice([0, 0, 1, 1, 2]))
+    }
+
+    return {
+        'user': user, 'profile': profile, 'educations': educations, 'experiences': experiences,
+        'skills': [(name, level, rng.randint(0, max(experience_years, 1))) for name, level in skills.items()],
+        'languages': list(languages.items()),
+        'salary_min': salary_min,
+    }
+
+
+def generate_chunk(chunk, count, seed, reference, chunk_size=CHUNK_SIZE):
+    """
+    Gera o bloco `chunk` de candidatos (índices chunk*chunk_size até o total `count`).
+
+    Returns:
+        dict com a quantidade de linhas criadas por modelo
+    """
+    from accounts.models import UserProfile
+    from admission.models import AdmissionData, CandidateDocument
+    from applications.models import Application
+    from selection_process.models import CandidateInProcess, CandidateStageResponse
+
+    from .pipeline_services import adjust_pipeline_counters, refresh_pipeline_status
+    from .search_services import refresh_search_documents
+    from .skill_services import refresh_skill_index
+
+    rng = random.Random(f'{seed}:{chunk}')
+    today = datetime.date.fromisoformat(reference['reference_date'])
+    now = timezone.make_aware(datetime.datetime.combine(today, datetime.time(12)))
+    start = chunk * chunk_size + 1
+    indexes = range(start, min(start + chunk_size, count + 1))
+    candidates = [_build_candidate(rng, index, seed, reference['password_hash'], today) for index in indexes]
+
+    with transaction.atomic():
+        for candidate in candidates:
+            candidate['user'] = UserProfile(**candidate['user'])
+            candidate['profile'].user = candidate['user']
+        UserProfile.objects.bulk_create([candidate['user'] for candidate in candidates])
+        profiles = CandidateProfile.objects.bulk_create([candidate['profile'] for candidate in candidates])
+
+        educations, experiences, skills, languages = [], [], [], []
+        for candidate, profile in zip(candidates, profiles):
+            educations.extend(CandidateEducation(candidate=profile, **data) for data in candidate['educations'])
+            for data in candidate['experiences']:
+                experience = CandidateExperience(candidate=profile, **data)
+                experience.sync_salary_values()
+                experiences.append(experience)
+            skills.extend(
+                CandidateSkill(candidate=profile, skill_name=name, level=level, years_experience=years)
+                for name, level, years in candidate['skills']
+            )
+            languages.extend(
+                CandidateLanguage(candidate=profile, language=name, proficiency=proficiency)
+                for name, proficiency in candidate['languages']
+            )
+        CandidateEducation.objects.bulk_create(educations)
+        CandidateExperience.objects.bulk_create(experiences)
+        CandidateSkill.objects.bulk_create(skills)
+        CandidateLanguage.objects.bulk_create(languages)
+
+        applications = []
+        for candidate, profile in zip(candidates, profiles):
+            user = candidate['user']
+            for job_id in rng.sample(reference['job_ids'], rng.choice(APPLICATIONS_PER_CANDIDATE)):
+                status = _weighted(rng, APPLICATION_STATUS_WEIGHTS)
+                applications.append(Application(
+                    candidate=user, job_id=job_id, name=f'{user.name} {user.last_name}', phone=user.phone,
+                    state=profile.state, city=profile.city, status=status,
+                    salary_expectation=Decimal(candidate['salary_min']),
+                    reviewed_at=None if status == 'submitted' else now,
+                ))
+        Application.objects.bulk_create(applications)
+
+        # Processos seletivos: parte dos aprovados, com respostas até a etapa atual
+        participants = []
+        stage_plan = []
+        for profile in profiles:
+            if profile.profile_status != 'approved' or rng.random() >= IN_PROCESS_SHARE:
+                continue
+            process_id, stages = rng.choice(reference['processes'])
+            status = _weighted(rng, PROCESS_STATUS_WEIGHTS)
+            if status == 'approved':
+                reached = len(stages)
+            elif status == 'pending':
+                reached = 0
+            else:
+                reached = rng.randint(1, len(stages))
+            participants.append(CandidateInProcess(
+                process_id=process_id, candidate_profile=profile, status=status,
+                current_stage_id=stages[min(reached, len(stages) - 1)][0],
+                added_by_id=rng.choice(reference['recruiter_ids']),
+            ))
+            stage_plan.append((status, stages[:reached]))
+        CandidateInProcess.objects.bulk_create(participants)
+
+        responses = []
+        for participant, (status, stages) in zip(participants, stage_plan):
+            for position, (stage_id, questions) in enumerate(stages, start=1):
+                last = position == len(stages)
+                if status == 'rejected' and last:
+                    evaluation = 'rejected'
+                elif status == 'in_progress' and last:
+                    evaluation = 'pending'
+                else:
+                    evaluation = 'approved'
+                completed = evaluation != 'pending'
+                responses.append(CandidateStageResponse(
+                    candidate_in_process=participant, stage_id=stage_id, evaluation=evaluation,
+                    answers={
+                        str(question_id): rng.choice(['Sim', 'Não', 'Parcialmente'])
+                        if question_type == 'multiple_choice' else 'Resposta do candidato.'
+                        for question_id, question_type in questions
+                    },
+                    rating=rng.randint(4, 10) if completed else None,
+                    evaluated_by_id=rng.choice(reference['recruiter_ids']) if completed else None,
+                    evaluated_at=now if completed else None,
+                    is_completed=completed, completed_at=now if completed else None,
+                ))
+        CandidateStageResponse.objects.bulk_create(responses)
+
+        # Documentos e admissão: aprovados no processo
+        documents = []
+        admissions = []
+        for participant in participants:
+            if participant.status != 'approved':
+                continue
+            profile = participant.candidate_profile
+            for document_type_id in reference['document_type_ids']:
+                if rng.random() < 0.85:
+                    document_status = _weighted(rng, DOCUMENT_STATUS_WEIGHTS)
+                    documents.append(CandidateDocument(
+                        candidate=profile, document_type_id=document_type_id,
+                        file=f'documents/sintetico_{profile.pk}_{document_type_id}.pdf',
+                        original_filename='documento.pdf', status=document_status,
+                        reviewed_at=None if document_status == 'pending' else now,
+                    ))
+            if rng.random() < ADMISSION_SHARE_OF_APPROVED:
+                user = profile.user
+                admissions.append(AdmissionData(
+                    candidate=profile, status=rng.choice(['draft', 'draft', 'completed', 'sent', 'confirmed']),
+                    nome=user.name[:100], nome_completo=f'{user.name} {user.last_name}'[:200],
+                    sexo=profile.gender if profile.gender in ('M', 'F') else '',
+                    data_nascimento=profile.date_of_birth, email=user.email,
+                    data_admissao=today + datetime.timedelta(days=rng.randint(1, 30)),
+                ))
+        CandidateDocument.objects.bulk_create(documents)
+        AdmissionData.objects.bulk_create(admissions)
+
+        counts = {}
+        for profile in profiles:
+            counts[profile.pipeline_status] = counts.get(profile.pipeline_status, 0) + 1
+        adjust_pipeline_counters(counts)
+
+    profile_ids = [profile.pk for profile in profiles]
+    refresh_pipeline_status(profile_ids)
+    refresh_search_documents(profile_ids)
+    # Também atualiza os atributos de ranqueamento (matching_services)
+    refresh_skill_index(profile_ids)
+
+    return {
+        'candidates': len(profiles),
+        'educations': len(educations),
+        'experiences': len(experiences),
+        'skills': len(skills),
+        'languages': len(languages),
+        'applications': len(applications),
+        'processes': len(participants),
+        'stage_responses': len(responses),
+        'documents': len(documents),
+        'admissions': len(admissions),
+    }
@@ -0,0 +1,177 @@
+"""
+Mantém dados derivados do candidato sincronizados com suas entradas:
+- CandidateProfile.pipeline_status: profile_status, CandidateInProcess,
+  CandidateDocument e AdmissionData.
+- PipelineCounter: criação e remoção de perfis (as mudanças de etapa são
+  contadas em pipeline_services).
+- CandidateSearchDocument: perfil, usuário, habilidades, experiências,
+  formação e idiomas.
+- CandidateSkillIndex: CandidateSkill e o texto livre CandidateProfile.skills.
+- CandidateMatchFeatures: campos do perfil usados no ranqueamento de vagas (as
+  habilidades e o pipeline_status são atualizados em skill_services/pipeline_services).
+"""
+import threading
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+
+from accounts.models import UserProfile
+from admission.models import AdmissionData, CandidateDocument, DocumentType
+from selection_process.models import CandidateInProcess
+
+from .models import (
+    CandidateProfile, CandidateEducation, CandidateExperience,
+    CandidateLanguage, CandidateSkill
+)
+from .services.matching_services import MATCH_FEATURE_INPUT_FIELDS, refresh_match_features_on_commit
+from .services.pipeline_services import (
+    DOCUMENT_PIPELINE_STATUSES,
+    adjust_pipeline_counters,
+    invalidate_required_document_types,
+    rebuild_pipeline_statuses,
+    refresh_pipeline_status,
+)
+from .services.search_services import PROFILE_SEARCH_FIELDS, refresh_search_documents
+from .services.skill_services import refresh_skill_index
+
+PIPELINE_INPUT_FIELDS = {'profile_status', 'pipeline_status'}
+
+# Perfis em remoção nesta thread -> pipeline_status gravado antes da cascata. Os
+# filhos (CandidateInProcess, documentos, admissão) caem antes do perfil e não
+# devem recalcular o status: o contador é baixado uma vez, pela etapa gravada.
+_deleting = threading.local()
+
+
+def _profiles_being_deleted():
+    if not hasattr(_deleting, 'statuses'):
+        _deleting.statuses = {}
+    return _deleting.statuses
+
+
+def _refresh_search_on_commit(profile_ids):
+    """Após o commit: o perfil pode ter sido removido em cascata na mesma transação."""
+    transaction.on_commit(lambda: refresh_search_documents(profile_ids))
+
+
+def _refresh_skills_on_commit(profile_ids):
+    transaction.on_commit(lambda: refresh_skill_index(profile_ids))
+
+
+@receiver(post_save, sender=CandidateProfile)
+def profile_saved(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    """Recalcula quando o profile_status muda (ou num save completo, que regrava o campo)."""
+    if raw:
+        return
+    if created:
+        adjust_pipeline_counters({instance.pipeline_status: 1})
+    elif update_fields is not None and not PIPELINE_INPUT_FIELDS.intersection(update_fields):
+        return
+    current = refresh_pipeline_status([instance.pk])
+    if instance.pk in current:
+        instance.pipeline_status = current[instance.pk]
+
+
+@receiver(pre_delete, sender=CandidateProfile)
+def profile_deleting(sender, instance, **kwargs):
+    stored = (
+        CandidateProfile.objects.filter(pk=instance.pk)
+        .values_list('pipeline_status', flat=True).first()
+    )
+    _profiles_being_deleted()[instance.pk] = stored or instance.pipeline_status
+
+
+@receiver(post_delete, sender=CandidateProfile)
+def profile_deleted(sender, instance, **kwargs):
+    status = _profiles_being_deleted().pop(instance.pk, instance.pipeline_status)
+    adjust_pipeline_counters({status: -1})
+
+
+@receiver(post_save, sender=CandidateInProcess)
+@receiver(post_delete, sender=CandidateInProcess)
+def candidate_in_process_changed(sender, instance, raw=False, **kwargs):
+    if raw or instance.candidate_profile_id in _profiles_being_deleted():
+        return
+    refresh_pipeline_status([instance.candidate_profile_id])
+
+
+@receiver(post_save, sender=CandidateDocument)
+@receiver(post_delete, sender=CandidateDocument)
+@receiver(post_save, sender=AdmissionData)
+@receiver(post_delete, sender=AdmissionData)
+def candidate_admission_changed(sender, instance, raw=False, **kwargs):
+    if raw or instance.candidate_id in _profiles_being_deleted():
+        return
+    refresh_pipeline_status([instance.candidate_id])
+
+
+@receiver(post_save, sender=DocumentType)
+@receiver(post_delete, sender=DocumentType)
+def document_type_changed(sender, instance, raw=False, **kwargs):
+    """Mudança nos tipos obrigatórios afeta todos os candidatos na etapa de documentos."""
+    if raw:
+        return
+    invalidate_required_document_types()
+    rebuild_pipeline_statuses(
+        CandidateProfile.objects.filter(pipeline_status__in=DOCUMENT_PIPELINE_STATUSES)
+    )
+
+
+@receiver(post_save, sender=CandidateProfile)
+def profile_search_fields_saved(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    if raw:
+        return
+    if not created and update_fields is not None and not PROFILE_SEARCH_FIELDS.intersection(update_fields):
+        return
+    _refresh_search_on_commit([instance.pk])
+
+
+@receiver(post_save, sender=UserProfile)
+def user_name_saved(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    if raw or created:
+        return
+    if update_fields is not None and not {'name', 'last_name'}.intersection(update_fields):
+        return
+    profile_ids = list(CandidateProfile.objects.filter(user=instance).values_list('pk', flat=True))
+    if profile_ids:
+        _refresh_search_on_commit(profile_ids)
+
+
+@receiver(post_save, sender=CandidateSkill)
+@receiver(post_delete, sender=CandidateSkill)
+@receiver(post_save, sender=CandidateExperience)
+@receiver(post_delete, sender=CandidateExperience)
+@receiver(post_save, sender=CandidateEducation)
+@receiver(post_delete, sender=CandidateEducation)
+@receiver(post_save, sender=CandidateLanguage)
+@receiver(post_delete, sender=CandidateLanguage)
+def candidate_details_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    _refresh_search_on_commit([instance.candidate_id])
+
+
+@receiver(post_save, sender=CandidateProfile)
+def profile_free_text_skills_saved(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and 'skills' not in update_fields:
+        return
+    _refresh_skills_on_commit([instance.pk])
+
+
+@receiver(post_save, sender=CandidateSkill)
+@receiver(post_delete, sender=CandidateSkill)
+def candidate_skill_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    _refresh_skills_on_commit([instance.candidate_id])
+
+
+@receiver(post_save, sender=CandidateProfile)
+def profile_match_fields_saved(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    if raw:
+        return
+    if not created and update_fields is not None and not MATCH_FEATURE_INPUT_FIELDS.intersection(update_fields):
+        return
+    refresh_match_features_on_commit([instance.pk])
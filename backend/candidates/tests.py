@@ -0,0 +1,405 @@
+import importlib
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from candidates.models import CandidateProfile
+from candidates.services.export_services import stream_csv
+from candidates.services.import_services import ERROR_REPORT_HEADER, error_report_rows
+from candidates.services.pipeline_services import compute_pipeline_statuses, reconcile_pipeline_counters
+
+LIST_URL = '/api/v1/candidates/profiles/'
+
+
+def _seed(count, seed):
+    call_command('generate_synthetic_data', count=count, seed=seed, stdout=StringIO())
+
+
+def _list_queries(client):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(LIST_URL)
+    assert response.status_code == 200
+    return len(queries), len(response.data['results'])
+
+
+@pytest.mark.django_db
+def test_profile_list_query_count_does_not_grow_with_rows(recruiter_client):
+    _seed(2, seed=1)
+    small_queries, small_rows = _list_queries(recruiter_client)
+
+    _seed(18, seed=2)
+    large_queries, large_rows = _list_queries(recruiter_client)
+
+    # Página cheia (PAGE_SIZE=10) de 20 perfis
+    assert (small_rows, large_rows) == (2, 10)
+    assert CandidateProfile.objects.count() == 20
+    assert large_queries == small_queries
+
+
+@pytest.mark.django_db
+def test_cascade_delete_keeps_pipeline_counters_in_sync():
+    _seed(60, seed=3)
+    assert reconcile_pipeline_counters() == {}
+    profile = CandidateProfile.objects.filter(
+        profile_status='approved', pipeline_status='in_selection_process'
+    ).select_related('user').first()
+    assert profile is not None
+
+    # Remove o perfil em cascata pelo usuário (CandidateInProcess cai antes do perfil)
+    profile.user.delete()
+
+    assert reconcile_pipeline_counters() == {}
+
+    # Remoção só do vínculo com o processo continua recalculando a etapa
+    other = CandidateProfile.objects.filter(pipeline_status='in_selection_process').first()
+    other.selection_processes.all().delete()
+    other.refresh_from_db()
+    assert other.pipeline_status != 'in_selection_process'
+    assert reconcile_pipeline_counters() == {}
+
+
+def test_stream_csv_neutralizes_formula_cells():
+    rows = [
+        ['=HYPERLINK("http://x")', '+55 11 9999', '-2+3', '@SUM(A1)', '\tcmd', '\rcmd'],
+        ['Maria', 'São Paulo', 5, -3, None, 'a=b'],
+    ]
+
+    lines = b''.join(stream_csv(['a', 'b', 'c', 'd', 'e', 'f'], rows)).decode('utf-8-sig').split('\r\n')
+
+    assert lines[1] == '"\'=HYPERLINK(""http://x"")";\'+55 11 9999;\'-2+3;\'@SUM(A1);\'\tcmd;"\'\rcmd"'
+    assert lines[2] == 'Maria;São Paulo;5;-3;;a=b'
+
+
+def test_import_error_report_neutralizes_formula_cells():
+    errors = [{'row': 2, 'errors': {'name': '=1+1'}}]
+
+    content = b''.join(stream_csv(ERROR_REPORT_HEADER, error_report_rows(errors))).decode('utf-8-sig')
+
+    assert content.splitlines()[1] == "2;name;'=1+1"
+
+
+@pytest.mark.django_db
+def test_notification_backfill_rebuilds_current_state_alerts():
+    from django.apps import apps
+
+    from admission.models import CandidateDocument
+    from candidates.models import Notification
+
+    backfill = importlib.import_module('candidates.migrations.0025_backfill_notifications')
+    _seed(80, seed=4)
+    Notification.objects.all().delete()
+    CandidateProfile.objects.update(unread_notifications=0)
+    rejected = CandidateDocument.objects.filter(
+        candidate__profile_status='approved', is_active=True, status='rejected'
+    ).select_related('candidate').first()
+    changes = CandidateProfile.objects.filter(profile_status='changes_requested').first()
+    assert rejected is not None and changes is not None
+
+    backfill.backfill_notifications(apps, None)
+
+    assert list(changes.notifications.values_list('event', flat=True)) == ['profile_changes_requested']
+    events = set(rejected.candidate.notifications.values_list('event', flat=True))
+    assert {'profile_approved', 'document_rejected'} <= events
+    for profile in CandidateProfile.objects.all():
+        assert profile.unread_notifications == profile.notifications.count()
+
+    # Reexecução não duplica
+    total = Notification.objects.count()
+    backfill.backfill_notifications(apps, None)
+    assert Notification.objects.count() == total
+
+
+@pytest.mark.django_db
+def test_profile_etag_changes_when_child_row_is_deleted():
+    from django.db.models import Count
+    from rest_framework.test import APIClient
+
+    from app.conditional import compute_validator
+    from candidates.models import CandidateEducation, CandidateExperience
+
+    _seed(30, seed=5)
+    profile = (
+        CandidateProfile.objects.annotate(total=Count('experiences')).filter(total__gte=2)
+        .select_related('user').first()
+    )
+    client = APIClient()
+    client.force_authenticate(profile.user)
+
+    first = client.get('/api/v1/candidates/profiles/me/')
+    etag = first['ETag']
+    assert first.status_code == 200
+    assert client.get('/api/v1/candidates/profiles/me/', HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    children = {
+        'experiences': (CandidateExperience, 'candidate'),
+        'educations': (CandidateEducation, 'candidate'),
+    }
+    before = compute_validator(CandidateProfile.objects.filter(pk=profile.pk), children=children)
+    # Exclusão não deixa updated_at: a quantidade de linhas é que muda o validador
+    profile.experiences.order_by('-updated_at').last().delete()
+    after = compute_validator(CandidateProfile.objects.filter(pk=profile.pk), children=children)
+    assert before.etag != after.etag
+
+    response = client.get('/api/v1/candidates/profiles/me/', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response['ETag'] != etag
+    assert compute_validator(CandidateProfile.objects.filter(pk=-1)) is None
+
+
+@pytest.mark.django_db
+def test_merge_moves_children_and_keeps_counters_consistent(recruiter):
+    from django.db.models import Count
+
+    from candidates.models import CandidateExperience, Notification
+    from candidates.services.dedup_services import merge_candidates
+    from candidates.services.notification_services import create_notification
+    from selection_process.models import CandidateInProcess
+
+    _seed(40, seed=6)
+    source = (
+        CandidateProfile.objects.annotate(processes=Count('selection_processes'))
+        .filter(processes__gte=1, experiences__isnull=False).select_related('user').first()
+    )
+    target = (
+        CandidateProfile.objects.filter(selection_processes__isnull=True)
+        .exclude(pk=source.pk).select_related('user').first()
+    )
+    create_notification(source, 'profile_changes_requested')
+    create_notification(target, 'profile_changes_requested')
+    source_experiences = list(source.experiences.values_list('pk', flat=True))
+    source_processes = list(source.selection_processes.values_list('pk', flat=True))
+    unread = Notification.objects.filter(candidate__in=[source, target], read_at__isnull=True).count()
+    assert reconcile_pipeline_counters() == {}
+
+    summary = merge_candidates(target.user, source.user, merged_by=recruiter)
+
+    source.refresh_from_db()
+    target.refresh_from_db()
+    assert summary['experiences_moved'] == len(source_experiences)
+    assert summary['processes_moved'] == len(source_processes)
+    assert set(
+        CandidateExperience.objects.filter(pk__in=source_experiences).values_list('candidate_id', flat=True)
+    ) == {target.pk}
+    assert set(
+        CandidateInProcess.objects.filter(pk__in=source_processes).values_list('candidate_profile_id', flat=True)
+    ) == {target.pk}
+    assert not source.is_active and not source.user.is_active
+
+    # Etapa gravada dos dois perfis reflete os processos após a mesclagem
+    assert compute_pipeline_statuses([source.pk, target.pk]) == {
+        source.pk: source.pipeline_status, target.pk: target.pipeline_status,
+    }
+    assert reconcile_pipeline_counters() == {}
+    assert (source.unread_notifications, target.unread_notifications) == (0, unread)
+    assert target.notifications.filter(read_at__isnull=True).count() == unread
+
+
+@pytest.mark.django_db
+def test_import_reports_cpf_date_and_duplicate_email_errors_per_row(recruiter):
+    from io import BytesIO
+
+    from candidates.services.import_services import import_candidates
+
+    sheet = '\r\n'.join([
+        'Nome;E-mail;CPF;Cidade;Estado;Data de Nascimento',
+        'Ana;ana@teste.com;529.982.247-25;Curitiba;PR;15/03/1990',
+        'Bruno;bruno@teste.com;123.456.789-00;Curitiba;PR;15/03/1990',
+        'Carla;carla@teste.com;111.444.777-35;Curitiba;PR;31/02/1990',
+        'Ana B;ANA@teste.com;390.533.447-05;Curitiba;PR;',
+        'Davi;recrutador@teste.com;123.123.123-87;Curitiba;PR;',
+        'Eva;eva@teste.com;52998224725;Curitiba;PR;',
+        'Fabio;fabio@teste.com;987.654.321-00;Curitiba;PR;01/01/1985',
+    ]).encode('utf-8')
+
+    result = import_candidates(BytesIO(sheet))
+
+    assert (result['total_rows'], result['imported_rows']) == (7, 2)
+    assert {entry['row']: entry['errors'] for entry in result['errors']} == {
+        3: {'cpf': 'CPF inválido.'},
+        4: {'date_of_birth': 'Data inválida (use dd/mm/aaaa).'},
+        5: {'email': 'E-mail repetido na planilha.'},
+        6: {'email': 'E-mail já cadastrado.'},
+        7: {'cpf': 'CPF repetido na planilha.'},
+    }
+    assert set(CandidateProfile.objects.values_list('cpf', flat=True)) == {'529.982.247-25', '987.654.321-00'}
+    assert reconcile_pipeline_counters() == {}
+
+
+def _synthetic_snapshot():
+    """Dados gerados sem ids nem timestamps, relacionados pelo e-mail do candidato."""
+    from admission.models import CandidateDocument
+    from applications.models import Application
+    from candidates.models import CandidateExperience, CandidateSkill
+    from jobs.models import Job
+    from selection_process.models import CandidateInProcess
+
+    return {
+        'profiles': list(CandidateProfile.objects.order_by('user__email').values_list(
+            'user__email', 'user__name', 'cpf', 'city', 'state', 'date_of_birth', 'current_position',
+            'desired_salary_min', 'profile_status', 'pipeline_status',
+        )),
+        'skills': list(CandidateSkill.objects.order_by('candidate__user__email', 'skill_name').values_list(
+            'candidate__user__email', 'skill_name', 'level',
+        )),
+        'experiences': list(CandidateExperience.objects.order_by('candidate__user__email', 'start_date').values_list(
+            'candidate__user__email', 'position', 'start_date', 'end_date',
+        )),
+        'jobs': list(Job.objects.order_by('slug').values_list('slug', 'closure')),
+        'applications': list(Application.objects.order_by('candidate__email', 'job__title').values_list(
+            'candidate__email', 'job__title', 'status',
+        )),
+        'processes': list(CandidateInProcess.objects.order_by(
+            'candidate_profile__user__email', 'process__title'
+        ).values_list('candidate_profile__user__email', 'process__title', 'status')),
+        'documents': list(CandidateDocument.objects.order_by(
+            'candidate__user__email', 'document_type__name'
+        ).values_list('candidate__user__email', 'document_type__name', 'status')),
+    }
+
+
+@pytest.mark.django_db
+def test_synthetic_data_is_deterministic_for_the_same_seed(monkeypatch):
+    import datetime
+
+    from django.db import transaction
+    from django.utils import timezone
+
+    from candidates.services.synthetic_services import chunk_count, create_reference_data, generate_chunk
+
+    count, seed, chunk_size = 45, 8, 20
+    with transaction.atomic():
+        call_command(
+            'generate_synthetic_data', count=count, seed=seed, chunk_size=chunk_size, stdout=StringIO()
+        )
+        first = _synthetic_snapshot()
+        transaction.set_rollback(True)
+    assert not CandidateProfile.objects.exists()
+
+    # Blocos em outra ordem (como com vários processos) e em outro dia geram os mesmos dados
+    later = timezone.now() + datetime.timedelta(days=400)
+    monkeypatch.setattr(timezone, 'now', lambda: later)
+    monkeypatch.setattr(timezone, 'localdate', lambda *args, **kwargs: later.date())
+    reference = create_reference_data(count, seed)
+    for chunk in reversed(range(chunk_count(count, chunk_size))):
+        generate_chunk(chunk, count, seed, reference, chunk_size)
+    second = _synthetic_snapshot()
+
+    assert len(first['profiles']) == count
+    assert all(first[key] for key in first)
+    assert second == first
+    assert reconcile_pipeline_counters() == {}
+
+
+def _matrix_by_candidate(matrix):
+    """Atributos e habilidades de cada perfil da matriz, independentes da posição da linha."""
+    skills = {}
+    for row, skill_id, level in zip(
+        matrix.skill_rows.tolist(), matrix.skill_ids.tolist(), matrix.skill_levels.tolist()
+    ):
+        skills.setdefault(int(matrix.ids[row]), set()).add((skill_id, level))
+    return {
+        candidate_id: (
+            bool(matrix.eligible[row]), int(matrix.education[row]), int(matrix.city[row]),
+            skills.get(candidate_id, set()),
+        )
+        for candidate_id, row in matrix.row_by_id.items()
+    }
+
+
+@pytest.mark.django_db
+def test_feature_matrix_refresh_drops_deleted_profiles():
+    from candidates.models import CandidateMatchFeatures
+    from candidates.services.matching_services import FEATURE_COLUMNS, _FeatureMatrix, _MatrixStore
+
+    _seed(30, seed=9)
+    matrix = _FeatureMatrix.load(list(CandidateMatchFeatures.objects.values_list(*FEATURE_COLUMNS)))
+    removed = CandidateProfile.objects.filter(detailed_skills__isnull=False).select_related('user').first()
+    removed.user.delete()
+
+    matrix = _MatrixStore._refreshed(matrix)
+
+    assert removed.pk not in matrix.row_by_id
+    assert len(matrix) == CandidateMatchFeatures.objects.count() == 29
+    reloaded = _FeatureMatrix.load(
+        list(CandidateMatchFeatures.objects.values_list(*FEATURE_COLUMNS)), matrix.city_codes
+    )
+    assert _matrix_by_candidate(matrix) == _matrix_by_candidate(reloaded)
+
+    # Totais iguais: a atualização seguinte não relê todos os ids
+    with CaptureQueriesContext(connection) as queries:
+        _MatrixStore._refreshed(matrix)
+    assert len(queries) == 2
+
+
+@pytest.mark.django_db
+def test_search_filters_position_separately_from_free_text(recruiter_client, django_capture_on_commit_callbacks):
+    from candidates.models import CandidateExperience
+
+    _seed(20, seed=11)
+    current, previous, mention = CandidateProfile.objects.order_by('pk')[:3]
+    with django_capture_on_commit_callbacks(execute=True):
+        current.current_position = 'Cartógrafo Submarino'
+        current.save()
+        CandidateExperience.objects.create(
+            candidate=previous, company='Marinha', position='CARTOGRAFO SUBMARINO SÊNIOR',
+            start_date='2015-01-01', end_date='2018-01-01',
+        )
+        # Cargo citado só no resumo não conta para o filtro por cargo
+        mention.professional_summary = 'Cartógrafo submarino nas horas vagas.'
+        mention.save()
+
+    response = recruiter_client.get(f'{LIST_URL}search/', {'position': 'cartografo submarino'})
+
+    assert response.status_code == 200
+    assert {row['id'] for row in response.data['results']} == {current.pk, previous.pk}
+
+
+@pytest.mark.django_db
+def test_stale_ai_insight_returns_the_numbers_it_was_generated_from(recruiter_client):
+    from candidates.models import PipelineInsight
+
+    _seed(15, seed=15)
+    old_inputs = {'distribution': {'pending': 3}, 'total': 3, 'conversion': {}, 'applications': {}}
+    PipelineInsight.objects.create(
+        input_hash='0' * 64, input_data=old_inputs,
+        result={'summary': '3 candidatos em análise.', 'highlights': [], 'bottleneck': '', 'recommendations': []},
+    )
+
+    response = recruiter_client.get(f'{LIST_URL}ai-insights/')
+
+    assert response.status_code == 200
+    assert response.data['status'] == 'stale'
+    assert response.data['summary'] == '3 candidatos em análise.'
+    assert response.data['data'] == old_inputs
+    assert response.data['current_data']['total'] == 15
+
+
+@pytest.mark.django_db
+def test_compound_skills_with_slash_are_not_split(recruiter_client, django_capture_on_commit_callbacks):
+    from candidates.models import CandidateSkillIndex
+    from candidates.services.skill_services import split_free_text_skills
+
+    assert split_free_text_skills('Python, PL/SQL; CI/CD | Git / Docker') == [
+        'Python', 'PL/SQL', 'CI/CD', 'Git', 'Docker',
+    ]
+
+    _seed(10, seed=16)
+    compound, split, parts = CandidateProfile.objects.order_by('pk')[:3]
+    with django_capture_on_commit_callbacks(execute=True):
+        compound.skills = 'CI/CD, PL/SQL'
+        compound.save()
+        split.skills = 'CI, CD, SQL'
+        split.save()
+        # Composto fora da taxonomia: indexa as partes
+        parts.skills = 'HTML/CSS'
+        parts.save()
+
+    response = recruiter_client.get(LIST_URL, {'has_skills': 'CI/CD, PL/SQL', 'skills_match': 'all'})
+    assert response.status_code == 200
+    assert {row['id'] for row in response.data['results']} == {compound.pk}
+
+    indexed = set(CandidateSkillIndex.objects.filter(candidate=parts).values_list('skill__name', flat=True))
+    assert {'HTML', 'CSS'} <= indexed
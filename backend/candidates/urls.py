@@ -2,7 +2,7 @@ from rest_framework.routers import DefaultRouter
 
 from candidates.views import (
     CandidateProfileViewSet, CandidateEducationViewSet, CandidateExperienceViewSet,
-    CandidateLanguageViewSet, CandidateSkillViewSet
+    CandidateLanguageViewSet, CandidateSkillViewSet, DuplicateSuggestionViewSet
 )
 
 
@@ -13,5 +13,6 @@ router.register(r'candidates/educations', CandidateEducationViewSet, basename='c
 router.register(r'candidates/experiences', CandidateExperienceViewSet, basename='candidate-experience')
 router.register(r'candidates/languages', CandidateLanguageViewSet, basename='candidate-language')
 router.register(r'candidates/skills', CandidateSkillViewSet, basename='candidate-skill')
+router.register(r'candidates/duplicates', DuplicateSuggestionViewSet, basename='candidate-duplicate')
 
 urlpatterns = router.urls
@@ -0,0 +1,63 @@
+"""
+Regras de validação do cadastro do candidato, compartilhadas pelos serializers e
+pela importação em lote (services/import_services). Cada função retorna a mensagem
+de erro, ou None se o valor é válido.
+"""
+import re
+from datetime import date
+
+MIN_AGE = 14
+MAX_AGE = 100
+
+
+def cpf_digits(value):
+    return re.sub(r'\D', '', value or '')
+
+
+def cpf_error(value):
+    """Formato e dígitos verificadores do CPF (a unicidade é verificada por quem chama)."""
+    numbers_only = cpf_digits(value)
+    if len(numbers_only) != 11:
+        return 'CPF deve ter 11 dígitos.'
+
+    # Rejeitar CPFs com todos os dígitos iguais (ex: 111.111.111-11)
+    if numbers_only == numbers_only[0] * 11:
+        return 'CPF inválido.'
+
+    # Validar primeiro dígito verificador
+    soma = sum(int(numbers_only[i]) * (10 - i) for i in range(9))
+    resto = soma % 11
+    digito1 = 0 if resto < 2 else 11 - resto
+    if int(numbers_only[9]) != digito1:
+        return 'CPF inválido.'
+
+    # Validar segundo dígito verificador
+    soma = sum(int(numbers_only[i]) * (11 - i) for i in range(10))
+    resto = soma % 11
+    digito2 = 0 if resto < 2 else 11 - resto
+    if int(numbers_only[10]) != digito2:
+        return 'CPF inválido.'
+    return None
+
+
+def format_cpf(value):
+    """CPF no formato do frontend: 000.000.000-00"""
+    d = cpf_digits(value)
+    return f'{d[:3]}.{d[3:6]}.{d[6:9]}-{d[9:]}'
+
+
+def birth_date_error(value):
+    today = date.today()
+    age = today.year - value.year - ((today.month, today.day) < (value.month, value.day))
+
+    if age < MIN_AGE:
+        return f'Idade mínima é {MIN_AGE} anos.'
+    if age > MAX_AGE:
+        return f'Idade não pode ser superior a {MAX_AGE} anos.'
+    return None
+
+
+def zip_code_error(value):
+    if not re.match(r'^\d{5}-?\d{3}$', value):
+        return 'CEP deve estar no formato 00000-000.'
+    return None
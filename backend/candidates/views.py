@@ -1,29 +1,39 @@
 from rest_framework import serializers, viewsets, permissions, status, filters
 from rest_framework.decorators import action
+from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.response import Response
 
 from django_filters.rest_framework import DjangoFilterBackend
-from django_filters import FilterSet, NumberFilter, CharFilter
+from django_filters import FilterSet, NumberFilter, CharFilter, ChoiceFilter
 
-from django.db.models import Q
-from django.db import IntegrityError
+from django.db.models import F, Q
+from django.http import StreamingHttpResponse
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 
+from app.conditional import compute_validator, conditional_get, serializer_signature
+from app.pagination import KeysetPagination
+
 from candidates.models import (
     CandidateProfile, CandidateEducation, CandidateExperience,
-    CandidateLanguage, CandidateSkill
+    CandidateLanguage, CandidateSkill, CandidateImport, DuplicateSuggestion, Notification
 )
 from candidates.serializers import (
     CandidateProfileSerializer, CandidateProfileCreateUpdateSerializer, CandidateProfileListSerializer,
     CandidateEducationSerializer, CandidateExperienceSerializer,
     CandidateLanguageSerializer, CandidateSkillSerializer,
-    ProfileStatusUpdateSerializer
+    ProfileStatusUpdateSerializer,
+    BulkProfileStatusUpdateSerializer,
+    NotificationSerializer, NotificationMarkReadSerializer,
+    DuplicateSuggestionSerializer, DuplicateMergeSerializer,
+    CandidateImportSerializer, CandidateImportUploadSerializer
 )
 
 
 import re as _re
+from datetime import date
 
 SECTION_LABEL_TO_KEY = {
     'Dados Pessoais': 'dadosPessoais',
@@ -48,6 +58,29 @@ PROFESSIONAL_FIELDS = {
 }
 
 
+def _profile_validator(queryset):
+    """
+    Validador (ETag/Last-Modified) do perfil completo de CandidateProfileSerializer:
+    o perfil, as relações aninhadas, o usuário, o revisor e a admissão. A data do dia
+    entra por causa da idade calculada.
+    """
+    return compute_validator(
+        queryset,
+        children={
+            'educations': (CandidateEducation, 'candidate'),
+            'experiences': (CandidateExperience, 'candidate'),
+            'languages': (CandidateLanguage, 'candidate'),
+            'detailed_skills': (CandidateSkill, 'candidate'),
+        },
+        # Gravados por UPDATE sem tocar em updated_at
+        fields=(
+            'pipeline_status', 'unread_notifications',
+            'user__updated_at', 'profile_reviewed_by__updated_at', 'admission_data__updated_at',
+        ),
+        extra=(date.today().isoformat(), serializer_signature(CandidateProfileSerializer)),
+    )
+
+
 def _parse_observation_sections(observations):
     """Extrai chaves de secao das observacoes estruturadas."""
     keys = []
@@ -105,8 +138,28 @@ class CandidateProfileFilter(FilterSet):
     # Filtro para buscar candidatos que se candidataram a uma vaga específica
     applied_to_job = NumberFilter(method='filter_by_job')
 
-    # Filtro por status do pipeline (computado)
-    pipeline_status = CharFilter(method='filter_pipeline_status')
+    # Filtro por status do pipeline (materializado em CandidateProfile.pipeline_status)
+    pipeline_status = CharFilter(field_name='pipeline_status')
+
+    # Faixa salarial pelas colunas Decimal indexadas (o texto "R$ 3.500,00" não
+    # compara como número); mantém os nomes de parâmetro anteriores
+    desired_salary_min__gte = NumberFilter(field_name='desired_salary_min_value', lookup_expr='gte')
+    desired_salary_min__lte = NumberFilter(field_name='desired_salary_min_value', lookup_expr='lte')
+    desired_salary_max__gte = NumberFilter(field_name='desired_salary_max_value', lookup_expr='gte')
+    desired_salary_max__lte = NumberFilter(field_name='desired_salary_max_value', lookup_expr='lte')
+
+    # Habilidades via taxonomia/índice invertido:
+    # ?has_skills=django,postgresql&skills_match=all&skill_level=advanced&skill_years=2
+    has_skills = CharFilter(method='filter_has_skills', label='Habilidades (separadas por vírgula)')
+    skills_match = ChoiceFilter(
+        choices=[('all', 'Todas (E)'), ('any', 'Qualquer (OU)')],
+        method='filter_skill_options', label='Combinação das habilidades'
+    )
+    skill_level = ChoiceFilter(
+        choices=CandidateSkill.SKILL_LEVEL_CHOICES,
+        method='filter_skill_options', label='Nível mínimo nas habilidades'
+    )
+    skill_years = NumberFilter(method='filter_skill_options', label='Anos mínimos nas habilidades')
 
     class Meta:
         model = CandidateProfile
@@ -117,8 +170,6 @@ class CandidateProfileFilter(FilterSet):
             'accepts_relocation': ['exact'],
             'can_travel': ['exact'],
             'experience_years': ['gte', 'lte'],
-            'desired_salary_min': ['gte', 'lte'],
-            'desired_salary_max': ['gte', 'lte'],
             'preferred_work_shift': ['exact'],
         }
 
@@ -128,82 +179,65 @@ class CandidateProfileFilter(FilterSet):
             return queryset.filter(user__applications__job_id=value).distinct()
         return queryset
 
-    def filter_pipeline_status(self, queryset, name, value):
-        """Filtra por status do pipeline (original ou computado)."""
-        from admission.models import DocumentType
-        from django.db.models import Count, Q
-
-        # Status originais do banco
-        if value in ('pending', 'awaiting_review', 'rejected', 'changes_requested'):
-            return queryset.filter(profile_status=value)
-
-        # Todos os computados partem de profile_status='approved'
-        approved = queryset.filter(profile_status='approved')
-
-        # Candidatos aprovados em algum processo seletivo (gate para documentos)
-        approved_in_process = approved.filter(
-            selection_processes__status='approved'
-        ).distinct()
-
-        # Candidatos aprovados SEM processo seletivo aprovado (e sem proc ativo, sem admissão)
-        just_approved = approved.exclude(
-            selection_processes__status='approved'
-        ).exclude(
-            selection_processes__is_active=True,
-            selection_processes__status__in=['pending', 'in_progress']
-        ).exclude(
-            admission_data__status__in=['draft', 'completed', 'sent', 'confirmed']
-        ).distinct()
-
-        if value == 'approved':
-            return just_approved
-
-        # --- Documentos (só entre quem foi aprovado em proc. seletivo) ---
-        required_types = DocumentType.objects.filter(is_active=True, is_required=True)
-        total_required = required_types.count()
-
-        if total_required > 0:
-            annotated = approved_in_process.annotate(
-                _approved_req=Count(
-                    'documents',
-                    filter=Q(
-                        documents__is_active=True,
-                        documents__status='approved',
-                        documents__document_type__in=required_types,
-                    )
-                )
-            )
-            docs_complete = annotated.filter(_approved_req__gte=total_required)
-            docs_incomplete = annotated.filter(_approved_req__lt=total_required)
-        else:
-            docs_complete = approved_in_process
-            docs_incomplete = approved_in_process.none()
-
-        # Candidatos em processo seletivo ativo
-        in_process = approved.filter(
-            selection_processes__is_active=True,
-            selection_processes__status__in=['pending', 'in_progress']
-        ).exclude(
-            admission_data__status__in=['draft', 'completed', 'sent', 'confirmed']
-        ).distinct()
-
-        if value == 'in_selection_process':
-            return in_process
-        elif value == 'documents_pending':
-            return docs_incomplete.exclude(pk__in=in_process)
-        elif value == 'documents_complete':
-            return docs_complete.exclude(
-                admission_data__status__in=['draft', 'completed', 'sent', 'confirmed']
-            ).exclude(pk__in=in_process)
-        elif value == 'admission_in_progress':
-            return docs_complete.filter(
-                admission_data__status='draft'
-            )
-        elif value == 'admitted':
-            return docs_complete.filter(
-                admission_data__status__in=['completed', 'sent', 'confirmed']
-            )
+    def filter_has_skills(self, queryset, name, value):
+        """Filtra por habilidades canônicas (aceita sinônimos) com combinação E/OU, nível e anos."""
+        from candidates.services.skill_services import filter_by_skills, split_free_text_skills
+        names = split_free_text_skills(value)
+        if not names:
+            return queryset
+        data = self.form.cleaned_data
+        return filter_by_skills(
+            queryset, names,
+            match=data.get('skills_match') or 'all',
+            min_level=data.get('skill_level') or None,
+            min_years=data.get('skill_years'),
+        )
 
+    def filter_skill_options(self, queryset, name, value):
+        """Opções de has_skills: aplicadas em filter_has_skills."""
+        return queryset
+
+
+class CandidateOrderingFilter(filters.OrderingFilter):
+    """
+    ?ordering=desired_salary_min / desired_salary_max ordena pelas colunas Decimal
+    (perfis sem pretensão informada ficam por último nos dois sentidos).
+    """
+
+    VALUE_FIELDS = {
+        'desired_salary_min': 'desired_salary_min_value',
+        'desired_salary_max': 'desired_salary_max_value',
+    }
+
+    def filter_queryset(self, request, queryset, view):
+        ordering = self.get_ordering(request, queryset, view)
+        if not ordering:
+            return queryset
+        return queryset.order_by(*[self._order_expression(term) for term in ordering])
+
+    def _order_expression(self, term):
+        name = term.lstrip('-')
+        if name not in self.VALUE_FIELDS:
+            return term
+        field = F(self.VALUE_FIELDS[name])
+        return field.desc(nulls_last=True) if term.startswith('-') else field.asc(nulls_last=True)
+
+
+class CandidateSearchFilter(filters.SearchFilter):
+    """
+    Busca textual (?search=) via CandidateSearchDocument.
+    PostgreSQL: full-text com tsvector/GIN e ordenação por relevância quando não há ?ordering=.
+    SQLite: icontains nas colunas do documento.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        from candidates.services.search_services import search_candidates
+        from rest_framework.settings import api_settings
+
+        term = request.query_params.get(self.search_param, '')
+        queryset, ranked = search_candidates(queryset, term)
+        if ranked and not request.query_params.get(api_settings.ORDERING_PARAM):
+            queryset = queryset.order_by('-search_rank', '-created_at')
         return queryset
 
 
@@ -239,27 +273,30 @@ class CandidateProfileViewSet(viewsets.ModelViewSet):
 
     serializer_class = CandidateProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    pagination_class = KeysetPagination
+    cursor_ordering = ('-created_at', '-id')
+    # CandidateSearchFilter roda depois do OrderingFilter para aplicar o ranking de relevância
+    filter_backends = [DjangoFilterBackend, CandidateOrderingFilter, CandidateSearchFilter]
     filterset_class = CandidateProfileFilter
-    search_fields = [
-        'user__name', 'current_position', 'current_company', 'skills', 
-        'professional_summary', 'certifications'
-    ]
-    ordering_fields = ['created_at', 'experience_years', 'desired_salary_min']
+    ordering_fields = ['created_at', 'experience_years', 'desired_salary_min', 'desired_salary_max']
     ordering = ['-created_at']
 
     def get_queryset(self):
         """Filtra perfis baseado no tipo de usuário (otimizado com prefetch)"""
         user = self.request.user
 
-        # Queryset otimizado para listagem (evita N+1)
-        full_qs = CandidateProfile.objects.all().select_related(
-            'user', 'admission_data'
-        ).prefetch_related(
-            'educations', 'experiences', 'languages', 'detailed_skills',
-            'selection_processes', 'selection_processes__process',
-            'selection_processes__current_stage',
-        )
+        # Listagem/busca: resumos via Prefetch(to_attr) e anotações (sem N+1)
+        if self.action in ('list', 'search'):
+            full_qs = CandidateProfileListSerializer.setup_eager_loading(CandidateProfile.objects.all())
+        elif self.action == 'export':
+            # Exportação usa projeção values_list: sem joins/prefetch de objetos
+            full_qs = CandidateProfile.objects.all()
+        else:
+            full_qs = CandidateProfile.objects.all().select_related(
+                'user', 'admission_data', 'profile_reviewed_by'
+            ).prefetch_related(
+                'educations', 'experiences', 'languages', 'detailed_skills',
+            )
 
         # Staff/Superuser sempre vê tudo (independente de user_type)
         if user.is_staff or user.is_superuser:
@@ -271,9 +308,7 @@ class CandidateProfileViewSet(viewsets.ModelViewSet):
 
         # Candidatos veem apenas seu próprio perfil
         if user.user_type == 'candidate':
-            return CandidateProfile.objects.filter(user=user).select_related(
-                'user', 'admission_data'
-            ).prefetch_related('selection_processes')
+            return full_qs.filter(user=user)
 
         return CandidateProfile.objects.none()
 
@@ -328,6 +363,14 @@ class CandidateProfileViewSet(viewsets.ModelViewSet):
 
         return instance
 
+    def retrieve(self, request, *args, **kwargs):
+        """Detalhe do perfil com GET condicional (ETag/Last-Modified)."""
+        lookup = kwargs.get(self.lookup_url_kwarg or self.lookup_field)
+        queryset = self.get_queryset()
+        validator = _profile_validator(queryset.filter(pk=lookup)) if str(lookup).isdigit() else None
+        parent_retrieve = super().retrieve
+        return conditional_get(request, validator, lambda: parent_retrieve(request, *args, **kwargs))
+
     def perform_destroy(self, instance):
         """Permite apenas que o próprio candidato delete seu perfil"""
         if self.request.user != instance.user:
@@ -348,16 +391,26 @@ class CandidateProfileViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        try:
-            profile = CandidateProfile.objects.get(user=request.user)
-            serializer = CandidateProfileSerializer(profile, context={'request': request})
-            return Response(serializer.data)
-        except CandidateProfile.DoesNotExist:
+        queryset = CandidateProfile.objects.filter(user=request.user)
+        validator = _profile_validator(queryset)
+        if validator is None:
             return Response(
                 {'error': 'Perfil de candidato não encontrado. Crie um perfil primeiro.'},
                 status=status.HTTP_404_NOT_FOUND
             )
 
+        def build_response():
+            profile = queryset.select_related(
+                'user', 'admission_data', 'profile_reviewed_by'
+            ).prefetch_related(
+                'educations', 'experiences', 'languages', 'detailed_skills',
+            ).get()
+            serializer = CandidateProfileSerializer(profile, context={'request': request})
+            return Response(serializer.data)
+
+        # Recarga sem alterações: 304 após uma consulta, sem serializar o perfil
+        return conditional_get(request, validator, build_response)
+
     @extend_schema(
         tags=['Candidatos'],
         summary='Buscar candidatos',
@@ -380,17 +433,17 @@ class CandidateProfileViewSet(viewsets.ModelViewSet):
         position_query = request.query_params.get('position')
         location_query = request.query_params.get('location')
 
-        if skills_query:
-            queryset = queryset.filter(
-                Q(skills__icontains=skills_query) |
-                Q(detailed_skills__skill_name__icontains=skills_query)
-            ).distinct()
-
+        # Habilidades conhecidas na taxonomia usam o índice invertido (todas obrigatórias);
+        # termos desconhecidos usam o documento de busca (full-text no PostgreSQL) e o
+        # cargo, só os cargos atual e anteriores do documento
+        from candidates.services.search_services import filter_by_position, search_candidates
+        from candidates.services.skill_services import filter_by_skills, partition_known_skills
+        known_skills, unknown_skills = partition_known_skills(skills_query)
+        if known_skills:
+            queryset = filter_by_skills(queryset, known_skills, match='all')
+        queryset, _ = search_candidates(queryset, ' '.join(unknown_skills))
         if position_query:
-            queryset = queryset.filter(
-                Q(current_position__icontains=position_query) |
-                Q(experiences__position__icontains=position_query)
-            ).distinct()
+            queryset = filter_by_position(queryset, position_query)
 
         if location_query:
             # Busca em qualquer campo de localização das applications do usuário
@@ -414,6 +467,142 @@ class CandidateProfileViewSet(viewsets.ModelViewSet):
         serializer = CandidateProfileListSerializer(queryset, many=True)
         return Response(serializer.data)
 
+    @extend_schema(
+        tags=['Candidatos - Perfis'],
+        summary='Exportar candidatos (CSV/XLSX)',
+        description='Exporta o banco de candidatos filtrado (mesmos filtros da listagem e ?search=) '
+                    'em CSV ou XLSX, gerado por streaming. Apenas recrutadores e admins.',
+        parameters=[
+            OpenApiParameter('file_format', str, description='csv (padrão) ou xlsx', enum=['csv', 'xlsx']),
+            OpenApiParameter('columns', str, description='Colunas separadas por vírgula (padrão: principais dados do perfil)'),
+        ],
+        responses={200: {'description': 'Arquivo CSV ou XLSX'}},
+    )
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        """Exporta perfis filtrados sem carregar todos em memória (StreamingHttpResponse)."""
+        user = request.user
+        if not (user.user_type == 'recruiter' or user.is_staff or user.is_superuser):
+            return Response(
+                {'error': 'Apenas recrutadores e admins podem exportar candidatos.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        from candidates.services.export_services import EXPORT_FORMATS, export_candidates, parse_columns
+
+        file_format = request.query_params.get('file_format', 'csv').lower()
+        if file_format not in EXPORT_FORMATS:
+            return Response(
+                {'error': 'Formato inválido. Use csv ou xlsx.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            columns = parse_columns(request.query_params.get('columns'))
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        queryset = self.filter_queryset(self.get_queryset())
+
+        content_type, extension = EXPORT_FORMATS[file_format]
+        filename = f'candidatos_{timezone.localtime():%Y%m%d_%H%M}.{extension}'
+        response = StreamingHttpResponse(
+            export_candidates(queryset, columns, file_format), content_type=content_type
+        )
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        # Entrega os blocos ao cliente sem bufferizar no proxy (nginx)
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    @extend_schema(
+        tags=['Candidatos - Perfis'],
+        summary='Importar candidatos (CSV/XLSX)',
+        description='Recebe uma planilha de candidatos (mesmas colunas da exportação) e a processa em '
+                    'segundo plano, em lotes. Acompanhe em GET imports/<id>/; o relatório de erros por '
+                    'linha fica em imports/<id>/report/. Apenas recrutadores e admins.',
+        request={'multipart/form-data': CandidateImportUploadSerializer},
+        responses={202: CandidateImportSerializer},
+    )
+    @action(detail=False, methods=['post'], url_path='import', parser_classes=[MultiPartParser, FormParser])
+    def import_spreadsheet(self, request):
+        """Agenda a importação da planilha enviada (o arquivo fica em disco só até o fim do processamento)."""
+        user = request.user
+        if not (user.user_type == 'recruiter' or user.is_staff or user.is_superuser):
+            return Response(
+                {'error': 'Apenas recrutadores e admins podem importar candidatos.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        serializer = CandidateImportUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data['file']
+        file_format = upload.name.rsplit('.', 1)[-1].lower()
+
+        import tempfile
+        from app.background import submit_on_commit
+        from candidates.services.import_services import run_import_job
+
+        with tempfile.NamedTemporaryFile(suffix=f'.{file_format}', delete=False) as destination:
+            for chunk in upload.chunks():
+                destination.write(chunk)
+
+        job = CandidateImport.objects.create(
+            file_name=upload.name[:255],
+            dry_run=serializer.validated_data['dry_run'],
+            created_by=user,
+        )
+        submit_on_commit(run_import_job, job.pk, destination.name, file_format)
+        return Response(CandidateImportSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+
+    @extend_schema(
+        tags=['Candidatos - Perfis'],
+        summary='Status da importação de candidatos',
+        description='Totais (lidas, importadas, com erro) e erros por linha de uma importação.',
+        responses={200: CandidateImportSerializer},
+    )
+    @action(detail=False, methods=['get'], url_path=r'imports/(?P<import_id>\d+)')
+    def import_status(self, request, import_id=None):
+        job, error = self._get_import(request, import_id)
+        if error:
+            return error
+        return Response(CandidateImportSerializer(job).data)
+
+    @extend_schema(
+        tags=['Candidatos - Perfis'],
+        summary='Relatório de erros da importação (CSV)',
+        responses={200: {'description': 'CSV com linha, coluna e erro'}},
+    )
+    @action(detail=False, methods=['get'], url_path=r'imports/(?P<import_id>\d+)/report')
+    def import_report(self, request, import_id=None):
+        job, error = self._get_import(request, import_id)
+        if error:
+            return error
+
+        from candidates.services.export_services import stream_csv
+        from candidates.services.import_services import ERROR_REPORT_HEADER, error_report_rows
+
+        response = StreamingHttpResponse(
+            stream_csv(ERROR_REPORT_HEADER, error_report_rows(job.errors)),
+            content_type='text/csv; charset=utf-8'
+        )
+        response['Content-Disposition'] = f'attachment; filename="importacao_{job.pk}_erros.csv"'
+        return response
+
+    def _get_import(self, request, import_id):
+        """Importação informada ou Response de erro."""
+        user = request.user
+        if not (user.user_type == 'recruiter' or user.is_staff or user.is_superuser):
+            return None, Response(
+                {'error': 'Apenas recrutadores e admins podem ver importações.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        job = CandidateImport.objects.filter(pk=import_id).first()
+        if job is None:
+            return None, Response(
+                {'error': 'Importação não encontrada.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return job, None
+
     @extend_schema(
         tags=['Candidatos - Perfis'],
         summary='Atualizar status do perfil',
@@ -482,6 +671,11 @@ class CandidateProfileViewSet(viewsets.ModelViewSet):
         if event:
             notify_candidate_status_change(profile, event, {'observacoes': observations})
 
+        from app.events import RECRUITERS_CHANNEL, publish
+        publish(RECRUITERS_CHANNEL, 'profile_status', {
+            'profile_ids': [profile.pk], 'profile_status': profile.profile_status,
+        })
+
         # Retornar perfil atualizado
         return Response({
             'message': 'Status do perfil atualizado com sucesso.',
@@ -491,95 +685,200 @@ class CandidateProfileViewSet(viewsets.ModelViewSet):
             'pending_observation_sections': profile.pending_observation_sections,
         })
 
-    @action(detail=False, methods=['get'], url_path='me/notifications')
-    def my_notifications(self, request):
-        """Retorna notificações pendentes do candidato."""
+    @extend_schema(
+        tags=['Candidatos - Perfis'],
+        summary='Atualizar status de perfis em lote',
+        description='Aplica a mesma decisão (aprovar, reprovar, solicitar alterações) a vários perfis '
+                    'em uma única transação. As notificações WhatsApp são enviadas em segundo plano '
+                    'após o commit. Apenas recrutadores e admins.',
+        request=BulkProfileStatusUpdateSerializer,
+        responses={200: {'description': 'Resultado por perfil'}},
+    )
+    @action(detail=False, methods=['post'], url_path='bulk-update-status')
+    def bulk_update_profile_status(self, request):
+        """
+        Revisão de perfis em lote: UPDATEs por conjunto em vez de um save por perfil.
+        Retorna o resultado de cada id enviado ('updated' ou 'not_found').
+        """
         user = request.user
-        if user.user_type != 'candidate':
+
+        if not (user.user_type == 'recruiter' or user.is_staff or user.is_superuser):
             return Response(
-                {'detail': 'Apenas candidatos podem acessar este endpoint.'},
+                {'error': 'Apenas recrutadores e admins podem atualizar status de perfil.'},
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        try:
-            profile = CandidateProfile.objects.get(user=user)
-        except CandidateProfile.DoesNotExist:
-            return Response(
-                {'detail': 'Perfil de candidato não encontrado.'},
-                status=status.HTTP_404_NOT_FOUND
-            )
+        serializer = BulkProfileStatusUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
 
-        notifications = []
+        profile_ids = serializer.validated_data['profile_ids']
+        new_status = serializer.validated_data['status']
+        observations = serializer.validated_data.get('observations', '')
+        reviewed_at = timezone.now()
 
-        # 1. Perfil com alterações solicitadas
-        if profile.profile_status == 'changes_requested':
-            notifications.append({
-                'type': 'profile_changes',
-                'title': 'Alterações solicitadas',
-                'message': 'O recrutador solicitou alterações no seu perfil.',
-                'link': '/perfil',
-                'icon': 'profile'
-            })
+        if new_status == 'changes_requested':
+            pending_sections = _parse_observation_sections(observations)
+        else:
+            pending_sections = []
 
-        # 2. Perfil aprovado
-        if profile.profile_status == 'approved':
-            notifications.append({
-                'type': 'profile_approved',
-                'title': 'Perfil aprovado!',
-                'message': 'Parabéns! Seu perfil foi aprovado pelo recrutador.',
-                'link': '/perfil',
-                'icon': 'profile_approved'
-            })
+        from applications.models import Application
+        from candidates.services.pipeline_services import refresh_pipeline_status
 
-        # 3. Documentos rejeitados (só se perfil aprovado)
-        if profile.profile_status == 'approved':
-            from admission.models import CandidateDocument
-            rejected_count = CandidateDocument.objects.filter(
-                candidate=profile, is_active=True, status='rejected'
-            ).count()
-            if rejected_count > 0:
-                notifications.append({
-                    'type': 'documents_rejected',
-                    'title': 'Documentos rejeitados',
-                    'message': f'{rejected_count} documento(s) rejeitado(s). Verifique o motivo e reenvie.',
-                    'link': '/perfil/documentos',
-                    'icon': 'document',
-                    'count': rejected_count
-                })
+        applications_updated = 0
+        with transaction.atomic():
+            found_ids = set(
+                CandidateProfile.objects.filter(pk__in=profile_ids).values_list('pk', flat=True)
+            )
+            if found_ids:
+                CandidateProfile.objects.filter(pk__in=found_ids).update(
+                    profile_status=new_status,
+                    profile_observations=observations,
+                    profile_reviewed_by=user,
+                    profile_reviewed_at=reviewed_at,
+                    pending_observation_sections=pending_sections,
+                    updated_at=reviewed_at,
+                )
 
-        # 3. Processos seletivos — aprovação/reprovação final
-        from selection_process.models import CandidateInProcess
-        process_updates = CandidateInProcess.objects.filter(
-            candidate_profile=profile,
-            status__in=['approved', 'rejected']
-        ).select_related('process')
-
-        for proc in process_updates:
-            if proc.status == 'approved':
-                notifications.append({
-                    'type': 'process_approved',
-                    'title': f'Aprovado: {proc.process.title}',
-                    'message': 'Parabéns! Você foi aprovado no processo seletivo.',
-                    'link': '/perfil',
-                    'icon': 'process_approved'
-                })
-            elif proc.status == 'rejected':
-                notifications.append({
-                    'type': 'process_rejected',
-                    'title': f'Reprovado: {proc.process.title}',
-                    'message': 'Infelizmente você não foi aprovado neste processo.',
-                    'link': '/perfil',
-                    'icon': 'process_rejected'
+                # Sincronizar status das candidaturas (Applications) com o status do perfil
+                if new_status in ('approved', 'rejected'):
+                    applications_updated = Application.objects.filter(
+                        candidate__candidate_profile__in=found_ids,
+                        status__in=['submitted', 'in_process', 'interview_scheduled'],
+                    ).update(
+                        status=new_status,
+                        reviewed_by=user,
+                        reviewed_at=reviewed_at,
+                    )
+
+                # update() não dispara signals: recalcular o pipeline explicitamente
+                refresh_pipeline_status(found_ids)
+
+                from app.events import RECRUITERS_CHANNEL, publish
+                publish(RECRUITERS_CHANNEL, 'profile_status', {
+                    'profile_ids': sorted(found_ids), 'profile_status': new_status,
                 })
 
+                # Caixa de entrada na mesma transação; WhatsApp somente após o commit,
+                # fora da requisição
+                from app.background import submit_on_commit
+                from candidates.services.notification_services import create_notifications
+                from whatsapp.services import notify_candidates_status_change
+                status_event_map = {
+                    'approved': 'profile_approved',
+                    'rejected': 'profile_rejected',
+                    'changes_requested': 'profile_changes_requested',
+                }
+                event = status_event_map.get(new_status)
+                if event:
+                    create_notifications(found_ids, event, {'observacoes': observations})
+                    submit_on_commit(
+                        notify_candidates_status_change,
+                        sorted(found_ids), event, {'observacoes': observations}
+                    )
+
+        results = [
+            {'id': pid, 'status': 'updated' if pid in found_ids else 'not_found'}
+            for pid in profile_ids
+        ]
         return Response({
-            'count': len(notifications),
-            'notifications': notifications
+            'message': f'{len(found_ids)} perfil(is) atualizado(s).',
+            'profile_status': new_status,
+            'profile_reviewed_at': reviewed_at.isoformat(),
+            'updated': len(found_ids),
+            'not_found': len(profile_ids) - len(found_ids),
+            'applications_updated': applications_updated,
+            'results': results,
         })
 
+    def _get_notification_profile(self, request):
+        """Perfil do candidato logado (id e contador de não lidas) ou Response de erro."""
+        if request.user.user_type != 'candidate':
+            return None, Response(
+                {'detail': 'Apenas candidatos podem acessar este endpoint.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        profile = CandidateProfile.objects.filter(user=request.user).only('id', 'unread_notifications').first()
+        if profile is None:
+            return None, Response(
+                {'detail': 'Perfil de candidato não encontrado.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return profile, None
+
+    @extend_schema(
+        tags=['Candidatos - Perfis'],
+        summary='Notificações do candidato',
+        description='Caixa de entrada do candidato, da mais recente para a mais antiga, paginada por '
+                    'cursor (?cursor=<next>). `count` é o total de notificações não lidas.',
+        parameters=[
+            OpenApiParameter(name='cursor', type=str, required=False,
+                             description='Valor retornado em next para a página seguinte'),
+        ],
+        responses={200: NotificationSerializer(many=True)},
+    )
+    @action(detail=False, methods=['get'], url_path='me/notifications')
+    def my_notifications(self, request):
+        """Retorna a caixa de entrada do candidato (leitura indexada + contador desnormalizado)."""
+        profile, error = self._get_notification_profile(request)
+        if error:
+            return error
+
+        paginator = KeysetPagination(cursor_ordering=('-created_at', '-id'), keyset_only=True, page_size=20)
+        page = paginator.paginate_queryset(Notification.objects.filter(candidate=profile), request, view=self)
+        return Response({
+            'count': profile.unread_notifications,
+            'next': paginator.get_next_link(),
+            'previous': paginator.get_previous_link(),
+            'notifications': NotificationSerializer(page, many=True).data,
+        })
+
+    @extend_schema(
+        tags=['Candidatos - Perfis'],
+        summary='Marcar notificações como lidas',
+        description='Marca como lidas as notificações informadas em `ids` ou, sem `ids`, todas as do candidato.',
+        request=NotificationMarkReadSerializer,
+        responses={200: {'description': 'Quantidade marcada e não lidas restantes'}},
+    )
+    @action(detail=False, methods=['post'], url_path='me/notifications/read')
+    def mark_notifications_read(self, request):
+        """Marca notificações do candidato como lidas."""
+        profile, error = self._get_notification_profile(request)
+        if error:
+            return error
+
+        serializer = NotificationMarkReadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        from candidates.services.notification_services import mark_notifications_read
+        marked, unread = mark_notifications_read(profile, serializer.validated_data.get('ids'))
+        return Response({'marked': marked, 'count': unread})
+
+    @extend_schema(
+        tags=['Candidatos - Perfis'],
+        summary='Marcar notificação como lida',
+        request=None,
+        responses={200: {'description': 'Quantidade marcada e não lidas restantes'}},
+    )
+    @action(detail=False, methods=['post'], url_path=r'me/notifications/(?P<notification_id>\d+)/read')
+    def mark_notification_read(self, request, notification_id=None):
+        """Marca uma notificação do candidato como lida."""
+        profile, error = self._get_notification_profile(request)
+        if error:
+            return error
+
+        if not Notification.objects.filter(pk=notification_id, candidate=profile).exists():
+            return Response(
+                {'detail': 'Notificação não encontrada.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        from candidates.services.notification_services import mark_notifications_read
+        marked, unread = mark_notifications_read(profile, [notification_id])
+        return Response({'marked': marked, 'count': unread})
+
     @action(detail=False, methods=['get'], url_path='dashboard-stats')
     def dashboard_stats(self, request):
-        """Retorna contagens de cada status do pipeline para o dashboard (otimizado com queries agregadas)."""
+        """Retorna contagens de cada status do pipeline para o dashboard (tabela PipelineCounter)."""
         user = request.user
         if not (user.is_staff or user.is_superuser or user.user_type == 'recruiter'):
             return Response(
@@ -587,134 +886,23 @@ class CandidateProfileViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        from django.core.cache import cache
-        cached = cache.get('dashboard_stats_result')
-        if cached:
-            return Response(cached)
-
-        result = self._compute_pipeline_distribution()
-        cache.set('dashboard_stats_result', result, 30)
-        return Response(result)
+        return Response(self._compute_pipeline_distribution())
 
     @staticmethod
     def _compute_pipeline_distribution():
-        """Calcula distribuição do pipeline com queries agregadas (sem N+1)."""
-        from django.db.models import Count
-        from admission.models import AdmissionData, CandidateDocument, DocumentType
-        from selection_process.models import CandidateInProcess
-
-        # 1. Contagem base por profile_status (1 query)
-        base_counts = dict(
-            CandidateProfile.objects.values_list('profile_status')
-            .annotate(count=Count('id'))
-            .values_list('profile_status', 'count')
-        )
-
-        # 2. IDs dos aprovados que precisam de sub-classificação (1 query)
-        approved_ids = set(
-            CandidateProfile.objects.filter(profile_status='approved').values_list('id', flat=True)
-        )
-
-        if not approved_ids:
-            distribution = {
-                'pending': base_counts.get('pending', 0),
-                'awaiting_review': base_counts.get('awaiting_review', 0),
-                'changes_requested': base_counts.get('changes_requested', 0),
-                'rejected': base_counts.get('rejected', 0),
-                'approved': 0,
-                'in_selection_process': 0,
-                'documents_pending': 0,
-                'documents_complete': 0,
-                'admission_in_progress': 0,
-                'admitted': 0,
-            }
-            return {'total': sum(distribution.values()), 'distribution': distribution}
-
-        # 3. Admissão (1 query)
-        admitted_set = set(
-            AdmissionData.objects.filter(
-                candidate_id__in=approved_ids,
-                status__in=['completed', 'sent', 'confirmed']
-            ).values_list('candidate_id', flat=True)
-        )
-        admission_set = set(
-            AdmissionData.objects.filter(
-                candidate_id__in=approved_ids,
-                status='draft'
-            ).values_list('candidate_id', flat=True)
-        ) - admitted_set
-
-        # 4. Processos seletivos (2 queries)
-        selection_set = set(
-            CandidateInProcess.objects.filter(
-                candidate_profile_id__in=approved_ids,
-                is_active=True,
-                status__in=['pending', 'in_progress']
-            ).values_list('candidate_profile_id', flat=True)
-        )
-        approved_proc_set = set(
-            CandidateInProcess.objects.filter(
-                candidate_profile_id__in=approved_ids,
-                status='approved'
-            ).values_list('candidate_profile_id', flat=True)
-        )
-
-        # 5. Documentos (2 queries)
-        required_types = DocumentType.objects.filter(is_active=True, is_required=True)
-        total_required = required_types.count()
-
-        docs_candidates = [
-            cid for cid in approved_ids
-            if cid not in admitted_set
-            and cid not in admission_set
-            and cid not in selection_set
-            and cid in approved_proc_set
-        ]
-
-        docs_complete_count = 0
-        docs_pending_count = 0
-        if total_required > 0 and docs_candidates:
-            doc_counts = dict(
-                CandidateDocument.objects.filter(
-                    candidate_id__in=docs_candidates,
-                    document_type__in=required_types,
-                    is_active=True, status='approved'
-                ).values('candidate_id').annotate(c=Count('id')).values_list('candidate_id', 'c')
-            )
-            for cid in docs_candidates:
-                if doc_counts.get(cid, 0) >= total_required:
-                    docs_complete_count += 1
-                else:
-                    docs_pending_count += 1
-        else:
-            docs_complete_count = len(docs_candidates)
-
-        just_approved = len([
-            cid for cid in approved_ids
-            if cid not in admitted_set
-            and cid not in admission_set
-            and cid not in selection_set
-            and cid not in approved_proc_set
-        ])
-
-        distribution = {
-            'pending': base_counts.get('pending', 0),
-            'awaiting_review': base_counts.get('awaiting_review', 0),
-            'changes_requested': base_counts.get('changes_requested', 0),
-            'rejected': base_counts.get('rejected', 0),
-            'approved': just_approved,
-            'in_selection_process': len(selection_set - admitted_set - admission_set),
-            'documents_pending': docs_pending_count,
-            'documents_complete': docs_complete_count,
-            'admission_in_progress': len(admission_set),
-            'admitted': len(admitted_set),
-        }
-
-        return {'total': sum(distribution.values()), 'distribution': distribution}
+        """Distribuição do pipeline lida da tabela de contadores (cache com recálculo único)."""
+        from candidates.services.pipeline_services import get_dashboard_stats
+        return get_dashboard_stats()
 
     @action(detail=False, methods=['get'], url_path='ai-insights')
     def ai_insights(self, request):
-        """Gera insights com IA sobre o pipeline de candidatos."""
+        """
+        Insights com IA sobre o pipeline de candidatos.
+        A IA roda em segundo plano: a resposta traz o insight dos dados atuais
+        (status 'ready'), o último gerado ('stale') ou 202 enquanto o primeiro é gerado.
+        `data` são os números dos quais o texto foi gerado; `current_data`, os atuais
+        (diferentes quando 'stale').
+        """
         user = request.user
         if not (user.is_staff or user.is_superuser or user.user_type == 'recruiter'):
             return Response(
@@ -722,114 +910,33 @@ class CandidateProfileViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        from django.conf import settings as django_settings
-        api_key = getattr(django_settings, 'OPENAI_API_KEY', '')
-        if not api_key:
+        from candidates.services.insights_services import InsightsUnavailable, get_pipeline_insights
+        try:
+            inputs, insight, insight_status = get_pipeline_insights()
+        except InsightsUnavailable as e:
             return Response(
-                {'error': 'OPENAI_API_KEY não configurada.'},
+                {'error': str(e)},
                 status=status.HTTP_503_SERVICE_UNAVAILABLE
             )
 
-        # 1. Coletar dados do pipeline (otimizado — reutiliza cache do dashboard-stats)
-        from django.core.cache import cache
-        cached_stats = cache.get('dashboard_stats_result')
-        if cached_stats:
-            distribution = cached_stats['distribution']
-            total = cached_stats['total']
-        else:
-            stats = self._compute_pipeline_distribution()
-            distribution = stats['distribution']
-            total = stats['total']
-            cache.set('dashboard_stats_result', stats, 30)
-
-        # 2. Coletar dados de candidaturas (1 query com agregação)
-        from applications.models import Application
-        from django.db.models import Count, Q
-        app_agg = Application.objects.aggregate(
-            total=Count('id'),
-            submitted=Count('id', filter=Q(status='submitted')),
-            in_process=Count('id', filter=Q(status='in_process')),
-            interview_scheduled=Count('id', filter=Q(status='interview_scheduled')),
-            approved=Count('id', filter=Q(status='approved')),
-            rejected=Count('id', filter=Q(status='rejected')),
-            withdrawn=Count('id', filter=Q(status='withdrawn')),
-        )
-        app_stats = app_agg
-
-        # 3. Calcular taxas de conversão
-        approved_profiles = distribution.get('approved', 0) + distribution.get('in_selection_process', 0) + \
-            distribution.get('documents_pending', 0) + distribution.get('documents_complete', 0) + \
-            distribution.get('admission_in_progress', 0) + distribution.get('admitted', 0)
-        docs_complete = distribution.get('documents_complete', 0) + distribution.get('in_selection_process', 0) + \
-            distribution.get('admission_in_progress', 0) + distribution.get('admitted', 0)
-        admitted_count = distribution.get('admitted', 0)
-
-        conversion = {
-            'cadastro_to_aprovado': round(approved_profiles / total * 100, 1) if total > 0 else 0,
-            'aprovado_to_docs_ok': round(docs_complete / approved_profiles * 100, 1) if approved_profiles > 0 else 0,
-            'docs_ok_to_admitido': round(admitted_count / docs_complete * 100, 1) if docs_complete > 0 else 0,
-        }
-
-        # 4. Chamar OpenAI
-        import json
-        try:
-            from openai import OpenAI
-            client = OpenAI(api_key=api_key)
-
-            prompt_data = json.dumps({
-                'total_candidatos': total,
-                'distribuicao_pipeline': distribution,
-                'candidaturas': app_stats,
-                'taxas_conversao': conversion,
-            }, ensure_ascii=False)
-
-            response = client.chat.completions.create(
-                model='gpt-4o-mini',
-                response_format={"type": "json_object"},
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "Você é um analista de RH especializado em recrutamento. "
-                            "Analise os dados do pipeline de candidatos e gere insights em português brasileiro. "
-                            "Retorne APENAS JSON válido com esta estrutura exata:\n"
-                            "{\n"
-                            '  "summary": "resumo geral em 1-2 frases",\n'
-                            '  "highlights": [{"title": "...", "description": "...", "type": "positive|warning|critical"}],\n'
-                            '  "bottleneck": "fase com maior perda de candidatos e explicação",\n'
-                            '  "recommendations": ["recomendação 1", "recomendação 2", "recomendação 3"]\n'
-                            "}\n"
-                            "Gere 3-5 highlights. Tipos: positive=bom, warning=atenção, critical=urgente."
-                        )
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Analise estes dados do nosso banco de talentos:\n\n{prompt_data}"
-                    }
-                ],
-                max_tokens=800,
-                temperature=0.7,
-            )
-
-            ai_response = json.loads(response.choices[0].message.content)
-        except Exception as e:
-            ai_response = {
-                'summary': 'Não foi possível gerar insights no momento.',
+        if insight is None:
+            return Response({
+                'summary': 'Gerando insights com IA. Atualize em alguns segundos.',
                 'highlights': [],
-                'bottleneck': 'Erro ao conectar com a IA.',
+                'bottleneck': '',
                 'recommendations': [],
-                'error': str(e),
-            }
+                'data': inputs,
+                'current_data': inputs,
+                'generated_at': None,
+                'status': insight_status,
+            }, status=status.HTTP_202_ACCEPTED)
 
         return Response({
-            **ai_response,
-            'data': {
-                'distribution': distribution,
-                'total': total,
-                'conversion': conversion,
-                'applications': app_stats,
-            },
-            'generated_at': timezone.now().isoformat(),
+            **insight.result,
+            'data': insight.input_data,
+            'current_data': inputs,
+            'generated_at': insight.generated_at.isoformat(),
+            'status': insight_status,
         })
 
 
@@ -1161,3 +1268,146 @@ class CandidateSkillViewSet(viewsets.ModelViewSet):
         super().perform_destroy(instance)
         if self.request.user.user_type == 'candidate':
             _transition_profile_to_awaiting_review(profile, section_keys=['habilidades'])
+
+
+def _is_recruiter(user):
+    return user.user_type == 'recruiter' or user.is_staff or user.is_superuser
+
+
+@extend_schema_view(
+    list=extend_schema(
+        tags=['Candidatos - Duplicidades'],
+        summary='Listar possíveis duplicidades',
+        description='Pares de usuários candidatos que parecem ser a mesma pessoa (CPF, e-mail, telefone '
+                    'ou nome parecido), do maior para o menor score. Filtre por ?status=pending. '
+                    'Apenas recrutadores.'
+    ),
+    retrieve=extend_schema(
+        tags=['Candidatos - Duplicidades'],
+        summary='Detalhar possível duplicidade',
+        description='Retorna os dois usuários, o score e os critérios coincidentes.'
+    ),
+)
+class DuplicateSuggestionViewSet(viewsets.ReadOnlyModelViewSet):
+    """ViewSet para sugestões de mesclagem de candidatos duplicados"""
+
+    serializer_class = DuplicateSuggestionSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['status']
+
+    def get_queryset(self):
+        if not _is_recruiter(self.request.user):
+            return DuplicateSuggestion.objects.none()
+        return DuplicateSuggestion.objects.select_related(
+            'user_a__candidate_profile', 'user_a__candidate_spontaneous',
+            'user_b__candidate_profile', 'user_b__candidate_spontaneous',
+        )
+
+    def list(self, request, *args, **kwargs):
+        if not _is_recruiter(request.user):
+            return Response(
+                {'error': 'Apenas recrutadores e admins podem ver duplicidades.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        return super().list(request, *args, **kwargs)
+
+    @extend_schema(
+        tags=['Candidatos - Duplicidades'],
+        summary='Procurar duplicidades',
+        description='Varre a base em segundo plano e atualiza as sugestões pendentes '
+                    '(também disponível em manage.py find_duplicate_candidates).',
+        request=None,
+        responses={202: {'description': 'Varredura agendada'}},
+    )
+    @action(detail=False, methods=['post'])
+    def scan(self, request):
+        if not _is_recruiter(request.user):
+            return Response(
+                {'error': 'Apenas recrutadores e admins podem procurar duplicidades.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        from app.background import submit
+        from candidates.services.dedup_services import scan_duplicates
+        submit(scan_duplicates)
+        return Response(
+            {'message': 'Varredura de duplicidades iniciada.'},
+            status=status.HTTP_202_ACCEPTED
+        )
+
+    @extend_schema(
+        tags=['Candidatos - Duplicidades'],
+        summary='Mesclar candidatos',
+        description='Move candidaturas, processos seletivos, documentos e dados do cadastro para o '
+                    'usuário mantido e desativa o outro. Registros em conflito (mesma vaga, mesmo '
+                    'processo, mesmo tipo de documento) ficam no usuário desativado.',
+        request=DuplicateMergeSerializer,
+        responses={200: {'description': 'Quantidade de registros movidos'}},
+    )
+    @action(detail=True, methods=['post'])
+    def merge(self, request, pk=None):
+        if not _is_recruiter(request.user):
+            return Response(
+                {'error': 'Apenas recrutadores e admins podem mesclar candidatos.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        suggestion = self.get_object()
+        if suggestion.status != 'pending':
+            return Response(
+                {'error': 'Esta sugestão já foi resolvida.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        serializer = DuplicateMergeSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        keep_user_id = serializer.validated_data.get('keep_user_id')
+
+        from candidates.services.dedup_services import choose_primary, merge_candidates
+        if keep_user_id is None:
+            target, source = choose_primary(suggestion.user_a, suggestion.user_b)
+        elif keep_user_id == suggestion.user_a_id:
+            target, source = suggestion.user_a, suggestion.user_b
+        elif keep_user_id == suggestion.user_b_id:
+            target, source = suggestion.user_b, suggestion.user_a
+        else:
+            return Response(
+                {'error': 'keep_user_id deve ser um dos usuários da sugestão.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        summary = merge_candidates(target, source, merged_by=request.user)
+        return Response({
+            'message': 'Candidatos mesclados com sucesso.',
+            'kept_user_id': target.pk,
+            'deactivated_user_id': source.pk,
+            'moved': summary,
+        })
+
+    @extend_schema(
+        tags=['Candidatos - Duplicidades'],
+        summary='Descartar sugestão',
+        description='Marca o par como pessoas diferentes; novas varreduras não o sugerem de novo.',
+        request=None,
+        responses={200: DuplicateSuggestionSerializer},
+    )
+    @action(detail=True, methods=['post'])
+    def dismiss(self, request, pk=None):
+        if not _is_recruiter(request.user):
+            return Response(
+                {'error': 'Apenas recrutadores e admins podem descartar sugestões.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        suggestion = self.get_object()
+        if suggestion.status != 'pending':
+            return Response(
+                {'error': 'Esta sugestão já foi resolvida.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        suggestion.status = 'dismissed'
+        suggestion.resolved_by = request.user
+        suggestion.resolved_at = timezone.now()
+        suggestion.save(update_fields=['status', 'resolved_by', 'resolved_at', 'updated_at'])
+        return Response(self.get_serializer(suggestion).data)
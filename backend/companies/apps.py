@@ -5,3 +5,12 @@ class CompaniesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'companies'
     verbose_name = 'Empresas'
+
+    def ready(self):
+        # Versão de cache das empresas e grupos (app.cache)
+        from app.cache import register_model_versioning
+        register_model_versioning(self.get_model('Company'), self.get_model('CompanyGroup'))
+
+        # Miniaturas do logo (app.thumbnails)
+        from app.thumbnails import register_thumbnails
+        register_thumbnails(self.get_model('Company'), 'logo')
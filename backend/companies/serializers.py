@@ -2,6 +2,7 @@ from rest_framework import serializers
 
 from django.utils.timezone import now
 
+from app.thumbnails import ThumbnailsField
 from companies.models import CompanyGroup, Company
 
 
@@ -14,6 +15,7 @@ class CompanyGroupSerializer(serializers.ModelSerializer):
 
 class CompanySerializer(serializers.ModelSerializer):
     open_jobs = serializers.SerializerMethodField()
+    logo_thumbnails = ThumbnailsField(source='logo')
 
     class Meta:
         model = Company
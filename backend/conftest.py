@@ -0,0 +1,16 @@
+import pytest
+from rest_framework.test import APIClient
+
+
+@pytest.fixture
+def recruiter(django_user_model):
+    return django_user_model.objects.create(
+        email='recrutador@teste.com', name='Recrutador', user_type='recruiter', is_staff=True
+    )
+
+
+@pytest.fixture
+def recruiter_client(recruiter):
+    client = APIClient()
+    client.force_authenticate(recruiter)
+    return client
@@ -1,6 +1,14 @@
 #!/bin/sh
 echo "Aplicando migracoes..."
 python manage.py migrate --noinput
+echo "Conferindo contadores do pipeline..."
+python manage.py reconcile_pipeline_counters
+echo "Indexando perfis sem documento de busca..."
+python manage.py rebuild_search_documents
+echo "Indexando habilidades de perfis ainda nao indexados..."
+python manage.py rebuild_skill_index --missing-only
+echo "Calculando atributos de ranqueamento faltantes..."
+python manage.py rebuild_match_features
 echo "Coletando arquivos estaticos..."
 python manage.py collectstatic --noinput
 echo "Verificando superusuario..."
@@ -0,0 +1,22 @@
+"""
+Configuração do gunicorn (carregada automaticamente do diretório de trabalho).
+
+As métricas do Prometheus (app.metrics) são agregadas entre os workers por
+arquivos em PROMETHEUS_MULTIPROC_DIR: o diretório é limpo na subida do master e
+os arquivos dos workers encerrados deixam de contar nos gauges "live".
+"""
+import os
+import shutil
+
+PROMETHEUS_MULTIPROC_DIR = os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', '/tmp/prometheus_multiproc')
+
+
+def on_starting(server):
+    shutil.rmtree(PROMETHEUS_MULTIPROC_DIR, ignore_errors=True)
+    os.makedirs(PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
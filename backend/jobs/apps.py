@@ -5,3 +5,8 @@ class JobsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'jobs'
     verbose_name = 'Empregos (Vagas)'
+
+    def ready(self):
+        # Versão de cache das vagas (app.cache)
+        from app.cache import register_model_versioning
+        register_model_versioning(self.get_model('Job'))
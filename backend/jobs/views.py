@@ -1,15 +1,23 @@
+from django.conf import settings
+
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from rest_framework import status
 
 from rest_framework import viewsets
-from drf_spectacular.utils import extend_schema, extend_schema_view
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
 
 from jobs.models import Job
 from jobs.serializers import JobSerializer
 
-from companies.models import Company
+from companies.models import Company, CompanyGroup
+
+from app.cache import cache_get, cache_set, versioned_key
+from app.instrumentation import record_cache
+
+MATCHES_DEFAULT_LIMIT = 50
+MATCHES_MAX_LIMIT = 200
 
 
 @extend_schema_view(
@@ -59,6 +67,15 @@ class JobViewSet(viewsets.ModelViewSet):
         """
         Retorna todas as vagas relacionadas a uma empresa com o slug informado.
         """
+        # Página pública da empresa: cache compartilhado, invalidado ao alterar vagas/empresas
+        cache_key = versioned_key(
+            'jobs_by_company', slug, request.get_host(), models=[Job, Company, CompanyGroup]
+        )
+        data = cache_get(cache_key)
+        record_cache('jobs_by_company', hit=data is not None)
+        if data is not None:
+            return Response(data)
+
         try:
             company = Company.objects.get(slug=slug)
         except Company.DoesNotExist:
@@ -66,4 +83,41 @@ class JobViewSet(viewsets.ModelViewSet):
 
         jobs = self.queryset.filter(company=company)
         serializer = self.get_serializer(jobs, many=True)
+        cache_set(cache_key, serializer.data, settings.CACHE_VERSIONED_TIMEOUT)
         return Response(serializer.data)
+
+    @extend_schema(
+        summary='Candidatos mais aderentes à vaga',
+        description='Ranqueia os candidatos ativos e disponíveis por habilidades, experiência, '
+                    'escolaridade, localização, modelo de trabalho e pretensão salarial. Cada resultado '
+                    'traz o score (0 a 100) e o score de cada critério. Apenas recrutadores.',
+        tags=['Jobs'],
+        parameters=[
+            OpenApiParameter('limit', int, description=f'Quantidade de candidatos (padrão {MATCHES_DEFAULT_LIMIT}, '
+                                                       f'máximo {MATCHES_MAX_LIMIT})'),
+            OpenApiParameter('skills', str, description='Habilidades separadas por vírgula '
+                                                        '(padrão: extraídas do título e dos requisitos)'),
+        ],
+        responses={200: {'description': 'Requisitos extraídos, pesos e candidatos ranqueados'}},
+    )
+    @action(detail=True, methods=['get'], url_path='candidate-matches')
+    def candidate_matches(self, request, pk=None):
+        """Retorna os candidatos com maior aderência à vaga."""
+        from candidates.services.matching_services import rank_candidates
+
+        user = request.user
+        if not (user.is_authenticated and (user.user_type == 'recruiter' or user.is_staff or user.is_superuser)):
+            return Response(
+                {'detail': 'Apenas recrutadores podem ver o ranqueamento de candidatos.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        try:
+            limit = int(request.query_params.get('limit', MATCHES_DEFAULT_LIMIT))
+        except ValueError:
+            return Response({'detail': 'limit deve ser um número inteiro.'}, status=status.HTTP_400_BAD_REQUEST)
+        limit = max(1, min(limit, MATCHES_MAX_LIMIT))
+        skills = [name.strip() for name in request.query_params.get('skills', '').split(',') if name.strip()]
+
+        job = self.get_object()
+        return Response(rank_candidates(job, limit=limit, skill_names=skills or None))
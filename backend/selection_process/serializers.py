@@ -1,4 +1,6 @@
 from rest_framework import serializers
+
+from app.thumbnails import ThumbnailsField
 from .models import (
     SelectionProcess,
     ProcessStage,
@@ -168,6 +170,7 @@ class CandidateInProcessSerializer(serializers.ModelSerializer):
     candidate_name = serializers.CharField(source='candidate_profile.user.name', read_only=True)
     candidate_email = serializers.CharField(source='candidate_profile.user.email', read_only=True)
     candidate_image = serializers.ImageField(source='candidate_profile.image_profile', read_only=True)
+    candidate_image_thumbnails = ThumbnailsField(source='candidate_profile.image_profile')
     current_stage_name = serializers.CharField(source='current_stage.name', read_only=True, default=None)
     current_stage_order = serializers.IntegerField(source='current_stage.order', read_only=True, default=None)
     added_by_name = serializers.CharField(source='added_by.name', read_only=True, default=None)
@@ -178,7 +181,8 @@ class CandidateInProcessSerializer(serializers.ModelSerializer):
         model = CandidateInProcess
         fields = [
             'id', 'process', 'process_title',
-            'candidate_profile', 'candidate_name', 'candidate_email', 'candidate_image',
+            'candidate_profile', 'candidate_name', 'candidate_email',
+            'candidate_image', 'candidate_image_thumbnails',
             'current_stage', 'current_stage_name', 'current_stage_order',
             'status', 'added_by', 'added_by_name', 'added_at',
             'recruiter_notes', 'stage_responses',
@@ -192,6 +196,7 @@ class CandidateInProcessListSerializer(serializers.ModelSerializer):
     candidate_name = serializers.CharField(source='candidate_profile.user.name', read_only=True)
     candidate_email = serializers.CharField(source='candidate_profile.user.email', read_only=True)
     candidate_image = serializers.ImageField(source='candidate_profile.image_profile', read_only=True)
+    candidate_image_thumbnails = ThumbnailsField(source='candidate_profile.image_profile')
     current_stage_name = serializers.CharField(source='current_stage.name', read_only=True, default=None)
     current_stage_order = serializers.IntegerField(source='current_stage.order', read_only=True, default=None)
     process_title = serializers.CharField(source='process.title', read_only=True)
@@ -204,7 +209,8 @@ class CandidateInProcessListSerializer(serializers.ModelSerializer):
         model = CandidateInProcess
         fields = [
             'id', 'process', 'process_title',
-            'candidate_profile', 'candidate_name', 'candidate_email', 'candidate_image',
+            'candidate_profile', 'candidate_name', 'candidate_email',
+            'candidate_image', 'candidate_image_thumbnails',
             'current_stage', 'current_stage_name', 'current_stage_order',
             'status', 'added_at',
             'average_rating', 'completed_stages', 'total_stages', 'stages_info'
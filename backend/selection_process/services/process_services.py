@@ -13,6 +13,18 @@ from ..models import (
 )
 
 
+def _publish_process_update(candidate_in_process):
+    """Avisa os painéis dos recrutadores (SSE) sobre a movimentação do candidato."""
+    from app.events import RECRUITERS_CHANNEL, publish
+    publish(RECRUITERS_CHANNEL, 'process_stage', {
+        'process_id': candidate_in_process.process_id,
+        'candidate_in_process_id': candidate_in_process.pk,
+        'candidate_profile_id': candidate_in_process.candidate_profile_id,
+        'status': candidate_in_process.status,
+        'current_stage_id': candidate_in_process.current_stage_id,
+    })
+
+
 def add_candidate_to_process(process, candidate_profile, added_by, recruiter_notes=''):
     """
     Adiciona um candidato aprovado ao processo seletivo.
@@ -80,6 +92,7 @@ def add_candidate_to_process(process, candidate_profile, added_by, recruiter_not
         from whatsapp.services import notify_candidate_status_change
         notify_candidate_status_change(candidate_profile, 'process_added', {'processo': process.title})
 
+        _publish_process_update(candidate_in_process)
         return candidate_in_process
 
 
@@ -125,6 +138,7 @@ def evaluate_candidate_stage(candidate_in_process, stage, evaluation, answers=No
         elif evaluation == 'rejected':
             _handle_stage_rejected(candidate_in_process, stage)
 
+        _publish_process_update(candidate_in_process)
         return stage_response
 
 
@@ -255,6 +269,7 @@ def advance_candidate_manually(candidate_in_process, advanced_by):
             defaults={'evaluation': 'pending'}
         )
 
+        _publish_process_update(candidate_in_process)
         return candidate_in_process
 
 
@@ -370,4 +385,5 @@ def withdraw_candidate(candidate_in_process, withdrawn_by):
     candidate_in_process.recruiter_notes += f'\n[Desistência registrada por {withdrawn_by.name}]'
     candidate_in_process.save(update_fields=['status', 'recruiter_notes', 'updated_at'])
 
+    _publish_process_update(candidate_in_process)
     return candidate_in_process
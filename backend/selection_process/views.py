@@ -5,6 +5,7 @@ from rest_framework.exceptions import PermissionDenied, ValidationError
 from django_filters.rest_framework import DjangoFilterBackend, FilterSet, CharFilter, NumberFilter
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
+from app.thumbnails import thumbnail_urls
 from candidates.models import CandidateProfile
 from .models import (
     SelectionProcess,
@@ -249,12 +250,19 @@ class SelectionProcessViewSet(viewsets.ModelViewSet):
     @extend_schema(
         tags=['Processos Seletivos'],
         summary='Candidatos aprovados disponíveis',
-        description='Lista candidatos com perfil aprovado que podem ser adicionados ao processo'
+        description=(
+            'Lista candidatos com perfil aprovado que podem ser adicionados ao processo. '
+            '?search= busca por nome/e-mail sem acentos (ranqueada por similaridade); '
+            'com ?page= a resposta é paginada, sem ele retorna até 50 candidatos.'
+        )
     )
     @action(detail=True, methods=['get'], url_path='available-candidates')
     def available_candidates(self, request, pk=None):
         """Lista candidatos aprovados que não estão no processo"""
-        process = self.get_object()
+        # ?search= aqui busca candidatos: não aplicar os filtros da listagem de processos
+        from django.shortcuts import get_object_or_404
+        process = get_object_or_404(self.get_queryset(), pk=pk)
+        self.check_object_permissions(request, process)
 
         # IDs dos candidatos já no processo
         existing_ids = CandidateInProcess.objects.filter(
@@ -267,24 +275,32 @@ class SelectionProcessViewSet(viewsets.ModelViewSet):
             profile_status='approved',
             is_active=True
         ).exclude(id__in=existing_ids).exclude(
-            admission_data__status__in=['completed', 'sent', 'confirmed']
-        )
+            pipeline_status='admitted'
+        ).select_related('user').order_by('user__search_name')
 
-        # Busca opcional
+        # Busca opcional (sem acentos, ranqueada por similaridade de trigramas no PostgreSQL)
         search = request.query_params.get('search', '')
         if search:
-            candidates = candidates.filter(
-                user__name__icontains=search
-            ) | candidates.filter(
-                user__email__icontains=search
-            )
+            from accounts.services.user_search_services import search_by_name
+            candidates, _ = search_by_name(candidates, search, field='user__search_name')
 
         # Filtro por vaga
         applied_to_job = request.query_params.get('applied_to_job', '')
         if applied_to_job:
+            from applications.models import Application
             candidates = candidates.filter(
-                user__applications__job_id=int(applied_to_job)
-            ).distinct()
+                user_id__in=Application.objects.filter(
+                    job_id=int(applied_to_job)
+                ).values('candidate_id')
+            )
+
+        # Paginação opcional (?page=); sem ela mantém a lista limitada a 50
+        page = self.paginate_queryset(candidates) if 'page' in request.query_params else None
+        rows = page if page is not None else list(candidates[:50])
+
+        # Top 5 candidaturas de todos os candidatos da página em uma única query
+        from applications.services.application_services import recent_applications_by_candidate
+        applications = recent_applications_by_candidate([c.user_id for c in rows], limit=5)
 
         # Serializar com dados ampliados
         data = [{
@@ -293,19 +309,15 @@ class SelectionProcessViewSet(viewsets.ModelViewSet):
             'email': c.user.email,
             'current_position': c.current_position,
             'image_profile': request.build_absolute_uri(c.image_profile.url) if c.image_profile else None,
+            'image_profile_thumbnails': thumbnail_urls(c.image_profile, request),
             'city': c.city,
             'state': c.state,
             'experience_years': c.experience_years,
-            'applications_summary': [
-                {
-                    'job_id': app.job.id,
-                    'job_title': app.job.title,
-                    'status': app.status,
-                }
-                for app in c.user.applications.select_related('job').order_by('-applied_at')[:5]
-            ]
-        } for c in candidates[:50]]  # Limitar a 50
+            'applications_summary': applications.get(c.user_id, []),
+        } for c in rows]
 
+        if page is not None:
+            return self.get_paginated_response(data)
         return Response(data)
 
 
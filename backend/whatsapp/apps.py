@@ -5,3 +5,8 @@ class WhatsappConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'whatsapp'
     verbose_name = 'WhatsApp'
+
+    def ready(self):
+        # Versão de cache dos templates de mensagem (app.cache)
+        from app.cache import register_model_versioning
+        register_model_versioning(self.get_model('WhatsAppTemplate'))
@@ -2,6 +2,8 @@ import logging
 import requests
 from django.conf import settings
 
+from app.instrumentation import record_cache, track_external
+
 logger = logging.getLogger('whatsapp')
 
 
@@ -46,8 +48,9 @@ def send_whatsapp_message(phone_number: str, message: str) -> dict:
     }
 
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=10)
-        response.raise_for_status()
+        with track_external('evolution_api'):
+            response = requests.post(url, json=payload, headers=headers, timeout=10)
+            response.raise_for_status()
         logger.info(f'WhatsApp enviado para {clean_number}: {message[:50]}...')
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -66,9 +69,30 @@ def format_template(template: str, context: dict) -> str:
     return result
 
 
+def get_active_template(status_event: str):
+    """
+    Retorna o template ativo do evento (ou None), com cache versionado por
+    WhatsAppTemplate: editar um template no admin invalida o cache em todos os workers.
+    """
+    from app.cache import cache_get, cache_set, versioned_key
+    from whatsapp.models import WhatsAppTemplate
+
+    cache_key = versioned_key('whatsapp_template', status_event, models=[WhatsAppTemplate])
+    cached = cache_get(cache_key)
+    record_cache('whatsapp_template', hit=cached is not None)
+    if cached is not None:
+        return cached or None
+
+    template = WhatsAppTemplate.objects.filter(status_event=status_event, is_active=True).first()
+    # False marca "sem template" no cache, para não consultar o banco a cada evento
+    cache_set(cache_key, template or False, settings.CACHE_VERSIONED_TIMEOUT)
+    return template
+
+
 def notify_candidate_status_change(candidate_profile, status_event: str, extra_context: dict = None):
     """
-    Função principal que busca o template, formata e envia a mensagem.
+    Função principal: registra a notificação na caixa de entrada do candidato
+    e busca o template, formata e envia a mensagem WhatsApp.
     Não bloqueia o fluxo principal em caso de erro.
 
     Args:
@@ -79,6 +103,10 @@ def notify_candidate_status_change(candidate_profile, status_event: str, extra_c
     if candidate_profile is None:
         return
 
+    # Caixa de entrada (independe de o candidato aceitar WhatsApp)
+    from candidates.services.notification_services import create_notification
+    create_notification(candidate_profile, status_event, extra_context)
+
     try:
         # Verificar se candidato aceita WhatsApp e tem telefone
         if not candidate_profile.accepts_whatsapp:
@@ -91,10 +119,8 @@ def notify_candidate_status_change(candidate_profile, status_event: str, extra_c
             return
 
         # Buscar template
-        from whatsapp.models import WhatsAppTemplate
-        try:
-            template = WhatsAppTemplate.objects.get(status_event=status_event, is_active=True)
-        except WhatsAppTemplate.DoesNotExist:
+        template = get_active_template(status_event)
+        if template is None:
             logger.info(f'Template WhatsApp para evento "{status_event}" não encontrado ou inativo.')
             return
 
@@ -111,3 +137,44 @@ def notify_candidate_status_change(candidate_profile, status_event: str, extra_c
 
     except Exception as e:
         logger.error(f'Erro na notificação WhatsApp ({status_event}): {e}')
+
+
+def notify_candidates_status_change(profile_ids, status_event: str, extra_context: dict = None):
+    """
+    Envia a mesma notificação para vários candidatos (ex.: revisão em lote).
+    O template é buscado uma única vez; feito para rodar em segundo plano
+    (app.background.submit_on_commit). Apenas WhatsApp: as notificações da caixa
+    de entrada são gravadas na transação do evento (notification_services.create_notifications).
+
+    Args:
+        profile_ids: ids de CandidateProfile
+        status_event: Chave do evento (ex: 'profile_approved')
+        extra_context: Dict com variáveis extras (observacoes, vaga, processo, documento)
+
+    Returns:
+        int com o número de mensagens enviadas
+    """
+    from candidates.models import CandidateProfile
+
+    template = get_active_template(status_event)
+    if template is None:
+        logger.info(f'Template WhatsApp para evento "{status_event}" não encontrado ou inativo.')
+        return 0
+
+    profiles = CandidateProfile.objects.filter(
+        pk__in=list(profile_ids), accepts_whatsapp=True
+    ).exclude(phone_secondary='').select_related('user')
+
+    sent = 0
+    for profile in profiles.iterator(chunk_size=200):
+        context = {'nome': profile.user.full_name}
+        if extra_context:
+            context.update(extra_context)
+        try:
+            result = send_whatsapp_message(profile.phone_secondary, format_template(template.message_template, context))
+        except Exception as e:
+            logger.error(f'Erro na notificação WhatsApp ({status_event}) do perfil {profile.pk}: {e}')
+            continue
+        if not (isinstance(result, dict) and 'error' in result):
+            sent += 1
+    return sent
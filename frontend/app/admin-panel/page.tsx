@@ -1,7 +1,7 @@
 'use client';
 
 import { useEffect, useState, useCallback } from 'react';
-import { useAutoRefresh } from '@/hooks/useAutoRefresh';
+import { useAutoRefresh, RECRUITER_LIVE_EVENTS } from '@/hooks/useAutoRefresh';
 import Link from 'next/link';
 import dynamic from 'next/dynamic';
 import { useRouter } from 'next/navigation';
@@ -114,7 +114,7 @@ export default function AdminDashboard() {
   }, []);
 
   useEffect(() => { fetchAll(); }, [fetchAll]);
-  useAutoRefresh(fetchAll);
+  useAutoRefresh(fetchAll, 10000, RECRUITER_LIVE_EVENTS);
 
   if (loading) {
     return (
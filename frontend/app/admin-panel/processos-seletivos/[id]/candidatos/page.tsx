@@ -8,6 +8,7 @@ import { ArrowLeft, Plus, Search, X, ClipboardList, UserPlus, ChevronLeft, Chevr
 import selectionProcessService from '@/services/selectionProcessService';
 import jobService from '@/services/jobService';
 import { SelectionProcess, CandidateInProcess, AvailableCandidate, ProcessStage, PaginatedResponse, Job } from '@/types';
+import ThumbnailImage from '@/components/ui/ThumbnailImage';
 
 export default function CandidatosPage({ params }: { params: Promise<{ id: string }> }) {
   const resolvedParams = use(params);
@@ -344,8 +345,9 @@ export default function CandidatosPage({ params }: { params: Promise<{ id: strin
                         <div className="flex items-center gap-3">
                           <div className="w-10 h-10 rounded-full bg-sky-600 flex items-center justify-center text-white font-bold text-sm flex-shrink-0 overflow-hidden">
                             {candidate.candidate_image ? (
-                              <img
+                              <ThumbnailImage
                                 src={candidate.candidate_image}
+                                thumbnails={candidate.candidate_image_thumbnails}
                                 alt={candidate.candidate_name || ''}
                                 className="w-full h-full object-cover"
                               />
@@ -536,8 +538,9 @@ export default function CandidatosPage({ params }: { params: Promise<{ id: strin
                         {/* Photo */}
                         <div className="w-11 h-11 rounded-full bg-sky-600 flex items-center justify-center text-white font-bold text-sm flex-shrink-0 overflow-hidden">
                           {candidate.image_profile ? (
-                            <img
+                            <ThumbnailImage
                               src={candidate.image_profile}
+                              thumbnails={candidate.image_profile_thumbnails}
                               alt={candidate.name}
                               className="w-full h-full object-cover"
                             />
@@ -1,12 +1,13 @@
 'use client';
 
 import { useState, useEffect, useCallback, useRef } from 'react';
-import { useAutoRefresh } from '@/hooks/useAutoRefresh';
+import { useAutoRefresh, RECRUITER_LIVE_EVENTS } from '@/hooks/useAutoRefresh';
 import { Search, Filter, Users, MapPin, Briefcase, GraduationCap, Check, X, ChevronLeft, ChevronRight, Eye, FileText, UserCheck, ClipboardList, LayoutGrid, LayoutList, Bell } from 'lucide-react';
 import Link from 'next/link';
 import candidateService from '@/services/candidateService';
 import jobService from '@/services/jobService';
 import { CandidateProfile, PaginatedResponse, Job } from '@/types';
+import ThumbnailImage from '@/components/ui/ThumbnailImage';
 
 export default function TalentosPage() {
   const [candidates, setCandidates] = useState<CandidateProfile[]>([]);
@@ -84,7 +85,7 @@ export default function TalentosPage() {
   useEffect(() => {
     fetchCandidates();
   }, [fetchCandidates]);
-  useAutoRefresh(fetchCandidates);
+  useAutoRefresh(fetchCandidates, 10000, RECRUITER_LIVE_EVENTS);
 
   const handleSearch = (e: React.FormEvent) => {
     e.preventDefault();
@@ -392,8 +393,9 @@ export default function TalentosPage() {
               <div className="flex items-start gap-3 mb-3">
                 <div className="w-12 h-12 rounded-full bg-sky-600 flex items-center justify-center text-white font-bold text-lg flex-shrink-0 overflow-hidden">
                   {candidate.image_profile ? (
-                    <img
+                    <ThumbnailImage
                       src={candidate.image_profile}
+                      thumbnails={candidate.image_profile_thumbnails}
                       alt={`${candidate.user_name || ''}${candidate.user_last_name ? ` ${candidate.user_last_name}` : ''}`.trim() || 'Candidato'}
                       className="w-full h-full object-cover"
                     />
@@ -578,8 +580,9 @@ export default function TalentosPage() {
                           <div className="relative">
                             <div className="w-10 h-10 rounded-full bg-sky-600 flex items-center justify-center text-white font-bold text-sm flex-shrink-0 overflow-hidden">
                               {candidate.image_profile ? (
-                                <img
+                                <ThumbnailImage
                                   src={candidate.image_profile}
+                                  thumbnails={candidate.image_profile_thumbnails}
                                   alt={fullName}
                                   className="w-full h-full object-cover"
                                 />
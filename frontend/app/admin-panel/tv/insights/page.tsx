@@ -19,6 +19,10 @@ export default function TVInsightsPage() {
     try {
       const data = await candidateService.getAIInsights();
       setInsights(data);
+      // Insight sendo gerado em segundo plano: consulta novamente em instantes
+      if (data.status === 'generating') {
+        setTimeout(fetchData, 10000);
+      }
     } catch (err: unknown) {
       const message = err instanceof Error ? err.message : 'Erro ao carregar insights';
       setError(message);
@@ -307,6 +311,11 @@ export default function TVInsightsPage() {
                 Gerado em {new Date(insights.generated_at).toLocaleString('pt-BR')}
               </p>
             )}
+            {insights.status === 'stale' && (
+              <p className="text-xs text-amber-400 mt-1">
+                Análise e números são da última geração; os dados mudaram desde então e uma nova análise está sendo gerada.
+              </p>
+            )}
           </div>
 
           {/* Highlights + Bottleneck */}
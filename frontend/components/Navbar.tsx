@@ -9,6 +9,7 @@ import { FileEarmarkPerson, House, Person as BsPerson } from 'react-bootstrap-ic
 import { useState, useEffect, useCallback, useMemo, memo, useRef } from 'react'
 import JobApplicationModalStart from './JobApplicationModalStart'
 import candidateService from '@/services/candidateService'
+import { useLiveEvents } from '@/hooks/useLiveEvents'
 import { CandidateNotification } from '@/types'
 
 // Hook customizado para gerenciar a lógica do timer
@@ -135,22 +136,55 @@ function Navbar() {
     const [isMenuOpen, setIsMenuOpen] = useState(false)
     const [jobStart, setJobStart] = useState(false);
     const [notifications, setNotifications] = useState<CandidateNotification[]>([]);
+    const [unreadCount, setUnreadCount] = useState(0);
     const [showNotifDropdown, setShowNotifDropdown] = useState(false);
     const notifRef = useRef<HTMLDivElement>(null);
 
     // Usar o hook customizado para gerenciar o timer
     const canClickJobStart = useJobStartTimer(isAuthenticated, user?.user_type, pathname);
 
+    const isCandidate = isAuthenticated && user?.user_type === 'candidate';
+
+    const loadNotifications = useCallback(() => {
+        candidateService.getMyNotifications()
+            .then(data => {
+                setNotifications(data.notifications || []);
+                setUnreadCount(data.count || 0);
+            })
+            .catch(() => {});
+    }, []);
+
     // Buscar notificações do candidato
     useEffect(() => {
-        if (isAuthenticated && user?.user_type === 'candidate') {
-            candidateService.getMyNotifications()
-                .then(data => {
-                    setNotifications(data.notifications || []);
-                })
+        if (isCandidate) loadNotifications();
+    }, [isCandidate, loadNotifications]);
+
+    // Notificações em tempo real (SSE); "ready" ressincroniza ao (re)conectar
+    useLiveEvents(['ready', 'notification', 'notifications_read'], (event) => {
+        if (event.type === 'ready') {
+            loadNotifications();
+        } else if (event.type === 'notification') {
+            const notif = event.data as unknown as CandidateNotification;
+            setNotifications(prev => [notif, ...prev.filter(n => n.id !== notif.id)]);
+            setUnreadCount(prev => prev + 1);
+        } else if (event.type === 'notifications_read') {
+            const ids = event.data.ids as number[] | null;
+            setUnreadCount(event.data.count as number);
+            setNotifications(prev => prev.map(n => (
+                ids === null || ids.includes(n.id) ? { ...n, is_read: true } : n
+            )));
+        }
+    }, isCandidate);
+
+    // Abrir a caixa de notificações marca as não lidas como lidas
+    const handleToggleNotifications = useCallback(() => {
+        setShowNotifDropdown(prev => !prev);
+        if (!showNotifDropdown && unreadCount > 0) {
+            candidateService.markNotificationsRead()
+                .then(data => setUnreadCount(data.count))
                 .catch(() => {});
         }
-    }, [isAuthenticated, user?.user_type]);
+    }, [showNotifDropdown, unreadCount]);
 
     // Fechar dropdown ao clicar fora
     useEffect(() => {
@@ -234,13 +268,15 @@ function Navbar() {
                                     {notifications.length > 0 && (
                                         <div className="relative" ref={notifRef}>
                                             <button
-                                                onClick={() => setShowNotifDropdown(!showNotifDropdown)}
+                                                onClick={handleToggleNotifications}
                                                 className="relative animate-fade p-2 text-yellow-300 hover:text-yellow-400 transition-colors"
                                             >
                                                 <Bell className="w-5 h-5" />
-                                                <span className="absolute -top-0.5 -right-0.5 inline-flex items-center justify-center min-w-[18px] h-[18px] px-1 text-[10px] font-bold text-white bg-red-500 rounded-full animate-pulse">
-                                                    {notifications.length}
-                                                </span>
+                                                {unreadCount > 0 && (
+                                                    <span className="absolute -top-0.5 -right-0.5 inline-flex items-center justify-center min-w-[18px] h-[18px] px-1 text-[10px] font-bold text-white bg-red-500 rounded-full animate-pulse">
+                                                        {unreadCount}
+                                                    </span>
+                                                )}
                                             </button>
                                             {showNotifDropdown && (
                                                 <div className="absolute right-0 mt-2 w-80 bg-white rounded-lg shadow-lg border border-zinc-200 z-50 overflow-hidden">
@@ -251,7 +287,7 @@ function Navbar() {
                                                         </button>
                                                     </div>
                                                     <div className="divide-y divide-zinc-100 max-h-80 overflow-y-auto">
-                                                        {notifications.map((notif, idx) => {
+                                                        {notifications.map((notif) => {
                                                             const iconMap: Record<string, { icon: React.ReactNode; bg: string }> = {
                                                                 profile: { icon: <Bell className="h-4 w-4 text-amber-600" />, bg: 'bg-amber-50' },
                                                                 profile_approved: { icon: <CheckCircle className="h-4 w-4 text-emerald-600" />, bg: 'bg-emerald-50' },
@@ -261,7 +297,7 @@ function Navbar() {
                                                             };
                                                             const style = iconMap[notif.icon] || iconMap.profile;
                                                             return (
-                                                                <div key={idx} className="p-3">
+                                                                <div key={notif.id} className={`p-3 ${notif.is_read ? '' : 'bg-sky-50/40'}`}>
                                                                     <div className="flex items-start gap-3">
                                                                         <div className={`p-1.5 ${style.bg} rounded-lg flex-shrink-0`}>
                                                                             {style.icon}
@@ -0,0 +1,38 @@
+'use client';
+
+import { useState } from 'react';
+import { ImageThumbnails } from '@/types';
+
+interface ThumbnailImageProps {
+  src: string;
+  thumbnails?: ImageThumbnails | null;
+  // Tamanho da miniatura (px): 64 para avatares de lista, 256 para cabeçalhos
+  size?: 64 | 256;
+  alt: string;
+  className?: string;
+}
+
+// Miniatura WebP (JPEG para navegadores sem WebP) gerada pelo backend.
+// Se a miniatura ainda não existe (upload recente), usa a imagem original.
+export default function ThumbnailImage({ src, thumbnails, size = 64, alt, className }: ThumbnailImageProps) {
+  const [failed, setFailed] = useState(false);
+  const thumbnail = thumbnails?.[String(size)];
+
+  if (!thumbnail || failed) {
+    return <img src={src} alt={alt} className={className} />;
+  }
+
+  return (
+    <picture className="contents">
+      <source srcSet={thumbnail.webp} type="image/webp" />
+      <img
+        src={thumbnail.jpeg}
+        alt={alt}
+        className={className}
+        loading="lazy"
+        decoding="async"
+        onError={() => setFailed(true)}
+      />
+    </picture>
+  );
+}
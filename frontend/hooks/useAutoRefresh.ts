@@ -1,13 +1,32 @@
 'use client';
 
 import { useEffect, useRef, useCallback } from 'react';
+import { useLiveEvents } from './useLiveEvents';
 
+// Eventos que alteram os dados dos painéis do recrutador
+export const RECRUITER_LIVE_EVENTS = [
+  'ready',
+  'pipeline_counters',
+  'profile_status',
+  'document_reviewed',
+  'process_stage',
+];
+
+const LIVE_DEBOUNCE_MS = 1000;
+
+/**
+ * Atualiza os dados periodicamente (poll). Com `liveEvents`, enquanto o stream
+ * de eventos (SSE) estiver conectado o poll é suspenso e a atualização acontece
+ * só quando chega um desses eventos (agrupados em 1s).
+ */
 export function useAutoRefresh(
   fetchFn: () => Promise<void> | void,
-  intervalMs: number = 10000
+  intervalMs: number = 10000,
+  liveEvents?: string[]
 ) {
   const fetchRef = useRef(fetchFn);
   fetchRef.current = fetchFn;
+  const debounceRef = useRef<ReturnType<typeof setTimeout> | null>(null);
 
   const silentRefresh = useCallback(() => {
     if (document.visibilityState === 'visible') {
@@ -15,8 +34,14 @@ export function useAutoRefresh(
     }
   }, []);
 
+  const liveStatus = useLiveEvents(liveEvents || [], () => {
+    if (debounceRef.current) clearTimeout(debounceRef.current);
+    debounceRef.current = setTimeout(silentRefresh, LIVE_DEBOUNCE_MS);
+  }, !!liveEvents);
+  const isLive = liveStatus === 'live';
+
   useEffect(() => {
-    const interval = setInterval(silentRefresh, intervalMs);
+    const interval = isLive ? null : setInterval(silentRefresh, intervalMs);
 
     const onVisibility = () => {
       if (document.visibilityState === 'visible') silentRefresh();
@@ -24,8 +49,9 @@ export function useAutoRefresh(
     document.addEventListener('visibilitychange', onVisibility);
 
     return () => {
-      clearInterval(interval);
+      if (interval) clearInterval(interval);
+      if (debounceRef.current) clearTimeout(debounceRef.current);
       document.removeEventListener('visibilitychange', onVisibility);
     };
-  }, [silentRefresh, intervalMs]);
+  }, [silentRefresh, intervalMs, isLive]);
 }
@@ -0,0 +1,42 @@
+'use client';
+
+import { useEffect, useRef, useState } from 'react';
+import {
+  getLiveStatus,
+  LiveEvent,
+  LiveStatus,
+  onLiveStatusChange,
+  subscribeLiveEvents,
+} from '@/lib/liveEvents';
+
+/**
+ * Inscreve o componente no stream de eventos (SSE) e chama `handler` para os
+ * tipos informados. Retorna o status da conexão: com 'live' o componente pode
+ * dispensar a consulta periódica.
+ */
+export function useLiveEvents(
+  types: string[],
+  handler: (event: LiveEvent) => void,
+  enabled: boolean = true
+): LiveStatus {
+  const [status, setStatus] = useState<LiveStatus>(getLiveStatus());
+  const handlerRef = useRef(handler);
+  handlerRef.current = handler;
+  const typesKey = types.join(',');
+
+  useEffect(() => {
+    if (!enabled) return;
+    const accepted = new Set(typesKey.split(','));
+    const unsubscribe = subscribeLiveEvents(event => {
+      if (accepted.has(event.type)) handlerRef.current(event);
+    });
+    const offStatus = onLiveStatusChange(setStatus);
+    setStatus(getLiveStatus());
+    return () => {
+      offStatus();
+      unsubscribe();
+    };
+  }, [typesKey, enabled]);
+
+  return enabled ? status : 'fallback';
+}
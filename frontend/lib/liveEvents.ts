@@ -0,0 +1,139 @@
+// lib/liveEvents.ts
+// Conexão única (por aba) com o stream de eventos do backend (Server-Sent Events).
+// Os componentes se inscrevem com subscribeLiveEvents(); enquanto a conexão está
+// ativa eles podem dispensar a consulta periódica. Se o servidor não oferecer o
+// stream (204, ex.: backend sob WSGI) ou a conexão cair, o status volta para
+// 'fallback' e os componentes continuam no poll.
+import axios from 'axios';
+import AuthService from '@/services/auth';
+
+const API_BASE_URL = process.env.NEXT_PUBLIC_API_BASE_URL;
+const API_VERSION = process.env.NEXT_PUBLIC_API_VERSION || 'v1';
+
+export type LiveStatus = 'connecting' | 'live' | 'fallback';
+
+export interface LiveEvent {
+  type: string;
+  data: Record<string, unknown>;
+}
+
+type EventHandler = (event: LiveEvent) => void;
+type StatusHandler = (status: LiveStatus) => void;
+
+// Eventos enviados pelo backend (app.events)
+const EVENT_TYPES = [
+  'ready',
+  'notification',
+  'notifications_read',
+  'pipeline_counters',
+  'profile_status',
+  'document_reviewed',
+  'process_stage',
+];
+
+const RECONNECT_DELAYS = [5000, 15000, 60000, 300000];
+
+const eventHandlers = new Set<EventHandler>();
+const statusHandlers = new Set<StatusHandler>();
+let source: EventSource | null = null;
+let status: LiveStatus = 'fallback';
+let attempts = 0;
+let reconnectTimer: ReturnType<typeof setTimeout> | null = null;
+
+function setStatus(next: LiveStatus) {
+  if (status === next) return;
+  status = next;
+  statusHandlers.forEach(handler => handler(next));
+}
+
+function scheduleReconnect() {
+  if (reconnectTimer || eventHandlers.size === 0) return;
+  const delay = RECONNECT_DELAYS[Math.min(attempts, RECONNECT_DELAYS.length - 1)];
+  attempts += 1;
+  reconnectTimer = setTimeout(() => {
+    reconnectTimer = null;
+    connect();
+  }, delay);
+}
+
+async function connect() {
+  if (source || typeof window === 'undefined' || !('EventSource' in window)) return;
+  const token = AuthService.getAccessToken();
+  if (!token) return;
+
+  setStatus('connecting');
+  try {
+    // EventSource não envia Authorization: o ticket de curta duração vai na URL
+    const response = await axios.post(
+      `${API_BASE_URL}/api/${API_VERSION}/events/ticket/`,
+      {},
+      { headers: { Authorization: `Bearer ${token}` } }
+    );
+    if (eventHandlers.size === 0) {
+      setStatus('fallback');
+      return;
+    }
+    source = new EventSource(`${API_BASE_URL}${response.data.stream_url}`);
+  } catch {
+    setStatus('fallback');
+    scheduleReconnect();
+    return;
+  }
+
+  EVENT_TYPES.forEach(type => {
+    source?.addEventListener(type, (message: MessageEvent) => {
+      if (type === 'ready') {
+        attempts = 0;
+        setStatus('live');
+      }
+      let data: Record<string, unknown> = {};
+      try {
+        data = JSON.parse(message.data);
+      } catch {
+        // evento sem dados
+      }
+      eventHandlers.forEach(handler => handler({ type, data }));
+    });
+  });
+
+  source.onerror = () => {
+    // CLOSED: stream indisponível (204), ticket expirado ou erro HTTP -> novo ticket depois.
+    // CONNECTING: o próprio EventSource está reconectando; enquanto isso, poll.
+    setStatus('fallback');
+    if (source && source.readyState === EventSource.CLOSED) {
+      source = null;
+      scheduleReconnect();
+    }
+  };
+}
+
+function disconnect() {
+  if (reconnectTimer) {
+    clearTimeout(reconnectTimer);
+    reconnectTimer = null;
+  }
+  source?.close();
+  source = null;
+  attempts = 0;
+  setStatus('fallback');
+}
+
+export function getLiveStatus(): LiveStatus {
+  return status;
+}
+
+export function onLiveStatusChange(handler: StatusHandler): () => void {
+  statusHandlers.add(handler);
+  return () => {
+    statusHandlers.delete(handler);
+  };
+}
+
+export function subscribeLiveEvents(handler: EventHandler): () => void {
+  eventHandlers.add(handler);
+  connect();
+  return () => {
+    eventHandlers.delete(handler);
+    if (eventHandlers.size === 0) disconnect();
+  };
+}
@@ -16,6 +16,46 @@ export interface CreateJobData {
 }
 
 export type UpdateJobData = Partial<CreateJobData>;
+
+export type MatchFeatureName = 'skills' | 'experience' | 'education' | 'location' | 'work_model' | 'salary';
+
+export interface CandidateMatchFeature {
+  score: number;
+  matched?: string[];
+  years?: number | null;
+  level?: string | null;
+  accepts_remote_work?: boolean;
+  accepts_relocation?: boolean;
+  desired_min?: number | null;
+}
+
+export interface CandidateMatch {
+  candidate_profile_id: number;
+  name: string;
+  current_position: string;
+  city: string;
+  state: string;
+  pipeline_status: string;
+  score: number;
+  features: Partial<Record<MatchFeatureName, CandidateMatchFeature>>;
+}
+
+export interface CandidateMatchesResponse {
+  job_id: number;
+  requirements: {
+    skills: string[];
+    min_experience_years: number | null;
+    education_level: string | null;
+    city: string;
+    state: string;
+    remote: boolean;
+    type_model: string;
+    salary_max: number | null;
+  };
+  weights: Partial<Record<MatchFeatureName, number>>;
+  evaluated: number;
+  results: CandidateMatch[];
+}
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_BASE_URL;
 const API_VERSION = process.env.NEXT_PUBLIC_API_VERSION || 'v1';
 
@@ -165,6 +205,36 @@ class AdminJobService {
       throw error;
     }
   }
+
+  // Candidatos mais aderentes à vaga (ranqueamento)
+  async getCandidateMatches(id: number, params?: { limit?: number; skills?: string[] }): Promise<CandidateMatchesResponse> {
+    try {
+      const accessToken = AuthService.getAccessToken();
+      if (!accessToken) {
+        throw new Error("Token de acesso ausente");
+      }
+      const query = new URLSearchParams();
+      if (params?.limit) query.set('limit', String(params.limit));
+      if (params?.skills?.length) query.set('skills', params.skills.join(','));
+      const suffix = query.toString() ? `?${query.toString()}` : '';
+      const response = await fetch(`${this.baseUrl}/jobs/${id}/candidate-matches/${suffix}`, {
+        method: 'GET',
+        headers: {
+          'Accept': 'application/json',
+          Authorization: `Bearer ${accessToken}`,
+        },
+      });
+
+      if (!response.ok) {
+        throw new Error(`Erro ao buscar candidatos para a vaga: ${response.status}`);
+      }
+
+      return await response.json();
+    } catch (error) {
+      console.error('Erro ao buscar candidatos para a vaga:', error);
+      throw error;
+    }
+  }
 }
 
 export const adminJobService = new AdminJobService();
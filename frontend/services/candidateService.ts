@@ -7,7 +7,8 @@ import {
   CandidateSkill,
   CandidateLanguage,
   PaginatedResponse,
-  CandidateNotificationsResponse
+  CandidateNotificationsResponse,
+  MarkNotificationsReadResponse
 } from '@/types';
 
 import AuthService from './auth';
@@ -353,10 +354,19 @@ class CandidateService {
       return response.data;
     } catch (error) {
       console.error('Erro ao buscar notificações:', error);
-      return { count: 0, notifications: [] };
+      return { count: 0, next: null, previous: null, notifications: [] };
     }
   }
 
+  async markNotificationsRead(ids?: number[]): Promise<MarkNotificationsReadResponse> {
+    const response = await axios.post(
+      `${this.baseUrl}/candidates/profiles/me/notifications/read/`,
+      ids ? { ids } : {},
+      this.getAxiosConfig()
+    );
+    return response.data;
+  }
+
   // === DASHBOARD ===
 
   async getDashboardStats(): Promise<{ total: number; distribution: Record<string, number> }> {
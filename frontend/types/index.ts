@@ -92,6 +92,11 @@ export interface CompanyGroup {
   description?: string;
 }
 
+// Miniaturas de uma imagem enviada (backend: app.thumbnails), por tamanho em px
+export interface ImageThumbnails {
+  [size: string]: { webp: string; jpeg: string };
+}
+
 export interface Company {
   id: number;
   is_active: boolean;
@@ -101,6 +106,7 @@ export interface Company {
   cnpj: string;
   slug: string;
   logo?: string;
+  logo_thumbnails?: ImageThumbnails | null;
   group?: CompanyGroup;
 }
 
@@ -161,6 +167,9 @@ export interface CandidateProfile {
   experience_years?: number;
   desired_salary_min?: string;
   desired_salary_max?: string;
+  // Valores numéricos das pretensões ("3500.00"), usados nos filtros de faixa
+  desired_salary_min_value?: string | null;
+  desired_salary_max_value?: string | null;
   professional_summary?: string;
   skills?: string;
   certifications?: string;
@@ -178,6 +187,7 @@ export interface CandidateProfile {
   emergency_contact_name?: string;
   emergency_contact_phone?: string;
   image_profile?: string;
+  image_profile_thumbnails?: ImageThumbnails | null;
   applications_count?: number;
   applications_summary?: Array<{
     id: number;
@@ -414,6 +424,7 @@ export interface CandidateInProcess {
   candidate_name?: string;
   candidate_email?: string;
   candidate_image?: string;
+  candidate_image_thumbnails?: ImageThumbnails | null;
   current_stage?: number;
   current_stage_name?: string;
   current_stage_order?: number;
@@ -482,6 +493,7 @@ export interface AvailableCandidate {
   email: string;
   current_position?: string;
   image_profile?: string;
+  image_profile_thumbnails?: ImageThumbnails | null;
   city?: string;
   state?: string;
   experience_years?: number;
@@ -673,22 +685,28 @@ export interface AIInsight {
   type: 'positive' | 'warning' | 'critical';
 }
 
+export interface AIInsightsData {
+  distribution: Record<string, number>;
+  total: number;
+  conversion: {
+    cadastro_to_aprovado: number;
+    aprovado_to_docs_ok: number;
+    docs_ok_to_admitido: number;
+  };
+  applications: Record<string, number>;
+}
+
 export interface AIInsightsResponse {
   summary: string;
   highlights: AIInsight[];
   bottleneck: string;
   recommendations: string[];
-  data: {
-    distribution: Record<string, number>;
-    total: number;
-    conversion: {
-      cadastro_to_aprovado: number;
-      aprovado_to_docs_ok: number;
-      docs_ok_to_admitido: number;
-    };
-    applications: Record<string, number>;
-  };
-  generated_at: string;
+  // Números dos quais o texto foi gerado; current_data: números atuais (diferem quando stale)
+  data: AIInsightsData;
+  current_data?: AIInsightsData;
+  generated_at: string | null;
+  // ready: insight dos dados atuais; stale: insight anterior (novo em geração); generating: primeiro em geração
+  status?: 'ready' | 'stale' | 'generating';
   error?: string;
 }
 
@@ -842,19 +860,29 @@ export type AdmissionDataCreate = Omit<AdmissionData,
 // ============================================
 
 export interface CandidateNotification {
+  id: number;
   type: string;
   title: string;
   message: string;
   link: string;
   icon: string;
-  count?: number;
+  is_read: boolean;
+  read_at: string | null;
+  created_at: string;
 }
 
 export interface CandidateNotificationsResponse {
-  count: number;
+  count: number; // notificações não lidas
+  next: string | null;
+  previous: string | null;
   notifications: CandidateNotification[];
 }
 
+export interface MarkNotificationsReadResponse {
+  marked: number;
+  count: number;
+}
+
 export interface AdmissionPrefill {
   nome: string;
   nome_completo: string;